@@ -4,14 +4,19 @@ import importlib.util
 import unicodedata
 import streamlit as st
 import re
-import json, os, time
+import json, os, sys, time
+import threading
+import itertools
+import weakref
+import copy
+from contextvars import ContextVar
 import streamlit.components.v1 as components
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 from datetime import date, datetime, timedelta, timezone
 from contextlib import contextmanager
 from decimal import Decimal, InvalidOperation
-from functools import lru_cache
+from functools import cached_property, lru_cache, partial
 import hashlib
 import base64
 import hmac
@@ -50,6 +55,19 @@ from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
 from google.oauth2.service_account import Credentials
 from googleapiclient.errors import HttpError
 from io import BytesIO, TextIOWrapper
+
+
+def pandas_copies_on_write() -> bool:
+    # pandas 3 always copies on write; earlier versions only when the deployment opted in.
+    try:
+        if int(pd.__version__.split(".", 1)[0]) >= 3:
+            return True
+        return pd.get_option("mode.copy_on_write") is True
+    except Exception:
+        return False
+
+
+PANDAS_COPIES_ON_WRITE = pandas_copies_on_write()
 PREPARED_SCHEMA_VERSION = 5
 SESSION_BUNDLE_SCHEMA_VERSION = 1
 STATISTICS_GENERATED_SCHEMA_VERSION = 1
@@ -359,7 +377,88 @@ top_account_slot = tut_col.empty()
 DEFAULT_DATASETS_FOLDER_ID = "1omuJfEmo_nuntr5uQBJhil_Q8ZNa2Lpr"  # from Drive folder URL
 DATASETS_FOLDER_ID = config_value("DATASETS_FOLDER_ID", DEFAULT_DATASETS_FOLDER_ID)
 DRIVE_TRANSFER_TIMEOUT_SECONDS = 300
+WORKING_DATASET_MUTATION_GUARD = config_value("WORKING_DATASET_MUTATION_GUARD", "").lower() in {"1", "true", "yes"}
+# Active reminders render as one grid component; set to 0 to fall back to per-row button columns.
+REMINDER_GRID_ENABLED = config_value("REMINDER_GRID_ENABLED", "1").lower() in {"1", "true", "yes"}
+SESSION_CACHE_MEMORY_BUDGET_BYTES = int(config_value("SESSION_CACHE_MEMORY_BUDGET_MB", "256")) * 1024 * 1024
+PROCESS_CACHE_MEMORY_BUDGET_BYTES = int(config_value("PROCESS_CACHE_MEMORY_BUDGET_MB", "2048")) * 1024 * 1024
+SHARED_DATASET_STORE_MAX_BYTES = int(config_value("SHARED_DATASET_STORE_MB", "1024")) * 1024 * 1024
+STATS_EXPORT_CSV_CACHE_MAX_BYTES = int(config_value("STATS_EXPORT_CSV_CACHE_MB", "64")) * 1024 * 1024
+SESSION_MEMORY_LEDGER_TTL_SECONDS = 60 * 60
+SESSION_MEMORY_REPORT_INTERVAL_SECONDS = 10 * 60
+SESSION_MEMORY_REPORT_TOP_CONSUMERS = 5
+# Recomputable session caches that may be evicted, with the keys that must be dropped alongside them.
+SESSION_EVICTABLE_CACHE_KEYS = {
+    "prepared_df": ("prepared_key", "_prepared_reminder_rows"),
+    "_prepared_reminder_rows": (),
+    "_reminder_source_prepared_df": ("_reminder_source_prepared_rows",),
+    "_reminder_source_prepared_rows": (),
+    "bundle": ("bundle_key",),
+    "_active_reminder_window_cache": (),
+    "_stats_calculation_cache": (),
+    "_stats_display_page_cache": (),
+    "_action_tracker_records_cache": (),
+    "_action_log_index": (),
+}
+SESSION_MEMORY_ACCOUNTED_KEYS = ("working_df", *SESSION_EVICTABLE_CACHE_KEYS)
+DATASET_PUBLISH_JOB_TRANSFER_TIMEOUT_SECONDS = 1800
+DRIVE_UPLOAD_CHUNK_ALIGNMENT_BYTES = 256 * 1024
+DRIVE_UPLOAD_INITIAL_CHUNK_BYTES = 1024 * 1024
+DRIVE_UPLOAD_MAX_CHUNK_BYTES = 16 * 1024 * 1024
+DRIVE_UPLOAD_TARGET_CHUNK_SECONDS = 4.0
+DRIVE_UPLOAD_MAX_RESUME_ATTEMPTS = 3
+DRIVE_UPLOAD_SESSION_TTL_SECONDS = 24 * 60 * 60
+DATASET_PUBLISH_JOB_POLL_SECONDS = 1.0
+DATASET_PUBLISH_JOB_RESULT_TTL_SECONDS = 15 * 60
+DATASET_PUBLISH_STAGE_LABELS = {
+    "queued": "Waiting to start",
+    "load_existing": "Loading saved clinic data",
+    "merge": "Merging new dates",
+    "serialize": "Preparing the file",
+    "drive_upload": "Uploading to Google Drive",
+    "settings_pointer_update": "Updating clinic settings",
+    "complete": "Saved",
+}
+STATS_COMPUTATION_POLL_SECONDS = 0.5
+# Finished stats calculations stay shareable this long so every session on the clinic can collect them.
+STATS_COMPUTATION_RESULT_TTL_SECONDS = 120
+STATS_COMPUTATION_STAGE_LABELS = {
+    "queued": "Refreshing stats…",
+    "outcomes": "Matching sent reminders to later sales…",
+    "summary": "Summary updated. Refreshing detailed tables…",
+}
+SETTINGS_SAVE_DEBOUNCE_SECONDS = 2.0
+SETTINGS_SAVE_MAX_DELAY_SECONDS = 10.0
+PENDING_SETTINGS_SAVE_KEY = "_pending_settings_save"
+# Action history lives in the action tracker sheet; these legacy keys are never kept in the settings cell.
+SETTINGS_ACTION_LOG_KEYS = ("deleted_reminders", "wa_reminder_log")
+ACTION_LOG_INDEX_STATE_KEY = "_action_log_index"
+REMINDER_EXCLUSION_FILTER_STATE_KEY = "_reminder_exclusion_filter"
+STATS_ACTION_RECORDS_SIGNATURE_KEY = "_stats_action_records_signature"
+# Active count drawn on the nav badge by the last full run; reminder fragments compare against it.
+REMINDERS_NAV_BADGE_COUNT_KEY = "_reminders_nav_badge_count"
+# Formatted (and styled) stats pages, keyed by stats version (or frame fingerprint), sort and page number.
+STATS_DISPLAY_PAGE_CACHE_KEY = "_stats_display_page_cache"
+STATS_DISPLAY_PAGE_CACHE_SIZE = 8
+VERSIONED_FRAME_SORT_INDEX_LIMIT = 32
 SHEETS_OPERATION_TIMEOUT_SECONDS = 300
+SHEETS_QUOTA_REQUESTS_PER_MINUTE = 300
+SHEETS_QUOTA_BURST_REQUESTS = 50
+SHEETS_INTERACTIVE_TOKEN_RESERVE = 5
+SHEETS_THROTTLE_BACKOFF_SECONDS = 2.0
+SHEETS_THROTTLE_MAX_BACKOFF_SECONDS = 30.0
+SHEETS_PRIORITY_INTERACTIVE = "interactive"
+SHEETS_PRIORITY_TELEMETRY = "telemetry"
+SHEETS_COALESCED_READ_METHODS = {
+    "get_all_values",
+    "get_all_records",
+    "row_values",
+    "col_values",
+    "get_values",
+    "batch_get",
+    "values_batch_get",
+}
+SHEETS_BATCH_READS_STATE_KEY = "_sheets_batch_reads"
 
 # === Sheet columns you created ===
 WORKSHEET_NAME_SUFFIX = config_value("WORKSHEET_NAME_SUFFIX", default_worksheet_name_suffix())
@@ -663,6 +762,9 @@ def reset_uploaded_data_state(clear_cache: bool = True, reset_uploader: bool = F
         "bundle",
         "bundle_key",
         "prepared_key",
+        "_prepared_reminder_rows",
+        "_reminder_source_prepared_df",
+        "_reminder_source_prepared_rows",
         "shared_dataset_loaded",
         "shared_dataset_name",
         "shared_dataset_updated_at",
@@ -677,6 +779,7 @@ def reset_uploaded_data_state(clear_cache: bool = True, reset_uploader: bool = F
 
 ACCOUNT_SCOPED_SESSION_KEYS = [
     "clinic_id",
+    PENDING_SETTINGS_SAVE_KEY,
     "rules",
     "applied_rules",
     "exclusions",
@@ -733,10 +836,6 @@ ACCOUNT_SCOPED_SESSION_KEYS = [
     "_search_criteria_refreshed",
     "_search_terms_autosave_error",
     "_pending_recent_reminder_warning",
-    "_replace_deleted_reminders_once",
-    "_replace_wa_reminder_log_once",
-    "_deleted_reminder_remove_keys_once",
-    "_wa_reminder_remove_keys_once",
     "_replace_search_settings_once",
     "show_data_privacy_dialog",
     "show_profile_dialog",
@@ -754,7 +853,7 @@ ACCOUNT_SCOPED_SESSION_KEYS = [
     "_action_tracker_pending_load_for",
     "_user_tracker_row_cache",
     "_active_reminder_badge_cache",
-    "_stats_export_csv_cache",
+    "_stats_display_page_cache",
     "stats_period",
     "stats_custom_range",
     "stats_custom_range_last_complete",
@@ -768,7 +867,7 @@ ACCOUNT_SCOPED_SESSION_KEYS = [
     "reminders_actioned_period",
     "reminders_actioned_custom_range",
     "reminders_actioned_custom_range_last_complete",
-    "_hidden_reminders_index_cache",
+    "_hidden_reminder_index",
     "pending_google_signup",
     "google_onboarding_mode",
     "show_staff_access_login",
@@ -805,8 +904,6 @@ def drop_duplicate_columns(df: pd.DataFrame) -> pd.DataFrame:
     if df is None:
         return df
 
-    df = df.copy()
-
     def _norm_col(c):
         if not isinstance(c, str):
             c = str(c)
@@ -815,8 +912,7 @@ def drop_duplicate_columns(df: pd.DataFrame) -> pd.DataFrame:
         return c
 
     norm_cols = pd.Index([_norm_col(c) for c in df.columns])
-    df = df.loc[:, ~norm_cols.duplicated()].copy()
-    return df
+    return df.loc[:, ~norm_cols.duplicated()]
     
 def clear_clinic_dataset_pointer(clinic_id: str):
     clinic_id = require_authenticated_tenant_access(clinic_id)
@@ -837,6 +933,7 @@ def clear_clinic_dataset_pointer(clinic_id: str):
             SHEET_COL_DATASET_UPDATED_AT: "",
         },
     )
+    shared_dataset_store().drop(normalize_clinic_id_key(clinic_id))
 
 def _settings_col_index(headers, name: str) -> int:
     return headers.index(name) + 1
@@ -906,7 +1003,8 @@ def ensure_settings_sheet_columns(
     updated_headers = headers + missing
     end_col = _column_number_to_letter(len(updated_headers))
     _gspread_retry(sheet.update, values=[updated_headers], range_name=f"A1:{end_col}1")
-    st.session_state.pop("_settings_row_cache", None)
+    active_session_state().pop("_settings_row_cache", None)
+    invalidate_settings_directory_index(sheet)
     return updated_headers
 
 
@@ -967,7 +1065,7 @@ def get_or_create_settings_worksheet(spreadsheet):
             cols=max(len(SETTINGS_REQUIRED_COLUMNS), 8),
         )
 
-    values = _gspread_retry(worksheet.get_all_values) or []
+    values = _settings_values_snapshot(worksheet)
     if not worksheet_values_have_settings_schema(values):
         legacy_values = []
         if not WORKSHEET_NAME_SUFFIX:
@@ -993,6 +1091,7 @@ def get_or_create_settings_worksheet(spreadsheet):
         elif not values or WORKSHEET_NAME_SUFFIX:
             copy_worksheet_values(worksheet, [list(SETTINGS_REQUIRED_COLUMNS)])
             values = [list(SETTINGS_REQUIRED_COLUMNS)]
+        settings_directory_index().rebuild(settings_sheet_index_key(worksheet), values)
 
     headers = list(values[0]) if values else list(SETTINGS_REQUIRED_COLUMNS)
     ensure_settings_sheet_columns(worksheet, headers, SETTINGS_REQUIRED_COLUMNS)
@@ -1113,35 +1212,212 @@ def _update_password_cells(sheet, headers, row_idx, plain_password, password_has
         _gspread_retry(sheet.batch_update, updates)
 
 
+SETTINGS_DIRECTORY_LOOKUP_FIELDS = ("clinic", "subject", "email")
+
+
+def settings_row_checksum(row_values) -> str:
+    text = "\x1f".join(str(value if value is not None else "") for value in (row_values or []))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def settings_sheet_index_key(sheet) -> tuple:
+    spreadsheet_id = str(getattr(sheet, "spreadsheet_id", "") or "")
+    worksheet_id = getattr(sheet, "id", None)
+    if spreadsheet_id and worksheet_id is not None:
+        return (spreadsheet_id, str(worksheet_id))
+    return ("object", id(sheet))
+
+
+def _settings_row_directory_keys(headers: list[str], row_values: list) -> dict[str, str]:
+    def cell(name: str) -> str:
+        if name not in headers:
+            return ""
+        idx = headers.index(name)
+        return row_values[idx] if idx < len(row_values) else ""
+
+    return {
+        "clinic": normalize_clinic_id_key(cell(SHEET_COL_CLINIC_ID)),
+        "subject": str(cell(SHEET_COL_GOOGLE_SUBJECT) or "").strip(),
+        "email": normalize_email(cell(SHEET_COL_GOOGLE_EMAIL)),
+    }
+
+
+class SettingsDirectoryIndex:
+    """
+    Process-wide map of ClinicID / Google subject / Google email to settings rows.
+    Entries hold (row_idx, checksum) and are validated against the fetched row on use.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sheets: dict[tuple, dict] = {}
+
+    def rebuild(self, sheet_key: tuple, values: list[list[str]]) -> None:
+        headers = list(values[0]) if values else []
+        directory = {
+            "headers": headers,
+            "rows": {},
+            **{field: {} for field in SETTINGS_DIRECTORY_LOOKUP_FIELDS},
+        }
+        for row_idx, row_values in enumerate(values[1:], start=2):
+            checksum = settings_row_checksum(row_values)
+            directory["rows"][row_idx] = checksum
+            for field, key in _settings_row_directory_keys(headers, row_values).items():
+                if key:
+                    directory[field].setdefault(key, row_idx)
+        with self._lock:
+            self._sheets[sheet_key] = directory
+
+    def lookup(self, sheet_key: tuple, field: str, key: str) -> tuple[list[str], int, str] | None:
+        with self._lock:
+            directory = self._sheets.get(sheet_key)
+            if not directory or not key:
+                return None
+            row_idx = directory.get(field, {}).get(key)
+            if row_idx is None:
+                return None
+            return list(directory["headers"]), row_idx, directory["rows"].get(row_idx, "")
+
+    def refresh_row(self, sheet_key: tuple, row_idx: int, row_values: list) -> None:
+        with self._lock:
+            directory = self._sheets.get(sheet_key)
+            if not directory:
+                return
+            directory["rows"][row_idx] = settings_row_checksum(row_values)
+            for field, key in _settings_row_directory_keys(directory["headers"], row_values).items():
+                stale = [existing for existing, idx in directory[field].items() if idx == row_idx and existing != key]
+                for existing in stale:
+                    directory[field].pop(existing, None)
+                if key:
+                    directory[field].setdefault(key, row_idx)
+
+    def invalidate(self, sheet_key: tuple | None = None) -> None:
+        with self._lock:
+            if sheet_key is None:
+                self._sheets.clear()
+            else:
+                self._sheets.pop(sheet_key, None)
+
+
+@st.cache_resource(show_spinner=False)
+def settings_directory_index() -> SettingsDirectoryIndex:
+    return SettingsDirectoryIndex()
+
+
+def invalidate_settings_directory_index(sheet=None) -> None:
+    settings_directory_index().invalidate(None if sheet is None else settings_sheet_index_key(sheet))
+
+
+def _settings_values_snapshot(sheet) -> list[list[str]]:
+    values = _gspread_retry(sheet.get_all_values) or []
+    settings_directory_index().rebuild(settings_sheet_index_key(sheet), values)
+    return values
+
+
+def _indexed_settings_row(sheet, field: str, key: str, matches) -> tuple[list[str], int, list[str]] | None:
+    index = settings_directory_index()
+    sheet_key = settings_sheet_index_key(sheet)
+    hit = index.lookup(sheet_key, field, key)
+    if hit is None:
+        return None
+    headers, row_idx, checksum = hit
+    try:
+        row_values = worksheet_batch_row(sheet, row_idx)
+    except Exception:
+        return None
+    if len(row_values) > len(headers) or not matches(headers, row_values):
+        # Rows shifted or headers grew since the last snapshot; force a rescan.
+        index.invalidate(sheet_key)
+        return None
+    if settings_row_checksum(row_values) != checksum:
+        index.refresh_row(sheet_key, row_idx, row_values)
+    return headers, row_idx, row_values
+
+
+def locate_settings_row(sheet, lookups: list[tuple[str, str]], matches) -> tuple[list[str], int, list[str]] | None:
+    """Find one settings row via the directory index, falling back to a full snapshot scan."""
+    for field, key in lookups:
+        if not key:
+            continue
+        located = _indexed_settings_row(sheet, field, key, matches)
+        if located is not None:
+            return located
+
+    values = _settings_values_snapshot(sheet)
+    if not values:
+        return None
+    headers = list(values[0])
+    for row_idx, row_values in enumerate(values[1:], start=2):
+        if matches(headers, row_values):
+            return headers, row_idx, list(row_values)
+    return None
+
+
+def settings_row_matches_clinic(clinic_key: str):
+    def matches(headers: list[str], row_values: list) -> bool:
+        if not clinic_key or SHEET_COL_CLINIC_ID not in headers:
+            return False
+        clinic_ix = headers.index(SHEET_COL_CLINIC_ID)
+        current = row_values[clinic_ix] if len(row_values) > clinic_ix else ""
+        return normalize_clinic_id_key(current) == clinic_key
+
+    return matches
+
+
+def locate_settings_row_for_clinic(sheet, clinic_id: str) -> tuple[list[str], int, list[str]] | None:
+    clinic_key = normalize_clinic_id_key(clinic_id)
+    return locate_settings_row(sheet, [("clinic", clinic_key)], settings_row_matches_clinic(clinic_key))
+
+
+def candidate_settings_rows_for_clinic(sheet, clinic_id: str):
+    """
+    Every settings row for a ClinicID, the indexed row first.
+    Duplicate rows are only scanned for when the caller rejects the indexed one.
+    """
+    clinic_key = normalize_clinic_id_key(clinic_id)
+    matches = settings_row_matches_clinic(clinic_key)
+    indexed = _indexed_settings_row(sheet, "clinic", clinic_key, matches) if clinic_key else None
+    if indexed is not None:
+        yield indexed
+    values = _settings_values_snapshot(sheet)
+    if not values:
+        return
+    headers = list(values[0])
+    for row_idx, row_values in enumerate(values[1:], start=2):
+        if matches(headers, row_values) and (indexed is None or row_idx != indexed[1]):
+            yield headers, row_idx, list(row_values)
+
+
+def settings_row_record(headers: list[str], row_values: list) -> dict:
+    return {
+        header: row_values[idx] if idx < len(row_values) else ""
+        for idx, header in enumerate(headers)
+    }
+
+
 def _get_settings_row_for_clinic(clinic_id: str):
+    session_state = active_session_state()
     clinic_key = normalize_clinic_id_key(clinic_id)
-    cached = st.session_state.get("_settings_row_cache")
+    cached = session_state.get("_settings_row_cache")
     if isinstance(cached, dict) and cached.get("clinic_key") == clinic_key:
         return get_settings_sheet(), list(cached.get("headers", [])), int(cached.get("row_idx"))
 
     sheet = get_settings_sheet()
-    all_vals = _gspread_retry(sheet.get_all_values)
-    headers = all_vals[0]
-    clinic_col = _settings_col_index(headers, "ClinicID")
-    row_idx = None
-    for i, r in enumerate(all_vals[1:], start=2):
-        if len(r) >= clinic_col and normalize_clinic_id_key(r[clinic_col - 1]) == clinic_key:
-            row_idx = i
-            break
-
-    if row_idx is None:
+    located = locate_settings_row_for_clinic(sheet, clinic_id)
+    if located is None:
         raise ValueError("ClinicID not found in settings sheet")
-    st.session_state["_settings_row_cache"] = {
+    headers, row_idx, row_values = located
+    session_state["_settings_row_cache"] = {
         "clinic_key": clinic_key,
         "headers": list(headers),
         "row_idx": row_idx,
-        "row_values": list(all_vals[row_idx - 1]) if len(all_vals) >= row_idx else [],
+        "row_values": list(row_values),
     }
     return sheet, headers, row_idx
 
 
 def get_cached_settings_row_values(clinic_id: str) -> list[str] | None:
-    cached = st.session_state.get("_settings_row_cache")
+    cached = active_session_state().get("_settings_row_cache")
     clinic_key = normalize_clinic_id_key(clinic_id)
     if isinstance(cached, dict) and cached.get("clinic_key") == clinic_key and "row_values" in cached:
         return list(cached.get("row_values") or [])
@@ -1149,7 +1425,7 @@ def get_cached_settings_row_values(clinic_id: str) -> list[str] | None:
 
 
 def update_cached_settings_row_fields(clinic_id: str, values_by_header: dict[str, str]) -> None:
-    cached = st.session_state.get("_settings_row_cache")
+    cached = active_session_state().get("_settings_row_cache")
     clinic_key = normalize_clinic_id_key(clinic_id)
     if not isinstance(cached, dict) or cached.get("clinic_key") != clinic_key:
         return
@@ -1187,8 +1463,16 @@ def _raw_update_settings_row_fields(
 class SettingsRepository:
     def get_fresh_row_values(self, clinic_id: str) -> tuple[object, list[str], int, list[str]]:
         sheet, headers, row_idx = _get_settings_row_for_clinic(clinic_id)
-        row_values = list(_gspread_retry(sheet.row_values, row_idx))
+        row_values = worksheet_batch_row(sheet, row_idx)
         clinic_key = normalize_clinic_id_key(clinic_id)
+        if not settings_row_matches_clinic(clinic_key)(headers, row_values):
+            # Another account was added or removed above this row since it was cached.
+            st.session_state.pop("_settings_row_cache", None)
+            invalidate_settings_directory_index(sheet)
+            sheet, headers, row_idx = _get_settings_row_for_clinic(clinic_id)
+            row_values = list(get_cached_settings_row_values(clinic_id) or [])
+        else:
+            settings_directory_index().refresh_row(settings_sheet_index_key(sheet), row_idx, row_values)
         st.session_state["_settings_row_cache"] = {
             "clinic_key": clinic_key,
             "headers": list(headers),
@@ -1240,12 +1524,15 @@ def update_authorized_settings_row_fields(
 
 
 def get_fresh_settings_row_values(clinic_id: str) -> tuple[object, list[str], int, list[str]]:
-    """Read the clinic row directly from Sheets and refresh the session cache."""
+    """
+    Read the clinic row through the run's Sheets read memo and refresh the session cache.
+    The memo is reset at the start of every script and fragment run and after every write.
+    """
     return settings_repository().get_fresh_row_values(clinic_id)
 
 
 def get_authorized_fresh_settings_row_values(clinic_id: str) -> tuple[object, list[str], int, list[str]]:
-    """Read the signed-in clinic row directly from Sheets and refresh the session cache."""
+    """Read the signed-in clinic row through the run's Sheets read memo and refresh the session cache."""
     return settings_repository().get_authorized_fresh_row_values(clinic_id)
 
 
@@ -1258,13 +1545,27 @@ def _copy_settings_dict(settings: dict | None) -> dict:
         return dict(settings or {})
 
 
-def cache_remote_settings(clinic_id: str, settings: dict | None) -> None:
+def cache_remote_settings(clinic_id: str, settings: dict | None, version: str = "") -> None:
+    """Remember the last saved settings and the row's UpdatedAt stamp they were read or written with."""
     st.session_state["_remote_settings_cache"] = {
         "clinic_key": str(clinic_id or "").strip().lower(),
-        "settings": _copy_settings_dict(settings),
+        "settings": _copy_settings_dict({
+            key: value
+            for key, value in (settings or {}).items()
+            if key not in SETTINGS_ACTION_LOG_KEYS
+        }),
+        "version": str(version or ""),
     }
 
 
+def get_cached_remote_settings_version(clinic_id: str) -> str:
+    cached = st.session_state.get("_remote_settings_cache")
+    clinic_key = str(clinic_id or "").strip().lower()
+    if isinstance(cached, dict) and cached.get("clinic_key") == clinic_key:
+        return str(cached.get("version", "") or "")
+    return ""
+
+
 def get_cached_remote_settings(clinic_id: str) -> dict:
     cached = st.session_state.get("_remote_settings_cache")
     clinic_key = str(clinic_id or "").strip().lower()
@@ -1292,12 +1593,41 @@ class GoogleSheetsOperationTimeoutError(TimeoutError):
     pass
 
 
+DETACHED_SESSION_STATE_KEYS = ("clinic_id", "user_name", "logged_in", "_settings_row_cache")
+_detached_session_state: ContextVar[dict | None] = ContextVar("detached_session_state", default=None)
+
+
+def active_session_state():
+    """Session state for this thread: a background worker's detached snapshot, else st.session_state."""
+    detached = _detached_session_state.get()
+    return st.session_state if detached is None else detached
+
+
+def capture_detached_session_state() -> dict:
+    """Copy the tenant and settings-row values a background worker needs, on the script thread."""
+    return {
+        key: copy.deepcopy(st.session_state[key])
+        for key in DETACHED_SESSION_STATE_KEYS
+        if key in st.session_state
+    }
+
+
+@contextmanager
+def detached_session_state(state: dict):
+    token = _detached_session_state.set(state)
+    try:
+        yield state
+    finally:
+        _detached_session_state.reset(token)
+
+
 def require_authenticated_tenant_access(clinic_id: str) -> str:
+    session_state = active_session_state()
     target_clinic_id = str(clinic_id or "").strip()
-    current_clinic_id = str(st.session_state.get("clinic_id", "") or "").strip()
+    current_clinic_id = str(session_state.get("clinic_id", "") or "").strip()
     if (
         not target_clinic_id
-        or not st.session_state.get("logged_in")
+        or not session_state.get("logged_in")
         or normalize_clinic_id_key(current_clinic_id) != normalize_clinic_id_key(target_clinic_id)
     ):
         raise TenantAuthorizationError(TENANT_AUTHORIZATION_MESSAGE)
@@ -3774,25 +4104,55 @@ def normalize_key_series(s, index=None) -> pd.Series:
     return s.map(_clean_one)
 
 
-def billed_item_duplicate_identity(df: pd.DataFrame) -> tuple[pd.DataFrame | None, pd.Series]:
+def normalized_key_codes(values) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Integer codes for normalize_key_series(values), normalising each distinct value once.
+    Returns row codes and the normalised uniques they index.
+    """
+    codes, uniques = pd.factorize(pd.Series(values, copy=False), use_na_sentinel=False)
+    normalized = normalize_key_series(pd.Series(np.asarray(uniques, dtype=object)))
+    canonical_codes, canonical = pd.factorize(normalized.to_numpy(dtype=object))
+    return canonical_codes[codes].astype(np.int64, copy=False), np.asarray(canonical, dtype=object)
+
+
+def sorted_value_codes(values) -> np.ndarray:
+    """Codes that order like sort_values (missing values last), for np.lexsort."""
+    codes, uniques = pd.factorize(values, sort=True)
+    codes = codes.astype(np.int64, copy=True)
+    codes[codes < 0] = len(uniques)
+    return codes
+
+
+def combine_key_codes(code_arrays: list[np.ndarray], length: int) -> np.ndarray:
+    """Fold non-negative code arrays into one exact int64 key, refactorising before the radix could overflow."""
+    key = np.zeros(length, dtype=np.int64)
+    span = 1
+    for codes in code_arrays:
+        width = int(codes.max()) + 1 if length else 1
+        if span * width >= 2**62:
+            key, uniques = pd.factorize(key)
+            key = key.astype(np.int64, copy=False)
+            span = len(uniques)
+        key = key * width + codes
+        span *= width
+    return key
+
+
+def billed_item_duplicate_keys(df: pd.DataFrame) -> tuple[np.ndarray | None, np.ndarray]:
+    """One int64 identity per row (billed date, owner, animal, item) and whether every part is present."""
     key_columns = ["ChargeDate", "Client Name", "Animal Name", "Item Name"]
     if df is None or getattr(df, "empty", True) or any(col not in df.columns for col in key_columns):
-        return None, pd.Series(False, index=getattr(df, "index", pd.Index([])), dtype=bool)
+        return None, np.zeros(len(getattr(df, "index", ())), dtype=bool)
 
     charge_dates = parse_dates(df["ChargeDate"]).dt.normalize()
-    identity = pd.DataFrame(
-        {
-            "ChargeDate": charge_dates.dt.strftime("%Y-%m-%d").fillna(""),
-            "Client Name": normalize_key_series(df["Client Name"], index=df.index),
-            "Animal Name": normalize_key_series(df["Animal Name"], index=df.index),
-            "Item Name": normalize_key_series(df["Item Name"], index=df.index),
-        },
-        index=df.index,
-    )
-    complete = charge_dates.notna()
+    complete = charge_dates.notna().to_numpy(dtype=bool, copy=True)
+    date_codes, _ = pd.factorize(charge_dates.to_numpy(dtype="datetime64[ns]").view(np.int64))
+    code_arrays = [date_codes.astype(np.int64, copy=False)]
     for col in ["Client Name", "Animal Name", "Item Name"]:
-        complete = complete & identity[col].ne("")
-    return identity, complete.fillna(False)
+        codes, canonical = normalized_key_codes(df[col])
+        complete &= ~(canonical == "")[codes]
+        code_arrays.append(codes)
+    return combine_key_codes(code_arrays, len(df)), complete
 
 
 def drop_duplicate_billed_item_rows(df: pd.DataFrame, keep: str = "last") -> pd.DataFrame:
@@ -3803,13 +4163,23 @@ def drop_duplicate_billed_item_rows(df: pd.DataFrame, keep: str = "last") -> pd.
     if df is None or getattr(df, "empty", True):
         return df
 
-    identity, complete = billed_item_duplicate_identity(df)
-    if identity is None or not complete.any():
+    keys, complete = billed_item_duplicate_keys(df)
+    if keys is None or not complete.any():
         return df.copy()
 
-    drop_rows = np.zeros(len(df), dtype=bool)
-    complete_values = complete.to_numpy(dtype=bool)
-    drop_rows[complete_values] = identity.loc[complete].duplicated(keep=keep).to_numpy(dtype=bool)
+    positions = np.flatnonzero(complete)
+    complete_keys = keys[positions]
+    if keep is False:
+        _, inverse, counts = np.unique(complete_keys, return_inverse=True, return_counts=True)
+        kept = positions[counts[inverse] == 1]
+    elif keep == "last":
+        _, last = np.unique(complete_keys[::-1], return_index=True)
+        kept = positions[len(positions) - 1 - last]
+    else:
+        _, first = np.unique(complete_keys, return_index=True)
+        kept = positions[first]
+    drop_rows = complete.copy()
+    drop_rows[kept] = False
     if not drop_rows.any():
         return df.copy()
     return df.loc[~drop_rows].copy().reset_index(drop=True)
@@ -3822,7 +4192,6 @@ def sanitize_working_df(df: pd.DataFrame) -> pd.DataFrame:
     if df is None:
         return df
 
-    df = df.copy()
     df = drop_duplicate_columns(df)
     df = ensure_min_canonical_schema(df)
 
@@ -3835,7 +4204,7 @@ def sanitize_working_df(df: pd.DataFrame) -> pd.DataFrame:
 
     if "ChargeDate" in df.columns:
         df["ChargeDate"] = parse_dates(df["ChargeDate"])
-        df = df.loc[df["ChargeDate"].isna() | (df["ChargeDate"] >= MIN_VALID_CHARGE_DATE)].copy().reset_index(drop=True)
+        df = df.loc[df["ChargeDate"].isna() | (df["ChargeDate"] >= MIN_VALID_CHARGE_DATE)].reset_index(drop=True)
 
     if "Qty" in df.columns:
         df["Qty"] = pd.to_numeric(df["Qty"], errors="coerce").fillna(1).astype(int)
@@ -3844,7 +4213,323 @@ def sanitize_working_df(df: pd.DataFrame) -> pd.DataFrame:
         df["Amount"] = pd.to_numeric(df["Amount"], errors="coerce").fillna(0)
 
     return drop_duplicate_billed_item_rows(df)
-    
+
+
+def freeze_working_df(df: pd.DataFrame) -> pd.DataFrame:
+    """Rebuild a shared dataset on read-only column arrays when the mutation guard is on."""
+    if not WORKING_DATASET_MUTATION_GUARD or not isinstance(df, pd.DataFrame):
+        return df
+    columns = {}
+    for position in range(df.shape[1]):
+        column = df.iloc[:, position]
+        if isinstance(column.dtype, np.dtype):
+            values = column.to_numpy(copy=True)
+            values.flags.writeable = False
+            columns[position] = values
+        else:
+            # Extension and Arrow columns have no public read-only switch; they stay as they are.
+            columns[position] = column.array
+    frozen = pd.DataFrame(columns, index=df.index, copy=False)
+    frozen.columns = df.columns
+    frozen.attrs = dict(df.attrs)
+    return frozen
+
+
+class SharedDatasetStore:
+    """
+    One sanitized working dataset per clinic, shared by every session in the process.
+    Frames are treated as immutable; pipeline stages derive new frames under copy-on-write.
+    Without copy-on-write each caller gets its own copy instead. Least recently used
+    clinics are dropped once the store grows past its byte budget.
+    """
+
+    def __init__(self, max_bytes: int = SHARED_DATASET_STORE_MAX_BYTES):
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._datasets: dict[str, tuple[tuple, pd.DataFrame, int]] = {}
+
+    @staticmethod
+    def _hand_out(df: pd.DataFrame) -> pd.DataFrame:
+        return df if PANDAS_COPIES_ON_WRITE else df.copy()
+
+    def get(self, clinic_key: str, version_key: tuple) -> pd.DataFrame | None:
+        with self._lock:
+            entry = self._datasets.pop(clinic_key, None)
+            if entry is not None:
+                self._datasets[clinic_key] = entry
+        if entry is None or entry[0] != version_key:
+            return None
+        return self._hand_out(entry[1])
+
+    def put(self, clinic_key: str, version_key: tuple, df: pd.DataFrame) -> pd.DataFrame:
+        df = freeze_working_df(df)
+        size = dataframe_memory_bytes(df)
+        with self._lock:
+            self._datasets.pop(clinic_key, None)
+            self._datasets[clinic_key] = (version_key, df, size)
+            total = sum(entry[2] for entry in self._datasets.values())
+            while total > self.max_bytes and len(self._datasets) > 1:
+                evicted = self._datasets.pop(next(iter(self._datasets)))
+                total -= evicted[2]
+        return self._hand_out(df)
+
+    def drop(self, clinic_key: str) -> None:
+        with self._lock:
+            self._datasets.pop(clinic_key, None)
+
+    def holds(self, df) -> bool:
+        with self._lock:
+            return any(entry[1] is df for entry in self._datasets.values())
+
+    def version_of(self, df) -> tuple | None:
+        """(clinic key, *version key) of the shared dataset that is this exact frame, if any."""
+        with self._lock:
+            for clinic_key, (version_key, shared_df, _) in self._datasets.items():
+                if shared_df is df:
+                    return (clinic_key, *version_key)
+        return None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._datasets)
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(entry[2] for entry in self._datasets.values())
+
+
+@st.cache_resource(show_spinner=False)
+def shared_dataset_store() -> SharedDatasetStore:
+    return SharedDatasetStore()
+
+
+class StatsExportCsvCache:
+    """Finished stats CSV exports shared by every session, least recently used first out past a byte budget."""
+
+    def __init__(self, max_bytes: int = STATS_EXPORT_CSV_CACHE_MAX_BYTES):
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._entries: dict[tuple, bytes] = {}
+        self._bytes = 0
+
+    def get(self, key: tuple) -> bytes | None:
+        with self._lock:
+            csv_bytes = self._entries.pop(key, None)
+            if csv_bytes is not None:
+                self._entries[key] = csv_bytes
+            return csv_bytes
+
+    def put(self, key: tuple, csv_bytes: bytes) -> bytes:
+        if len(csv_bytes) > self.max_bytes:
+            return csv_bytes
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = csv_bytes
+            self._bytes += len(csv_bytes)
+            while self._bytes > self.max_bytes and self._entries:
+                evicted = self._entries.pop(next(iter(self._entries)))
+                self._bytes -= len(evicted)
+        return csv_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._bytes
+
+
+@st.cache_resource(show_spinner=False)
+def stats_export_csv_process_cache() -> StatsExportCsvCache:
+    return StatsExportCsvCache()
+
+
+def shared_dataset_version_key(file_id: str, updated_at: str) -> tuple[str, str]:
+    return (str(file_id or "").strip(), str(updated_at or "").strip())
+
+
+def share_working_df(clinic_id: str, df: pd.DataFrame, file_id: str, updated_at: str) -> pd.DataFrame:
+    shared_df = shared_dataset_store().put(
+        normalize_clinic_id_key(clinic_id),
+        shared_dataset_version_key(file_id, updated_at),
+        df,
+    )
+    purchase_timeline_index(shared_df)
+    return shared_df
+
+
+def estimate_object_bytes(value, _seen: set | None = None) -> int:
+    """Approximate deep size of a cached value; frames and arrays use their own accounting."""
+    seen = _seen if _seen is not None else set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, pd.DataFrame):
+        return dataframe_memory_bytes(value)
+    if isinstance(value, PreparedReminderRows):
+        return value.memory_bytes()
+    if isinstance(value, (pd.Series, pd.Index)):
+        try:
+            return int(value.memory_usage(deep=True))
+        except Exception:
+            return 0
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_object_bytes(key, seen) + estimate_object_bytes(item, seen)
+            for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_object_bytes(item, seen) for item in value)
+    return sys.getsizeof(value)
+
+
+class SessionMemoryLedger:
+    """Process-wide view of how many cache bytes each live session holds."""
+
+    def __init__(self, ttl_seconds: float = SESSION_MEMORY_LEDGER_TTL_SECONDS):
+        self.ttl_seconds = float(ttl_seconds)
+        self._lock = threading.Lock()
+        self._sessions: dict[str, tuple[int, float]] = {}
+
+    def update(self, session_token: str, session_bytes: int) -> tuple[int, int]:
+        """Record a session's bytes; returns (total session bytes, live session count)."""
+        now = time.monotonic()
+        with self._lock:
+            self._sessions[session_token] = (int(session_bytes), now)
+            for token in [t for t, (_, seen) in self._sessions.items() if now - seen > self.ttl_seconds]:
+                self._sessions.pop(token, None)
+            return sum(size for size, _ in self._sessions.values()), len(self._sessions)
+
+
+@st.cache_resource(show_spinner=False)
+def session_memory_ledger() -> SessionMemoryLedger:
+    return SessionMemoryLedger()
+
+
+def session_instance_token() -> str:
+    token = st.session_state.get("_session_instance_token")
+    if not token:
+        token = uuid.uuid4().hex
+        st.session_state["_session_instance_token"] = token
+    return token
+
+
+def note_session_cache_use(key: str) -> None:
+    """Mark a recomputable session cache as recently used for LRU eviction."""
+    last_used = st.session_state.setdefault("_session_cache_last_used", {})
+    last_used[key] = time.monotonic()
+
+
+def session_memory_usage() -> dict[str, int]:
+    """Bytes held by each accounted session key; datasets shared process-wide are not charged to the session."""
+    store = shared_dataset_store()
+    # Sizes are remembered per object identity so unchanged caches are not re-measured every rerun.
+    measured = st.session_state.setdefault("_session_memory_sizes", {})
+    usage = {}
+    for key in SESSION_MEMORY_ACCOUNTED_KEYS:
+        value = st.session_state.get(key)
+        if value is None or (key == "working_df" and store.holds(value)):
+            measured.pop(key, None)
+            continue
+        cached = measured.get(key)
+        if cached is None or cached[0] != id(value):
+            cached = (id(value), estimate_object_bytes(value))
+            measured[key] = cached
+        usage[key] = cached[1]
+    return usage
+
+
+def evict_session_cache(key: str) -> None:
+    st.session_state.pop(key, None)
+    for companion_key in SESSION_EVICTABLE_CACHE_KEYS.get(key, ()):
+        st.session_state.pop(companion_key, None)
+    st.session_state.get("_session_cache_last_used", {}).pop(key, None)
+    st.session_state.get("_session_memory_sizes", {}).pop(key, None)
+
+
+def enforce_session_memory_budget(
+    session_budget_bytes: int | None = None,
+    process_budget_bytes: int | None = None,
+) -> dict:
+    """
+    Evict least recently used recomputable caches until this session fits its budget.
+    When the process is over budget the session budget shrinks to a fair share.
+    """
+    started = time.perf_counter()
+    session_budget_bytes = SESSION_CACHE_MEMORY_BUDGET_BYTES if session_budget_bytes is None else session_budget_bytes
+    process_budget_bytes = PROCESS_CACHE_MEMORY_BUDGET_BYTES if process_budget_bytes is None else process_budget_bytes
+    token = session_instance_token()
+    ledger = session_memory_ledger()
+    usage = session_memory_usage()
+    session_bytes = sum(usage.values())
+    shared_bytes = shared_dataset_store().total_bytes() + stats_export_csv_process_cache().total_bytes()
+    sessions_bytes, session_count = ledger.update(token, session_bytes)
+    target_bytes = session_budget_bytes
+    if shared_bytes + sessions_bytes > process_budget_bytes:
+        fair_share = max(0, process_budget_bytes - shared_bytes) // max(1, session_count)
+        target_bytes = min(target_bytes, fair_share)
+
+    last_used = st.session_state.get("_session_cache_last_used", {})
+    evicted = []
+    for key in sorted(
+        (key for key in usage if key in SESSION_EVICTABLE_CACHE_KEYS),
+        key=lambda key: last_used.get(key, 0.0),
+    ):
+        if session_bytes <= target_bytes:
+            break
+        session_bytes -= usage.pop(key)
+        evict_session_cache(key)
+        evicted.append(key)
+    if evicted:
+        sessions_bytes, session_count = ledger.update(token, session_bytes)
+
+    report = {
+        "session_bytes": session_bytes,
+        "process_bytes": shared_bytes + sessions_bytes,
+        "session_count": session_count,
+        "target_bytes": target_bytes,
+        "top_consumers": sorted(usage.items(), key=lambda item: item[1], reverse=True)[:SESSION_MEMORY_REPORT_TOP_CONSUMERS],
+        "evicted": evicted,
+        "duration_ms": (time.perf_counter() - started) * 1000,
+    }
+    report_session_memory(report)
+    return report
+
+
+def report_session_memory(report: dict) -> None:
+    """Send top consumers to the performance tracker on eviction or every report interval."""
+    if not st.session_state.get("clinic_id"):
+        return
+    now = time.monotonic()
+    reported_at = st.session_state.setdefault("_session_memory_reported_at", now)
+    if not report["evicted"] and now - reported_at < SESSION_MEMORY_REPORT_INTERVAL_SECONDS:
+        return
+    st.session_state["_session_memory_reported_at"] = now
+    top = ",".join(f"{key}:{size}" for key, size in report["top_consumers"])
+    record_performance_tracker_event(
+        "session_memory",
+        report["duration_ms"],
+        rows=len(report["top_consumers"]),
+        status="evicted" if report["evicted"] else "ok",
+        message=(
+            f"session_bytes={report['session_bytes']}; process_bytes={report['process_bytes']}; "
+            f"sessions={report['session_count']}; target_bytes={report['target_bytes']}; "
+            f"top={top}; evicted={','.join(report['evicted'])}"
+        ),
+        source="enforce_session_memory_budget",
+    )
+
+
 def load_shared_dataset_for_clinic():
     """
     If the clinic has a DatasetFileId stored in the settings sheet,
@@ -3864,10 +4549,7 @@ def load_shared_dataset_for_clinic():
             for idx, header in enumerate(headers)
         }
     except Exception:
-        sheet = get_settings_sheet()
-        records = sheet.get_all_records()
-        clinic_key = normalize_clinic_id_key(clinic_id)
-        rec = next((r for r in records if normalize_clinic_id_key(r.get("ClinicID", "")) == clinic_key), None)
+        rec = get_clinic_row(clinic_id)
     if not rec:
         return
 
@@ -3918,6 +4600,22 @@ def load_shared_dataset_for_clinic():
         else:
             return  # no shared dataset published yet
 
+    filename = rec.get(SHEET_COL_DATASET_FILE_NAME, "shared_dataset.csv") or "shared_dataset.csv"
+    dataset_updated_at = rec.get(SHEET_COL_DATASET_UPDATED_AT, "")
+    shared_df = shared_dataset_store().get(
+        normalize_clinic_id_key(clinic_id),
+        shared_dataset_version_key(file_id, dataset_updated_at),
+    )
+    if shared_df is not None:
+        require_clinic_dataset_file_access(clinic_id, file_id, current_file_id=file_id)
+        st.session_state["working_df"] = shared_df
+        st.session_state["data_version"] = st.session_state.get("data_version", 0) + 1
+        st.session_state["shared_dataset_loaded"] = True
+        st.session_state["shared_dataset_name"] = filename
+        st.session_state["shared_dataset_updated_at"] = dataset_updated_at
+        remember_shared_dataset_loaded_for_current_pointer(clinic_id)
+        return
+
     load_started = time.perf_counter()
     try:
         with busy_overlay("Loading saved clinic data", "Getting the latest saved data for this clinic."):
@@ -3925,14 +4623,13 @@ def load_shared_dataset_for_clinic():
 
             # Reuse your existing pipeline so schema normalization still happens
             # Filename is just for detect logic; use stored name if present, else default
-            filename = rec.get(SHEET_COL_DATASET_FILE_NAME, "shared_dataset.csv") or "shared_dataset.csv"
             df, pms_name, amount_col = process_file(file_bytes, filename)
 
-            st.session_state["working_df"] = sanitize_working_df(df)
+            st.session_state["working_df"] = share_working_df(clinic_id, sanitize_working_df(df), file_id, dataset_updated_at)
             st.session_state["data_version"] = st.session_state.get("data_version", 0) + 1  # invalidate downstream caches
             st.session_state["shared_dataset_loaded"] = True
             st.session_state["shared_dataset_name"] = filename
-            st.session_state["shared_dataset_updated_at"] = rec.get(SHEET_COL_DATASET_UPDATED_AT, "")
+            st.session_state["shared_dataset_updated_at"] = dataset_updated_at
             remember_shared_dataset_loaded_for_current_pointer(clinic_id)
             load_duration_ms = (time.perf_counter() - load_started) * 1000
             if load_duration_ms >= PERFORMANCE_TRACKER_SLOW_LOAD_MS:
@@ -4016,6 +4713,93 @@ def shared_dataset_reload_needed_for_clinic(clinic_id: str) -> bool:
         return False
     return st.session_state.get("_shared_dataset_loaded_for") != current_token
 
+def adaptive_drive_chunk_bytes(current_chunk_bytes: int, sent_bytes: int, elapsed_seconds: float) -> int:
+    """Size the next chunk to take about DRIVE_UPLOAD_TARGET_CHUNK_SECONDS at the measured throughput."""
+    current_chunk_bytes = max(int(current_chunk_bytes or 0), DRIVE_UPLOAD_CHUNK_ALIGNMENT_BYTES)
+    if sent_bytes <= 0 or elapsed_seconds <= 0:
+        return current_chunk_bytes
+    target = (sent_bytes / elapsed_seconds) * DRIVE_UPLOAD_TARGET_CHUNK_SECONDS
+    target = min(max(target, current_chunk_bytes / 2), current_chunk_bytes * 2)
+    target = min(target, DRIVE_UPLOAD_MAX_CHUNK_BYTES)
+    aligned = int(target) // DRIVE_UPLOAD_CHUNK_ALIGNMENT_BYTES * DRIVE_UPLOAD_CHUNK_ALIGNMENT_BYTES
+    return max(aligned, DRIVE_UPLOAD_CHUNK_ALIGNMENT_BYTES)
+
+
+def drive_upload_fingerprint(file_bytes: bytes, filename: str, folder_id: str, existing_file_id: str | None) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{filename}\0{folder_id}\0{existing_file_id or ''}\0".encode("utf-8"))
+    digest.update(file_bytes)
+    return digest.hexdigest()
+
+
+class DriveUploadSessionStore:
+    """
+    Resumable upload sessions keyed by publish operation ID.
+    A retry of the same operation with the same bytes resumes from the last committed chunk.
+    """
+
+    def __init__(self, ttl_seconds: float = DRIVE_UPLOAD_SESSION_TTL_SECONDS):
+        self.ttl_seconds = float(ttl_seconds)
+        self._lock = threading.Lock()
+        self._sessions: dict[str, dict] = {}
+
+    def get(self, operation_id: str, fingerprint: str) -> dict | None:
+        with self._lock:
+            session = self._sessions.get(operation_id)
+            if session is None:
+                return None
+            if session["fingerprint"] != fingerprint or time.monotonic() - session["updated_at"] > self.ttl_seconds:
+                self._sessions.pop(operation_id, None)
+                return None
+            return dict(session)
+
+    def save(self, operation_id: str, fingerprint: str, resumable_uri: str, bytes_committed: int, chunk_bytes: int) -> None:
+        if not operation_id or not resumable_uri:
+            return
+        with self._lock:
+            self._sessions[operation_id] = {
+                "fingerprint": fingerprint,
+                "resumable_uri": resumable_uri,
+                "bytes_committed": int(bytes_committed or 0),
+                "chunk_bytes": int(chunk_bytes),
+                "updated_at": time.monotonic(),
+            }
+
+    def drop(self, operation_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(operation_id, None)
+
+
+@st.cache_resource(show_spinner=False)
+def drive_upload_sessions() -> DriveUploadSessionStore:
+    return DriveUploadSessionStore()
+
+
+def drive_upload_error_is_resumable(error: Exception) -> bool:
+    if isinstance(error, HttpError):
+        return getattr(getattr(error, "resp", None), "status", None) in (429, 500, 502, 503, 504)
+    return isinstance(error, OSError)
+
+
+def drive_upload_session_status(http, resumable_uri: str, total_bytes: int) -> tuple[int, dict | None]:
+    """Ask Drive how much of a resumable upload it holds: (bytes committed, file resource once finished)."""
+    resp, content = http.request(
+        resumable_uri,
+        method="PUT",
+        headers={"Content-Length": "0", "Content-Range": f"bytes */{total_bytes}"},
+    )
+    status = int(getattr(resp, "status", 0) or 0)
+    if status in (200, 201):
+        if isinstance(content, bytes):
+            content = content.decode("utf-8")
+        return total_bytes, json.loads(content or "{}")
+    if status != 308:
+        raise HttpError(resp, content, uri=resumable_uri)
+    committed_range = str(resp.get("range", "") or "")
+    committed = int(committed_range.rsplit("-", 1)[1]) + 1 if "-" in committed_range else 0
+    return committed, None
+
+
 def drive_upsert_csv_bytes(
     file_bytes: bytes,
     filename: str,
@@ -4023,11 +4807,15 @@ def drive_upsert_csv_bytes(
     existing_file_id: str | None,
     clinic_id: str | None = None,
     timeout_seconds: float | int | None = DRIVE_TRANSFER_TIMEOUT_SECONDS,
+    on_progress=None,
+    operation_id: str | None = None,
 ) -> str:
     """
     If existing_file_id is provided -> update that file in-place.
     Else -> create a new file in folder_id.
     Uses resumable upload to reduce BrokenPipe issues.
+    on_progress(bytes_done, bytes_total) is called after each uploaded chunk.
+    With an operation_id, the upload session is kept so a retry resumes from the last committed chunk.
     Returns the fileId.
     """
     if clinic_id is not None:
@@ -4035,35 +4823,93 @@ def drive_upsert_csv_bytes(
         if existing_file_id:
             require_clinic_dataset_file_access(clinic_id, existing_file_id)
     service = get_drive_service()
-    media = MediaIoBaseUpload(BytesIO(file_bytes), mimetype="text/csv", resumable=True)
-
-    if existing_file_id:
-        update_body: dict[str, object] = {}
-        if clinic_id is not None:
-            update_body["appProperties"] = {"clinic_id": require_authenticated_tenant_access(clinic_id)}
-        req = service.files().update(
-            fileId=existing_file_id,
-            body=update_body,
-            media_body=media,
-            supportsAllDrives=True,
-        )
-    else:
-        create_body: dict[str, object] = {"name": filename, "parents": [folder_id]}
-        if clinic_id is not None:
-            create_body["appProperties"] = {"clinic_id": require_authenticated_tenant_access(clinic_id)}
-        req = service.files().create(
-            body=create_body,
-            media_body=media,
-            fields="id",
-            supportsAllDrives=True,
-        )
-
+    sessions = drive_upload_sessions() if operation_id else None
+    fingerprint = drive_upload_fingerprint(file_bytes, filename, folder_id, existing_file_id) if sessions else ""
+    saved_session = sessions.get(operation_id, fingerprint) if sessions else None
+    chunk_bytes = int(saved_session["chunk_bytes"]) if saved_session else DRIVE_UPLOAD_INITIAL_CHUNK_BYTES
+    resumable_uri = saved_session["resumable_uri"] if saved_session else None
+    committed = int(saved_session["bytes_committed"]) if saved_session else 0
+
+    def upload_request():
+        # A fresh request per chunk size; an open session continues from the committed offset.
+        media = MediaIoBaseUpload(BytesIO(file_bytes), mimetype="text/csv", chunksize=chunk_bytes, resumable=True)
+        if existing_file_id:
+            update_body: dict[str, object] = {}
+            if clinic_id is not None:
+                update_body["appProperties"] = {"clinic_id": require_authenticated_tenant_access(clinic_id)}
+            request = service.files().update(
+                fileId=existing_file_id,
+                body=update_body,
+                media_body=media,
+                supportsAllDrives=True,
+            )
+        else:
+            create_body: dict[str, object] = {"name": filename, "parents": [folder_id]}
+            if clinic_id is not None:
+                create_body["appProperties"] = {"clinic_id": require_authenticated_tenant_access(clinic_id)}
+            request = service.files().create(
+                body=create_body,
+                media_body=media,
+                fields="id",
+                supportsAllDrives=True,
+            )
+        if resumable_uri:
+            request.resumable_uri = resumable_uri
+            request.resumable_progress = committed
+        return request
+
+    def remember_session() -> None:
+        if sessions:
+            sessions.save(operation_id, fingerprint, resumable_uri, committed, chunk_bytes)
+
+    req = upload_request()
+    # Ask Drive which bytes it already holds before sending the next chunk.
+    check_session = bool(resumable_uri)
     resp = None
+    resume_attempts = 0
     started_at = time.perf_counter()
     try:
         while resp is None:
             raise_if_drive_transfer_timed_out(started_at, timeout_seconds, "Drive upload")
-            status, resp = req.next_chunk()
+            progress_before = committed
+            chunk_started = time.monotonic()
+            try:
+                if check_session:
+                    committed, resp = drive_upload_session_status(req.http, resumable_uri, len(file_bytes))
+                    check_session = False
+                    req = upload_request()
+                    continue
+                status, resp = req.next_chunk()
+            except Exception as e:
+                resumable_uri = getattr(req, "resumable_uri", None) or resumable_uri
+                if not drive_upload_error_is_resumable(e):
+                    if sessions:
+                        sessions.drop(operation_id)
+                    raise
+                remember_session()
+                if resume_attempts >= DRIVE_UPLOAD_MAX_RESUME_ATTEMPTS:
+                    raise
+                resume_attempts += 1
+                check_session = bool(resumable_uri)
+                if not check_session:
+                    req = upload_request()
+                time.sleep(min(2 ** resume_attempts, 8))
+                continue
+            resumable_uri = getattr(req, "resumable_uri", None) or resumable_uri
+            committed = len(file_bytes) if resp is not None else int(getattr(req, "resumable_progress", 0) or 0)
+            next_chunk_bytes = adaptive_drive_chunk_bytes(
+                chunk_bytes,
+                committed - progress_before,
+                time.monotonic() - chunk_started,
+            )
+            if next_chunk_bytes != chunk_bytes and resp is None:
+                chunk_bytes = next_chunk_bytes
+                req = upload_request()
+            if resp is None:
+                remember_session()
+            if on_progress is not None:
+                bytes_done = len(file_bytes) if resp is not None else int(getattr(status, "resumable_progress", 0) or 0)
+                on_progress(bytes_done, len(file_bytes))
             raise_if_drive_transfer_timed_out(started_at, timeout_seconds, "Drive upload")
     except DriveTransferTimeoutError as e:
         record_error_tracker_event(
@@ -4074,6 +4920,8 @@ def drive_upsert_csv_bytes(
         )
         raise
 
+    if sessions:
+        sessions.drop(operation_id)
     return resp["id"]
 
 def drive_check_folder_access(folder_id: str):
@@ -4167,7 +5015,7 @@ def update_clinic_dataset_pointer(clinic_id: str, file_id: str, filename: str):
     }.items():
         if header in headers:
             current_row[headers.index(header)] = value
-    st.session_state["_settings_row_cache"] = {
+    active_session_state()["_settings_row_cache"] = {
         "clinic_key": normalize_clinic_id_key(clinic_id),
         "headers": list(headers),
         "row_idx": row_idx,
@@ -4206,45 +5054,452 @@ def raise_if_google_sheets_timed_out(started_at: float, timeout_seconds: float |
         )
 
 
-def _gspread_retry(fn, *args, timeout_seconds: float | int | None = SHEETS_OPERATION_TIMEOUT_SECONDS, **kwargs):
+_sheets_request_priority: ContextVar[str] = ContextVar("sheets_request_priority", default=SHEETS_PRIORITY_INTERACTIVE)
+
+
+@contextmanager
+def sheets_request_priority(priority: str):
+    token = _sheets_request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _sheets_request_priority.reset(token)
+
+
+class SheetsRequestScheduler:
     """
-    Retries common transient Google Sheets errors (429/500/502/503/504).
-    Keeps other errors as-is so you still see real permission/config issues.
+    Process-wide token bucket for Google Sheets calls.
+    Interactive reads/writes are served ahead of telemetry appends, quota errors pause
+    every session together, and identical concurrent reads share one request. Reads only
+    share a request started after the last write to their worksheet (read-your-own-write).
     """
-    max_tries = 3
-    started_at = time.perf_counter()
-    for attempt in range(max_tries):
-        raise_if_google_sheets_timed_out(started_at, timeout_seconds, "Google Sheets operation")
-        try:
-            result = fn(*args, **kwargs)
-            raise_if_google_sheets_timed_out(started_at, timeout_seconds, "Google Sheets operation")
-            return result
-        except APIError as e:
-            raise_if_google_sheets_timed_out(started_at, timeout_seconds, "Google Sheets operation")
-            status = gspread_api_error_status(e)
 
-            # Retry only transient/quota-ish errors
-            if status in (429, 500, 502, 503, 504):
-                sleep = min(4, (0.75 * (2 ** attempt)) + random.random())
-                if timeout_seconds is not None:
-                    remaining = float(timeout_seconds) - (time.perf_counter() - started_at)
-                    if remaining <= 0:
-                        raise GoogleSheetsOperationTimeoutError(
-                            "Google Sheets operation timed out before the next retry. Please try again."
-                        ) from e
-                    sleep = min(sleep, remaining)
-                time.sleep(sleep)
-                raise_if_google_sheets_timed_out(started_at, timeout_seconds, "Google Sheets operation")
-                continue
+    def __init__(
+        self,
+        requests_per_minute: float = SHEETS_QUOTA_REQUESTS_PER_MINUTE,
+        burst: int = SHEETS_QUOTA_BURST_REQUESTS,
+        interactive_reserve: int = SHEETS_INTERACTIVE_TOKEN_RESERVE,
+    ):
+        self.rate_per_second = max(0.01, float(requests_per_minute) / 60.0)
+        self.capacity = max(1.0, float(burst))
+        self.interactive_reserve = max(0.0, min(float(interactive_reserve), self.capacity - 1))
+        self._tokens = self.capacity
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._throttle_streak = 0
+        self._condition = threading.Condition()
+        self._waiting = {SHEETS_PRIORITY_INTERACTIVE: 0, SHEETS_PRIORITY_TELEMETRY: 0}
+        self._inflight: dict[tuple, dict] = {}
+        self._write_generations: dict[tuple, int] = {}
+        self._metrics = {
+            "granted": 0,
+            "waited": 0,
+            "wait_seconds_total": 0.0,
+            "wait_seconds_max": 0.0,
+            "queue_depth_max": 0,
+            "coalesced_reads": 0,
+            "throttled": 0,
+            "acquire_timeouts": 0,
+        }
 
-            # Not transient -> raise (likely 403 perms, 400 bad request, etc.)
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._refilled_at)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+        self._refilled_at = now
+
+    def _can_take(self, priority: str) -> bool:
+        if priority == SHEETS_PRIORITY_TELEMETRY:
+            if self._waiting[SHEETS_PRIORITY_INTERACTIVE]:
+                return False
+            return self._tokens >= 1 + self.interactive_reserve
+        return self._tokens >= 1
+
+    def acquire(self, priority: str = SHEETS_PRIORITY_INTERACTIVE, timeout_seconds: float | int | None = None) -> bool:
+        priority = priority if priority in self._waiting else SHEETS_PRIORITY_INTERACTIVE
+        started = time.monotonic()
+        deadline = None if timeout_seconds is None else started + float(timeout_seconds)
+        with self._condition:
+            queued = False
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if now >= self._paused_until and self._can_take(priority):
+                        self._tokens -= 1
+                        waited = now - started
+                        self._metrics["granted"] += 1
+                        if queued:
+                            self._metrics["waited"] += 1
+                            self._metrics["wait_seconds_total"] += waited
+                            self._metrics["wait_seconds_max"] = max(self._metrics["wait_seconds_max"], waited)
+                        return True
+                    if deadline is not None and now >= deadline:
+                        self._metrics["acquire_timeouts"] += 1
+                        return False
+                    if not queued:
+                        queued = True
+                        self._waiting[priority] += 1
+                        self._metrics["queue_depth_max"] = max(self._metrics["queue_depth_max"], sum(self._waiting.values()))
+                    needed = (1 + (self.interactive_reserve if priority == SHEETS_PRIORITY_TELEMETRY else 0)) - self._tokens
+                    wait_for = max(self._paused_until - now, needed / self.rate_per_second, 0.01)
+                    if deadline is not None:
+                        wait_for = min(wait_for, max(0.0, deadline - now))
+                    self._condition.wait(wait_for)
+            finally:
+                if queued:
+                    self._waiting[priority] -= 1
+                    self._condition.notify_all()
+
+    def note_success(self) -> None:
+        if self._throttle_streak:
+            with self._condition:
+                self._throttle_streak = 0
+
+    def note_throttled(self) -> float:
+        """Pause the whole process after a quota error so sessions do not retry in lockstep."""
+        with self._condition:
+            self._throttle_streak += 1
+            self._metrics["throttled"] += 1
+            backoff = min(
+                SHEETS_THROTTLE_MAX_BACKOFF_SECONDS,
+                SHEETS_THROTTLE_BACKOFF_SECONDS * (2 ** (self._throttle_streak - 1)),
+            ) + random.random()
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + backoff)
+            self._tokens = 0.0
+            self._refilled_at = max(now, self._paused_until)
+            self._condition.notify_all()
+            return backoff
+
+    def write_generation(self, scopes: tuple) -> tuple[int, ...]:
+        with self._condition:
+            return tuple(self._write_generations.get(scope, 0) for scope in scopes)
+
+    def note_write(self, scope: tuple) -> None:
+        with self._condition:
+            self._write_generations[scope] = self._write_generations.get(scope, 0) + 1
+
+    def run_coalesced(self, key: tuple, call, timeout_seconds: float | int | None = None):
+        with self._condition:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = {"done": threading.Event(), "result": None, "error": None, "followers": 0}
+                self._inflight[key] = flight
+            else:
+                flight["followers"] += 1
+                self._metrics["coalesced_reads"] += 1
+
+        if not leader:
+            if not flight["done"].wait(None if timeout_seconds is None else float(timeout_seconds)):
+                raise GoogleSheetsOperationTimeoutError("Google Sheets operation timed out. Please try again.")
+            if flight["error"] is not None:
+                raise flight["error"]
+            return copy.deepcopy(flight["result"])
+
+        try:
+            flight["result"] = call()
+        except BaseException as e:
+            flight["error"] = e
             raise
+        finally:
+            with self._condition:
+                self._inflight.pop(key, None)
+                followers = flight["followers"]
+            flight["done"].set()
+        return copy.deepcopy(flight["result"]) if followers else flight["result"]
+
+    def metrics(self) -> dict:
+        with self._condition:
+            self._refill(time.monotonic())
+            waited = self._metrics["waited"]
+            return {
+                **self._metrics,
+                "queue_depth": sum(self._waiting.values()),
+                "queue_depth_interactive": self._waiting[SHEETS_PRIORITY_INTERACTIVE],
+                "queue_depth_telemetry": self._waiting[SHEETS_PRIORITY_TELEMETRY],
+                "wait_seconds_avg": (self._metrics["wait_seconds_total"] / waited) if waited else 0.0,
+                "tokens_available": round(self._tokens, 2),
+                "inflight_reads": len(self._inflight),
+            }
 
-    # If we exhausted retries, raise last error
-    raise_if_google_sheets_timed_out(started_at, timeout_seconds, "Google Sheets operation")
-    result = fn(*args, **kwargs)
+
+@st.cache_resource(show_spinner=False)
+def sheets_request_scheduler() -> SheetsRequestScheduler:
+    return SheetsRequestScheduler()
+
+
+def sheets_scheduler_metrics() -> dict:
+    return sheets_request_scheduler().metrics()
+
+
+def sheets_write_generation_scopes(owner) -> tuple:
+    """Scopes a call's writes are counted under: its own worksheet (or spreadsheet) first, then the spreadsheet."""
+    spreadsheet_id = str(getattr(owner, "spreadsheet_id", "") or "")
+    if spreadsheet_id:
+        return (settings_sheet_index_key(owner), ("spreadsheet", spreadsheet_id))
+    if isinstance(owner, gspread.Spreadsheet):
+        return (("spreadsheet", str(owner.id)),)
+    return (settings_sheet_index_key(owner),)
+
+
+def note_sheets_write(fn) -> None:
+    """Move the write generation of the worksheet a non-read call acted on, so later reads start a new flight."""
+    owner = getattr(fn, "__self__", None)
+    if owner is None or getattr(fn, "__name__", "") in SHEETS_COALESCED_READ_METHODS:
+        return
+    try:
+        sheets_request_scheduler().note_write(sheets_write_generation_scopes(owner)[0])
+    except Exception:
+        pass
+
+
+def sheets_read_coalesce_key(fn, args: tuple, kwargs: dict) -> tuple | None:
+    name = getattr(fn, "__name__", "")
+    owner = getattr(fn, "__self__", None)
+    if owner is None or name not in SHEETS_COALESCED_READ_METHODS:
+        return None
+    try:
+        generation = sheets_request_scheduler().write_generation(sheets_write_generation_scopes(owner))
+        return (settings_sheet_index_key(owner), generation, name, repr(args), repr(sorted(kwargs.items())))
+    except Exception:
+        return None
+
+
+def _gspread_retry(fn, *args, timeout_seconds: float | int | None = SHEETS_OPERATION_TIMEOUT_SECONDS, **kwargs):
+    """
+    Retries common transient Google Sheets errors (429/500/502/503/504).
+    Keeps other errors as-is so you still see real permission/config issues.
+    Calls are paced by the shared quota scheduler; identical concurrent reads are coalesced.
+    """
+    coalesce_key = sheets_read_coalesce_key(fn, args, kwargs)
+    if coalesce_key is not None:
+        return sheets_request_scheduler().run_coalesced(
+            coalesce_key,
+            lambda: _scheduled_gspread_call(fn, args, kwargs, timeout_seconds),
+            timeout_seconds=timeout_seconds,
+        )
+    try:
+        return _scheduled_gspread_call(fn, args, kwargs, timeout_seconds)
+    finally:
+        # After the call, even a failed one: a write may have landed before the error came back.
+        note_sheets_write(fn)
+        invalidate_sheets_batch_reads_for_write(fn)
+
+
+def _acquire_sheets_quota(scheduler: SheetsRequestScheduler, timeout_seconds: float | int | None) -> None:
+    if not scheduler.acquire(_sheets_request_priority.get(), timeout_seconds):
+        raise GoogleSheetsOperationTimeoutError(
+            "Google Sheets is busy right now and the request timed out. Please try again."
+        )
+
+
+def _scheduled_gspread_call(fn, args: tuple, kwargs: dict, timeout_seconds: float | int | None):
+    scheduler = sheets_request_scheduler()
+    max_tries = 3
+    started_at = time.perf_counter()
+    for attempt in range(max_tries):
+        raise_if_google_sheets_timed_out(started_at, timeout_seconds, "Google Sheets operation")
+        _acquire_sheets_quota(scheduler, timeout_seconds)
+        try:
+            result = fn(*args, **kwargs)
+            raise_if_google_sheets_timed_out(started_at, timeout_seconds, "Google Sheets operation")
+            scheduler.note_success()
+            return result
+        except APIError as e:
+            raise_if_google_sheets_timed_out(started_at, timeout_seconds, "Google Sheets operation")
+            status = gspread_api_error_status(e)
+
+            if status == 429:
+                # Quota errors pause the shared bucket; the next acquire waits for it.
+                scheduler.note_throttled()
+                continue
+
+            # Retry only transient server errors
+            if status in (500, 502, 503, 504):
+                sleep = min(4, (0.75 * (2 ** attempt)) + random.random())
+                if timeout_seconds is not None:
+                    remaining = float(timeout_seconds) - (time.perf_counter() - started_at)
+                    if remaining <= 0:
+                        raise GoogleSheetsOperationTimeoutError(
+                            "Google Sheets operation timed out before the next retry. Please try again."
+                        ) from e
+                    sleep = min(sleep, remaining)
+                time.sleep(sleep)
+                raise_if_google_sheets_timed_out(started_at, timeout_seconds, "Google Sheets operation")
+                continue
+
+            # Not transient -> raise (likely 403 perms, 400 bad request, etc.)
+            raise
+
+    # If we exhausted retries, raise last error
+    raise_if_google_sheets_timed_out(started_at, timeout_seconds, "Google Sheets operation")
+    _acquire_sheets_quota(scheduler, timeout_seconds)
+    result = fn(*args, **kwargs)
     raise_if_google_sheets_timed_out(started_at, timeout_seconds, "Google Sheets operation")
     return result
+
+def sheets_a1_range(title: str, a1: str = "") -> str:
+    quoted = "'" + str(title or "").replace("'", "''") + "'"
+    return f"{quoted}!{a1}" if a1 else quoted
+
+
+def _rectangular_values(values) -> list[list[str]]:
+    rows = [[("" if cell is None else cell) for cell in (row or [])] for row in (values or [])]
+    width = max((len(row) for row in rows), default=0)
+    return [row + [""] * (width - len(row)) for row in rows]
+
+
+class SheetsBatchReader:
+    """
+    Per-rerun memo of worksheet ranges for one spreadsheet.
+    Ranges queued with want() are fetched together with a single values.batchGet.
+    """
+
+    def __init__(self, spreadsheet):
+        self.spreadsheet = spreadsheet
+        self._pending: list[str] = []
+        self._values: dict[str, list[list[str]]] = {}
+        self.requests_made = 0
+
+    def want(self, *range_names: str) -> None:
+        for range_name in range_names:
+            if range_name and range_name not in self._values and range_name not in self._pending:
+                self._pending.append(range_name)
+
+    def fetch(self) -> None:
+        if not self._pending:
+            return
+        ranges = list(self._pending)
+        self._pending = []
+        response = _gspread_retry(self.spreadsheet.values_batch_get, ranges) or {}
+        self.requests_made += 1
+        value_ranges = response.get("valueRanges", []) if isinstance(response, dict) else []
+        for range_name, value_range in zip(ranges, value_ranges):
+            self._values[range_name] = _rectangular_values((value_range or {}).get("values", []))
+
+    def values(self, range_name: str) -> list[list[str]]:
+        if range_name not in self._values:
+            self.want(range_name)
+            self.fetch()
+        return [list(row) for row in self._values.get(range_name, [])]
+
+    def row(self, title: str, row_idx: int) -> list[str]:
+        values = self.values(sheets_a1_range(title, f"{int(row_idx)}:{int(row_idx)}"))
+        row_values = list(values[0]) if values else []
+        while row_values and row_values[-1] == "":
+            row_values.pop()
+        return row_values
+
+    def table(self, title: str) -> list[list[str]]:
+        return self.values(sheets_a1_range(title))
+
+    def invalidate(self, title: str | None = None) -> None:
+        if title is None:
+            self._values.clear()
+            self._pending = []
+            return
+        prefix = sheets_a1_range(title)
+        for range_name in [name for name in self._values if name == prefix or name.startswith(prefix + "!")]:
+            self._values.pop(range_name, None)
+
+
+def begin_sheets_read_batch() -> None:
+    """Start a fresh read memo for this script run."""
+    st.session_state.pop(SHEETS_BATCH_READS_STATE_KEY, None)
+
+
+def is_fragment_rerun() -> bool:
+    ctx = get_script_run_ctx() if get_script_run_ctx is not None else None
+    return bool(getattr(ctx, "fragment_ids_this_run", None))
+
+
+def begin_fragment_sheets_read_batch() -> None:
+    """Fragment reruns skip the top of the script, so they start their own read memo."""
+    if is_fragment_rerun():
+        begin_sheets_read_batch()
+
+
+def sheets_batch_reader(spreadsheet) -> SheetsBatchReader:
+    readers = active_session_state().setdefault(SHEETS_BATCH_READS_STATE_KEY, {})
+    key = str(getattr(spreadsheet, "id", "") or id(spreadsheet))
+    reader = readers.get(key)
+    if not isinstance(reader, SheetsBatchReader):
+        reader = SheetsBatchReader(spreadsheet)
+        readers[key] = reader
+    return reader
+
+
+def invalidate_sheets_batch_reads(title: str | None = None) -> None:
+    try:
+        readers = active_session_state().get(SHEETS_BATCH_READS_STATE_KEY)
+    except Exception:
+        return
+    for reader in (readers or {}).values():
+        if isinstance(reader, SheetsBatchReader):
+            reader.invalidate(title)
+
+
+def invalidate_sheets_batch_reads_for_write(fn) -> None:
+    owner = getattr(fn, "__self__", None)
+    if owner is None or getattr(fn, "__name__", "") in SHEETS_COALESCED_READ_METHODS:
+        return
+    invalidate_sheets_batch_reads(owner.title if isinstance(owner, gspread.Worksheet) else None)
+
+
+def worksheet_batch_row(worksheet, row_idx: int) -> list[str]:
+    if isinstance(worksheet, gspread.Worksheet):
+        return sheets_batch_reader(worksheet.spreadsheet).row(worksheet.title, row_idx)
+    return list(_gspread_retry(worksheet.row_values, row_idx) or [])
+
+
+def worksheet_batch_values(worksheet) -> list[list[str]]:
+    if isinstance(worksheet, gspread.Worksheet):
+        return sheets_batch_reader(worksheet.spreadsheet).table(worksheet.title)
+    return _gspread_retry(worksheet.get_all_values) or []
+
+
+def prefetch_session_bootstrap_reads(clinic_id: str) -> int:
+    """
+    Queue the settings row, tracker headers and action tracker this render will read,
+    then fetch them with one values.batchGet. Returns the number of ranges requested.
+    """
+    clinic_id = str(clinic_id or "").strip()
+    if not clinic_id:
+        return 0
+    try:
+        sheet = get_settings_sheet()
+        if not isinstance(sheet, gspread.Worksheet):
+            return 0
+        reader = sheets_batch_reader(sheet.spreadsheet)
+        clinic_key = normalize_clinic_id_key(clinic_id)
+        ranges = []
+        if "rules" not in st.session_state or st.session_state.get("working_df") is None:
+            cached = st.session_state.get("_settings_row_cache")
+            row_idx = None
+            if isinstance(cached, dict) and cached.get("clinic_key") == clinic_key:
+                row_idx = int(cached.get("row_idx") or 0) or None
+            else:
+                hit = settings_directory_index().lookup(settings_sheet_index_key(sheet), "clinic", clinic_key)
+                row_idx = hit[1] if hit else None
+            if row_idx:
+                ranges.append(sheets_a1_range(sheet.title, f"{row_idx}:{row_idx}"))
+        tracker_cache = st.session_state.get("_tracker_sheet_cache", {}) or {}
+        for title, headers in TRACKER_SHEET_DEFINITIONS:
+            if (str(title), tuple(headers)) not in tracker_cache:
+                ranges.append(sheets_a1_range(title, "1:1"))
+        action_records_cached = isinstance(st.session_state.get("_action_tracker_records_cache"), dict)
+        if not action_records_cached and (
+            "rules" not in st.session_state
+            or st.session_state.get("_action_tracker_pending_load_for") == clinic_key
+        ):
+            ranges.append(sheets_a1_range(ACTION_TRACKER_WORKSHEET))
+        reader.want(*ranges)
+        reader.fetch()
+        return len(ranges)
+    except Exception:
+        return 0
+
 
 def get_existing_dataset_pointer(clinic_id: str) -> tuple[str, str]:
     """
@@ -4651,7 +5906,7 @@ def dataset_publish_metrics_message(
     )
 
 
-def publish_dataset_for_clinic(
+def run_dataset_publish_stages(
     clinic_id: str,
     new_df: pd.DataFrame,
     datasets_folder_id: str,
@@ -4660,21 +5915,25 @@ def publish_dataset_for_clinic(
     existing_name: str | None = None,
     existing_df: pd.DataFrame | None = None,
     allow_publish_without_existing_dataset: bool = False,
-) -> tuple[pd.DataFrame, str, str]:
+    operation_id: str | None = None,
+    progress=None,
+    transfer_timeout_seconds: float | int | None = DRIVE_TRANSFER_TIMEOUT_SECONDS,
+) -> tuple[pd.DataFrame, str, str, str]:
     """
-    Save an upload for the whole clinic:
-      1) fetch existing dataset pointer from settings sheet
-      2) load existing shared dataset from Drive (if any)
-      3) append new dates, or replace the uploaded date range when confirmed
-      4) upload merged CSV to Drive (new file each publish)
-      5) update dataset pointer columns in settings sheet
+    Run the publish stages without touching session state.
+    progress(stage, bytes_done=None, bytes_total=None) is called as each stage starts.
 
     Returns:
-      (merged_df, new_file_id, out_name)
+      (merged_df, new_file_id, out_name, dataset_updated_at)
     """
+    def report(stage: str, bytes_done: int | None = None, bytes_total: int | None = None) -> None:
+        if progress is not None:
+            progress(stage, bytes_done=bytes_done, bytes_total=bytes_total)
+
     clinic_id = require_authenticated_tenant_access(clinic_id)
 
     # 1) Get current pointer (if any)
+    report("load_existing")
     if existing_file_id is None or existing_name is None:
         existing_file_id, existing_name = get_existing_dataset_pointer(clinic_id)
     if existing_file_id:
@@ -4690,10 +5949,12 @@ def publish_dataset_for_clinic(
                     "Could not load the saved clinic data, so this upload was not saved. "
                     "Please try again before replacing clinic data."
                 ) from e
-            st.warning("Could not load the saved clinic data, so this upload will be saved as a new copy.")
+            if progress is None:
+                st.warning("Could not load the saved clinic data, so this upload will be saved as a new copy.")
             existing_df = None
 
     # 3) Merge according to the clinic update rule
+    report("merge")
     merged_df = merge_dataset_update(
         existing_df=existing_df,
         new_df=new_df,
@@ -4701,6 +5962,7 @@ def publish_dataset_for_clinic(
     )
 
     # 4) Upload merged dataset to Drive
+    report("serialize")
     out_name  = f"{clinic_id}_shared_dataset.csv"
     out_bytes = dataframe_to_csv_bytes(merged_df)
     drive_upload_message = dataset_publish_metrics_message(
@@ -4711,7 +5973,7 @@ def publish_dataset_for_clinic(
         out_bytes,
     )
 
-    operation_id = make_dataset_publish_operation_id()
+    operation_id = operation_id or make_dataset_publish_operation_id()
     record_dataset_tracker_event(
         "dataset_publish",
         "started",
@@ -4728,6 +5990,10 @@ def publish_dataset_for_clinic(
     new_file_id = ""
     stage = "drive_upload"
     try:
+        report("drive_upload", bytes_done=0, bytes_total=len(out_bytes))
+        upload_kwargs = {}
+        if progress is not None:
+            upload_kwargs["on_progress"] = lambda done, total: report("drive_upload", bytes_done=done, bytes_total=total)
         # ✅ Update existing file if it exists; otherwise create first time
         new_file_id = drive_upsert_csv_bytes(
             file_bytes=out_bytes,
@@ -4735,10 +6001,14 @@ def publish_dataset_for_clinic(
             folder_id=datasets_folder_id,
             existing_file_id=(existing_file_id or None),
             clinic_id=clinic_id,
+            timeout_seconds=transfer_timeout_seconds,
+            operation_id=operation_id,
+            **upload_kwargs,
         )
 
         # ✅ Only update pointer after upload success
         stage = "settings_pointer_update"
+        report("settings_pointer_update", bytes_done=len(out_bytes), bytes_total=len(out_bytes))
         dataset_updated_at = update_clinic_dataset_pointer(clinic_id, new_file_id, out_name)
     except Exception as e:
         cleanup_message = ""
@@ -4777,12 +6047,265 @@ def publish_dataset_for_clinic(
         message=dataset_publish_metrics_message("complete", existing_df, new_df, merged_df, out_bytes),
         source="publish_dataset_for_clinic",
     )
+    report("complete", bytes_done=len(out_bytes), bytes_total=len(out_bytes))
+    return merged_df, new_file_id, out_name, dataset_updated_at
+
+
+def remember_published_dataset(clinic_id: str, dataset_updated_at: str) -> None:
     st.session_state["shared_dataset_updated_at"] = dataset_updated_at
     st.session_state.pop("_shared_dataset_load_attempted_for", None)
     remember_shared_dataset_loaded_for_current_pointer(clinic_id)
 
 
+def publish_dataset_for_clinic(
+    clinic_id: str,
+    new_df: pd.DataFrame,
+    datasets_folder_id: str,
+    replace_overlapping_dates: bool = False,
+    existing_file_id: str | None = None,
+    existing_name: str | None = None,
+    existing_df: pd.DataFrame | None = None,
+    allow_publish_without_existing_dataset: bool = False,
+) -> tuple[pd.DataFrame, str, str]:
+    """
+    Save an upload for the whole clinic:
+      1) fetch existing dataset pointer from settings sheet
+      2) load existing shared dataset from Drive (if any)
+      3) append new dates, or replace the uploaded date range when confirmed
+      4) upload merged CSV to Drive (new file each publish)
+      5) update dataset pointer columns in settings sheet
+
+    Returns:
+      (merged_df, new_file_id, out_name)
+    """
+    merged_df, new_file_id, out_name, dataset_updated_at = run_dataset_publish_stages(
+        clinic_id,
+        new_df,
+        datasets_folder_id,
+        replace_overlapping_dates=replace_overlapping_dates,
+        existing_file_id=existing_file_id,
+        existing_name=existing_name,
+        existing_df=existing_df,
+        allow_publish_without_existing_dataset=allow_publish_without_existing_dataset,
+    )
+    remember_published_dataset(require_authenticated_tenant_access(clinic_id), dataset_updated_at)
     return merged_df, new_file_id, out_name
+
+
+class DatasetPublishJob:
+    """State of one background dataset publish, shared between the worker and UI polls."""
+
+    ACTIVE_STATUSES = ("queued", "running")
+
+    def __init__(
+        self,
+        clinic_key: str,
+        owner: str = "",
+        upload_key: str = "",
+        context: dict | None = None,
+        job_id: str = "",
+    ):
+        self.job_id = job_id or make_dataset_publish_operation_id()
+        self.clinic_key = clinic_key
+        self.owner = owner
+        self.upload_key = upload_key
+        self.context = dict(context or {})
+        self.status = "queued"
+        self.stage = "queued"
+        self.bytes_done = 0
+        self.bytes_total = 0
+        self.result = None
+        self.error: Exception | None = None
+        self.started_at = time.monotonic()
+        self.finished_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return self.status in self.ACTIVE_STATUSES
+
+    def progress(self, stage: str, bytes_done: int | None = None, bytes_total: int | None = None) -> bool:
+        """Update progress; returns True when the stage changed."""
+        with self._lock:
+            stage_changed = stage != self.stage
+            self.status = "running"
+            self.stage = stage
+            if bytes_total is not None:
+                self.bytes_total = int(bytes_total)
+            if bytes_done is not None:
+                self.bytes_done = int(bytes_done)
+            return stage_changed
+
+    def finish(self, result=None, error: Exception | None = None) -> None:
+        with self._lock:
+            self.result = result
+            self.error = error
+            self.status = "error" if error is not None else "success"
+            self.finished_at = time.monotonic()
+
+    def elapsed_ms(self) -> float:
+        return ((self.finished_at or time.monotonic()) - self.started_at) * 1000
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "job_id": self.job_id,
+                "status": self.status,
+                "stage": self.stage,
+                "bytes_done": self.bytes_done,
+                "bytes_total": self.bytes_total,
+                "elapsed_ms": self.elapsed_ms(),
+            }
+
+
+class DatasetPublishJobRegistry:
+    """
+    Process-wide publish jobs keyed by clinic; at most one in flight per clinic.
+    Workers run without a script context; finished jobs nobody collects expire after result_ttl_seconds.
+    """
+
+    def __init__(self, result_ttl_seconds: float = DATASET_PUBLISH_JOB_RESULT_TTL_SECONDS):
+        self._lock = threading.Lock()
+        self._jobs: dict[str, DatasetPublishJob] = {}
+        self.result_ttl_seconds = result_ttl_seconds
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for clinic_key, job in list(self._jobs.items()):
+            if job.finished_at is not None and now - job.finished_at > self.result_ttl_seconds:
+                self._jobs.pop(clinic_key, None)
+
+    def submit(
+        self,
+        clinic_key: str,
+        run,
+        owner: str = "",
+        upload_key: str = "",
+        context: dict | None = None,
+        job_id: str = "",
+    ) -> tuple[DatasetPublishJob, bool]:
+        with self._lock:
+            self._prune()
+            existing = self._jobs.get(clinic_key)
+            if existing is not None and (
+                existing.active or (existing.owner == owner and existing.upload_key == upload_key)
+            ):
+                return existing, False
+            job = DatasetPublishJob(clinic_key, owner=owner, upload_key=upload_key, context=context, job_id=job_id)
+            self._jobs[clinic_key] = job
+        worker = threading.Thread(
+            target=self._run,
+            args=(job, run),
+            name=f"dataset-publish-{job.job_id}",
+            daemon=True,
+        )
+        worker.start()
+        return job, True
+
+    @staticmethod
+    def _run(job: DatasetPublishJob, run) -> None:
+        try:
+            job.finish(result=run(job))
+        except Exception as e:
+            job.finish(error=e)
+
+    def get(self, clinic_key: str) -> DatasetPublishJob | None:
+        with self._lock:
+            self._prune()
+            return self._jobs.get(clinic_key)
+
+    def collect(self, clinic_key: str, job_id: str) -> DatasetPublishJob | None:
+        """Remove and return a finished job so its result is applied only once."""
+        with self._lock:
+            self._prune()
+            job = self._jobs.get(clinic_key)
+            if job is None or job.job_id != job_id or job.active:
+                return None
+            return self._jobs.pop(clinic_key)
+
+
+@st.cache_resource(show_spinner=False)
+def dataset_publish_jobs() -> DatasetPublishJobRegistry:
+    return DatasetPublishJobRegistry()
+
+
+def dataset_publish_session_owner() -> str:
+    return session_instance_token()
+
+
+def current_dataset_publish_job(clinic_id: str) -> DatasetPublishJob | None:
+    return dataset_publish_jobs().get(normalize_clinic_id_key(clinic_id))
+
+
+def start_dataset_publish_job(
+    clinic_id: str,
+    new_df: pd.DataFrame,
+    upload_key: str = "",
+    context: dict | None = None,
+    operation_id: str = "",
+    **publish_kwargs,
+) -> tuple[DatasetPublishJob, bool]:
+    """
+    Queue a background publish for the clinic and return (job, started).
+    Stage changes and uploaded byte counts are recorded to the dataset tracker.
+    Reusing a failed job's operation_id resumes its Drive upload session.
+
+    The worker never touches session state: the tenant, settings row and dataset pointer
+    are captured here, and the merged dataset goes to the shared dataset store, so the
+    finished job holds only a summary for the owning session to apply.
+    """
+    clinic_id = require_authenticated_tenant_access(clinic_id)
+    if publish_kwargs.get("existing_file_id") is None or publish_kwargs.get("existing_name") is None:
+        publish_kwargs["existing_file_id"], publish_kwargs["existing_name"] = get_existing_dataset_pointer(clinic_id)
+    worker_state = capture_detached_session_state()
+
+    def run(job: DatasetPublishJob):
+        def progress(stage: str, bytes_done: int | None = None, bytes_total: int | None = None) -> None:
+            if job.progress(stage, bytes_done=bytes_done, bytes_total=bytes_total):
+                snapshot = job.snapshot()
+                record_dataset_tracker_event(
+                    "dataset_publish_progress",
+                    stage,
+                    operation_id=job.job_id,
+                    message=(
+                        f"stage={stage}; bytes_done={snapshot['bytes_done']}; "
+                        f"bytes_total={snapshot['bytes_total']}; elapsed_ms={snapshot['elapsed_ms']:.0f}"
+                    ),
+                    source="dataset_publish_job",
+                )
+
+        with detached_session_state(worker_state):
+            merged_df, new_file_id, out_name, dataset_updated_at = run_dataset_publish_stages(
+                clinic_id,
+                new_df,
+                operation_id=job.job_id,
+                progress=progress,
+                transfer_timeout_seconds=DATASET_PUBLISH_JOB_TRANSFER_TIMEOUT_SECONDS,
+                **publish_kwargs,
+            )
+        share_working_df(clinic_id, sanitize_working_df(merged_df), new_file_id, dataset_updated_at)
+        merged_min, merged_max = dataset_date_bounds(merged_df)
+        return {
+            "file_id": new_file_id,
+            "file_name": out_name,
+            "updated_at": dataset_updated_at,
+            "rows": len(merged_df),
+            "date_min": merged_min,
+            "date_max": merged_max,
+            "settings_row_cache": worker_state.get("_settings_row_cache"),
+        }
+
+    job, started = dataset_publish_jobs().submit(
+        normalize_clinic_id_key(clinic_id),
+        run,
+        owner=dataset_publish_session_owner(),
+        upload_key=upload_key,
+        context=context,
+        job_id=operation_id,
+    )
+    if started:
+        st.session_state["_dataset_publish_upload_df"] = new_df
+    return job, started
 
 # --------------------------------
 # 💾 Per-clinic settings persistence via Google Sheets
@@ -5024,23 +6547,17 @@ def load_settings(load_action_history: bool = True):
     rec = None
     try:
         sheet, headers, row_idx = _get_settings_row_for_clinic(clinic_id)
-        row_values = get_cached_settings_row_values(clinic_id) or _gspread_retry(sheet.row_values, row_idx)
-        rec = {
-            header: row_values[idx] if idx < len(row_values) else ""
-            for idx, header in enumerate(headers)
-        }
+        row_values = get_cached_settings_row_values(clinic_id) or worksheet_batch_row(sheet, row_idx)
+        rec = settings_row_record(headers, row_values)
     except Exception:
-        sheet = get_settings_sheet()
-        records = sheet.get_all_records()
-        clinic_key = normalize_clinic_id_key(clinic_id)
-        rec = next((r for r in records if normalize_clinic_id_key(r.get("ClinicID", "")) == clinic_key), None)
+        rec = get_clinic_row(clinic_id)
 
     if rec and rec.get(SHEET_COL_SETTINGS_JSON):
         try:
             settings = json.loads(rec.get(SHEET_COL_SETTINGS_JSON, "{}"))
         except Exception:
             settings = {}
-        cache_remote_settings(clinic_id, settings)
+        cache_remote_settings(clinic_id, settings, rec.get(SHEET_COL_UPDATED_AT, ""))
         st.session_state["rules"] = normalize_search_term_rules(settings.get("rules", DEFAULT_RULES.copy()))
         st.session_state["exclusions"] = settings.get("exclusions", [])
         st.session_state["client_exclusions"] = settings.get("client_exclusions", [])
@@ -5303,6 +6820,31 @@ def merge_keyed_list_setting_for_save(base_list, remote_list, local_list, key_fn
     return [result[key] for key in result_order if key in result]
 
 
+def settings_delta_keys(saved_settings: dict, settings_data: dict) -> list[str]:
+    """Keys whose value differs between the saved settings JSON and the one about to be written."""
+    saved_settings = saved_settings if isinstance(saved_settings, dict) else {}
+    return sorted(
+        key
+        for key in set(saved_settings) | set(settings_data)
+        if key not in saved_settings
+        or key not in settings_data
+        or not _settings_equal(saved_settings[key], settings_data[key])
+    )
+
+
+def settings_metadata_delta(clinic_id: str, headers: list[str], values_by_header: dict[str, object]) -> dict:
+    """Drop metadata cells that already hold the same value in the cached settings row."""
+    cached_row = get_cached_settings_row_values(clinic_id)
+    if cached_row is None:
+        return dict(values_by_header)
+    current = settings_row_record(headers, cached_row)
+    return {
+        header: value
+        for header, value in values_by_header.items()
+        if str(current.get(header, "") or "") != str(value)
+    }
+
+
 def save_settings(track_user: bool = True, refresh_remote: bool = True):
     """Save current clinic’s settings back to the Google Sheet."""
     clinic_id = st.session_state.get("clinic_id")
@@ -5318,54 +6860,19 @@ def save_settings(track_user: bool = True, refresh_remote: bool = True):
         sheet = get_settings_sheet()
 
     base_settings = get_cached_remote_settings(clinic_id)
+    base_version = get_cached_remote_settings_version(clinic_id)
+    remote_unchanged = False
+    if refresh_remote and row and base_version:
+        # Optimistic check: an unchanged UpdatedAt stamp means the saved JSON is still our base.
+        remote_unchanged = read_settings_version_stamp(sheet, headers, row) == base_version
     remote_settings = (
         read_remote_settings_for_save(sheet=sheet, headers=headers, row=row)
-        if refresh_remote and row
+        if refresh_remote and row and not remote_unchanged
         else base_settings
     )
     if not remote_settings and base_settings:
         remote_settings = base_settings
 
-    wa_remove_keys = {
-        tuple(key)
-        for key in st.session_state.pop("_wa_reminder_remove_keys_once", [])
-        if isinstance(key, (list, tuple)) and any(key)
-    }
-    replace_wa_log = st.session_state.pop("_replace_wa_reminder_log_once", False)
-    if replace_wa_log and not wa_remove_keys:
-        wa_reminder_log = st.session_state.get("wa_reminder_log", [])
-    else:
-        wa_reminder_log = merge_wa_reminder_logs(
-            remote_settings.get("wa_reminder_log", []),
-            st.session_state.get("wa_reminder_log", []),
-        )
-        if wa_remove_keys:
-            wa_reminder_log = [
-                entry for entry in wa_reminder_log
-                if tuple(entry.get("ReminderKey", [])) not in wa_remove_keys
-            ]
-    st.session_state["wa_reminder_log"] = wa_reminder_log
-
-    deleted_remove_keys = {
-        tuple(key)
-        for key in st.session_state.pop("_deleted_reminder_remove_keys_once", [])
-        if isinstance(key, (list, tuple)) and any(key)
-    }
-    replace_deleted_reminders = st.session_state.pop("_replace_deleted_reminders_once", False)
-    if replace_deleted_reminders and not deleted_remove_keys:
-        deleted_reminders = st.session_state.get("deleted_reminders", [])
-    else:
-        deleted_reminders = merge_deleted_reminders(
-            remote_settings.get("deleted_reminders", []),
-            st.session_state.get("deleted_reminders", []),
-        )
-        if deleted_remove_keys:
-            deleted_reminders = [
-                entry for entry in deleted_reminders
-                if hidden_reminder_key(entry) not in deleted_remove_keys
-            ]
-        st.session_state["deleted_reminders"] = deleted_reminders
-
     def int_setting_for_save(key: str, default: int) -> int:
         value = _merged_scalar_setting(key, default, base_settings, remote_settings)
         try:
@@ -5512,16 +7019,22 @@ def save_settings(track_user: bool = True, refresh_remote: bool = True):
     }
     settings_json = json.dumps(settings_data)
     updated_at = utc_now_iso()
+    changed_keys = settings_delta_keys(remote_settings, settings_data)
+    row_written = True
 
     # Update existing row or append a new one
     if row:
         metadata_updates = {}
         if settings_data.get("country"):
-            metadata_updates = {
+            metadata_updates = settings_metadata_delta(clinic_id, headers, {
                 SHEET_COL_COUNTRY: settings_data.get("country", ""),
                 SHEET_COL_ACCOUNT_STATUS: "active",
-            }
-        if callable(globals().get("_update_settings_cells", None)):
+            })
+        if refresh_remote and not changed_keys and not metadata_updates:
+            # The saved row already matches; skip the write and keep its version stamp.
+            row_written = False
+            updated_at = get_cached_remote_settings_version(clinic_id) or base_version
+        elif callable(globals().get("_update_settings_cells", None)):
             if metadata_updates:
                 _update_settings_cells(sheet, headers, row, settings_json, updated_at, metadata_updates)
             else:
@@ -5558,16 +7071,20 @@ def save_settings(track_user: bool = True, refresh_remote: bool = True):
             ),
             value_input_option="USER_ENTERED",
         )
-    update_cached_settings_row_fields(
-        clinic_id,
-        {
-            SHEET_COL_SETTINGS_JSON: settings_json,
-            SHEET_COL_UPDATED_AT: updated_at,
-            SHEET_COL_COUNTRY: settings_data.get("country", ""),
-            SHEET_COL_ACCOUNT_STATUS: "active",
-        },
-    )
-    cache_remote_settings(clinic_id, settings_data)
+    if row_written:
+        update_cached_settings_row_fields(
+            clinic_id,
+            {
+                SHEET_COL_SETTINGS_JSON: settings_json,
+                SHEET_COL_UPDATED_AT: updated_at,
+                SHEET_COL_COUNTRY: settings_data.get("country", ""),
+                SHEET_COL_ACCOUNT_STATUS: "active",
+            },
+        )
+    cache_remote_settings(clinic_id, settings_data, updated_at)
+    pending = st.session_state.get(PENDING_SETTINGS_SAVE_KEY)
+    if isinstance(pending, dict) and pending.get("clinic_key") == normalize_clinic_id_key(clinic_id):
+        st.session_state.pop(PENDING_SETTINGS_SAVE_KEY, None)
     saved_outcome_due_date_window_days = normalized_outcome_due_date_window_days(
         settings_data.get("outcome_due_date_window_days")
     )
@@ -5654,6 +7171,74 @@ def save_settings_quietly(refresh_remote: bool = True) -> bool:
         return False
 
 
+def queue_settings_save() -> bool:
+    """Defer a quiet save so rapid edits within the debounce window share one write."""
+    clinic_id = st.session_state.get("clinic_id")
+    if not clinic_id:
+        return False
+    clinic_key = normalize_clinic_id_key(clinic_id)
+    now = time.monotonic()
+    pending = st.session_state.get(PENDING_SETTINGS_SAVE_KEY)
+    if not isinstance(pending, dict) or pending.get("clinic_key") != clinic_key:
+        pending = {"clinic_key": clinic_key, "first_at": now, "edits": 0}
+    pending["last_at"] = now
+    pending["edits"] = int(pending.get("edits", 0)) + 1
+    st.session_state[PENDING_SETTINGS_SAVE_KEY] = pending
+    return True
+
+
+def pending_settings_save_due(now: float | None = None) -> bool:
+    pending = st.session_state.get(PENDING_SETTINGS_SAVE_KEY)
+    if not isinstance(pending, dict):
+        return False
+    now = time.monotonic() if now is None else now
+    return (
+        now - float(pending.get("last_at", 0.0)) >= SETTINGS_SAVE_DEBOUNCE_SECONDS
+        or now - float(pending.get("first_at", 0.0)) >= SETTINGS_SAVE_MAX_DELAY_SECONDS
+    )
+
+
+def flush_pending_settings_save(force: bool = False) -> bool:
+    """Write queued settings edits once the debounce window has passed (or immediately when forced)."""
+    pending = st.session_state.get(PENDING_SETTINGS_SAVE_KEY)
+    if not isinstance(pending, dict):
+        return False
+    if pending.get("clinic_key") != normalize_clinic_id_key(st.session_state.get("clinic_id")):
+        # Clinic switches flush first (flush_pending_settings_save_before_clinic_change); edits that still
+        # belong to another clinic cannot be written from this clinic's settings.
+        st.session_state.pop(PENDING_SETTINGS_SAVE_KEY, None)
+        st.session_state["_pending_settings_sync_warning"] = (
+            "Some settings changes made before switching clinic could not be saved. Please check them and try again."
+        )
+        return False
+    if not force and not pending_settings_save_due():
+        return False
+    st.session_state.pop(PENDING_SETTINGS_SAVE_KEY, None)
+    return save_settings_quietly()
+
+
+def flush_pending_settings_save_before_clinic_change(next_clinic_id: str) -> bool:
+    """Write the current clinic's queued edits while its settings are still loaded in the session."""
+    pending = st.session_state.get(PENDING_SETTINGS_SAVE_KEY)
+    if not isinstance(pending, dict):
+        return False
+    if not st.session_state.get("logged_in") or pending.get("clinic_key") != normalize_clinic_id_key(st.session_state.get("clinic_id")):
+        return False
+    if normalize_clinic_id_key(next_clinic_id) == pending.get("clinic_key"):
+        return False
+    return flush_pending_settings_save(force=True)
+
+
+@st.fragment(run_every=SETTINGS_SAVE_DEBOUNCE_SECONDS)
+def render_pending_settings_save_flush() -> None:
+    # Rendered on every logged-in run, so edits queued after the top-of-script flush or during
+    # fragment-only reruns are still written; a no-op while nothing is pending.
+    if not isinstance(st.session_state.get(PENDING_SETTINGS_SAVE_KEY), dict):
+        return
+    begin_fragment_sheets_read_batch()
+    flush_pending_settings_save()
+
+
 def show_pending_settings_sync_warning():
     warning = st.session_state.pop("_pending_settings_sync_warning", "")
     if warning:
@@ -5709,22 +7294,48 @@ def _days_ago_text(then: datetime, now: datetime) -> str:
         return "1 day ago"
     return f"{days} days ago"
 
-def read_remote_settings_from_row(sheet, headers, row) -> dict:
+def _settings_row_version(headers, row_values) -> str:
+    if SHEET_COL_UPDATED_AT not in headers:
+        return ""
+    updated_idx = _settings_col_index(headers, SHEET_COL_UPDATED_AT) - 1
+    return str(row_values[updated_idx] or "") if len(row_values) > updated_idx else ""
+
+
+def read_remote_settings_row(sheet, headers, row) -> tuple[dict, str]:
     current_row = _gspread_retry(sheet.row_values, row)
+    version = _settings_row_version(headers, current_row)
     settings_idx = _settings_col_index(headers, "SettingsJSON") - 1
     if len(current_row) <= settings_idx or not current_row[settings_idx]:
-        return {}
-    return json.loads(current_row[settings_idx])
+        return {}, version
+    return json.loads(current_row[settings_idx]), version
+
+
+def read_remote_settings_from_row(sheet, headers, row) -> dict:
+    return read_remote_settings_row(sheet, headers, row)[0]
+
+
+def read_settings_version_stamp(sheet, headers, row) -> str:
+    """Read only the row's UpdatedAt cell, which every settings write stamps."""
+    if SHEET_COL_UPDATED_AT not in headers:
+        return ""
+    try:
+        if isinstance(sheet, gspread.Worksheet):
+            col_idx = _settings_col_index(headers, SHEET_COL_UPDATED_AT)
+            values = _gspread_retry(sheet.get_values, _row_range_a1(row, col_idx, col_idx))
+            return str(values[0][0] or "") if values and values[0] else ""
+        return _settings_row_version(headers, _gspread_retry(sheet.row_values, row))
+    except Exception as e:
+        raise SettingsFreshReadError("Could not read latest clinic settings before saving.") from e
 
 
 def read_remote_settings_for_save(sheet, headers, row) -> dict:
     try:
-        settings = read_remote_settings_from_row(sheet, headers, row)
+        settings, version = read_remote_settings_row(sheet, headers, row)
     except Exception as e:
         raise SettingsFreshReadError("Could not read latest clinic settings before saving.") from e
     clinic_id = st.session_state.get("clinic_id")
     if clinic_id:
-        cache_remote_settings(clinic_id, settings)
+        cache_remote_settings(clinic_id, settings, version)
     return settings
 
 
@@ -5736,19 +7347,16 @@ def get_remote_settings(sheet=None, headers=None, row=None) -> dict:
     try:
         if not (sheet and headers and row):
             sheet, headers, row = _get_settings_row_for_clinic(clinic_id)
-        settings = read_remote_settings_from_row(sheet, headers, row)
-        cache_remote_settings(clinic_id, settings)
+        settings, version = read_remote_settings_row(sheet, headers, row)
+        cache_remote_settings(clinic_id, settings, version)
         return settings
     except Exception:
         return {}
 
-def get_remote_wa_reminder_log(sheet=None, headers=None, row=None) -> list:
+def get_remote_wa_reminder_log() -> list:
     clinic_id = st.session_state.get("clinic_id", "")
     tracked_actions = load_action_tracker_records_for_clinic(clinic_id)
-    return merge_wa_reminder_logs(
-        get_remote_settings(sheet=sheet, headers=headers, row=row).get("wa_reminder_log", []),
-        action_records_to_wa_log(tracked_actions),
-    )
+    return merge_wa_reminder_logs(action_records_to_wa_log(tracked_actions))
 
 def merge_wa_reminder_logs(*logs):
     merged = {}
@@ -5830,28 +7438,169 @@ def reminder_details_json(row) -> str:
     return json.dumps(details, ensure_ascii=True) if details else ""
 
 
-def get_hidden_reminders_index() -> dict[tuple[str, ...], dict]:
-    deleted = st.session_state.get("deleted_reminders", [])
-    cache_key = tuple(
-        hidden_reminder_key(entry)
-        for entry in deleted
-        if isinstance(entry, dict)
-    )
-    cached = st.session_state.get("_hidden_reminders_index_cache")
-    if isinstance(cached, dict) and cached.get("cache_key") == cache_key:
-        return cached.get("index", {})
+_HIDDEN_REMINDER_INDEX_VERSIONS = itertools.count(1)
+HIDDEN_REMINDER_INDEX_EVENT_LIMIT = 512
 
-    index = {}
-    for entry in deleted:
-        if not isinstance(entry, dict):
-            continue
+
+def hidden_reminder_key_digest(key: tuple[str, ...]) -> int:
+    return int(pd.util.hash_array(np.array(["\x1f".join(key)], dtype=object))[0])
+
+
+def hidden_reminder_key_digests(frame: pd.DataFrame) -> np.ndarray:
+    """64-bit digests of hidden_reminder_key for every row, derived column-wise."""
+    joined = None
+    for field in HIDDEN_REMINDER_KEY_FIELDS:
+        if field in frame.columns:
+            values = frame[field].astype(object)
+            part = values.where(values.notna(), "").astype(str)
+            part = part.str.strip().str.replace(_SPACE_RX.pattern, " ", regex=True).str.lower()
+        else:
+            part = pd.Series("", index=frame.index, dtype=object)
+        joined = part if joined is None else joined + "\x1f" + part
+    if joined is None or joined.empty:
+        return np.empty(0, dtype=np.uint64)
+    return pd.util.hash_array(joined.to_numpy(dtype=object))
+
+
+class HiddenReminderIndex:
+    """
+    Actioned reminders keyed by hidden_reminder_key and by its 64-bit digest.
+    version comes from a process-wide counter and moves on every change, so cache keys can use it directly.
+    """
+
+    def __init__(self, deleted_reminders):
+        self.source = deleted_reminders
+        self.by_key: dict[tuple[str, ...], dict] = {}
+        self.digest_by_key: dict[tuple[str, ...], int] = {}
+        self._key_by_entry_id: dict[int, tuple[str, ...]] = {}
+        for entry in deleted_reminders:
+            if isinstance(entry, dict):
+                self._add(entry)
+        self._digests = None
+        self.version = next(_HIDDEN_REMINDER_INDEX_VERSIONS)
+        # (version, key digest, +1 newly hidden / -1 unhidden) since construction, for incremental consumers.
+        self.events: list[tuple[int, int, int]] = []
+        self.events_floor = self.version
+
+    def _add(self, entry: dict) -> None:
         key = hidden_reminder_key(entry)
+        self._key_by_entry_id[id(entry)] = key
         if any(key):
-            index[key] = entry
-    st.session_state["_hidden_reminders_index_cache"] = {
-        "cache_key": cache_key,
-        "index": index,
-    }
+            self.by_key[key] = entry
+            if key not in self.digest_by_key:
+                self.digest_by_key[key] = hidden_reminder_key_digest(key)
+
+    def _changed(self, deleted_reminders, digest: int | None = None, delta: int = 0) -> None:
+        self.source = deleted_reminders
+        self._digests = None
+        self.version = next(_HIDDEN_REMINDER_INDEX_VERSIONS)
+        if digest is not None and delta:
+            self.events.append((self.version, digest, delta))
+            if len(self.events) > HIDDEN_REMINDER_INDEX_EVENT_LIMIT:
+                dropped = self.events[: len(self.events) // 2]
+                self.events = self.events[len(dropped):]
+                self.events_floor = dropped[-1][0]
+
+    def upserted(self, entry: dict, deleted_reminders) -> None:
+        key = hidden_reminder_key(entry)
+        newly_hidden = any(key) and key not in self.by_key
+        self._add(entry)
+        self._changed(deleted_reminders, self.digest_by_key.get(key), 1 if newly_hidden else 0)
+
+    def removed(self, key: tuple[str, ...], deleted_reminders) -> None:
+        self.by_key.pop(key, None)
+        digest = self.digest_by_key.pop(key, None)
+        self._changed(deleted_reminders, digest, -1)
+
+    def events_since(self, version: int) -> list[tuple[int, int, int]] | None:
+        """Hide/unhide events after version, or None when they are no longer all retained."""
+        if version < self.events_floor:
+            return None
+        return [event for event in self.events if event[0] > version]
+
+    def without_key(self, key: tuple[str, ...]) -> list:
+        """A copy of the source list minus every entry stored under key, without re-deriving keys."""
+        if key not in self.by_key:
+            return list(self.source)
+        return [
+            entry for entry in self.source
+            if not (isinstance(entry, dict) and self._key_by_entry_id.get(id(entry)) == key)
+        ]
+
+    def digests(self) -> np.ndarray:
+        if self._digests is None:
+            self._digests = np.fromiter(self.digest_by_key.values(), dtype=np.uint64, count=len(self.digest_by_key))
+        return self._digests
+
+
+def hidden_reminder_index() -> HiddenReminderIndex:
+    deleted = st.session_state.get("deleted_reminders")
+    deleted = () if deleted is None else deleted
+    index = st.session_state.get("_hidden_reminder_index")
+    if not isinstance(index, HiddenReminderIndex) or index.source is not deleted:
+        # The history list was replaced wholesale (load, tracker refresh, logout); rebuild once.
+        index = HiddenReminderIndex(deleted)
+        st.session_state["_hidden_reminder_index"] = index
+    return index
+
+
+def invalidate_hidden_reminder_index() -> None:
+    """Rebuild the index on next use; required after editing stored action records in place."""
+    st.session_state.pop("_hidden_reminder_index", None)
+
+
+def get_hidden_reminders_index() -> dict[tuple[str, ...], dict]:
+    return hidden_reminder_index().by_key
+
+
+class ActionLogIndex:
+    """
+    Per-client and per-action lookups over the session's action history.
+    Writers always replace the history lists, so list identity is the version check.
+    """
+
+    def __init__(self, deleted_reminders, wa_reminder_log):
+        self.deleted_reminders = deleted_reminders
+        self.wa_reminder_log = wa_reminder_log
+        self.latest_action_token: dict[str, str] = {}
+        self.client_reminded_at: dict[str, datetime] = {}
+        self.latest_reminded_token = ""
+        for entry in deleted_reminders:
+            if not isinstance(entry, dict):
+                continue
+            action = str(entry.get("Action", "")).strip().lower()
+            token = str(entry.get("ActionedAt", "") or entry.get("DeletedAt", ""))
+            if token > self.latest_action_token.get(action, ""):
+                self.latest_action_token[action] = token
+        for entry in wa_reminder_log:
+            if not isinstance(entry, dict):
+                continue
+            token = str(entry.get("RemindedAt", ""))
+            self.latest_reminded_token = max(self.latest_reminded_token, token)
+            reminded_at = _parse_reminder_log_time(token)
+            if not reminded_at:
+                continue
+            client_key = _reminder_client_key(entry.get("Client Name", ""))
+            latest = self.client_reminded_at.get(client_key)
+            if latest is None or reminded_at > latest:
+                self.client_reminded_at[client_key] = reminded_at
+
+    def is_for(self, deleted_reminders, wa_reminder_log) -> bool:
+        return deleted_reminders is self.deleted_reminders and wa_reminder_log is self.wa_reminder_log
+
+    def last_reminded_at(self, client_name: str) -> datetime | None:
+        return self.client_reminded_at.get(_reminder_client_key(client_name))
+
+
+def action_log_index() -> ActionLogIndex:
+    deleted = st.session_state.get("deleted_reminders")
+    wa_log = st.session_state.get("wa_reminder_log")
+    deleted = () if deleted is None else deleted
+    wa_log = () if wa_log is None else wa_log
+    index = st.session_state.get(ACTION_LOG_INDEX_STATE_KEY)
+    if not isinstance(index, ActionLogIndex) or not index.is_for(deleted, wa_log):
+        index = ActionLogIndex(deleted, wa_log)
+        st.session_state[ACTION_LOG_INDEX_STATE_KEY] = index
     return index
 
 
@@ -5982,6 +7731,19 @@ def action_records_to_wa_log(records: list[dict]) -> list[dict]:
     return merge_wa_reminder_logs(wa_log)
 
 
+class ReadOnlyRecord(dict):
+    """A dict that rejects in-place changes; callers take dict(record) to edit."""
+
+    def _reject(self, *args, **kwargs):
+        raise TypeError("Cached action tracker records are read-only; copy with dict(record) first.")
+
+    __setitem__ = __delitem__ = _reject
+    clear = pop = popitem = setdefault = update = _reject
+
+    def __reduce__(self):
+        return (ReadOnlyRecord, (dict(self),))
+
+
 def load_action_tracker_records_for_clinic(clinic_id: str) -> list[dict]:
     clinic_id = str(clinic_id or "").strip()
     if not clinic_id:
@@ -5990,10 +7752,11 @@ def load_action_tracker_records_for_clinic(clinic_id: str) -> list[dict]:
     timezone_key = user_timezone_name()
     cache = st.session_state.get("_action_tracker_records_cache")
     if isinstance(cache, dict) and cache.get("clinic_key") == clinic_key and cache.get("timezone_key") == timezone_key:
-        return [dict(record) for record in cache.get("records", []) if isinstance(record, dict)]
+        note_session_cache_use("_action_tracker_records_cache")
+        return list(cache.get("records", []))
     try:
         sheet = get_or_create_tracker_sheet(ACTION_TRACKER_WORKSHEET, ACTION_TRACKER_HEADERS)
-        values = _gspread_retry(sheet.get_all_values) or []
+        values = worksheet_batch_values(sheet)
     except Exception:
         return []
     if not values:
@@ -6007,13 +7770,14 @@ def load_action_tracker_records_for_clinic(clinic_id: str) -> list[dict]:
         rec = action_tracker_values_to_record(headers, raw)
         if rec:
             records.append(rec)
-    reduced = reduce_action_tracker_records(records)
+    reduced = [ReadOnlyRecord(record) for record in reduce_action_tracker_records(records)]
     st.session_state["_action_tracker_records_cache"] = {
         "clinic_key": clinic_key,
         "timezone_key": timezone_key,
-        "records": [dict(record) for record in reduced],
+        "records": reduced,
     }
-    return reduced
+    note_session_cache_use("_action_tracker_records_cache")
+    return list(reduced)
 
 
 def invalidate_action_tracker_records_cache() -> None:
@@ -6075,33 +7839,27 @@ def upsert_hidden_reminder(row, action: str, message: str = "", now: datetime |
         rec["ReminderDetails"] = details
 
     target_key = hidden_reminder_key(rec)
-    reminders = [
-        existing for existing in st.session_state.get("deleted_reminders", [])
-        if not (isinstance(existing, dict) and hidden_reminder_key(existing) == target_key)
-    ]
+    index = hidden_reminder_index()
+    reminders = index.without_key(target_key)
     reminders.append(rec)
-    st.session_state["deleted_reminders"] = reminders[-MAX_SETTINGS_LOG_ENTRIES:]
+    if len(reminders) > MAX_SETTINGS_LOG_ENTRIES:
+        # Trimming drops older keys too; let the next lookup rebuild the index.
+        st.session_state["deleted_reminders"] = reminders[-MAX_SETTINGS_LOG_ENTRIES:]
+        return rec
+    st.session_state["deleted_reminders"] = reminders
+    index.upserted(rec, reminders)
     return rec
 
 
 def filter_hidden_reminders(reminders_df: pd.DataFrame) -> pd.DataFrame:
-    deleted = st.session_state.get("deleted_reminders", [])
-    if reminders_df.empty or not deleted:
+    if reminders_df.empty or not st.session_state.get("deleted_reminders"):
         return reminders_df
 
-    deleted_keys = {hidden_reminder_key(d) for d in deleted if isinstance(d, dict)}
-    if not deleted_keys:
+    hidden_digests = hidden_reminder_index().digests()
+    if not len(hidden_digests):
         return reminders_df
 
-    key_parts = []
-    for field in HIDDEN_REMINDER_KEY_FIELDS:
-        if field in reminders_df.columns:
-            values = reminders_df[field]
-        else:
-            values = pd.Series("", index=reminders_df.index)
-        key_parts.append(values.map(_hidden_reminder_key_part))
-
-    keep_mask = [key not in deleted_keys for key in zip(*key_parts)]
+    keep_mask = ~np.isin(hidden_reminder_key_digests(reminders_df), hidden_digests)
     return reminders_df.loc[keep_mask].copy()
 
 
@@ -6109,12 +7867,10 @@ def remove_actioned_reminder(row) -> None:
     target_key = hidden_reminder_key(row)
     if not any(target_key):
         return
-    st.session_state["deleted_reminders"] = [
-        entry for entry in st.session_state.get("deleted_reminders", [])
-        if not (isinstance(entry, dict) and hidden_reminder_key(entry) == target_key)
-    ]
-    remove_keys = st.session_state.setdefault("_deleted_reminder_remove_keys_once", [])
-    remove_keys.append(list(target_key))
+    index = hidden_reminder_index()
+    reminders = index.without_key(target_key)
+    st.session_state["deleted_reminders"] = reminders
+    index.removed(target_key, reminders)
 
 
 def get_recent_reminder_warning(client_name: str, now: datetime | None = None, sync_remote: bool = False) -> str | None:
@@ -6128,14 +7884,7 @@ def get_recent_reminder_warning(client_name: str, now: datetime | None = None, s
             get_remote_wa_reminder_log(),
             st.session_state.get("wa_reminder_log", []),
         )
-    client_key = _reminder_client_key(client_name)
-    latest = None
-    for entry in st.session_state.get("wa_reminder_log", []):
-        if _reminder_client_key(entry.get("Client Name", "")) != client_key:
-            continue
-        reminded_at = _parse_reminder_log_time(entry.get("RemindedAt", ""))
-        if reminded_at and (latest is None or reminded_at > latest):
-            latest = reminded_at
+    latest = action_log_index().last_reminded_at(client_name)
 
     if latest and now - latest <= timedelta(days=warning_days):
         display_name = normalize_display_case(client_name)
@@ -6157,7 +7906,7 @@ def record_wa_reminder_click(client_name: str, now: datetime | None = None, row=
         save_settings_quietly()
 
 
-def remove_wa_reminder_click_for_row(row, queue_settings_removal: bool = True):
+def remove_wa_reminder_click_for_row(row):
     target_key = list(hidden_reminder_key(row))
     if not any(target_key):
         return
@@ -6165,9 +7914,6 @@ def remove_wa_reminder_click_for_row(row, queue_settings_removal: bool = True):
         entry for entry in st.session_state.get("wa_reminder_log", [])
         if not (isinstance(entry, dict) and entry.get("ReminderKey") == target_key)
     ]
-    if queue_settings_removal:
-        remove_keys = st.session_state.setdefault("_wa_reminder_remove_keys_once", [])
-        remove_keys.append(target_key)
 
 
 def record_action_tracker(row, action: str, message: str = "", source: str = "", now: datetime | None = None):
@@ -7362,7 +9108,7 @@ def get_settings_sheet():
 
 def get_or_create_tracker_sheet(title: str, headers: list[str]):
     cache_key = (str(title), tuple(headers))
-    tracker_cache = st.session_state.setdefault("_tracker_sheet_cache", {})
+    tracker_cache = active_session_state().setdefault("_tracker_sheet_cache", {})
     if cache_key in tracker_cache:
         return tracker_cache[cache_key]
 
@@ -7372,7 +9118,7 @@ def get_or_create_tracker_sheet(title: str, headers: list[str]):
     except Exception:
         worksheet = spreadsheet.add_worksheet(title=title, rows=1000, cols=max(len(headers), 8))
 
-    first_row = worksheet.row_values(1)
+    first_row = worksheet_batch_row(worksheet, 1)
     if first_row[:len(headers)] != headers:
         end_col = _column_number_to_letter(len(headers))
         _gspread_retry(worksheet.update, values=[headers], range_name=f"A1:{end_col}1")
@@ -7380,10 +9126,16 @@ def get_or_create_tracker_sheet(title: str, headers: list[str]):
     return worksheet
 
 
+def tracker_request_priority(title: str) -> str:
+    """Action rows are user data; every other tracker append is telemetry and may wait."""
+    return SHEETS_PRIORITY_INTERACTIVE if title == ACTION_TRACKER_WORKSHEET else SHEETS_PRIORITY_TELEMETRY
+
+
 def append_tracker_row(title: str, headers: list[str], row_values: list[str]):
     try:
         worksheet = get_or_create_tracker_sheet(title, headers)
-        _gspread_retry(worksheet.append_row, row_values, value_input_option="USER_ENTERED")
+        with sheets_request_priority(tracker_request_priority(title)):
+            _gspread_retry(worksheet.append_row, row_values, value_input_option="USER_ENTERED")
         if title == ACTION_TRACKER_WORKSHEET:
             invalidate_action_tracker_records_cache()
         return True
@@ -7397,11 +9149,12 @@ def append_tracker_rows(title: str, headers: list[str], rows: list[list[str]]):
         return False
     try:
         worksheet = get_or_create_tracker_sheet(title, headers)
-        if hasattr(worksheet, "append_rows"):
-            _gspread_retry(worksheet.append_rows, rows, value_input_option="USER_ENTERED")
-        else:
-            for row in rows:
-                _gspread_retry(worksheet.append_row, row, value_input_option="USER_ENTERED")
+        with sheets_request_priority(tracker_request_priority(title)):
+            if hasattr(worksheet, "append_rows"):
+                _gspread_retry(worksheet.append_rows, rows, value_input_option="USER_ENTERED")
+            else:
+                for row in rows:
+                    _gspread_retry(worksheet.append_row, row, value_input_option="USER_ENTERED")
         if title == ACTION_TRACKER_WORKSHEET:
             invalidate_action_tracker_records_cache()
         return True
@@ -7491,8 +9244,8 @@ def dataset_tracker_row_values(
         gst_now_iso(now),
         tracker_cell_value(event),
         tracker_cell_value(status),
-        tracker_cell_value(st.session_state.get("clinic_id", "")),
-        tracker_cell_value(st.session_state.get("user_name", "")),
+        tracker_cell_value(active_session_state().get("clinic_id", "")),
+        tracker_cell_value(active_session_state().get("user_name", "")),
         tracker_cell_value(file_name),
         tracker_cell_value(pms),
         tracker_cell_value(rows),
@@ -7567,8 +9320,8 @@ def record_settings_audit_event(
     now = now or utc_now()
     return append_tracker_row(SETTINGS_AUDIT_WORKSHEET, SETTINGS_AUDIT_HEADERS, [
         gst_now_iso(now),
-        tracker_cell_value(st.session_state.get("clinic_id", "")),
-        tracker_cell_value(st.session_state.get("user_name", "")),
+        tracker_cell_value(active_session_state().get("clinic_id", "")),
+        tracker_cell_value(active_session_state().get("user_name", "")),
         tracker_cell_value(event),
         tracker_cell_value(area),
         tracker_cell_value(item),
@@ -7596,8 +9349,8 @@ def record_error_tracker_event(
     error_message = sanitize_diagnostic_message(message or (str(error) if error is not None else ""))
     return append_tracker_row(ERROR_TRACKER_WORKSHEET, ERROR_TRACKER_HEADERS, [
         gst_now_iso(now),
-        tracker_cell_value(st.session_state.get("clinic_id", "")),
-        tracker_cell_value(st.session_state.get("user_name", "")),
+        tracker_cell_value(active_session_state().get("clinic_id", "")),
+        tracker_cell_value(active_session_state().get("user_name", "")),
         tracker_cell_value(event),
         tracker_cell_value(stage),
         tracker_cell_value(error_type),
@@ -7623,8 +9376,8 @@ def record_performance_tracker_event(
     safe_message = sanitize_diagnostic_message(message)
     return append_tracker_row(PERFORMANCE_TRACKER_WORKSHEET, PERFORMANCE_TRACKER_HEADERS, [
         gst_now_iso(now),
-        tracker_cell_value(st.session_state.get("clinic_id", "")),
-        tracker_cell_value(st.session_state.get("user_name", "")),
+        tracker_cell_value(active_session_state().get("clinic_id", "")),
+        tracker_cell_value(active_session_state().get("user_name", "")),
         tracker_cell_value(event),
         duration_value,
         tracker_cell_value(rows),
@@ -7825,11 +9578,21 @@ def ensure_tracking_sheets_once():
     spreadsheet = get_settings_spreadsheet()
     existing = {worksheet.title: worksheet for worksheet in spreadsheet.worksheets()}
     tracker_cache = {}
+    header_reader = None
+    if isinstance(spreadsheet, gspread.Spreadsheet):
+        header_reader = SheetsBatchReader(spreadsheet)
+        header_reader.want(
+            *[sheets_a1_range(title, "1:1") for title, _headers in TRACKER_SHEET_DEFINITIONS if title in existing]
+        )
+        try:
+            header_reader.fetch()
+        except Exception:
+            header_reader = None
     for title, headers in TRACKER_SHEET_DEFINITIONS:
         worksheet = existing.get(title)
         if worksheet is None:
             worksheet = spreadsheet.add_worksheet(title=title, rows=1000, cols=max(len(headers), 8))
-        first_row = worksheet.row_values(1)
+        first_row = header_reader.row(title, 1) if header_reader is not None else worksheet.row_values(1)
         if first_row[:len(headers)] != headers:
             end_col = _column_number_to_letter(len(headers))
             _gspread_retry(worksheet.update, values=[headers], range_name=f"A1:{end_col}1")
@@ -8020,52 +9783,28 @@ def settings_json_from_row(row: dict | None) -> dict:
 def authenticate_user(username, password):
     """Check username/password pair against the sheet."""
     sheet = get_settings_sheet()
-    values = _gspread_retry(sheet.get_all_values) or []
-    if not values:
-        return None
-    headers = list(values[0])
-    if SHEET_COL_CLINIC_ID not in headers or SHEET_COL_PASSWORD_HASH not in headers:
-        return None
-    clinic_ix = headers.index(SHEET_COL_CLINIC_ID)
-    password_ix = headers.index(SHEET_COL_PASSWORD_HASH)
     username_key = normalize_clinic_id_key(username)
-    for row_idx, values_row in enumerate(values[1:], start=2):
-        clinic_id = values_row[clinic_ix] if len(values_row) > clinic_ix else ""
-        if normalize_clinic_id_key(clinic_id) == username_key:
-            password_hash = values_row[password_ix] if len(values_row) > password_ix else ""
-            if verify_password(password, password_hash):
-                row = {
-                    header: values_row[idx] if idx < len(values_row) else ""
-                    for idx, header in enumerate(headers)
-                }
-                st.session_state["_settings_row_cache"] = {
-                    "clinic_key": username_key,
-                    "headers": list(headers),
-                    "row_idx": row_idx,
-                    "row_values": list(values_row),
-                }
-                return row
+    for headers, row_idx, values_row in candidate_settings_rows_for_clinic(sheet, username):
+        if SHEET_COL_PASSWORD_HASH not in headers:
+            return None
+        password_ix = headers.index(SHEET_COL_PASSWORD_HASH)
+        password_hash = values_row[password_ix] if len(values_row) > password_ix else ""
+        if verify_password(password, password_hash):
+            st.session_state["_settings_row_cache"] = {
+                "clinic_key": username_key,
+                "headers": list(headers),
+                "row_idx": row_idx,
+                "row_values": list(values_row),
+            }
+            return settings_row_record(headers, values_row)
     return None
 
 
 def authenticate_clinic_access(clinic_id: str, access_code: str) -> dict | None:
     sheet = get_settings_sheet()
-    values = _gspread_retry(sheet.get_all_values) or []
-    if not values:
-        return None
-    headers = list(values[0])
-    if SHEET_COL_CLINIC_ID not in headers:
-        return None
-    clinic_ix = headers.index(SHEET_COL_CLINIC_ID)
     clinic_key = normalize_clinic_id_key(clinic_id)
-    for row_idx, values_row in enumerate(values[1:], start=2):
-        current_clinic_id = values_row[clinic_ix] if len(values_row) > clinic_ix else ""
-        if normalize_clinic_id_key(current_clinic_id) != clinic_key:
-            continue
-        row = {
-            header: values_row[idx] if idx < len(values_row) else ""
-            for idx, header in enumerate(headers)
-        }
+    for headers, row_idx, values_row in candidate_settings_rows_for_clinic(sheet, clinic_id):
+        row = settings_row_record(headers, values_row)
         settings = settings_json_from_row(row)
         stored_hash = str(settings.get("clinic_access_code_hash", "") or "").strip()
         if verify_clinic_access_code(access_code, stored_hash):
@@ -8080,39 +9819,42 @@ def authenticate_clinic_access(clinic_id: str, access_code: str) -> dict | None:
 
 def get_clinic_row(username):
     """Return a clinic row by ClinicID without checking password."""
-    sheet = get_settings_sheet()
-    records = sheet.get_all_records()
-    username_key = normalize_clinic_id_key(username)
-    for r in records:
-        if normalize_clinic_id_key(r.get("ClinicID", "")) == username_key:
-            return r
-    return None
+    located = locate_settings_row_for_clinic(get_settings_sheet(), username)
+    if located is None:
+        return None
+    headers, _row_idx, values_row = located
+    return settings_row_record(headers, values_row)
 
 
 def get_clinic_row_by_google_identity(google_user: dict):
     if not google_user.get("is_logged_in"):
         return None
     sheet = get_settings_sheet()
-    values = _gspread_retry(sheet.get_all_values) or []
-    if not values:
+
+    def matches(headers: list[str], row_values: list) -> bool:
+        return google_identity_matches_row(settings_row_record(headers, row_values), google_user)
+
+    located = locate_settings_row(
+        sheet,
+        [
+            ("subject", str(google_user.get("subject", "")).strip()),
+            ("email", normalize_email(google_user.get("email", ""))),
+        ],
+        matches,
+    )
+    if located is None:
         return None
-    headers = list(values[0])
-    for row_idx, values_row in enumerate(values[1:], start=2):
-        row = {
-            header: values_row[idx] if idx < len(values_row) else ""
-            for idx, header in enumerate(headers)
+    headers, row_idx, values_row = located
+    row = settings_row_record(headers, values_row)
+    clinic_key = normalize_clinic_id_key(row.get(SHEET_COL_CLINIC_ID, ""))
+    if clinic_key:
+        st.session_state["_settings_row_cache"] = {
+            "clinic_key": clinic_key,
+            "headers": list(headers),
+            "row_idx": row_idx,
+            "row_values": list(values_row),
         }
-        if google_identity_matches_row(row, google_user):
-            clinic_key = normalize_clinic_id_key(row.get(SHEET_COL_CLINIC_ID, ""))
-            if clinic_key:
-                st.session_state["_settings_row_cache"] = {
-                    "clinic_key": clinic_key,
-                    "headers": list(headers),
-                    "row_idx": row_idx,
-                    "row_values": list(values_row),
-                }
-            return row
-    return None
+    return row
 
 
 def _remember_login_signature(clinic_id: str, expires_at: int, password_hash: str) -> str:
@@ -8414,55 +10156,56 @@ def upsert_user_tracker(clinic_id: str, country: str = "", event: str = "updated
     country = str(country or "").strip()
     clinic_key = normalize_clinic_id_key(clinic_id)
     try:
-        sheet = get_or_create_tracker_sheet(USER_TRACKER_WORKSHEET, USER_TRACKER_HEADERS)
-        cached = st.session_state.get("_user_tracker_row_cache")
-        if isinstance(cached, dict) and cached.get("clinic_key") == clinic_key:
-            headers = list(cached.get("headers") or USER_TRACKER_HEADERS)
-            row_idx = int(cached.get("row_idx") or 0) or None
-            row_values = list(cached.get("row_values") or [])
-        else:
-            rows = _gspread_retry(sheet.get_all_values) or []
-            headers = rows[0] if rows else USER_TRACKER_HEADERS
-            clinic_ix = headers.index("ClinicID")
-            row_idx = None
-            row_values = []
-            for i, row in enumerate(rows[1:], start=2):
-                if len(row) > clinic_ix and normalize_clinic_id_key(row[clinic_ix]) == clinic_key:
-                    row_idx = i
-                    row_values = list(row)
-                    break
+        with sheets_request_priority(SHEETS_PRIORITY_TELEMETRY):
+            sheet = get_or_create_tracker_sheet(USER_TRACKER_WORKSHEET, USER_TRACKER_HEADERS)
+            cached = st.session_state.get("_user_tracker_row_cache")
+            if isinstance(cached, dict) and cached.get("clinic_key") == clinic_key:
+                headers = list(cached.get("headers") or USER_TRACKER_HEADERS)
+                row_idx = int(cached.get("row_idx") or 0) or None
+                row_values = list(cached.get("row_values") or [])
+            else:
+                rows = _gspread_retry(sheet.get_all_values) or []
+                headers = rows[0] if rows else USER_TRACKER_HEADERS
+                clinic_ix = headers.index("ClinicID")
+                row_idx = None
+                row_values = []
+                for i, row in enumerate(rows[1:], start=2):
+                    if len(row) > clinic_ix and normalize_clinic_id_key(row[clinic_ix]) == clinic_key:
+                        row_idx = i
+                        row_values = list(row)
+                        break
+
+            existing = {}
+            if row_idx:
+                existing = {
+                    header: row_values[idx] if idx < len(row_values) else ""
+                    for idx, header in enumerate(headers)
+                }
 
-        existing = {}
-        if row_idx:
-            existing = {
-                header: row_values[idx] if idx < len(row_values) else ""
-                for idx, header in enumerate(headers)
+            created_at = existing.get("CreatedAtGST") or timestamp
+            last_login = timestamp if event in LOGIN_TRACKER_EVENTS else existing.get("LastLoginAtGST", "")
+            values_by_header = {
+                "ClinicID": clinic_id,
+                "Country": country or existing.get("Country", ""),
+                "CreatedAtGST": created_at,
+                "LastUpdatedAtGST": timestamp,
+                "LastLoginAtGST": last_login,
+                "AccountStatus": existing.get("AccountStatus") or "active",
+                "LastEvent": event,
             }
+            row_values = [values_by_header.get(header, "") for header in USER_TRACKER_HEADERS]
 
-        created_at = existing.get("CreatedAtGST") or timestamp
-        last_login = timestamp if event in LOGIN_TRACKER_EVENTS else existing.get("LastLoginAtGST", "")
-        values_by_header = {
-            "ClinicID": clinic_id,
-            "Country": country or existing.get("Country", ""),
-            "CreatedAtGST": created_at,
-            "LastUpdatedAtGST": timestamp,
-            "LastLoginAtGST": last_login,
-            "AccountStatus": existing.get("AccountStatus") or "active",
-            "LastEvent": event,
-        }
-        row_values = [values_by_header.get(header, "") for header in USER_TRACKER_HEADERS]
-
-        if row_idx:
-            end_col = _column_number_to_letter(len(USER_TRACKER_HEADERS))
-            _gspread_retry(sheet.update, values=[row_values], range_name=f"A{row_idx}:{end_col}{row_idx}")
-            st.session_state["_user_tracker_row_cache"] = {
-                "clinic_key": clinic_key,
-                "headers": list(USER_TRACKER_HEADERS),
-                "row_idx": row_idx,
-                "row_values": list(row_values),
-            }
-        else:
-            _gspread_retry(sheet.append_row, row_values, value_input_option="USER_ENTERED")
+            if row_idx:
+                end_col = _column_number_to_letter(len(USER_TRACKER_HEADERS))
+                _gspread_retry(sheet.update, values=[row_values], range_name=f"A{row_idx}:{end_col}{row_idx}")
+                st.session_state["_user_tracker_row_cache"] = {
+                    "clinic_key": clinic_key,
+                    "headers": list(USER_TRACKER_HEADERS),
+                    "row_idx": row_idx,
+                    "row_values": list(row_values),
+                }
+            else:
+                _gspread_retry(sheet.append_row, row_values, value_input_option="USER_ENTERED")
     except Exception:
         return
 
@@ -8503,7 +10246,7 @@ def create_clinic_account(clinic_id: str, country: str, password: str):
     validate_password_policy(password, clinic_id)
 
     sheet = get_settings_sheet()
-    all_vals = _gspread_retry(sheet.get_all_values)
+    all_vals = _settings_values_snapshot(sheet)
     headers = all_vals[0] if all_vals else list(SETTINGS_REQUIRED_COLUMNS)
     if SHEET_COL_CLINIC_ID in headers:
         clinic_ix = headers.index(SHEET_COL_CLINIC_ID)
@@ -8528,6 +10271,7 @@ def create_clinic_account(clinic_id: str, country: str, password: str):
         SHEET_COL_ACCOUNT_STATUS: "active",
     }
     _gspread_retry(sheet.append_row, settings_row_values(headers, values_by_header), value_input_option="USER_ENTERED")
+    invalidate_settings_directory_index(sheet)
     upsert_user_tracker(clinic_id, country=country, event="created")
     record_account_lifecycle_event(
         clinic_id,
@@ -8557,7 +10301,7 @@ def create_google_clinic_account(clinic_id: str, country: str, google_user: dict
     }
 
     sheet = get_settings_sheet()
-    all_vals = _gspread_retry(sheet.get_all_values)
+    all_vals = _settings_values_snapshot(sheet)
     headers = all_vals[0] if all_vals else list(SETTINGS_REQUIRED_COLUMNS)
     clinic_key = normalize_clinic_id_key(clinic_id)
     clinic_ix = headers.index(SHEET_COL_CLINIC_ID) if SHEET_COL_CLINIC_ID in headers else -1
@@ -8591,6 +10335,7 @@ def create_google_clinic_account(clinic_id: str, country: str, google_user: dict
         SHEET_COL_ACCOUNT_STATUS: "active",
     }
     _gspread_retry(sheet.append_row, settings_row_values(headers, values_by_header), value_input_option="USER_ENTERED")
+    invalidate_settings_directory_index(sheet)
     upsert_user_tracker(clinic_id, country=country, event="google_created")
     record_account_lifecycle_event(
         clinic_id,
@@ -8777,6 +10522,7 @@ def update_rows_with_clinic_id(old_clinic_id: str, new_clinic_id: str) -> int:
             _gspread_retry(worksheet.batch_update, updates)
             updated += len(updates)
     st.session_state.pop("_settings_row_cache", None)
+    invalidate_settings_directory_index()
     return updated
 
 
@@ -8946,6 +10692,7 @@ def delete_clinic_account_and_data(clinic_id: str) -> dict:
     st.session_state.pop("_settings_row_cache", None)
     st.session_state.pop("_remote_settings_cache", None)
     st.session_state.pop("_tracker_sheet_cache", None)
+    invalidate_settings_directory_index()
     return {"deleted_rows": deleted_rows, "trashed_dataset": bool(file_id)}
 
 
@@ -9179,6 +10926,7 @@ def render_profile_dialog():
 
         if submitted:
             try:
+                flush_pending_settings_save(force=True)
                 updated = update_clinic_profile(clinic_id, new_clinic_id, new_email)
                 st.session_state["clinic_id"] = updated["clinic_id"]
                 if st.session_state.get("auth_provider") != GOOGLE_AUTH_PROVIDER:
@@ -9459,7 +11207,7 @@ def update_clinic_access_code_hash(
             SHEET_COL_ACCOUNT_STATUS: "active",
         },
     )
-    cache_remote_settings(clinic_id, settings)
+    cache_remote_settings(clinic_id, settings, updated_at)
     st.session_state["clinic_access_code_hash"] = settings["clinic_access_code_hash"]
     st.session_state["clinic_access_code_plain"] = settings.get("clinic_access_code_plain", "")
 
@@ -9522,6 +11270,7 @@ def finish_authenticated_session(
     user_row: dict | None = None,
 ):
     clinic_id = str(clinic_id or "").strip()
+    flush_pending_settings_save_before_clinic_change(clinic_id)
     close_account_dialogs()
     st.session_state["clinic_id"] = clinic_id
     st.session_state["logged_in"] = True
@@ -9698,6 +11447,8 @@ def prepare_session_bundle(df: pd.DataFrame, cache_key: str):
     return df, masks, tx_client, tx_patient, patients_per_month
 
 # === LOGIN FORM ===
+begin_sheets_read_batch()
+enforce_session_memory_budget()
 if "logged_in" not in st.session_state:
     st.session_state["logged_in"] = False
 
@@ -10004,6 +11755,7 @@ else:
 
             if st.button("Logout", key="top_account_logout", use_container_width=True):
                 google_session_active = get_google_user_info().get("is_logged_in", False)
+                flush_pending_settings_save(force=True)
                 clear_remember_login_token()
                 clear_account_session_state()
                 st.session_state["logout_notice"] = "You have been logged out."
@@ -10061,11 +11813,15 @@ elif st.session_state.get("show_upload_sales_data_help_dialog", False):
 if not st.session_state["logged_in"]:
     st.stop()
 
+if not E2E_SEARCH_TERMS_LAYOUT_MODE:
+    ensure_tracking_sheets()
+    prefetch_session_bootstrap_reads(st.session_state.get("clinic_id", ""))
 if "rules" not in st.session_state:
     load_settings()
 if not E2E_SEARCH_TERMS_LAYOUT_MODE:
-    ensure_tracking_sheets()
     ensure_shared_dataset_loaded_for_session()
+    flush_pending_settings_save()
+    render_pending_settings_save_flush()
     show_pending_settings_sync_warning()
     show_pending_action_sync_warning()
 
@@ -10104,25 +11860,11 @@ def main_section_tab_visited(tab_name: str) -> bool:
 
 
 def get_started_latest_action_token(action_name: str) -> str:
-    timestamps = []
-    for entry in st.session_state.get("deleted_reminders", []):
-        if not isinstance(entry, dict):
-            continue
-        if str(entry.get("Action", "")).strip().lower() == action_name:
-            timestamps.append(str(entry.get("ActionedAt", "") or entry.get("DeletedAt", "")))
-    return max(timestamps, default="")
+    return action_log_index().latest_action_token.get(action_name, "")
 
 
 def get_started_latest_sent_token() -> str:
-    timestamps = [
-        str(entry.get("RemindedAt", ""))
-        for entry in st.session_state.get("wa_reminder_log", [])
-        if isinstance(entry, dict)
-    ]
-    action_token = get_started_latest_action_token(REMINDER_ACTION_SENT)
-    if action_token:
-        timestamps.append(action_token)
-    return max(timestamps, default="")
+    return max(action_log_index().latest_reminded_token, get_started_latest_action_token(REMINDER_ACTION_SENT))
 
 
 def get_setup_checklist_modules() -> list[dict]:
@@ -10334,6 +12076,20 @@ def get_started_incomplete_count() -> int:
     return sum(1 for step in get_setup_checklist_steps() if not step["done"])
 
 
+def tab_badge_svg_data_uri(badge_text: str, fill: str = "#dc2626", font_weight: str = "700") -> tuple[str, int]:
+    """(data URI, pixel width) of one pill badge; the SVG is 22px tall."""
+    width = max(26, 18 + (len(badge_text) * 8))
+    text_x = width / 2
+    badge_svg = f"""
+    <svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="22" viewBox="0 0 {width} 22">
+      <rect x="1" y="2" width="{width - 2}" height="18" rx="9" fill="{fill}"/>
+      <text x="{text_x}" y="11" dy="0.08em" fill="#fff" font-family="Arial, sans-serif" font-size="13" font-weight="{html_lib.escape(font_weight)}" text-anchor="middle" dominant-baseline="middle" alignment-baseline="middle">{html_lib.escape(badge_text)}</text>
+    </svg>
+    """
+    encoded_badge = base64.b64encode(badge_svg.encode("utf-8")).decode("ascii")
+    return f"data:image/svg+xml;base64,{encoded_badge}", width
+
+
 def tab_badge_label_text(
     tab_name: str,
     badge_text: str,
@@ -10344,16 +12100,8 @@ def tab_badge_label_text(
     badge_text = str(badge_text or "").strip()
     if not badge_text:
         return tab_name
-    width = max(26, 18 + (len(badge_text) * 8))
-    text_x = width / 2
-    badge_svg = f"""
-    <svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="22" viewBox="0 0 {width} 22">
-      <rect x="1" y="2" width="{width - 2}" height="18" rx="9" fill="{fill}"/>
-      <text x="{text_x}" y="11" dy="0.08em" fill="#fff" font-family="Arial, sans-serif" font-size="13" font-weight="{html_lib.escape(font_weight)}" text-anchor="middle" dominant-baseline="middle" alignment-baseline="middle">{html_lib.escape(badge_text)}</text>
-    </svg>
-    """
-    encoded_badge = base64.b64encode(badge_svg.encode("utf-8")).decode("ascii")
-    return f"{tab_name} ![{alt_text}](data:image/svg+xml;base64,{encoded_badge})"
+    badge_uri, _ = tab_badge_svg_data_uri(badge_text, fill=fill, font_weight=font_weight)
+    return f"{tab_name} ![{alt_text}]({badge_uri})"
 
 
 def tab_badge_label(tab_name: str, count: int, alt_text: str) -> str:
@@ -10482,6 +12230,8 @@ def render_main_section_nav(active_tab: str) -> None:
     widths = []
     for tab_name in MAIN_SECTION_TABS:
         count = main_section_tab_badge_count(tab_name)
+        if tab_name == "Reminders":
+            st.session_state[REMINDERS_NAV_BADGE_COUNT_KEY] = count
         extra_width = 0.7 if tab_name == "Graphs" else 0.38 if count > 0 else 0
         widths.append(max(1.35, min(2.9, len(tab_name) / 7 + extra_width)))
     nav_spacer_width = 6.8
@@ -10525,8 +12275,6 @@ def search_criteria_have_pending_changes() -> bool:
 def apply_search_criteria_changes(show_notice: bool = True):
     st.session_state["rules"] = normalize_search_term_rules(st.session_state.get("rules", DEFAULT_RULES.copy()))
     st.session_state["applied_rules"] = clone_reminder_rules(st.session_state["rules"])
-    st.session_state.pop("prepared_df", None)
-    st.session_state.pop("prepared_key", None)
     if show_notice:
         st.session_state["_search_criteria_refreshed"] = True
 
@@ -10545,6 +12293,8 @@ if st.session_state.get("working_df") is not None:
     elif not PRECOMPUTE_ANALYTICS_BUNDLE:
         st.session_state.pop("bundle", None)
         st.session_state.pop("bundle_key", None)
+    if st.session_state.get("bundle") is not None:
+        note_session_cache_use("bundle")
 else:
     # No data → clear any stale bundle so downstream checks can bail gracefully
     st.session_state.pop("bundle", None)
@@ -10590,6 +12340,157 @@ def format_dataset_saved_summary(row_count: int, start_date, end_date) -> str:
         f"**Total rows:** {rows_text}  \n"
         f"**Total date range (all uploads):** {date_range}"
     )
+
+
+def dataset_publish_progress_fraction(snapshot: dict) -> float:
+    stage = snapshot.get("stage", "")
+    if stage == "drive_upload":
+        total = int(snapshot.get("bytes_total") or 0)
+        done = int(snapshot.get("bytes_done") or 0)
+        return 0.3 + 0.6 * (min(done, total) / total if total else 0.0)
+    return {
+        "queued": 0.0,
+        "load_existing": 0.05,
+        "merge": 0.15,
+        "serialize": 0.25,
+        "settings_pointer_update": 0.92,
+        "complete": 1.0,
+    }.get(stage, 0.0)
+
+
+def dataset_publish_progress_text(snapshot: dict, own_job: bool = True) -> str:
+    if not own_job:
+        return "Another upload for this clinic is being saved."
+    text = DATASET_PUBLISH_STAGE_LABELS.get(snapshot.get("stage", ""), "Saving clinic data")
+    total = int(snapshot.get("bytes_total") or 0)
+    if snapshot.get("stage") == "drive_upload" and total:
+        done = min(int(snapshot.get("bytes_done") or 0), total)
+        text += f" ({done / 1_000_000:.1f} of {total / 1_000_000:.1f} MB)"
+    return text
+
+
+@st.fragment(run_every=DATASET_PUBLISH_JOB_POLL_SECONDS)
+def render_dataset_publish_progress(clinic_id: str) -> None:
+    begin_fragment_sheets_read_batch()
+    job = current_dataset_publish_job(clinic_id)
+    if job is None:
+        return
+    snapshot = job.snapshot()
+    if snapshot["status"] not in DatasetPublishJob.ACTIVE_STATUSES:
+        st.rerun()
+    own_job = job.owner == dataset_publish_session_owner()
+    st.progress(dataset_publish_progress_fraction(snapshot), text=dataset_publish_progress_text(snapshot, own_job))
+
+
+def apply_finished_dataset_publish_job(clinic_id: str) -> bool:
+    """Apply this session's finished publish once; a successful save reruns the app."""
+    job = current_dataset_publish_job(clinic_id)
+    if job is None or job.active or job.owner != dataset_publish_session_owner():
+        return False
+    job = dataset_publish_jobs().collect(job.clinic_key, job.job_id)
+    if job is None:
+        return False
+    context = job.context
+    file_names = ", ".join(context.get("file_names", []))
+    replace_overlapping_dates = bool(context.get("replace_overlapping_dates", False))
+    new_df = st.session_state.pop("_dataset_publish_upload_df", None)
+
+    if job.error is not None:
+        e = job.error
+        record_dataset_tracker_event(
+            "upload_save_failed",
+            "error",
+            file_name=file_names,
+            replace_overlapping_dates=replace_overlapping_dates,
+            message=str(e),
+            source="file_uploader",
+        )
+        record_error_tracker_event(
+            "upload_save_failed",
+            stage="publish_dataset_for_clinic",
+            error=e,
+            source="file_uploader",
+        )
+        record_performance_tracker_event(
+            "dataset_publish",
+            job.elapsed_ms(),
+            status="error",
+            message=str(e),
+            source="file_uploader",
+        )
+        st.session_state["_dataset_publish_failed_upload_key"] = job.upload_key
+        st.session_state["_dataset_publish_failed_operation_id"] = job.job_id
+        st.session_state["_pending_dataset_warning"] = "This upload could not be saved. Please try again."
+        return True
+
+    result = job.result
+    new_file_id = result["file_id"]
+    out_name = result["file_name"]
+    dataset_updated_at = result["updated_at"]
+    summary_rows = context.get("summary_rows", [])
+    settings_row_cache = result.get("settings_row_cache")
+    if isinstance(settings_row_cache, dict) and settings_row_cache.get("clinic_key") == job.clinic_key:
+        st.session_state["_settings_row_cache"] = settings_row_cache
+    remember_published_dataset(clinic_id, dataset_updated_at)
+    shared_df = shared_dataset_store().get(job.clinic_key, shared_dataset_version_key(new_file_id, dataset_updated_at))
+    if shared_df is not None:
+        st.session_state["working_df"] = shared_df
+        st.session_state["data_version"] = st.session_state.get("data_version", 0) + 1
+        st.session_state["shared_dataset_loaded"] = True
+        st.session_state["shared_dataset_name"] = out_name
+        remember_shared_dataset_loaded_for_current_pointer(st.session_state.get("clinic_id", ""))
+    else:
+        # Another publish replaced the shared frame; the next run reloads the saved pointer.
+        st.session_state.pop("working_df", None)
+    saved_history_rows = upload_summary_rows_to_history(summary_rows, status="Saved")
+    st.session_state["dataset_upload_history"] = merge_dataset_upload_history(
+        st.session_state.get("dataset_upload_history", []),
+        saved_history_rows,
+        replace_overlapping_dates=replace_overlapping_dates,
+        upload_min=context.get("upload_min"),
+        upload_max=context.get("upload_max"),
+    )
+    record_dataset_tracker_events([
+        {
+            "event": "upload_saved",
+            "status": "success",
+            "file_name": summary_row.get("file_name", ""),
+            "pms": summary_row.get("pms", ""),
+            "rows": summary_row.get("rows", ""),
+            "from_date": summary_row.get("from", ""),
+            "to_date": summary_row.get("to", ""),
+            "replace_overlapping_dates": replace_overlapping_dates,
+            "drive_file_id": new_file_id,
+            "drive_file_name": out_name,
+            "source": "file_uploader",
+        }
+        for summary_row in saved_history_rows
+    ])
+    record_performance_tracker_event(
+        "dataset_publish",
+        job.elapsed_ms(),
+        rows=result["rows"],
+        status="success",
+        message=out_name,
+        source="file_uploader",
+    )
+    st.session_state.pop("_dataset_publish_failed_upload_key", None)
+    st.session_state.pop("_dataset_publish_failed_operation_id", None)
+    st.session_state["last_saved_upload_key"] = job.upload_key
+    st.session_state["file_uploader_reset_version"] = st.session_state.get("file_uploader_reset_version", 0) + 1
+    st.session_state["last_uploaded_files"] = []
+    set_main_section_tab("Upload Data")
+    st.session_state["_pending_dataset_success"] = format_dataset_saved_summary(
+        result["rows"],
+        result["date_min"],
+        result["date_max"],
+    )
+    if isinstance(new_df, pd.DataFrame):
+        add_automatic_patient_exclusions_from_upload(new_df)
+    save_settings_quietly()
+    clear_upload_parse_caches()
+    st.rerun()
+    return True
 
 def get_dataset_date_range(df: pd.DataFrame) -> tuple[pd.Timestamp | None, pd.Timestamp | None]:
     if df is None or df.empty:
@@ -11289,7 +13190,7 @@ def _positive_int_or_na(value):
 
 
 def map_intervals_vec(df, rules):
-    df = df.copy()
+    df = df.copy(deep=False)
     if "ItemNorm" not in df.columns:
         def _norm(name):
             if not isinstance(name, str): return ""
@@ -11420,7 +13321,7 @@ def ensure_reminder_columns(df: pd.DataFrame, rules: dict) -> pd.DataFrame:
             "NextDueDate", "NextDueDateBase", "NextDueDateTs", "ReminderDate", "ReminderDateTs", "ChargeDate"
         ])
 
-    df = df.copy()
+    df = df.copy(deep=False)
     for col, default in [
         ("ChargeDate", pd.NaT),
         ("Client Name", ""),
@@ -11461,6 +13362,18 @@ def ensure_reminder_columns(df: pd.DataFrame, rules: dict) -> pd.DataFrame:
 
     return df
 
+def matched_items_sort_codes(values: pd.Series) -> np.ndarray:
+    """Sort codes for the joined, sorted MatchedItems label, built once per distinct list."""
+    keys = np.empty(len(values), dtype=object)
+    keys[:] = [tuple(x) if isinstance(x, list) else x for x in values]
+    codes, uniques = pd.factorize(keys, use_na_sentinel=False)
+    labels = np.array(
+        [", ".join(sorted(x)) if isinstance(x, tuple) else str(x) for x in uniques],
+        dtype=object,
+    )
+    return sorted_value_codes(labels)[codes]
+
+
 def drop_early_duplicates_fast(df: pd.DataFrame) -> pd.DataFrame:
     """
     Keeps only the most recent treatment record per client–animal–item combination
@@ -11472,99 +13385,488 @@ def drop_early_duplicates_fast(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
 
-    df = df.copy()
-    df["MatchedItems_str"] = df["MatchedItems"].apply(
-        lambda x: ", ".join(sorted(x)) if isinstance(x, list) else str(x)
-    )
-
-    # Sort chronologically within each client–animal–item
-    df.sort_values(
-        ["Client Name", "Animal Name", "MatchedItems_str", "ChargeDate"],
-        inplace=True,
-        ignore_index=True
-    )
-
-    # Within each animal+item, find the next charge date
-    g = df.groupby(["Client Name", "Animal Name", "MatchedItems_str"], dropna=False)
-    next_charge = g["ChargeDate"].shift(-1)
+    # Sort chronologically within each client–animal–item using integer codes.
+    client_codes = sorted_value_codes(df["Client Name"])
+    animal_codes = sorted_value_codes(df["Animal Name"])
+    item_codes = matched_items_sort_codes(df["MatchedItems"])
+    date_codes = sorted_value_codes(df["ChargeDate"])
+    order = np.lexsort((date_codes, item_codes, animal_codes, client_codes))
 
     # Rule:
     #  - Drop any row that has a later charge for the same item, regardless of early/late.
     #  - Keep only the last one (most recent) before the next charge.
-    keep = next_charge.isna()
+    group_key = combine_key_codes([client_codes, animal_codes, item_codes], len(df))[order]
+    date_missing = df["ChargeDate"].isna().to_numpy(dtype=bool)[order]
+    keep = np.ones(len(order), dtype=bool)
+    keep[:-1] = (group_key[1:] != group_key[:-1]) | date_missing[1:]
 
-    return df.loc[keep].drop(columns=["MatchedItems_str"]).reset_index(drop=True)
+    return df.take(order[keep]).reset_index(drop=True)
 
 
 def _exclusion_key(value) -> str:
     return _SPACE_RX.sub(" ", str(value or "").strip()).lower()
 
 
-def apply_reminder_exclusion_filters(df: pd.DataFrame, rules: dict) -> pd.DataFrame:
+def _terms_pattern(terms) -> re.Pattern | None:
+    terms = sorted({term for term in terms if term})
+    return re.compile("|".join(map(re.escape, terms))) if terms else None
+
+
+def _unique_value_codes(values: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    return codes, np.asarray(uniques, dtype=object)
+
+
+class ReminderExclusionFilter:
+    """
+    Exclusion lists compiled once: key sets for clients and patients, one regex for item terms,
+    and one regex per client for client-specific items. Rows are matched per distinct value.
+    """
+
+    def __init__(self, client_exclusions, patient_exclusions, client_item_exclusions, item_exclusions):
+        self.client_keys = frozenset(
+            _exclusion_key(name) for name in client_exclusions or [] if str(name or "").strip()
+        )
+        self.patient_pairs = frozenset(
+            (_exclusion_key(item.get("client", "")), _exclusion_key(item.get("patient", "")))
+            for item in patient_exclusions or []
+            if isinstance(item, dict) and str(item.get("client", "") or "").strip() and str(item.get("patient", "") or "").strip()
+        )
+        self.patient_clients = frozenset(client for client, _patient in self.patient_pairs)
+        client_terms: dict[str, set[str]] = {}
+        for exclusion in client_item_exclusions or []:
+            client_key = _exclusion_key(exclusion.get("client", ""))
+            item_term = str(exclusion.get("item", "") or "").strip().lower()
+            if client_key and item_term:
+                client_terms.setdefault(client_key, set()).add(item_term)
+        self.client_terms = {client: _terms_pattern(terms) for client, terms in client_terms.items()}
+        self.item_pattern = _terms_pattern(
+            str(term or "").strip().lower() for term in item_exclusions or [] if str(term or "").strip()
+        )
+
+    def exclude_mask(self, df: pd.DataFrame) -> np.ndarray:
+        mask = np.zeros(len(df), dtype=bool)
+        target_col = "Item Name" if "Item Name" in df.columns else "Plan Item"
+        item_codes = item_text = None
+        if target_col in df.columns and (self.item_pattern is not None or self.client_terms):
+            item_codes, item_uniques = _unique_value_codes(df[target_col])
+            item_text = [str(value).lower() for value in item_uniques]
+        if self.item_pattern is not None and item_codes is not None:
+            matched = np.fromiter((self.item_pattern.search(text) is not None for text in item_text), dtype=bool, count=len(item_text))
+            mask |= matched[item_codes]
+
+        needs_clients = self.client_keys or (self.patient_pairs and "Animal Name" in df.columns) or (self.client_terms and item_codes is not None)
+        if not needs_clients or "Client Name" not in df.columns:
+            return mask
+        client_codes, client_uniques = _unique_value_codes(df["Client Name"])
+        client_keys = [_exclusion_key(value) for value in client_uniques]
+        if self.client_keys:
+            excluded = np.fromiter((key in self.client_keys for key in client_keys), dtype=bool, count=len(client_keys))
+            mask |= excluded[client_codes]
+        if self.patient_pairs and "Animal Name" in df.columns:
+            mask |= self._pair_mask(
+                client_codes,
+                client_keys,
+                self.patient_clients,
+                *_unique_value_codes(df["Animal Name"]),
+                lambda client_key, animal: (client_key, _exclusion_key(animal)) in self.patient_pairs,
+            )
+        if self.client_terms and item_codes is not None:
+            mask |= self._pair_mask(
+                client_codes,
+                client_keys,
+                self.client_terms,
+                item_codes,
+                item_text,
+                lambda client_key, text: self.client_terms[client_key].search(text) is not None,
+            )
+        return mask
+
+    @staticmethod
+    def _pair_mask(client_codes, client_keys, clients, other_codes, other_uniques, matches) -> np.ndarray:
+        """Evaluate matches once per distinct (client, other) pair among rows whose client is listed."""
+        mask = np.zeros(len(client_codes), dtype=bool)
+        listed = np.fromiter((key in clients for key in client_keys), dtype=bool, count=len(client_keys))
+        rows = np.flatnonzero(listed[client_codes])
+        if not len(rows):
+            return mask
+        pairs = combine_key_codes([client_codes[rows], other_codes[rows]], len(rows))
+        unique_pairs, first, inverse = np.unique(pairs, return_index=True, return_inverse=True)
+        pair_matches = np.fromiter(
+            (
+                matches(client_keys[client_codes[rows[idx]]], other_uniques[other_codes[rows[idx]]])
+                for idx in first
+            ),
+            dtype=bool,
+            count=len(unique_pairs),
+        )
+        mask[rows] = pair_matches[inverse]
+        return mask
+
+
+def reminder_exclusion_filter() -> ReminderExclusionFilter:
+    """Session-cached compiled filter, rebuilt when any exclusion list changes."""
+    client_exclusions = list(st.session_state.get("client_exclusions", []) or [])
+    patient_exclusions = combined_patient_exclusions()
+    client_item_exclusions = normalize_client_item_exclusions(st.session_state.get("client_item_exclusions", []))
+    item_exclusions = list(st.session_state.get("exclusions", []) or [])
+    signature = repr((client_exclusions, patient_exclusions, client_item_exclusions, item_exclusions))
+    cached = st.session_state.get(REMINDER_EXCLUSION_FILTER_STATE_KEY)
+    if isinstance(cached, tuple) and len(cached) == 2 and cached[0] == signature:
+        return cached[1]
+    compiled = ReminderExclusionFilter(client_exclusions, patient_exclusions, client_item_exclusions, item_exclusions)
+    st.session_state[REMINDER_EXCLUSION_FILTER_STATE_KEY] = (signature, compiled)
+    return compiled
+
+
+def plan_item_column(item_names: pd.Series, rules: dict) -> np.ndarray:
+    codes, uniques = _unique_value_codes(item_names)
+    plan_items = np.empty(len(uniques), dtype=object)
+    plan_items[:] = [simplify_vaccine_text(get_visible_plan_item(value, rules)) for value in uniques]
+    return plan_items[codes]
+
+
+def apply_reminder_exclusion_filters(
+    df: pd.DataFrame,
+    rules: dict,
+    exclusion_filter: ReminderExclusionFilter | None = None,
+) -> pd.DataFrame:
     if df.empty:
         return df
     df = df.copy()
     if "Item Name" in df.columns:
-        df["Plan Item"] = df["Item Name"].apply(
-            lambda x: simplify_vaccine_text(get_visible_plan_item(x, rules))
-        )
+        df["Plan Item"] = plan_item_column(df["Item Name"], rules)
     elif "Plan Item" not in df.columns:
         df["Plan Item"] = ""
-    client_exclusions = st.session_state.get("client_exclusions", [])
-    if client_exclusions and "Client Name" in df.columns:
-        excluded_clients = {
-            _exclusion_key(name)
-            for name in client_exclusions
-            if str(name or "").strip()
-        }
-        if excluded_clients:
-            client_keys = df["Client Name"].map(_exclusion_key)
-            df = df[~client_keys.isin(excluded_clients)]
-    patient_exclusions = combined_patient_exclusions()
-    if patient_exclusions and {"Client Name", "Animal Name"}.issubset(df.columns):
-        excluded_patient_pairs = {
-            (
-                _exclusion_key(item.get("client", "")),
-                _exclusion_key(item.get("patient", "")),
-            )
-            for item in patient_exclusions
-            if isinstance(item, dict) and str(item.get("client", "") or "").strip() and str(item.get("patient", "") or "").strip()
-        }
-        if excluded_patient_pairs:
-            row_pairs = list(zip(
-                df["Client Name"].map(_exclusion_key),
-                df["Animal Name"].map(_exclusion_key),
-            ))
-            df = df[[pair not in excluded_patient_pairs for pair in row_pairs]]
-    client_item_exclusions = normalize_client_item_exclusions(st.session_state.get("client_item_exclusions", []))
-    if client_item_exclusions and "Client Name" in df.columns:
-        target_col = "Item Name" if "Item Name" in df.columns else "Plan Item"
-        if target_col in df.columns:
-            client_keys = df["Client Name"].map(_exclusion_key)
-            item_text = df[target_col].astype(str).str.lower()
-            exclude_mask = pd.Series(False, index=df.index)
-            for exclusion in client_item_exclusions:
-                client_key = _exclusion_key(exclusion.get("client", ""))
-                item_term = str(exclusion.get("item", "") or "").strip().lower()
-                if not client_key or not item_term:
+    exclude_mask = (exclusion_filter or reminder_exclusion_filter()).exclude_mask(df)
+    if not exclude_mask.any():
+        return df
+    return df[~exclude_mask]
+
+
+_NAT_NS = np.iinfo(np.int64).min
+_FRAME_INDEX_LOCK = threading.Lock()
+_SORTED_DATE_INDEXES: dict[tuple[int, str], "SortedDateIndex"] = {}
+
+
+class SortedDateIndex:
+    """
+    One frame column as ascending int64 nanoseconds (missing dates first) for searchsorted range queries.
+    order is None when the frame is physically sorted by the column, otherwise its stable argsort.
+    """
+
+    __slots__ = ("frame_ref", "dates", "order")
+
+    def __init__(self, frame_ref, dates: np.ndarray, order: np.ndarray | None):
+        self.frame_ref = frame_ref
+        self.dates = dates
+        self.order = order
+
+
+def _forget_frame_index(registry: dict, key, ref) -> None:
+    with _FRAME_INDEX_LOCK:
+        entry = registry.get(key)
+        if entry is not None and entry.frame_ref is ref:
+            registry.pop(key, None)
+
+
+def _coerce_datetimes(values: pd.Series) -> pd.Series:
+    return pd.to_datetime(values, errors="coerce")
+
+
+def sorted_date_index(frame: pd.DataFrame, column: str, parse=_coerce_datetimes) -> SortedDateIndex | None:
+    """Cached per frame object; frames are never reordered in place, so identity is enough."""
+    if not isinstance(frame, pd.DataFrame) or column not in frame.columns:
+        return None
+    key = (id(frame), column)
+    with _FRAME_INDEX_LOCK:
+        entry = _SORTED_DATE_INDEXES.get(key)
+    if entry is not None and entry.frame_ref() is frame:
+        return entry
+    parsed = parse(frame[column])
+    ns = pd.Series(parsed, copy=False).to_numpy(dtype="datetime64[ns]").view(np.int64)
+    order = None if len(ns) < 2 or bool(np.all(ns[1:] >= ns[:-1])) else np.argsort(ns, kind="stable")
+    dates = ns if order is None else ns[order]
+    entry = SortedDateIndex(
+        weakref.ref(frame, lambda ref, key=key: _forget_frame_index(_SORTED_DATE_INDEXES, key, ref)),
+        dates,
+        order,
+    )
+    with _FRAME_INDEX_LOCK:
+        _SORTED_DATE_INDEXES[key] = entry
+    return entry
+
+
+def date_range_rows(
+    frame: pd.DataFrame,
+    column: str,
+    start_ts: pd.Timestamp | None = None,
+    end_ts: pd.Timestamp | None = None,
+    include_missing: bool = False,
+    parse=_coerce_datetimes,
+) -> pd.DataFrame | None:
+    """Rows with start_ts <= column <= end_ts (plus missing dates if asked) via searchsorted, or None if unindexed."""
+    index = sorted_date_index(frame, column, parse)
+    if index is None:
+        return None
+    dates = index.dates
+    n_missing = int(np.searchsorted(dates, _NAT_NS, side="right"))
+    lo = n_missing if start_ts is None else max(n_missing, int(np.searchsorted(dates, pd.Timestamp(start_ts).value, side="left")))
+    hi = len(dates) if end_ts is None else int(np.searchsorted(dates, pd.Timestamp(end_ts).value, side="right"))
+    hi = max(lo, hi)
+    spans = [(0, n_missing), (lo, hi)] if include_missing and n_missing else [(lo, hi)]
+    if spans[0][1] == spans[-1][0]:
+        spans = [(spans[0][0], spans[-1][1])]
+    if len(spans) == 1 and spans[0] == (0, len(dates)):
+        return frame.copy(deep=False)
+    if index.order is None:
+        if len(spans) == 1:
+            return frame.iloc[spans[0][0]:spans[0][1]]
+        return frame.take(np.concatenate([np.arange(a, b) for a, b in spans]))
+    positions = np.sort(np.concatenate([index.order[a:b] for a, b in spans]))
+    return frame.take(positions)
+
+
+def sort_frame_by_date(frame: pd.DataFrame, column: str) -> pd.DataFrame:
+    if not isinstance(frame, pd.DataFrame) or frame.empty or column not in frame.columns:
+        return frame
+    if frame[column].is_monotonic_increasing:
+        return frame
+    return frame.sort_values(column, kind="stable", na_position="first")
+
+
+def build_prepared_reminder_rows(working_df: pd.DataFrame, rules: dict) -> pd.DataFrame:
+    prepared = ensure_reminder_columns(working_df, rules)
+    prepared = drop_early_duplicates_fast(prepared)
+    prepared = expand_reminder_dates(prepared)
+    # Kept in reminder-date order so window and period filters are searchsorted slices.
+    return sort_frame_by_date(prepared, "ReminderDateTs")
+
+
+def changed_rule_terms(old_rules: dict, new_rules: dict) -> set[str]:
+    """Search terms whose rule was added, removed or edited between two rule sets."""
+    terms = set()
+    for rule_text in set(old_rules or {}) | set(new_rules or {}):
+        if (old_rules or {}).get(rule_text) == (new_rules or {}).get(rule_text):
+            continue
+        term = str(rule_text or "").lower().strip()
+        if term:
+            terms.add(term)
+    return terms
+
+
+# Columns ensure_reminder_columns derives from the rules; everything else on a mapped row is rule independent.
+PREPARED_RULE_COLUMNS = (
+    "MatchedItems",
+    "MatchedSearchTerms",
+    "IntervalDays",
+    "BaseIntervalDays",
+    "Reminder1Days",
+    "Reminder2Days",
+    "OverdueReminderDays",
+    "NextDueDate",
+    "NextDueDateBase",
+    "NextDueDateTs",
+    "DueDateFmt",
+)
+
+
+class PreparedReminderRows:
+    """
+    build_prepared_reminder_rows output kept with the per-row rule mapping it came from.
+    A rule edit remaps only rows whose ItemNorm contains a changed term, then re-runs dedupe and
+    expansion for the client–animal–item groups those rows leave or join; every other row is kept.
+    """
+
+    SOURCE_COLUMN = "_PreparedSource"
+
+    def __init__(self, source_df: pd.DataFrame, rules: dict, working_df: pd.DataFrame, source_key: tuple):
+        self.working_ref = weakref.ref(working_df)
+        self.source_key = source_key
+        self.rules = copy.deepcopy(rules or {})
+        self.mapped = ensure_reminder_columns(source_df, self.rules)
+        self._label_texts: list[str] = []
+        self._label_index: dict[str, int] = {}
+        n = len(self.mapped)
+        if n:
+            self.client_codes = sorted_value_codes(self.mapped["Client Name"])
+            self.animal_codes = sorted_value_codes(self.mapped["Animal Name"])
+            self.date_codes = sorted_value_codes(self.mapped["ChargeDate"])
+            pair_codes, _ = pd.factorize(combine_key_codes([self.client_codes, self.animal_codes], n))
+            self.pair_codes = pair_codes.astype(np.int64, copy=False)
+            # One match test per distinct ItemNorm instead of one per row.
+            self.item_codes, self.item_norms = _unique_value_codes(self.mapped["ItemNorm"].astype(str))
+            self.label_ids = self._label_ids(self.mapped["MatchedItems"])
+        self._rebuild()
+
+    def serves(self, working_df: pd.DataFrame, source_key: tuple) -> bool:
+        return self.working_ref() is working_df and self.source_key == source_key
+
+    def memory_bytes(self) -> int:
+        """Mapping and index bytes; the prepared frame is accounted under the key it is published at."""
+        arrays = [
+            getattr(self, name, None)
+            for name in ("client_codes", "animal_codes", "date_codes", "pair_codes", "item_codes", "item_norms", "label_ids", "sources")
+        ]
+        return dataframe_memory_bytes(self.mapped) + sum(int(values.nbytes) for values in arrays if values is not None)
+
+    def _label_id(self, label: str) -> int:
+        label_id = self._label_index.get(label)
+        if label_id is None:
+            label_id = self._label_index[label] = len(self._label_texts)
+            self._label_texts.append(label)
+        return label_id
+
+    def _label_ids(self, matched_items: pd.Series) -> np.ndarray:
+        """Ids of the joined, sorted MatchedItems label that drop_early_duplicates_fast groups on."""
+        keys = np.empty(len(matched_items), dtype=object)
+        keys[:] = [tuple(x) if isinstance(x, list) else x for x in matched_items]
+        codes, uniques = pd.factorize(keys, use_na_sentinel=False)
+        ids = np.fromiter(
+            (self._label_id(", ".join(sorted(x)) if isinstance(x, tuple) else str(x)) for x in uniques),
+            dtype=np.int64,
+            count=len(uniques),
+        )
+        return ids[codes]
+
+    def _prepare(self, mapped: pd.DataFrame, positions: np.ndarray) -> tuple[pd.DataFrame, np.ndarray]:
+        """Dedupe and expand mapped rows, tagging each output row with its mapped position."""
+        prepared = expand_reminder_dates(drop_early_duplicates_fast(mapped.assign(**{self.SOURCE_COLUMN: positions})))
+        return prepared, prepared[self.SOURCE_COLUMN].to_numpy(dtype=np.int64)
+
+    def update(self, rules: dict) -> pd.DataFrame:
+        rules = copy.deepcopy(rules or {})
+        terms = changed_rule_terms(self.rules, rules)
+        if not terms or self.mapped.empty:
+            self.rules = rules
+            return self.prepared
+        state = (self.mapped, self.label_ids, self.prepared, self.sources)
+        try:
+            prepared = self._splice(terms, rules)
+        except Exception:
+            # Keep serving the rows of the rules they were built from; the next edit diffs against those.
+            self.mapped, self.label_ids, self.prepared, self.sources = state
+            raise
+        self.rules = rules
+        return prepared
+
+    def _splice(self, terms: set, rules: dict) -> pd.DataFrame:
+        item_hits = np.fromiter(
+            (any(term in item_norm for term in terms) for item_norm in self.item_norms),
+            dtype=bool,
+            count=len(self.item_norms),
+        )
+        positions = np.flatnonzero(item_hits[self.item_codes])
+        if not len(positions):
+            return self.prepared
+
+        remapped = ensure_reminder_columns(self.mapped.iloc[positions], rules)
+        mapped = self.mapped.copy(deep=False)
+        for col in PREPARED_RULE_COLUMNS:
+            values = mapped[col].copy()
+            values.iloc[positions] = remapped[col].to_numpy()
+            mapped[col] = values
+        label_ids = self.label_ids.copy()
+        label_ids[positions] = self._label_ids(remapped["MatchedItems"])
+
+        # Groups the remapped rows leave or join; rows of any other group keep their prepared rows.
+        width = len(self._label_texts)
+        touched = np.unique(np.concatenate([
+            self.pair_codes[positions] * width + self.label_ids[positions],
+            self.pair_codes[positions] * width + label_ids[positions],
+        ]))
+        rows = np.flatnonzero(np.isin(self.pair_codes * width + label_ids, touched))
+        keep = ~np.isin(self.pair_codes[self.sources] * width + self.label_ids[self.sources], touched)
+        self.mapped, self.label_ids = mapped, label_ids
+        if not keep.any():
+            return self._rebuild()
+
+        kept = self.prepared.iloc[np.flatnonzero(keep)]
+        rebuilt, rebuilt_sources = self._prepare(mapped.iloc[rows], rows)
+        if rebuilt.empty:
+            combined, sources = kept.reset_index(drop=True), self.sources[keep]
+        else:
+            rebuilt = rebuilt.drop(columns=self.SOURCE_COLUMN)
+            if list(rebuilt.columns) != list(kept.columns):
+                return self._rebuild()
+            combined = pd.concat([kept, rebuilt], ignore_index=True)
+            sources = np.concatenate([self.sources[keep], rebuilt_sources])
+        combined = self._settle_dtypes(combined, kept, rebuilt, sources)
+        if not pd.api.types.is_datetime64_any_dtype(combined["ReminderDateTs"]):
+            return self._rebuild()
+
+        # Position each row would have in the expanded frame of a full build, then its stable date order.
+        label_ranks = sorted_value_codes(np.array(self._label_texts, dtype=object))
+        expanded_order = np.lexsort((
+            combined["ReminderDays"].to_numpy(dtype=np.int64),
+            sources,
+            self.date_codes[sources],
+            label_ranks[self.label_ids[sources]],
+            self.animal_codes[sources],
+            self.client_codes[sources],
+        ))
+        expanded_positions = np.empty(len(expanded_order), dtype=np.int64)
+        expanded_positions[expanded_order] = np.arange(len(expanded_order), dtype=np.int64)
+        reminder_ts = combined["ReminderDateTs"].to_numpy().view(np.int64)
+        order = np.lexsort((expanded_positions, reminder_ts))
+        prepared = combined.take(order)
+        prepared.index = pd.RangeIndex(len(order)).take(expanded_positions[order])
+        self.prepared, self.sources = prepared, sources[order]
+        return self.prepared
+
+    def _settle_dtypes(self, combined: pd.DataFrame, kept: pd.DataFrame, rebuilt: pd.DataFrame, sources: np.ndarray) -> pd.DataFrame:
+        """Re-infer columns whose dtype a full build would infer differently from the spliced parts."""
+        for col in combined.columns:
+            mixed = not rebuilt.empty and kept[col].dtype != rebuilt[col].dtype
+            if not mixed and (combined[col].dtype == object or not combined[col].isna().all()):
+                continue
+            if mixed:
+                # Usually one part is all missing (a reminder no remapped rule sets): the other part's dtype wins.
+                settled = self._settled_dtype(kept[col], rebuilt[col])
+                if settled is not None:
+                    combined[col] = combined[col].astype(settled)
                     continue
-                exclude_mask |= (
-                    client_keys.eq(client_key)
-                    & item_text.str.contains(re.escape(item_term), regex=True, na=False)
-                )
-            df = df[~exclude_mask]
-    item_exclusions = [str(term or "").strip().lower() for term in st.session_state.get("exclusions", []) if str(term or "").strip()]
-    if item_exclusions:
-        excl_pattern = "|".join(map(re.escape, item_exclusions))
-        target_col = "Item Name" if "Item Name" in df.columns else "Plan Item"
-        df = df[~df[target_col].astype(str).str.lower().str.contains(excl_pattern, regex=True, na=False)]
-    return df
+            origin = self.mapped[col].take(sources) if col in self.mapped.columns else combined[col]
+            combined[col] = pd.DataFrame(origin.to_frame(col).to_dict("records"), index=combined.index)[col]
+        return combined
+
+    @staticmethod
+    def _settled_dtype(kept: pd.Series, rebuilt: pd.Series):
+        """The dtype that absorbs the other part's missing values unchanged, when there is one."""
+        for part, other in ((kept, rebuilt), (rebuilt, kept)):
+            if part.dtype == object or part.isna().all() or not other.isna().all():
+                continue
+            if pd.api.types.is_float_dtype(part.dtype) or pd.api.types.is_datetime64_dtype(part.dtype) or pd.api.types.is_string_dtype(part.dtype):
+                return part.dtype
+        return None
 
+    def _rebuild(self) -> pd.DataFrame:
+        if self.mapped.empty:
+            self.prepared, self.sources = self.mapped, np.empty(0, dtype=np.int64)
+            return self.prepared
+        prepared, _ = self._prepare(self.mapped, np.arange(len(self.mapped), dtype=np.int64))
+        self.prepared = sort_frame_by_date(prepared, "ReminderDateTs")
+        self.sources = self.prepared.pop(self.SOURCE_COLUMN).to_numpy(dtype=np.int64)
+        return self.prepared
 
-def build_prepared_reminder_rows(working_df: pd.DataFrame, rules: dict) -> pd.DataFrame:
-    prepared = ensure_reminder_columns(working_df, rules)
-    prepared = drop_early_duplicates_fast(prepared)
-    prepared = expand_reminder_dates(prepared)
+
+def incremental_prepared_reminder_rows(
+    state_key: str,
+    working_df: pd.DataFrame,
+    source_key: tuple,
+    rules: dict,
+    load_source=None,
+) -> pd.DataFrame:
+    """Prepared reminder rows for a source frame, patched on rule edits instead of rebuilt."""
+    state = st.session_state.get(state_key)
+    if isinstance(state, PreparedReminderRows) and state.serves(working_df, source_key):
+        prepared = state.update(rules)
+    else:
+        source_df = working_df if load_source is None else load_source(working_df)
+        state = PreparedReminderRows(source_df, rules, working_df, source_key)
+        prepared = state.prepared
+    st.session_state[state_key] = state
+    note_session_cache_use(state_key)
     return prepared
 
 
@@ -11572,12 +13874,10 @@ def filter_sales_as_of_date(working_df: pd.DataFrame, as_of_date: date | None) -
     if working_df is None:
         return pd.DataFrame()
     if working_df.empty or as_of_date is None or "ChargeDate" not in working_df.columns:
-        return working_df.copy()
+        return working_df.copy(deep=False)
 
-    charge_dates = parse_dates(working_df["ChargeDate"])
     cutoff = pd.Timestamp(as_of_date).normalize()
-    keep_mask = charge_dates.isna() | (charge_dates <= cutoff)
-    return working_df.loc[keep_mask].copy()
+    return date_range_rows(working_df, "ChargeDate", end_ts=cutoff, include_missing=True, parse=parse_dates)
 
 
 def empty_grouped_reminders_frame() -> pd.DataFrame:
@@ -11633,17 +13933,17 @@ def build_active_reminder_window(
         grouped = cached.get("grouped")
         reminders_before_exclusions = int(cached.get("reminders_before_exclusions", 0) or 0)
         if isinstance(grouped, pd.DataFrame):
-            return grouped.copy(), reminders_before_exclusions
-
-    reminder_ts = prepared.get("ReminderDateTs")
-    if reminder_ts is None:
-        reminder_ts = prepared.get("NextDueDateTs")
-    if reminder_ts is None:
-        reminder_ts = pd.to_datetime(prepared["NextDueDate"], errors="coerce")
+            note_session_cache_use("_active_reminder_window_cache")
+            return share_frame_sort_index(grouped, grouped.copy(deep=False)), reminders_before_exclusions
 
     start_ts = pd.Timestamp(start_date)
     end_ts = pd.Timestamp(end_date)
-    due = prepared[(reminder_ts >= start_ts) & (reminder_ts <= end_ts)].copy()
+    due = date_range_rows(prepared, "ReminderDateTs", start_ts, end_ts)
+    if due is None:
+        reminder_ts = prepared.get("NextDueDateTs")
+        if reminder_ts is None:
+            reminder_ts = pd.to_datetime(prepared["NextDueDate"], errors="coerce")
+        due = prepared[(reminder_ts >= start_ts) & (reminder_ts <= end_ts)]
     reminders_before_exclusions = len(due)
     due = apply_reminder_exclusion_filters(due, rules)
     grouped = (
@@ -11651,22 +13951,30 @@ def build_active_reminder_window(
         if not due.empty
         else empty_grouped_reminders_frame()
     )
+    cached_grouped = grouped.copy(deep=False)
     st.session_state["_active_reminder_window_cache"] = {
         "key": cache_key,
-        "grouped": grouped.copy(),
+        "grouped": cached_grouped,
         "reminders_before_exclusions": reminders_before_exclusions,
     }
-    return grouped, reminders_before_exclusions
+    note_session_cache_use("_active_reminder_window_cache")
+    return share_frame_sort_index(cached_grouped, grouped), reminders_before_exclusions
 
 
 def get_prepared_df(working_df: pd.DataFrame, rules: dict) -> pd.DataFrame:
     key = (st.session_state.get("data_version", 0), _rules_fp(rules), PREPARED_SCHEMA_VERSION)
     if st.session_state.get("prepared_key") != key:
-        prepared = build_prepared_reminder_rows(working_df, rules)
+        prepared = incremental_prepared_reminder_rows(
+            "_prepared_reminder_rows",
+            working_df,
+            (st.session_state.get("data_version", 0), PREPARED_SCHEMA_VERSION),
+            rules,
+        )
 
         st.session_state["prepared_df"] = prepared
         st.session_state["prepared_key"] = key
 
+    note_session_cache_use("prepared_df")
     return st.session_state["prepared_df"]
 
 
@@ -11835,19 +14143,11 @@ def reminder_row_in_date_range(row: dict, start_date: date, end_date: date) -> b
 
 
 def active_reminder_action_fingerprint() -> tuple:
-    values = []
-    for entry in st.session_state.get("deleted_reminders", []) or []:
-        if not isinstance(entry, dict):
-            continue
-        values.append((
-            hidden_reminder_key(entry),
-            str(entry.get("Action", "") or "").strip().lower(),
-            str(entry.get("ActionedAt", "") or entry.get("DeletedAt", "") or ""),
-        ))
-    return tuple(sorted(values))
+    return ("hidden_reminders", hidden_reminder_index().version)
 
 
 def active_reminder_badge_cache_key(today: date, rules: dict) -> tuple:
+    """Identifies the grouped badge window; actions are applied to its count incrementally."""
     return (
         int(st.session_state.get("data_version", 0) or 0),
         _rules_fp(rules),
@@ -11855,42 +14155,67 @@ def active_reminder_badge_cache_key(today: date, rules: dict) -> tuple:
         today.isoformat(),
         normalized_reminder_lookback_days(),
         normalized_reminder_group_days(),
-        active_reminder_action_fingerprint(),
         PREPARED_SCHEMA_VERSION,
     )
 
 
+def build_active_reminder_badge_window(today: date, rules: dict) -> dict[int, int]:
+    """Row counts per hidden-key digest for grouped reminders in the look-back window, before actions."""
+    working_df = st.session_state.get("working_df")
+    lookback_start_date = today - timedelta(days=normalized_reminder_lookback_days())
+    prepared = get_prepared_df(working_df, rules)
+    grouped, _ = build_active_reminder_window(
+        prepared,
+        rules,
+        lookback_start_date,
+        today,
+        normalized_reminder_group_days(),
+    )
+    if grouped.empty:
+        return {}
+    grouped_badge_range = grouped[
+        [reminder_row_in_date_range(row, lookback_start_date, today) for row in grouped.to_dict("records")]
+    ]
+    digests, counts = np.unique(hidden_reminder_key_digests(grouped_badge_range), return_counts=True)
+    return {int(digest): int(count) for digest, count in zip(digests, counts)}
+
+
+def count_active_badge_rows(row_counts: dict[int, int], index: HiddenReminderIndex) -> int:
+    hidden = set(int(digest) for digest in index.digests())
+    return sum(count for digest, count in row_counts.items() if digest not in hidden)
+
+
 def get_active_reminder_badge_count(today: date | None = None) -> int:
     working_df = st.session_state.get("working_df")
     if working_df is None or getattr(working_df, "empty", True):
         return 0
     today = today or user_today()
-    lookback_start_date = today - timedelta(days=normalized_reminder_lookback_days())
     try:
         rules = get_applied_reminder_rules()
         if not rules:
             return 0
         cache_key = active_reminder_badge_cache_key(today, rules)
+        index = hidden_reminder_index()
         cached = st.session_state.get("_active_reminder_badge_cache")
         if isinstance(cached, dict) and cached.get("key") == cache_key:
-            return int(cached.get("count", 0) or 0)
-        prepared = get_prepared_df(working_df, rules)
-        grouped, _ = build_active_reminder_window(
-            prepared,
-            rules,
-            lookback_start_date,
-            today,
-            normalized_reminder_group_days(),
-        )
-        if grouped.empty:
-            st.session_state["_active_reminder_badge_cache"] = {"key": cache_key, "count": 0}
-            return 0
-        grouped_badge_range = grouped[
-            [reminder_row_in_date_range(row, lookback_start_date, today) for row in grouped.to_dict("records")]
-        ].copy()
-        active_badge_range = filter_hidden_reminders(grouped_badge_range)
-        count = len(active_badge_range.index)
-        st.session_state["_active_reminder_badge_cache"] = {"key": cache_key, "count": count}
+            row_counts = cached.get("row_counts", {})
+            count = int(cached.get("count", 0) or 0)
+            events = index.events_since(cached.get("version", 0)) if cached.get("index") is index else None
+            if events is None:
+                count = count_active_badge_rows(row_counts, index)
+            else:
+                for _version, digest, delta in events:
+                    count -= delta * row_counts.get(digest, 0)
+        else:
+            row_counts = build_active_reminder_badge_window(today, rules)
+            count = count_active_badge_rows(row_counts, index) if row_counts else 0
+        st.session_state["_active_reminder_badge_cache"] = {
+            "key": cache_key,
+            "row_counts": row_counts,
+            "index": index,
+            "version": index.version,
+            "count": count,
+        }
         return count
     except Exception:
         return 0
@@ -12387,6 +14712,7 @@ st.markdown(
     unsafe_allow_html=True,
 )
 consume_main_section_tab_query_param()
+apply_finished_dataset_publish_job(st.session_state.get("clinic_id", ""))
 default_main_section_tab = canonical_main_section_tab(st.session_state.get("main_section_tab", "Reminders"))
 if default_main_section_tab not in MAIN_SECTION_TABS:
     default_main_section_tab = "Reminders"
@@ -12421,6 +14747,9 @@ if active_main_section == "Upload Data":
         """,
         unsafe_allow_html=True,
     )
+    publish_job = current_dataset_publish_job(st.session_state.get("clinic_id", ""))
+    if publish_job is not None and publish_job.active:
+        render_dataset_publish_progress(st.session_state.get("clinic_id", ""))
     saved_dataset_rows = get_saved_dataset_summary_rows()
     render_dataset_status(saved_dataset_rows)
     dataset_summary_slot = st.empty()
@@ -12644,123 +14973,37 @@ if active_main_section == "Upload Data":
                     st.error("Not logged in.")
                     st.stop()
     
-                existing_file_id, existing_name = get_existing_dataset_pointer(clinic_id)
-                existing_df = None
-                if existing_file_id:
-                    try:
-                        existing_df = load_existing_shared_df(existing_file_id, existing_name, clinic_id=clinic_id)
-                    except Exception as e:
-                        record_error_tracker_event(
-                            "existing_dataset_load_failed",
-                            stage="upload_existing_dataset_check",
-                            error=e,
-                            source="file_uploader",
-                        )
-                        record_dataset_tracker_event(
-                            "upload_save_failed",
-                            "error",
-                            file_name=", ".join(current_files),
-                            message=str(e),
-                            source="file_uploader",
-                        )
-                        st.error(
-                            "Could not load the existing clinic data, so this upload was not saved. "
-                            "Please try again before replacing clinic data."
-                        )
-                        st.stop()
-    
-                def save_uploaded_dataset(replace_overlapping_dates: bool = False):
-                    publish_started = time.perf_counter()
-                    try:
-                        merged_df, new_file_id, out_name = publish_dataset_for_clinic(
-                            clinic_id=clinic_id,
-                            new_df=new_df,
-                            datasets_folder_id=DATASETS_FOLDER_ID,
-                            replace_overlapping_dates=replace_overlapping_dates,
-                            existing_file_id=existing_file_id,
-                            existing_name=existing_name,
-                            existing_df=existing_df,
-                        )
-                    except Exception as e:
-                        record_dataset_tracker_event(
-                            "upload_save_failed",
-                            "error",
-                            file_name=", ".join(current_files),
-                            replace_overlapping_dates=replace_overlapping_dates,
-                            message=str(e),
-                            source="file_uploader",
-                        )
-                        record_error_tracker_event(
-                            "upload_save_failed",
-                            stage="publish_dataset_for_clinic",
-                            error=e,
-                            source="file_uploader",
-                        )
-                        record_performance_tracker_event(
-                            "dataset_publish",
-                            (time.perf_counter() - publish_started) * 1000,
-                            status="error",
-                            message=str(e),
-                            source="file_uploader",
+                publish_job = current_dataset_publish_job(clinic_id)
+                if publish_job is not None and publish_job.active:
+                    # Progress for the in-flight publish is polled above the uploader.
+                    pass
+                elif st.session_state.get("_dataset_publish_failed_upload_key") == current_upload_key:
+                    if st.button("Try saving again", key="retry_dataset_publish"):
+                        st.session_state.pop("_dataset_publish_failed_upload_key", None)
+                        st.session_state["_dataset_publish_resume_operation_id"] = st.session_state.pop(
+                            "_dataset_publish_failed_operation_id",
+                            "",
                         )
-                        raise
-    
-                    st.session_state["working_df"] = sanitize_working_df(merged_df)
-                    st.session_state["data_version"] = st.session_state.get("data_version", 0) + 1
-                    st.session_state["shared_dataset_loaded"] = True
-                    st.session_state["shared_dataset_name"] = out_name
-                    remember_shared_dataset_loaded_for_current_pointer(st.session_state.get("clinic_id", ""))
-                    existing_upload_history = st.session_state.get("dataset_upload_history", [])
-                    st.session_state["dataset_upload_history"] = merge_dataset_upload_history(
-                        existing_upload_history,
-                        upload_summary_rows_to_history(summary_rows, status="Saved"),
-                        replace_overlapping_dates=replace_overlapping_dates,
-                        upload_min=upload_min,
-                        upload_max=upload_max,
-                    )
-                    saved_history_rows = upload_summary_rows_to_history(summary_rows, status="Saved")
-                    record_dataset_tracker_events([
-                        {
-                            "event": "upload_saved",
-                            "status": "success",
-                            "file_name": summary_row.get("file_name", ""),
-                            "pms": summary_row.get("pms", ""),
-                            "rows": summary_row.get("rows", ""),
-                            "from_date": summary_row.get("from", ""),
-                            "to_date": summary_row.get("to", ""),
-                            "replace_overlapping_dates": replace_overlapping_dates,
-                            "drive_file_id": new_file_id,
-                            "drive_file_name": out_name,
-                            "source": "file_uploader",
-                        }
-                        for summary_row in saved_history_rows
-                    ])
-                    record_performance_tracker_event(
-                        "dataset_publish",
-                        (time.perf_counter() - publish_started) * 1000,
-                        rows=len(merged_df),
-                        status="success",
-                        message=out_name,
-                        source="file_uploader",
-                    )
-                    st.session_state["last_saved_upload_key"] = current_upload_key
-                    st.session_state["file_uploader_reset_version"] = st.session_state.get("file_uploader_reset_version", 0) + 1
-                    st.session_state["last_uploaded_files"] = []
-                    set_main_section_tab("Upload Data")
-                    merged_min, merged_max = dataset_date_bounds(merged_df)
-                    st.session_state["_pending_dataset_success"] = format_dataset_saved_summary(
-                        len(merged_df),
-                        merged_min,
-                        merged_max,
+                        st.rerun()
+                else:
+                    existing_file_id, existing_name = get_existing_dataset_pointer(clinic_id)
+                    start_dataset_publish_job(
+                        clinic_id,
+                        new_df,
+                        upload_key=current_upload_key,
+                        operation_id=st.session_state.pop("_dataset_publish_resume_operation_id", ""),
+                        context={
+                            "file_names": list(current_files),
+                            "summary_rows": list(summary_rows),
+                            "upload_min": upload_min,
+                            "upload_max": upload_max,
+                            "replace_overlapping_dates": False,
+                        },
+                        datasets_folder_id=DATASETS_FOLDER_ID,
+                        existing_file_id=existing_file_id,
+                        existing_name=existing_name,
                     )
-                    add_automatic_patient_exclusions_from_upload(new_df)
-                    save_settings_quietly()
-                    clear_upload_parse_caches()
-    
                     st.rerun()
-    
-                with busy_overlay("Saving clinic data", "Larger exports can take a moment."):
-                    save_uploaded_dataset()
     
     # -------------------------------------
     # Clear Clinic Data
@@ -12864,6 +15107,7 @@ if active_main_section == "Upload Data":
 # --------------------------------
 def render_table(df, title, key_prefix, msg_key, rules):
     render_started = time.perf_counter()
+    sort_base = df
     if df.empty:
         st.info(f"No reminders in {title}. Try another date range or check Search Terms.")
         record_slow_render_performance("reminders_table_render", render_started, rows=0, source=key_prefix)
@@ -12874,18 +15118,70 @@ def render_table(df, title, key_prefix, msg_key, rules):
         record_slow_render_performance("reminders_table_render", render_started, rows=0, source=key_prefix)
         return
 
+    render_reminders_table_fragment(df, key_prefix, msg_key, sort_base)
+    record_slow_render_performance("reminders_table_render", render_started, rows=len(df), source=key_prefix)
+
+
+@st.fragment
+def render_reminders_table_fragment(df, key_prefix, msg_key, sort_base=None):
+    """
+    Row actions, sorting, paging and the composer rerun only this fragment.
+    The nav badge is redrawn from here after each action.
+    """
+    begin_fragment_sheets_read_batch()
+    show_pending_action_sync_warning()
     show_pending_recent_reminder_warning()
 
     selected_reminders_subtab = render_reminders_subtab_selector(key_prefix)
     if selected_reminders_subtab == "Active Reminders":
         active_df = filter_hidden_reminders(df)
         if not active_df.empty:
-            render_table_with_buttons(active_df, key_prefix, msg_key, hidden_index=get_hidden_reminders_index())
+            render_table_with_buttons(
+                active_df,
+                key_prefix,
+                msg_key,
+                hidden_index=get_hidden_reminders_index(),
+                sort_base=sort_base,
+            )
         render_whatsapp_tools(key_prefix, msg_key)
 
     else:
         render_actioned_reminders_tab(key_prefix)
-    record_slow_render_performance("reminders_table_render", render_started, rows=len(df), source=key_prefix)
+    refresh_reminders_nav_badge()
+
+
+def refresh_reminders_nav_badge() -> None:
+    """
+    Fragment reruns leave the nav as the last full run drew it, so the new count is drawn over it here.
+    A full rerun happens only when the count reaches or leaves zero, since that changes the nav layout.
+    """
+    badge_count = main_section_tab_badge_count("Reminders")
+    if reminders_nav_badge_is_stale(badge_count):
+        st.rerun(scope="app")
+    rendered = st.session_state.get(REMINDERS_NAV_BADGE_COUNT_KEY)
+    if rendered is not None and is_fragment_rerun() and badge_count != int(rendered):
+        st.markdown(reminders_nav_badge_css(badge_count), unsafe_allow_html=True)
+
+
+def reminders_nav_badge_is_stale(count: int | None = None) -> bool:
+    rendered = st.session_state.get(REMINDERS_NAV_BADGE_COUNT_KEY)
+    if rendered is None:
+        return False
+    count = main_section_tab_badge_count("Reminders") if count is None else count
+    return (count > 0) != (int(rendered) > 0)
+
+
+def reminders_nav_badge_css(count: int) -> str:
+    """Hide the nav's drawn badge image and show the current count in its place."""
+    button = f".st-key-{main_section_nav_button_key('Reminders')} button"
+    css = f"{button} img {{ display: none !important; }}"
+    if count > 0:
+        badge_uri, width = tab_badge_svg_data_uri(str(count))
+        css += (
+            f" {button} p::after {{ content: ''; display: inline-block; height: 1.1rem; "
+            f"width: {width / 22 * 1.1:.2f}rem; background: url('{badge_uri}') center / contain no-repeat; }}"
+        )
+    return f"<style>{css}</style>"
 
 
 def render_sender_name_input(key_suffix: str):
@@ -12907,7 +15203,7 @@ def render_sender_name_input(key_suffix: str):
     if new_name != prev_name:
         st.session_state["user_name"] = new_name
         st.session_state["user_name_updated_at"] = user_now().isoformat()
-        save_settings_quietly()
+        queue_settings_save()
 
 
 def build_whatsapp_message_for_row(row) -> str:
@@ -13070,7 +15366,7 @@ def decline_reminder_action(row_data: dict, key_prefix: str):
             remember_action_tracker_save_failure()
             return
     if hidden_action == REMINDER_ACTION_SENT:
-        remove_wa_reminder_click_for_row(row_data, queue_settings_removal=False)
+        remove_wa_reminder_click_for_row(row_data)
     upsert_hidden_reminder(row_data, REMINDER_ACTION_DECLINED, now=now)
     hide_revealed_reminders_after_action(key_prefix)
 
@@ -13086,7 +15382,6 @@ def remove_actioned_reminder_action(row_data: dict, key_prefix: str):
         if hidden_action == REMINDER_ACTION_SENT:
             remove_wa_reminder_click_for_row(row_data)
         remove_actioned_reminder(row_data)
-        save_settings_quietly()
 
 
 def render_search_criteria_refresh_notice():
@@ -13178,33 +15473,145 @@ def get_reminder_table_sort(key_prefix: str) -> dict:
 
 
 def parse_reminder_sort_date(value):
-    first_value = str(value or "").split("|", 1)[0].strip()
+    return _parse_reminder_sort_date_text(str(value or "").split("|", 1)[0].strip())
+
+
+@lru_cache(maxsize=8192)
+def _parse_reminder_sort_date_text(first_value: str):
     return pd.to_datetime(first_value, errors="coerce", dayfirst=True)
 
 
-def sort_reminder_table(df: pd.DataFrame, key_prefix: str) -> pd.DataFrame:
+def sort_rank_codes(values) -> np.ndarray:
+    """Dense ranks in sort order with -1 for missing values."""
+    codes, _uniques = pd.factorize(values, sort=True)
+    return codes.astype(np.int64, copy=False)
+
+
+def unique_sort_rank_codes(values: pd.Series, sort_key) -> np.ndarray:
+    """Rank codes from sort_key applied once per distinct value."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    unique_ranks = sort_rank_codes(pd.Series([sort_key(value) for value in uniques]))
+    return unique_ranks[codes]
+
+
+def stable_rank_order(codes: np.ndarray, ascending: bool) -> np.ndarray:
+    """Positions sorted like a stable mergesort, ties kept in row order and missing values last."""
+    keys = codes if ascending else -codes
+    keys = np.where(codes < 0, np.iinfo(np.int64).max, keys)
+    return np.argsort(keys, kind="stable")
+
+
+_FRAME_SORT_INDEXES: dict[int, "FrameSortIndex"] = {}
+_VERSIONED_FRAME_SORT_INDEXES: dict[tuple, "FrameSortIndex"] = {}
+
+
+class FrameSortIndex:
+    """Per-column rank codes and (column, direction) permutations for one frame object."""
+
+    __slots__ = ("frame_ref", "codes", "orders")
+
+    def __init__(self, frame_ref):
+        self.frame_ref = frame_ref
+        self.codes: dict[str, np.ndarray] = {}
+        self.orders: dict[tuple[str, bool], np.ndarray] = {}
+
+    def order(self, frame: pd.DataFrame, column: str, ascending: bool, rank_codes) -> np.ndarray:
+        cache_key = (column, bool(ascending))
+        order = self.orders.get(cache_key)
+        if order is None:
+            codes = self.codes.get(column)
+            if codes is None:
+                codes = self.codes[column] = rank_codes(frame[column])
+            order = self.orders[cache_key] = stable_rank_order(codes, ascending)
+        return order
+
+
+def frame_sort_index(frame: pd.DataFrame) -> FrameSortIndex:
+    key = id(frame)
+    with _FRAME_INDEX_LOCK:
+        entry = _FRAME_SORT_INDEXES.get(key)
+    if entry is not None and entry.frame_ref() is frame:
+        return entry
+    entry = FrameSortIndex(weakref.ref(frame, lambda ref, key=key: _forget_frame_index(_FRAME_SORT_INDEXES, key, ref)))
+    with _FRAME_INDEX_LOCK:
+        _FRAME_SORT_INDEXES[key] = entry
+    return entry
+
+
+def share_frame_sort_index(source: pd.DataFrame, frame: pd.DataFrame) -> pd.DataFrame:
+    """Let an unmodified copy of source reuse, and extend, source's rank codes and permutations."""
+    shared = frame_sort_index(source)
+    entry = frame_sort_index(frame)
+    entry.codes = shared.codes
+    entry.orders = shared.orders
+    return frame
+
+
+def versioned_frame_sort_index(frame: pd.DataFrame, version: tuple) -> FrameSortIndex:
+    """Sort index shared by every rebuild of a frame whose contents are fixed by version."""
+    key = (version, len(frame.index), tuple(map(str, frame.columns)))
+    with _FRAME_INDEX_LOCK:
+        entry = _VERSIONED_FRAME_SORT_INDEXES.pop(key, None) or FrameSortIndex(None)
+        _VERSIONED_FRAME_SORT_INDEXES[key] = entry
+        while len(_VERSIONED_FRAME_SORT_INDEXES) > VERSIONED_FRAME_SORT_INDEX_LIMIT:
+            _VERSIONED_FRAME_SORT_INDEXES.pop(next(iter(_VERSIONED_FRAME_SORT_INDEXES)))
+    return entry
+
+
+def frame_sort_order(
+    frame: pd.DataFrame,
+    column: str,
+    ascending: bool,
+    rank_codes,
+    base: pd.DataFrame | None = None,
+    version: tuple | None = None,
+) -> np.ndarray:
+    """
+    Positions of frame rows in sorted order. When frame is a row subset of a longer-lived base frame,
+    the base permutation is reused and filtered instead of re-sorting. A version marks frames rebuilt
+    each run with the same contents, so their permutations outlive the frame objects.
+    """
+    if base is not None and base is not frame and column in base.columns and base.index.is_unique:
+        positions = base.index.get_indexer(frame.index)
+        if len(positions) and (positions >= 0).all():
+            base_order = frame_sort_index(base).order(base, column, ascending, rank_codes)
+            member = np.full(len(base), -1, dtype=np.int64)
+            member[positions] = np.arange(len(frame))
+            mapped = member[base_order]
+            return mapped[mapped >= 0]
+    index = frame_sort_index(frame) if version is None else versioned_frame_sort_index(frame, version)
+    return index.order(frame, column, ascending, rank_codes)
+
+
+def reminder_sort_rank_codes(values: pd.Series) -> np.ndarray:
+    if values.name in {"Reminder Date", "Due Date", "Charge Date"}:
+        return unique_sort_rank_codes(values, parse_reminder_sort_date)
+    return unique_sort_rank_codes(values, lambda value: normalize_display_case(str(value)).casefold())
+
+
+def reminder_table_order(df: pd.DataFrame, key_prefix: str, base: pd.DataFrame | None = None) -> np.ndarray | None:
     sort_state = get_reminder_table_sort(key_prefix)
     sort_column = sort_state["column"]
     if sort_column not in df.columns:
-        return df
+        return None
+    return frame_sort_order(df, sort_column, sort_state["ascending"], reminder_sort_rank_codes, base=base)
 
-    sorted_df = df.copy()
-    helper_col = "__reminder_sort_value"
-    if sort_column in {"Reminder Date", "Due Date", "Charge Date"}:
-        sorted_df[helper_col] = sorted_df[sort_column].map(parse_reminder_sort_date)
-    else:
-        sorted_df[helper_col] = sorted_df[sort_column].astype(str).map(lambda value: normalize_display_case(value).casefold())
 
-    return (
-        sorted_df
-        .sort_values(helper_col, ascending=sort_state["ascending"], kind="mergesort", na_position="last")
-        .drop(columns=[helper_col])
-    )
+def sort_reminder_table(df: pd.DataFrame, key_prefix: str) -> pd.DataFrame:
+    order = reminder_table_order(df, key_prefix)
+    return df if order is None else df.take(order)
 
 
-def paginate_dataframe(frame: pd.DataFrame, key: str, page_size: int, item_label: str) -> pd.DataFrame:
+def paginate_dataframe(
+    frame: pd.DataFrame,
+    key: str,
+    page_size: int,
+    item_label: str,
+    order: np.ndarray | None = None,
+) -> pd.DataFrame:
+    """Slice one page; with a sort order only that page's rows are taken."""
     if frame is None or frame.empty or page_size <= 0 or len(frame.index) <= page_size:
-        return frame
+        return frame if order is None or frame is None else frame.take(order)
     total_rows = len(frame.index)
     page_key = f"{key}_page"
     try:
@@ -13224,6 +15631,8 @@ def paginate_dataframe(frame: pd.DataFrame, key: str, page_size: int, item_label
         if st.button("Next", key=f"{page_key}_next", disabled=current_page >= total_pages - 1):
             st.session_state[page_key] = min(total_pages - 1, current_page + 1)
             st.rerun()
+    if order is not None:
+        return frame.take(order[start:end])
     return frame.iloc[start:end].copy()
 
 
@@ -13633,10 +16042,10 @@ def render_actioned_reminders_tab(key_prefix: str):
         )
 
 
-def render_table_with_buttons(df, key_prefix, msg_key, hidden_index=None):
+def render_table_with_buttons(df, key_prefix, msg_key, hidden_index=None, sort_base=None):
     render_started = time.perf_counter()
-    df = sort_reminder_table(df, key_prefix)
-    df = paginate_dataframe(df, f"{key_prefix}_reminders", REMINDER_TABLE_PAGE_SIZE, "listed reminders")
+    order = reminder_table_order(df, key_prefix, base=sort_base)
+    df = paginate_dataframe(df, f"{key_prefix}_reminders", REMINDER_TABLE_PAGE_SIZE, "listed reminders", order=order)
     rendered_rows = []
     for idx, row in df.iterrows():
         row_data = row.to_dict()
@@ -13648,6 +16057,15 @@ def render_table_with_buttons(df, key_prefix, msg_key, hidden_index=None):
         decline_key = f"{key_prefix}_decline_{idx}"
         rendered_rows.append((idx, row_data, vals, hidden_action, wa_key, sent_key, decline_key))
     listed_rows = [row_data for _, row_data, *_ in rendered_rows]
+    if REMINDER_GRID_ENABLED:
+        bulk_sent_success = st.session_state.pop("_bulk_sent_success", "")
+        if bulk_sent_success:
+            st.success(bulk_sent_success)
+        render_reminder_grid(rendered_rows, key_prefix, msg_key)
+        _footer_spacer, send_all_col = st.columns([8, 1.2], gap="small")
+        render_send_all_controls(send_all_col, listed_rows, key_prefix, msg_key)
+        record_slow_render_performance("active_reminder_rows_render", render_started, rows=len(rendered_rows), source=key_prefix)
+        return
     col_widths = [2.3, 2, 2, 5, 3, 4, 1, 1, 2, 2, 2]
     headers = ["Reminder Date", "Due Date", "Charge Date", "Client Name", "Animal Name", "Plan Item", "Qty", "Days", "WhatsApp", "Sent", "Decline"]
     safe_key_prefix = re.sub(r"[^a-zA-Z0-9_-]", "_", key_prefix)
@@ -13752,10 +16170,15 @@ def render_table_with_buttons(df, key_prefix, msg_key, hidden_index=None):
             args=(row_data, key_prefix),
         )
 
+    footer_cols = st.columns(col_widths, gap="small")
+    render_send_all_controls(footer_cols[9], listed_rows, key_prefix, msg_key)
+    record_slow_render_performance("active_reminder_rows_render", render_started, rows=len(rendered_rows), source=key_prefix)
+
+
+def render_send_all_controls(container, listed_rows: list[dict], key_prefix: str, msg_key: str):
     send_all_confirm_key = f"{key_prefix}_send_all_confirm"
     send_all_rows_key = f"{key_prefix}_send_all_rows"
-    footer_cols = st.columns(col_widths, gap="small")
-    if footer_cols[9].button(
+    if container.button(
         "Send All",
         key=f"{key_prefix}_send_all",
         use_container_width=True,
@@ -13800,9 +16223,215 @@ def render_table_with_buttons(df, key_prefix, msg_key, hidden_index=None):
         else:
             with st.expander("Send All", expanded=True):
                 _render_send_all_confirm()
-    record_slow_render_performance("active_reminder_rows_render", render_started, rows=len(rendered_rows), source=key_prefix)
 
+
+REMINDER_GRID_COLUMNS = ["Reminder Date", "Due Date", "Charge Date", "Client Name", "Animal Name", "Plan Item", "Qty", "Days"]
+REMINDER_GRID_STATUS_LABELS = {REMINDER_ACTION_SENT: "Sent", REMINDER_ACTION_DECLINED: "Declined"}
+REMINDER_GRID_ACTIONS = ("whatsapp", "sent", "decline")
+REMINDER_GRID_CSS = """
+.reminder-grid { font-family: inherit; font-size: 0.9rem; color: inherit; }
+.reminder-grid__header, .reminder-grid__row {
+    display: grid;
+    grid-template-columns: 2.3fr 2fr 2fr 5fr 3fr 4fr 1fr 1fr 2fr 1.4fr 1.4fr;
+    gap: 0.4rem;
+    align-items: center;
+    padding: 0 0.25rem;
+}
+.reminder-grid__header { font-weight: 600; min-height: 2.4rem; border-bottom: 1px solid rgba(49, 51, 63, 0.2); }
+.reminder-grid__header button {
+    background: transparent; border: 0; color: inherit; cursor: pointer;
+    font: inherit; font-weight: 600; padding: 0; text-align: left;
+}
+.reminder-grid__header button:hover { color: var(--cr-link, #1DA759); }
+.reminder-grid__viewport { max-height: 560px; overflow-y: auto; position: relative; }
+.reminder-grid__row { position: absolute; left: 0; right: 0; height: 44px; border-bottom: 1px solid rgba(49, 51, 63, 0.08); }
+.reminder-grid__cell { overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }
+.reminder-grid__action {
+    border: 1px solid rgba(49, 51, 63, 0.2); border-radius: 0.5rem; background: transparent;
+    color: inherit; cursor: pointer; font: inherit; height: 2rem; width: 100%;
+}
+.reminder-grid__action:hover { border-color: var(--cr-primary, #29D272); }
+.reminder-grid__action.is-active { background: var(--cr-primary-soft, #dcf8e8); border-color: var(--cr-primary, #29D272); }
+.reminder-grid__action[data-action="decline"].is-active { background: #fde8e8; border-color: #e05252; }
+"""
+REMINDER_GRID_JS = """
+const ROW_HEIGHT = 44;
+const OVERSCAN = 6;
+
+function gridRecords(rows) {
+    if (!rows) return [];
+    if (Array.isArray(rows)) return rows;
+    if (typeof rows.toArray === "function") {
+        return rows.toArray().map((row) => (row && typeof row.toJSON === "function" ? row.toJSON() : row));
+    }
+    return [];
+}
+
+export default function(component) {
+    const { data, parentElement, setTriggerValue } = component;
+    const records = gridRecords(data && data.rows);
+    const headers = (data && data.headers) || [];
+    const activeClass = { whatsapp: "", sent: "Sent", decline: "Declined" };
+
+    let root = parentElement.querySelector(".reminder-grid");
+    if (!root) {
+        root = document.createElement("div");
+        root.className = "reminder-grid";
+        parentElement.appendChild(root);
+    }
+    root.replaceChildren();
+
+    const header = document.createElement("div");
+    header.className = "reminder-grid__header";
+    headers.forEach((column) => {
+        const cell = document.createElement(column.sortable ? "button" : "div");
+        cell.textContent = column.label;
+        cell.title = column.help || "";
+        if (column.sortable) {
+            cell.type = "button";
+            cell.onclick = () => setTriggerValue("sort", column.column);
+        }
+        header.appendChild(cell);
+    });
+    root.appendChild(header);
+
+    const viewport = document.createElement("div");
+    viewport.className = "reminder-grid__viewport";
+    viewport.style.height = `${Math.min(records.length, 12) * ROW_HEIGHT}px`;
+    const spacer = document.createElement("div");
+    spacer.style.height = `${records.length * ROW_HEIGHT}px`;
+    viewport.appendChild(spacer);
+    root.appendChild(viewport);
+
+    const renderWindow = () => {
+        const first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+        const last = Math.min(records.length, Math.ceil((viewport.scrollTop + viewport.clientHeight) / ROW_HEIGHT) + OVERSCAN);
+        spacer.replaceChildren();
+        for (let position = first; position < last; position += 1) {
+            const record = records[position];
+            const row = document.createElement("div");
+            row.className = "reminder-grid__row";
+            row.style.top = `${position * ROW_HEIGHT}px`;
+            (data.columns || []).forEach((column) => {
+                const cell = document.createElement("div");
+                cell.className = "reminder-grid__cell";
+                cell.textContent = record[column] == null ? "" : String(record[column]);
+                cell.title = cell.textContent;
+                row.appendChild(cell);
+            });
+            (data.actions || []).forEach((action) => {
+                const button = document.createElement("button");
+                button.type = "button";
+                button.className = "reminder-grid__action";
+                button.dataset.action = action.action;
+                button.textContent = action.label;
+                button.title = action.help;
+                if (activeClass[action.action] && record.Status === activeClass[action.action]) {
+                    button.classList.add("is-active");
+                }
+                button.onclick = () => setTriggerValue("action", { row: String(record.RowKey), action: action.action });
+                row.appendChild(button);
+            });
+            spacer.appendChild(row);
+        }
+    };
+    viewport.onscroll = () => window.requestAnimationFrame(renderWindow);
+    renderWindow();
+    return () => { viewport.onscroll = null; };
+}
+"""
+reminder_grid_component = st.components.v2.component(
+    "reminder_grid",
+    css=REMINDER_GRID_CSS,
+    js=REMINDER_GRID_JS,
+)
+
+
+def reminder_grid_frame(rendered_rows: list[tuple]) -> pd.DataFrame:
+    records = []
+    for idx, _row_data, vals, hidden_action, *_keys in rendered_rows:
+        record = {
+            h: normalize_display_case(vals[h]) if h in ["Client Name", "Animal Name", "Plan Item"] else vals[h]
+            for h in REMINDER_GRID_COLUMNS
+        }
+        record["Status"] = REMINDER_GRID_STATUS_LABELS.get(hidden_action, "")
+        record["RowKey"] = str(idx)
+        records.append(record)
+    return pd.DataFrame(records, columns=[*REMINDER_GRID_COLUMNS, "Status", "RowKey"])
+
+
+def reminder_grid_headers(key_prefix: str) -> list[dict]:
+    sort_state = get_reminder_table_sort(key_prefix)
+    headers = []
+    for head in [*REMINDER_GRID_COLUMNS, "WhatsApp", "Sent", "Decline"]:
+        label = REMINDER_TABLE_HEADER_LABELS.get(head, head)
+        sortable = head in REMINDER_TABLE_SORTABLE_COLUMNS
+        if sortable and sort_state["column"] == head:
+            label = f"{label} {'↑' if sort_state['ascending'] else '↓'}"
+        headers.append({"column": head, "label": label, "help": reminder_header_help(head), "sortable": sortable})
+    return headers
+
+
+def reminder_grid_event(grid_key: str, event_name: str):
+    state = st.session_state.get(grid_key)
+    return state.get(event_name) if hasattr(state, "get") else None
+
+
+def dispatch_reminder_grid_action(event, rendered_rows: list[tuple], key_prefix: str, msg_key: str) -> bool:
+    """Run the row callback for one grid click; event is {"row": row key, "action": one of REMINDER_GRID_ACTIONS}."""
+    if not hasattr(event, "get") or event.get("action") not in REMINDER_GRID_ACTIONS:
+        return False
+    row_key = str(event.get("row", ""))
+    match = next((row for row in rendered_rows if str(row[0]) == row_key), None)
+    if match is None:
+        return False
+    idx, row_data = match[0], match[1]
+    action = event["action"]
+    if action == "whatsapp":
+        prepare_whatsapp_action(row_data, key_prefix, msg_key, idx)
+    elif action == "sent":
+        mark_reminder_sent_action(row_data, key_prefix, msg_key, idx)
+    else:
+        decline_reminder_action(row_data, key_prefix)
+    return True
+
+
+def run_reminder_grid_action(grid_key: str, rendered_rows: list[tuple], key_prefix: str, msg_key: str):
+    dispatch_reminder_grid_action(reminder_grid_event(grid_key, "action"), rendered_rows, key_prefix, msg_key)
+
+
+def run_reminder_grid_sort(grid_key: str, key_prefix: str):
+    column = reminder_grid_event(grid_key, "sort")
+    if column in REMINDER_TABLE_SORTABLE_COLUMNS:
+        set_reminder_table_sort(key_prefix, column)
+
+
+def render_reminder_grid(rendered_rows: list[tuple], key_prefix: str, msg_key: str):
+    """
+    The page as one component: rows travel as a single Arrow payload, the browser scrolls them virtually,
+    and each click sends one (row key, action) event that runs the matching row callback.
+    """
+    grid_key = f"{key_prefix}_grid"
+    reminder_grid_component(
+        key=grid_key,
+        data={
+            "rows": reminder_grid_frame(rendered_rows),
+            "columns": REMINDER_GRID_COLUMNS,
+            "headers": reminder_grid_headers(key_prefix),
+            "actions": [
+                {"action": "whatsapp", "label": "WhatsApp", "help": "Prepare WhatsApp message"},
+                {"action": "sent", "label": "✔", "help": "Mark as sent"},
+                {"action": "decline", "label": "✖", "help": "Decline reminder"},
+            ],
+        },
+        on_action_change=partial(run_reminder_grid_action, grid_key, rendered_rows, key_prefix, msg_key),
+        on_sort_change=partial(run_reminder_grid_sort, grid_key, key_prefix),
+    )
+
+
+@st.fragment
 def render_whatsapp_tools(key_prefix: str, msg_key: str):
+    begin_fragment_sheets_read_batch()
     # --- WhatsApp Composer section (after the table) ---
     st.markdown("<div id='whatsapp-composer' class='anchor-offset'></div>", unsafe_allow_html=True)
     template_selector_ver_key = f"{key_prefix}_wa_template_selector_ver"
@@ -14379,7 +17008,7 @@ STATS_REVENUE_DISPLAY_COLUMNS = [
     "Unique Purchasing Patients",
     "Unique Repeat Purchasing Patients",
 ]
-STATS_CALCULATION_CACHE_SCHEMA_VERSION = 3
+STATS_CALCULATION_CACHE_SCHEMA_VERSION = 4
 STATS_ITEMS_DISPLAY_COLUMNS = [
     "Item",
     STATISTICS_SCHEDULED_REMINDERS_LABEL,
@@ -14627,15 +17256,16 @@ def filter_prepared_for_statistics_period(
     if start is None:
         return prepared
     today = today or user_today()
-    reminder_ts = prepared.get("ReminderDateTs")
-    if reminder_ts is None:
-        reminder_ts = prepared.get("NextDueDateTs")
+    start_ts = pd.Timestamp(start)
+    end_ts = pd.Timestamp(today)
+    period_rows = date_range_rows(prepared, "ReminderDateTs", start_ts, end_ts)
+    if period_rows is not None:
+        return period_rows
+    reminder_ts = prepared.get("NextDueDateTs")
     if reminder_ts is None:
         reminder_ts = pd.to_datetime(prepared.get("NextDueDate"), errors="coerce")
     else:
         reminder_ts = pd.to_datetime(reminder_ts, errors="coerce")
-    start_ts = pd.Timestamp(start)
-    end_ts = pd.Timestamp(today)
     return prepared.loc[(reminder_ts >= start_ts) & (reminder_ts <= end_ts)].copy()
 
 
@@ -14645,6 +17275,7 @@ def build_statistics_generated_rows(
     group_days: int | None = None,
     period: str = "All time",
     today: date | None = None,
+    exclusion_filter: ReminderExclusionFilter | None = None,
 ) -> pd.DataFrame:
     if prepared is None or getattr(prepared, "empty", True):
         return empty_statistics_generated_frame()
@@ -14656,7 +17287,7 @@ def build_statistics_generated_rows(
     prepared_period = filter_prepared_for_statistics_period(prepared, period, today)
     if prepared_period is None or getattr(prepared_period, "empty", True):
         return empty_statistics_generated_frame()
-    filtered = apply_reminder_exclusion_filters(prepared_period, rules)
+    filtered = apply_reminder_exclusion_filters(prepared_period, rules, exclusion_filter)
     if filtered.empty:
         return empty_statistics_generated_frame()
     return bundle_client_reminders_by_window(filtered, window_days=group_days, rules=rules)
@@ -14673,6 +17304,7 @@ def cached_statistics_generated_rows(
     rules_fp: str,
     exclusion_fp: str,
     schema_version: int,
+    _exclusion_filter: ReminderExclusionFilter | None = None,
 ) -> pd.DataFrame:
     today = pd.to_datetime(today_iso, errors="coerce")
     today_date = today.date() if pd.notna(today) else user_today()
@@ -14682,6 +17314,7 @@ def cached_statistics_generated_rows(
         group_days=group_days,
         period=period,
         today=today_date,
+        exclusion_filter=_exclusion_filter,
     )
 
 
@@ -14695,10 +17328,7 @@ def statistics_current_action_records() -> list[dict]:
 def filter_generated_for_statistics_period(generated_df: pd.DataFrame, period: str, today: date | None = None) -> pd.DataFrame:
     if generated_df is None or generated_df.empty:
         return pd.DataFrame(columns=list(generated_df.columns) if generated_df is not None else [])
-    mask = [
-        statistics_row_in_reminder_period(row, period, today)
-        for row in generated_df.to_dict("records")
-    ]
+    mask = StatisticsDates(statistics_frame_reminder_date_values(generated_df)).period_mask(period, today)
     return generated_df.loc[mask].copy()
 
 
@@ -14749,7 +17379,7 @@ def statistics_generated_records_in_period(
 ) -> list[dict]:
     if generated_df is None or getattr(generated_df, "empty", True):
         return []
-    return statistics_records_in_reminder_period(generated_df.to_dict("records"), period, today)
+    return filter_generated_for_statistics_period(generated_df, period, today).to_dict("records")
 
 
 def expand_rows_for_statistics_item_period(
@@ -14758,7 +17388,8 @@ def expand_rows_for_statistics_item_period(
     today: date | None = None,
 ) -> list[dict]:
     expanded_rows = expand_grouped_action_records(rows)
-    return statistics_records_in_reminder_period(expanded_rows, period, today)
+    mask = StatisticsDates(map(statistics_reminder_date_value, expanded_rows)).period_mask(period, today)
+    return [dict(row) for row, keep in zip(expanded_rows, mask) if keep]
 
 
 def statistics_item_purchase_cycle_key(row: dict) -> tuple[str, ...]:
@@ -14797,33 +17428,7 @@ def statistics_summary_for_period(
     period: str,
     today: date | None = None,
 ) -> dict:
-    generated_records = statistics_generated_records_in_period(generated_df, period, today)
-    generated_keys = {
-        statistics_row_key(row)
-        for row in generated_records
-        if any(statistics_row_key(row))
-    }
-    actioned_by_key = {}
-    for record in filter_actions_by_reminder_period(action_records, period, today):
-        key = statistics_row_key(record)
-        if not any(key) or key not in generated_keys:
-            continue
-        actioned_by_key[key] = record
-
-    sent = sum(1 for record in actioned_by_key.values() if str(record.get("Action", "")).strip().lower() == REMINDER_ACTION_SENT)
-    declined = sum(1 for record in actioned_by_key.values() if str(record.get("Action", "")).strip().lower() == REMINDER_ACTION_DECLINED)
-    generated_count = len(generated_records)
-    actioned_count = sent + declined
-    remaining = max(generated_count - actioned_count, 0)
-    completion_rate = (actioned_count / generated_count) if generated_count else 0.0
-    return {
-        "generated": generated_count,
-        "actioned": actioned_count,
-        "sent": sent,
-        "declined": declined,
-        "remaining": remaining,
-        "completion_rate": completion_rate,
-    }
+    return StatisticsFacts(generated_df, action_records).summary(period, today)
 
 
 def build_statistics_daily_frame(
@@ -14832,43 +17437,7 @@ def build_statistics_daily_frame(
     period: str,
     today: date | None = None,
 ) -> pd.DataFrame:
-    today = today or user_today()
-    generated_counts = {}
-    for row in statistics_generated_records_in_period(generated_df, period, today):
-        row_date = statistics_primary_reminder_date(row)
-        if row_date is not None:
-            generated_counts[row_date] = generated_counts.get(row_date, 0) + 1
-
-    action_counts = {}
-    for record in filter_actions_by_reminder_period(action_records, period, today):
-        row_date = statistics_primary_reminder_date(record)
-        if row_date is None:
-            continue
-        action = str(record.get("Action", "")).strip().lower()
-        counts = action_counts.setdefault(row_date, {"Sent": 0, "Declined": 0})
-        if action == REMINDER_ACTION_SENT:
-            counts["Sent"] += 1
-        elif action == REMINDER_ACTION_DECLINED:
-            counts["Declined"] += 1
-
-    all_dates = sorted(set(generated_counts) | set(action_counts))
-    start = statistics_period_start(period, today)
-    if start is not None:
-        all_dates = [day for day in all_dates if start <= day <= today]
-    rows = []
-    for row_date in all_dates:
-        sent = action_counts.get(row_date, {}).get("Sent", 0)
-        declined = action_counts.get(row_date, {}).get("Declined", 0)
-        generated = generated_counts.get(row_date, 0)
-        rows.append({
-            "Date": pd.Timestamp(row_date),
-            "Generated": generated,
-            "Actioned": sent + declined,
-            "Sent": sent,
-            "Declined": declined,
-            "Remaining": max(generated - sent - declined, 0),
-        })
-    return pd.DataFrame(rows)
+    return StatisticsFacts(generated_df, action_records).daily_frame(period, today)
 
 
 def build_statistics_team_frame(
@@ -14877,14 +17446,11 @@ def build_statistics_team_frame(
     today: date | None = None,
     action_rows: list[dict] | None = None,
 ) -> pd.DataFrame:
-    rows = (
-        action_rows
-        if action_rows is not None
-        else filter_actions_by_actioned_period(action_records, period, today, include_parsed=True)
-    )
-    if not rows:
-        return pd.DataFrame(columns=["User", "Actioned", "Sent", "Declined", "Last Actioned"])
-    df_actions = pd.DataFrame(rows)
+    if action_rows is None:
+        return StatisticsFacts(None, action_records).team_frame(period, today)
+    if not action_rows:
+        return pd.DataFrame(columns=STATISTICS_TEAM_FRAME_COLUMNS)
+    df_actions = pd.DataFrame(action_rows)
     actioned_by = (
         df_actions["Actioned By"]
         if "Actioned By" in df_actions.columns
@@ -14923,6 +17489,8 @@ def build_statistics_item_frame(
     generated_rows: list[dict] | None = None,
     action_rows: list[dict] | None = None,
 ) -> pd.DataFrame:
+    if generated_rows is None and action_rows is None:
+        return StatisticsFacts(generated_df, action_records).item_frame(period, today)
     if generated_rows is None:
         generated_source_rows = (
             generated_df.to_dict("records")
@@ -14959,7 +17527,407 @@ def build_statistics_item_frame(
             "Sent": sent,
             "Declined": declined,
         })
-    return pd.DataFrame(rows).sort_values(["Generated", "Actioned"], ascending=False) if rows else pd.DataFrame(columns=["Item", "Generated", "Actioned", "Sent", "Declined"])
+    return pd.DataFrame(rows).sort_values(["Generated", "Actioned"], ascending=False) if rows else pd.DataFrame(columns=STATISTICS_ITEM_FRAME_COLUMNS)
+
+
+STATISTICS_ACTION_CODES = {REMINDER_ACTION_SENT: 1, REMINDER_ACTION_DECLINED: 2}
+STATISTICS_ITEM_FRAME_COLUMNS = ["Item", "Generated", "Actioned", "Sent", "Declined"]
+STATISTICS_TEAM_FRAME_COLUMNS = ["User", "Actioned", "Sent", "Declined", "Last Actioned"]
+
+
+def statistics_reminder_date_value(row: dict):
+    return row.get("Reminder Date", "") or row.get("ReminderDate", "")
+
+
+def statistics_frame_reminder_date_values(frame: pd.DataFrame) -> list:
+    """statistics_reminder_date_value for every row, read column-wise."""
+    values = frame["Reminder Date"].tolist() if "Reminder Date" in frame.columns else [""] * len(frame.index)
+    if "ReminderDate" in frame.columns:
+        values = [value or fallback for value, fallback in zip(values, frame["ReminderDate"].tolist())]
+    return values
+
+
+def statistics_item_label(row: dict) -> str:
+    return normalize_display_case(str(row.get("Plan Item", "") or "Unknown").strip() or "Unknown")
+
+
+def statistics_team_user_label(row: dict) -> str:
+    value = row.get("Actioned By", "")
+    try:
+        if value is None or pd.isna(value):
+            value = ""
+    except (TypeError, ValueError):
+        pass
+    return str(value).strip() or "Unknown"
+
+
+class StatisticsDates:
+    """Reminder dates exploded to one (row position, day) pair per date part; each distinct part is parsed once."""
+
+    __slots__ = ("row_count", "positions", "days")
+
+    def __init__(self, values):
+        positions = []
+        parts = []
+        row_count = 0
+        for position, value in enumerate(values):
+            row_count += 1
+            if value is None:
+                continue
+            if isinstance(value, date):
+                positions.append(position)
+                parts.append(value.date() if isinstance(value, datetime) else value)
+                continue
+            for part in str(value or "").split("|"):
+                part = part.strip()
+                if part:
+                    positions.append(position)
+                    parts.append(part)
+        parsed = {part: parse_statistics_date_part(part) for part in set(parts) if isinstance(part, str)}
+        kept_positions = []
+        days = []
+        for position, part in zip(positions, parts):
+            day = parsed[part] if isinstance(part, str) else part
+            if day:
+                kept_positions.append(position)
+                days.append(day)
+        self.row_count = row_count
+        self.positions = np.asarray(kept_positions, dtype=np.int64)
+        self.days = np.asarray(days, dtype="datetime64[D]")
+
+    def range_mask(self, start: date | None = None, end: date | None = None) -> np.ndarray:
+        """Rows with any date inside [start, end]; without bounds, rows with any date at all."""
+        hits = np.ones(len(self.positions), dtype=bool)
+        if start is not None:
+            hits &= self.days >= np.datetime64(start, "D")
+        if end is not None:
+            hits &= self.days <= np.datetime64(end, "D")
+        mask = np.zeros(self.row_count, dtype=bool)
+        mask[self.positions[hits]] = True
+        return mask
+
+    def period_mask(self, period: str, today: date | None = None) -> np.ndarray:
+        """statistics_row_in_reminder_period for every row."""
+        today = today or user_today()
+        start = statistics_period_start(period, today)
+        return self.range_mask() if start is None else self.range_mask(start, today)
+
+    def custom_range_mask(self, custom_range: tuple[date, date] | None) -> np.ndarray:
+        """Rows with any date inside the custom range, in either order; no range keeps every row."""
+        if custom_range is None:
+            return np.ones(self.row_count, dtype=bool)
+        start_date, end_date = custom_range
+        if end_date < start_date:
+            start_date, end_date = end_date, start_date
+        return self.range_mask(start_date, end_date)
+
+    def period_filter_mask(self, period_label: str, custom_range: tuple[date, date] | None = None) -> np.ndarray:
+        """Stats period selector semantics: a custom range, or the mapped reminder period ending today."""
+        if str(period_label or "").strip() == "Custom":
+            return self.custom_range_mask(custom_range)
+        return self.period_mask(sent_reminder_outcome_period(period_label), user_today())
+
+    def primary_days(self) -> np.ndarray:
+        """Earliest date per row, NaT where a row has none."""
+        primary = np.full(self.row_count, np.datetime64("NaT"), dtype="datetime64[D]")
+        if len(self.positions):
+            order = np.lexsort((self.days, self.positions))
+            positions = self.positions[order]
+            first = np.r_[True, positions[1:] != positions[:-1]]
+            primary[positions[first]] = self.days[order][first]
+        return primary
+
+
+class StatisticsVocabulary:
+    """
+    Integer codes for labels and keys, shared by every row set of one StatisticsFacts.
+    Finished facts are shared across sessions, so code assignment is serialised by a lock.
+    """
+
+    def __init__(self):
+        self.tables: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def codes(self, name: str, values) -> np.ndarray:
+        """Code per value, assigning new codes in first-seen order; None maps to -1."""
+        values = list(values)
+        with self._lock:
+            table = self.tables.setdefault(name, {})
+            return np.fromiter(
+                (-1 if value is None else table.setdefault(value, len(table)) for value in values),
+                dtype=np.int64,
+                count=len(values),
+            )
+
+    def labels(self, name: str) -> list:
+        with self._lock:
+            return list(self.tables.get(name, {}))
+
+
+class StatisticsFactRows:
+    """Statistics records as parallel arrays; each column is derived on first use and then kept."""
+
+    def __init__(self, records: list[dict], vocabulary: StatisticsVocabulary):
+        self.records = records
+        self.vocabulary = vocabulary
+        self.row_count = len(records)
+
+    @cached_property
+    def dates(self) -> StatisticsDates:
+        return StatisticsDates(map(statistics_reminder_date_value, self.records))
+
+    @cached_property
+    def primary_days(self) -> np.ndarray:
+        return self.dates.primary_days()
+
+    @cached_property
+    def item_codes(self) -> np.ndarray:
+        return self.vocabulary.codes("items", map(statistics_item_label, self.records))
+
+    @cached_property
+    def key_codes(self) -> np.ndarray:
+        """statistics_row_key codes; -1 where the key is blank."""
+        keys = map(statistics_row_key, self.records)
+        return self.vocabulary.codes("keys", (key if any(key) else None for key in keys))
+
+    @cached_property
+    def cycle_codes(self) -> np.ndarray:
+        return self.vocabulary.codes("cycles", map(statistics_item_purchase_cycle_key, self.records))
+
+    @cached_property
+    def action_codes(self) -> np.ndarray:
+        return np.fromiter(
+            (STATISTICS_ACTION_CODES.get(str(row.get("Action", "")).strip().lower(), 0) for row in self.records),
+            dtype=np.int8,
+            count=self.row_count,
+        )
+
+    @cached_property
+    def team_action_codes(self) -> np.ndarray:
+        """Action codes as the team view has always read them: lower-cased but not stripped."""
+        return np.fromiter(
+            (STATISTICS_ACTION_CODES.get(str(row.get("Action", "")).lower(), 0) for row in self.records),
+            dtype=np.int8,
+            count=self.row_count,
+        )
+
+    @cached_property
+    def user_codes(self) -> np.ndarray:
+        return self.vocabulary.codes("users", map(statistics_team_user_label, self.records))
+
+    @cached_property
+    def actioned_at(self) -> np.ndarray:
+        return np.array([statistics_actioned_datetime(row) for row in self.records], dtype="datetime64[us]")
+
+    @cached_property
+    def action_sort_times(self) -> np.ndarray:
+        """_statistics_item_action_sort_time for every row."""
+        times = self.actioned_at.copy()
+        missing = np.isnat(times)
+        times[missing] = self.primary_days.astype("datetime64[us]")[missing]
+        times[np.isnat(times)] = np.datetime64(datetime.min, "us")
+        return times
+
+    def actioned_mask(self, start: date | None = None, end: date | None = None) -> np.ndarray:
+        """Rows with an action time, optionally on a day inside [start, end]."""
+        days = self.actioned_at.astype("datetime64[D]")
+        mask = ~np.isnat(days)
+        if start is not None:
+            mask &= days >= np.datetime64(start, "D")
+        if end is not None:
+            mask &= days <= np.datetime64(end, "D")
+        return mask
+
+
+def statistics_cycle_representatives(cycle_codes: np.ndarray, mask: np.ndarray, sort_times: np.ndarray | None = None) -> np.ndarray:
+    """
+    dedupe_statistics_item_cycle_rows over row positions: the first row per purchase cycle,
+    or with sort_times the latest row, later rows winning ties.
+    """
+    positions = np.flatnonzero(mask)
+    cycles = cycle_codes[positions]
+    if sort_times is None:
+        _, first = np.unique(cycles, return_index=True)
+        return positions[first]
+    order = np.lexsort((positions, sort_times[positions], cycles))
+    ordered = cycles[order]
+    last = np.r_[ordered[1:] != ordered[:-1], True] if len(ordered) else np.zeros(0, dtype=bool)
+    return positions[order][last]
+
+
+def statistics_last_rows_by_code(codes: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """The last of positions for each distinct code."""
+    _, last = np.unique(codes[::-1], return_index=True)
+    return positions[::-1][last]
+
+
+class StatisticsFacts:
+    """
+    Generated reminders and tracker actions as columns, built once per stats calculation signature.
+    Summary, daily, item and team views are masks and counts over it, so a period switch is only a filter.
+    """
+
+    def __init__(self, generated_df: pd.DataFrame, action_records: list[dict]):
+        self.vocabulary = StatisticsVocabulary()
+        generated_records = (
+            generated_df.to_dict("records")
+            if generated_df is not None and not getattr(generated_df, "empty", True)
+            else []
+        )
+        self.generated = StatisticsFactRows(generated_records, self.vocabulary)
+        self.actions = StatisticsFactRows(
+            [record for record in action_records or [] if isinstance(record, dict)],
+            self.vocabulary,
+        )
+
+    @cached_property
+    def generated_items(self) -> StatisticsFactRows:
+        return StatisticsFactRows(expand_grouped_action_records(self.generated.records), self.vocabulary)
+
+    @cached_property
+    def action_items(self) -> StatisticsFactRows:
+        return StatisticsFactRows(expand_grouped_action_records(self.actions.records), self.vocabulary)
+
+    def summary(self, period: str, today: date | None = None) -> dict:
+        generated_mask = self.generated.dates.period_mask(period, today)
+        generated_keys = self.generated.key_codes[generated_mask]
+        generated_keys = np.unique(generated_keys[generated_keys >= 0])
+        positions = np.flatnonzero(self.actions.dates.period_mask(period, today))
+        keys = self.actions.key_codes[positions]
+        matched = np.isin(keys, generated_keys)
+        action_codes = self.actions.action_codes[statistics_last_rows_by_code(keys[matched], positions[matched])]
+
+        sent = int((action_codes == STATISTICS_ACTION_CODES[REMINDER_ACTION_SENT]).sum())
+        declined = int((action_codes == STATISTICS_ACTION_CODES[REMINDER_ACTION_DECLINED]).sum())
+        generated_count = int(generated_mask.sum())
+        actioned_count = sent + declined
+        return {
+            "generated": generated_count,
+            "actioned": actioned_count,
+            "sent": sent,
+            "declined": declined,
+            "remaining": max(generated_count - actioned_count, 0),
+            "completion_rate": (actioned_count / generated_count) if generated_count else 0.0,
+        }
+
+    def daily_frame(self, period: str, today: date | None = None) -> pd.DataFrame:
+        today = today or user_today()
+        generated_days = self.generated.primary_days[self.generated.dates.period_mask(period, today)]
+        generated_days = generated_days[~np.isnat(generated_days)]
+        action_mask = self.actions.dates.period_mask(period, today)
+        action_days = self.actions.primary_days[action_mask]
+        action_codes = self.actions.action_codes[action_mask]
+        has_day = ~np.isnat(action_days)
+        action_days, action_codes = action_days[has_day], action_codes[has_day]
+
+        all_days = np.union1d(generated_days, action_days)
+        start = statistics_period_start(period, today)
+        if start is not None:
+            all_days = all_days[(all_days >= np.datetime64(start, "D")) & (all_days <= np.datetime64(today, "D"))]
+
+        def counts_by_day(days: np.ndarray) -> np.ndarray:
+            days = days[np.isin(days, all_days)]
+            return np.bincount(np.searchsorted(all_days, days), minlength=len(all_days))
+
+        generated_counts = counts_by_day(generated_days)
+        sent_counts = counts_by_day(action_days[action_codes == STATISTICS_ACTION_CODES[REMINDER_ACTION_SENT]])
+        declined_counts = counts_by_day(action_days[action_codes == STATISTICS_ACTION_CODES[REMINDER_ACTION_DECLINED]])
+        rows = []
+        for row_date, generated, sent, declined in zip(all_days.tolist(), generated_counts, sent_counts, declined_counts):
+            generated, sent, declined = int(generated), int(sent), int(declined)
+            rows.append({
+                "Date": pd.Timestamp(row_date),
+                "Generated": generated,
+                "Actioned": sent + declined,
+                "Sent": sent,
+                "Declined": declined,
+                "Remaining": max(generated - sent - declined, 0),
+            })
+        return pd.DataFrame(rows)
+
+    def item_frame(self, period: str, today: date | None = None) -> pd.DataFrame:
+        return self._item_frame(
+            self.generated_items.dates.period_mask(period, today),
+            self.action_items.dates.period_mask(period, today),
+        )
+
+    def item_frame_for_filter(self, period_label: str, custom_range: tuple[date, date] | None = None) -> pd.DataFrame:
+        return self._item_frame(
+            self.generated_items.dates.period_filter_mask(period_label, custom_range),
+            self.action_items.dates.period_filter_mask(period_label, custom_range),
+        )
+
+    def _item_frame(self, generated_mask: np.ndarray, action_mask: np.ndarray) -> pd.DataFrame:
+        generated_rows = statistics_cycle_representatives(self.generated_items.cycle_codes, generated_mask)
+        action_rows = statistics_cycle_representatives(
+            self.action_items.cycle_codes,
+            action_mask,
+            sort_times=self.action_items.action_sort_times,
+        )
+        generated_items = self.generated_items.item_codes[generated_rows]
+        action_items = self.action_items.item_codes[action_rows]
+        action_codes = self.action_items.action_codes[action_rows]
+        labels = self.vocabulary.labels("items")
+        generated_counts = np.bincount(generated_items, minlength=len(labels))
+        action_presence = np.bincount(action_items, minlength=len(labels))
+        sent = np.bincount(
+            action_items[action_codes == STATISTICS_ACTION_CODES[REMINDER_ACTION_SENT]],
+            minlength=len(labels),
+        )
+        declined = np.bincount(
+            action_items[action_codes == STATISTICS_ACTION_CODES[REMINDER_ACTION_DECLINED]],
+            minlength=len(labels),
+        )
+        codes = sorted(np.flatnonzero((generated_counts > 0) | (action_presence > 0)).tolist(), key=labels.__getitem__)
+        if not codes:
+            return pd.DataFrame(columns=STATISTICS_ITEM_FRAME_COLUMNS)
+        return pd.DataFrame({
+            "Item": [labels[code] for code in codes],
+            "Generated": generated_counts[codes],
+            "Actioned": sent[codes] + declined[codes],
+            "Sent": sent[codes],
+            "Declined": declined[codes],
+        }).sort_values(["Generated", "Actioned"], ascending=False)
+
+    def team_frame(self, period: str, today: date | None = None) -> pd.DataFrame:
+        today = today or user_today()
+        start = statistics_period_start(period, today)
+        return self._team_frame(self.actions.actioned_mask(start, None if start is None else today))
+
+    def team_frame_for_filter(self, period_label: str, custom_range: tuple[date, date] | None = None) -> pd.DataFrame:
+        """Team actions by actioned date, with statistics_action_records_for_actioned_period_filter semantics."""
+        if str(period_label or "").strip() != "Custom":
+            return self.team_frame(sent_reminder_outcome_period(period_label), user_today())
+        if custom_range is None:
+            return pd.DataFrame(columns=STATISTICS_TEAM_FRAME_COLUMNS)
+        start_date, end_date = custom_range
+        if end_date < start_date:
+            start_date, end_date = end_date, start_date
+        return self._team_frame(self.actions.actioned_mask(start_date, end_date))
+
+    def _team_frame(self, mask: np.ndarray) -> pd.DataFrame:
+        positions = np.flatnonzero(mask)
+        if not len(positions):
+            return pd.DataFrame(columns=STATISTICS_TEAM_FRAME_COLUMNS)
+        users = self.actions.user_codes[positions]
+        action_codes = self.actions.team_action_codes[positions]
+        actioned_at = self.actions.actioned_at[positions]
+        labels = self.vocabulary.labels("users")
+        codes = sorted(np.unique(users).tolist(), key=labels.__getitem__)
+        last_actioned = np.full(len(labels), np.datetime64("NaT"), dtype="datetime64[us]")
+        order = np.lexsort((actioned_at, users))
+        last = np.r_[users[order][1:] != users[order][:-1], True]
+        last_actioned[users[order][last]] = actioned_at[order][last]
+        actioned = np.bincount(users, minlength=len(labels))
+        sent = np.bincount(users[action_codes == STATISTICS_ACTION_CODES[REMINDER_ACTION_SENT]], minlength=len(labels))
+        declined = np.bincount(users[action_codes == STATISTICS_ACTION_CODES[REMINDER_ACTION_DECLINED]], minlength=len(labels))
+        return pd.DataFrame({
+            "User": [labels[code] for code in codes],
+            "Actioned": actioned[codes],
+            "Sent": sent[codes],
+            "Declined": declined[codes],
+            "Last Actioned": [pd.Timestamp(last_actioned[code]).strftime("%d %b %Y") for code in codes],
+        }).sort_values(["Actioned", "Sent"], ascending=False)
 
 
 def render_statistics_metric_card(label: str, value: str, help_text: str = ""):
@@ -15577,12 +18545,11 @@ def build_outcome_item_match_map(sales: pd.DataFrame, match_keys: Iterable[str])
     return pd.concat(mapped_frames, ignore_index=True).drop_duplicates(columns)
 
 
-def build_average_sales_purchase_gap_map(
-    sales: pd.DataFrame,
-    gap_key_matches: dict[tuple[str, ...], list[str]],
-    item_match_map: pd.DataFrame,
-) -> dict[tuple[str, ...], dict[str, float | int | None]]:
-    empty_result = {
+_PURCHASE_TIMELINE_INDEXES: dict[int, "PurchaseTimelineIndex"] = {}
+
+
+def empty_purchase_gap_stats() -> dict[str, float | int | None]:
+    return {
         "average": None,
         "count": 0,
         "total": 0,
@@ -15592,94 +18559,209 @@ def build_average_sales_purchase_gap_map(
         "average_revenue": 0.0,
         "median": None,
     }
-    if sales is None or sales.empty or not gap_key_matches:
-        return {key: dict(empty_result) for key in gap_key_matches}
-
-    gap_lookup = {idx: key for idx, key in enumerate(gap_key_matches)}
-    match_rows = []
-    for gap_id, gap_key in gap_lookup.items():
-        match_keys = [
-            normalize_outcome_item_text(key)
-            for key in gap_key_matches.get(gap_key, [])
-            if normalize_outcome_item_text(key)
-        ]
-        if not match_keys:
-            continue
-        match_rows.extend({"_GapID": gap_id, "_OutcomeMatchKey": key} for key in match_keys)
-
-    key_frames = []
-    if match_rows and item_match_map is not None and not item_match_map.empty:
-        term_key_frame = pd.DataFrame(match_rows).drop_duplicates(["_GapID", "_OutcomeMatchKey"]).merge(
-            item_match_map,
-            on="_OutcomeMatchKey",
-            how="inner",
-        )[["_GapID", "OutcomeItemKey"]]
-        if not term_key_frame.empty:
-            key_frames.append(term_key_frame.drop_duplicates(["_GapID", "OutcomeItemKey"]))
-    if not key_frames:
-        return {key: dict(empty_result) for key in gap_key_matches}
-
-    gap_item_keys = pd.concat(key_frames, ignore_index=True).drop_duplicates(["_GapID", "OutcomeItemKey"])
-    matched = gap_item_keys.merge(
-        sales[["OutcomeItemKey", "OutcomeClientKey", "OutcomePatientKey", "OutcomeChargeDate", "OutcomeAmount"]],
-        on="OutcomeItemKey",
-        how="inner",
-    )
-    if matched.empty:
-        return {key: dict(empty_result) for key in gap_key_matches}
 
-    matched = matched.loc[
-        matched["OutcomeClientKey"].astype(str).ne("")
-        & matched["OutcomePatientKey"].astype(str).ne("")
-        & pd.to_datetime(matched["OutcomeChargeDate"], errors="coerce").notna()
-    ].copy()
-    if matched.empty:
-        return {key: dict(empty_result) for key in gap_key_matches}
-
-    matched["OutcomeChargeDate"] = pd.to_datetime(matched["OutcomeChargeDate"], errors="coerce")
-    matched = matched.drop_duplicates(["_GapID", "OutcomeClientKey", "OutcomePatientKey", "OutcomeChargeDate"])
-    matched["OutcomeAmount"] = pd.to_numeric(matched["OutcomeAmount"], errors="coerce").fillna(0.0)
-    matched = matched.sort_values(["_GapID", "OutcomeClientKey", "OutcomePatientKey", "OutcomeChargeDate"])
-    total_counts = matched.groupby("_GapID")["OutcomeChargeDate"].count()
-    average_revenue = matched.groupby("_GapID")["OutcomeAmount"].mean()
-    patient_purchase_counts = (
-        matched
-        .groupby(["_GapID", "OutcomeClientKey", "OutcomePatientKey"], dropna=False)["OutcomeChargeDate"]
-        .count()
-    )
-    unique_patient_counts = patient_purchase_counts.groupby(level="_GapID").count()
-    unique_repeat_patient_counts = patient_purchase_counts.loc[patient_purchase_counts.ge(2)].groupby(level="_GapID").count()
-    matched["_GapDays"] = (
-        matched
-        .groupby(["_GapID", "OutcomeClientKey", "OutcomePatientKey"], dropna=False)["OutcomeChargeDate"]
-        .diff()
-        .dt.days
-    )
-    positive_gaps = matched.loc[matched["_GapDays"].gt(0)]
-    gap_means = positive_gaps.groupby("_GapID")["_GapDays"].mean()
-    gap_medians = positive_gaps.groupby("_GapID")["_GapDays"].median()
-    gap_counts = positive_gaps.groupby("_GapID")["_GapDays"].count()
-    return {
-        gap_key: {
-            "average": float(gap_means.loc[gap_id]) if gap_id in gap_means.index else None,
-            "median": float(gap_medians.loc[gap_id]) if gap_id in gap_medians.index else None,
-            "count": int(gap_counts.loc[gap_id]) if gap_id in gap_counts.index else 0,
-            "total": int(total_counts.loc[gap_id]) if gap_id in total_counts.index else 0,
-            "unique_patients": int(unique_patient_counts.loc[gap_id]) if gap_id in unique_patient_counts.index else 0,
-            "unique_repeat_patients": (
-                int(unique_repeat_patient_counts.loc[gap_id])
-                if gap_id in unique_repeat_patient_counts.index
-                else 0
-            ),
-            "average_revenue": float(average_revenue.loc[gap_id]) if gap_id in average_revenue.index else 0.0,
-            "repeat_rate": (
-                float(gap_counts.loc[gap_id]) / float(total_counts.loc[gap_id])
-                if gap_id in gap_counts.index and gap_id in total_counts.index and int(total_counts.loc[gap_id]) > 0
-                else 0.0
-            ),
+
+def datetime_day_numbers(values) -> tuple[np.ndarray, np.ndarray]:
+    """(days since epoch, missing mask) for date-like values; missing days are 0."""
+    dates = pd.to_datetime(pd.Series(values, copy=False), errors="coerce").to_numpy(dtype="datetime64[D]")
+    missing = np.isnat(dates)
+    days = dates.astype(np.int64)
+    days[missing] = 0
+    return days, missing
+
+
+class PurchaseTimelineIndex:
+    """
+    Every sale of one prepared sales frame as a CSR timeline: rows sorted by (patient, item, day, sale ID),
+    with patient_indptr marking each patient's slice. Next-purchase and date-range probes are searchsorted
+    calls on one combined (patient item pair, day) key; item_order lists identity rows per item for gap stats.
+    """
+
+    def __init__(self, sales: pd.DataFrame | None, frame_ref=None):
+        self.frame_ref = frame_ref
+        self._stats: dict[tuple[str, ...], dict] = {}
+        columns = ["OutcomeItemKey", "OutcomeClientKey", "OutcomePatientKey", "OutcomeChargeDate", "OutcomeAmount", "Item Name", "OutcomeSaleID"]
+        if sales is None or sales.empty or any(column not in sales.columns for column in columns):
+            sales = pd.DataFrame({column: pd.Series(dtype=object) for column in columns})
+        charge_dates = pd.to_datetime(sales["OutcomeChargeDate"], errors="coerce")
+        sales = sales.loc[charge_dates.notna(), columns]
+        charge_dates = charge_dates.loc[charge_dates.notna()]
+        patient_codes = sales.groupby(["OutcomeClientKey", "OutcomePatientKey"], sort=False, dropna=False).ngroup().to_numpy(dtype=np.int64)
+        patient_frame = sales[["OutcomeClientKey", "OutcomePatientKey"]].drop_duplicates()
+        self.patient_index = pd.MultiIndex.from_frame(patient_frame)
+        patient_has_identity = (
+            patient_frame["OutcomeClientKey"].astype(str).ne("")
+            & patient_frame["OutcomePatientKey"].astype(str).ne("")
+        ).to_numpy(dtype=bool)
+        item_codes, item_keys = pd.factorize(sales["OutcomeItemKey"], use_na_sentinel=False)
+        self.item_index = pd.Index(item_keys)
+        name_codes, self.item_names = pd.factorize(sales["Item Name"], use_na_sentinel=False)
+        days, _ = datetime_day_numbers(charge_dates)
+        sale_ids = sales["OutcomeSaleID"].to_numpy(dtype=np.int64)
+
+        order = np.lexsort((sale_ids, days, item_codes, patient_codes))
+        self.patients = patient_codes[order]
+        self.items = item_codes.astype(np.int64)[order]
+        self.days = days[order]
+        self.sale_ids = sale_ids[order]
+        self.charge_dates = charge_dates.to_numpy()[order]
+        self.amounts = sales["OutcomeAmount"].to_numpy()[order]
+        self.name_codes = name_codes[order]
+        self.patient_indptr = np.searchsorted(self.patients, np.arange(len(self.patient_index) + 1), side="left")
+
+        item_count = max(len(self.item_index), 1)
+        row_pairs = self.patients * item_count + self.items
+        self.pair_keys, pair_ranks = np.unique(row_pairs, return_inverse=True)
+        self.min_day = int(self.days.min()) if len(self.days) else 0
+        self.day_span = (int(self.days.max()) - self.min_day + 2) if len(self.days) else 2
+        self.timeline_keys = pair_ranks.astype(np.int64) * self.day_span + (self.days - self.min_day)
+
+        identity_rows = np.flatnonzero(patient_has_identity[self.patients]) if len(self.patients) else np.empty(0, dtype=np.int64)
+        self.item_order = identity_rows[np.argsort(self.items[identity_rows], kind="stable")]
+        sorted_items = self.items[self.item_order]
+        item_range = np.arange(len(self.item_index))
+        starts = np.searchsorted(sorted_items, item_range, side="left")
+        ends = np.searchsorted(sorted_items, item_range, side="right")
+        self._item_slices = {str(key): (int(start), int(end)) for key, start, end in zip(self.item_index, starts, ends)}
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def item_key_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({"OutcomeItemKey": np.asarray(self.item_index, dtype=object)})
+
+    def patient_codes(self, client_keys, patient_keys) -> np.ndarray:
+        """Patient codes for key pairs; -1 where the pair never purchased."""
+        if not len(self.patient_index):
+            return np.full(len(client_keys), -1, dtype=np.int64)
+        return self.patient_index.get_indexer(pd.MultiIndex.from_arrays([list(client_keys), list(patient_keys)]))
+
+    def item_codes(self, item_keys) -> np.ndarray:
+        return self.item_index.get_indexer(list(item_keys))
+
+    def purchases_between(self, patient_codes, item_codes, start_days, end_days) -> tuple[np.ndarray, np.ndarray]:
+        """Row ranges [first, stop) of each patient's purchases of the item with start_day <= day <= end_day."""
+        patient_codes = np.asarray(patient_codes, dtype=np.int64)
+        item_codes = np.asarray(item_codes, dtype=np.int64)
+        item_count = max(len(self.item_index), 1)
+        query_pairs = patient_codes * item_count + item_codes
+        ranks = np.searchsorted(self.pair_keys, query_pairs)
+        found = (patient_codes >= 0) & (item_codes >= 0) & (ranks < len(self.pair_keys))
+        found[found] = self.pair_keys[ranks[found]] == query_pairs[found]
+        start_offsets = np.clip(np.asarray(start_days, dtype=np.int64) - self.min_day, 0, self.day_span - 1)
+        end_offsets = np.clip(np.asarray(end_days, dtype=np.int64) - self.min_day, -1, self.day_span - 1)
+        first = np.searchsorted(self.timeline_keys, ranks * self.day_span + start_offsets, side="left")
+        stop = np.searchsorted(self.timeline_keys, ranks * self.day_span + end_offsets, side="right")
+        stop = np.where(found, np.maximum(stop, first), first)
+        return first, stop
+
+    def next_purchase_on_or_after(self, patient_codes, item_codes, days) -> np.ndarray:
+        """Row of each patient's first purchase of the item on or after the day (lowest sale ID first); -1 if none."""
+        days = np.asarray(days, dtype=np.int64)
+        last_days = np.full(len(days), self.min_day + self.day_span, dtype=np.int64)
+        first, stop = self.purchases_between(patient_codes, item_codes, days, last_days)
+        return np.where(first < stop, first, -1)
+
+    def purchase_rows(self, rows: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame({
+            "OutcomeChargeDate": self.charge_dates[rows],
+            "Item Name": np.asarray(self.item_names, dtype=object)[self.name_codes[rows]],
+            "OutcomeAmount": self.amounts[rows],
+            "OutcomeSaleID": self.sale_ids[rows],
+            "_OutcomeDay": self.days[rows],
+        })
+
+    def purchase_gap_stats(self, item_keys: Iterable[str]) -> dict[str, float | int | None]:
+        """Statistics over the union of the items' sales; earlier item keys win same-day duplicates."""
+        key = tuple(dict.fromkeys(item_key for item_key in item_keys if item_key in self._item_slices))
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = self._compute_gap_stats(key)
+        return dict(stats)
+
+    def _compute_gap_stats(self, item_keys: tuple[str, ...]) -> dict[str, float | int | None]:
+        if not item_keys:
+            return empty_purchase_gap_stats()
+        rows = np.concatenate([self.item_order[slice(*self._item_slices[item_key])] for item_key in item_keys])
+        patients, days, amounts = self.patients[rows], self.days[rows], self.amounts[rows].astype(float)
+        order = np.lexsort((days, patients))
+        patients, days, amounts = patients[order], days[order], amounts[order]
+        keep = np.ones(len(days), dtype=bool)
+        keep[1:] = (patients[1:] != patients[:-1]) | (days[1:] != days[:-1])
+        patients, days, amounts = patients[keep], days[keep], amounts[keep]
+        total = len(days)
+        if not total:
+            return empty_purchase_gap_stats()
+        new_patient = np.ones(total, dtype=bool)
+        new_patient[1:] = patients[1:] != patients[:-1]
+        purchase_counts = np.diff(np.append(np.flatnonzero(new_patient), total))
+        gap_days = np.diff(days)[~new_patient[1:]]
+        gap_days = gap_days[gap_days > 0]
+        return {
+            "average": float(gap_days.mean()) if len(gap_days) else None,
+            "median": float(np.median(gap_days)) if len(gap_days) else None,
+            "count": int(len(gap_days)),
+            "total": int(total),
+            "unique_patients": int(len(purchase_counts)),
+            "unique_repeat_patients": int(np.count_nonzero(purchase_counts >= 2)),
+            "repeat_rate": float(len(gap_days)) / float(total),
+            "average_revenue": float(amounts.mean()),
         }
-        for gap_id, gap_key in gap_lookup.items()
-    }
+
+    def gap_map(
+        self,
+        gap_key_matches: dict[tuple[str, ...], list[str]],
+        item_match_map: pd.DataFrame,
+    ) -> dict[tuple[str, ...], dict[str, float | int | None]]:
+        items_by_match_key: dict[str, list[str]] = {}
+        if item_match_map is not None and not item_match_map.empty:
+            for match_key, item_key in zip(item_match_map["_OutcomeMatchKey"], item_match_map["OutcomeItemKey"]):
+                items_by_match_key.setdefault(match_key, []).append(item_key)
+        gap_map = {}
+        for gap_key, match_keys in gap_key_matches.items():
+            normalized_keys = dict.fromkeys(
+                normalize_outcome_item_text(key)
+                for key in match_keys or []
+                if normalize_outcome_item_text(key)
+            )
+            gap_map[gap_key] = self.purchase_gap_stats(
+                item_key
+                for match_key in normalized_keys
+                for item_key in items_by_match_key.get(match_key, [])
+            )
+        return gap_map
+
+
+def purchase_timeline_index(sales_df: pd.DataFrame) -> PurchaseTimelineIndex:
+    """Built once per sales frame object; shared datasets are frozen, so identity stands in for content version."""
+    if not isinstance(sales_df, pd.DataFrame):
+        return PurchaseTimelineIndex(None)
+    key = id(sales_df)
+    with _FRAME_INDEX_LOCK:
+        entry = _PURCHASE_TIMELINE_INDEXES.get(key)
+    if entry is not None and entry.frame_ref() is sales_df:
+        return entry
+    entry = PurchaseTimelineIndex(
+        prepare_sales_for_outcomes(sales_df),
+        weakref.ref(sales_df, lambda ref, key=key: _forget_frame_index(_PURCHASE_TIMELINE_INDEXES, key, ref)),
+    )
+    with _FRAME_INDEX_LOCK:
+        _PURCHASE_TIMELINE_INDEXES[key] = entry
+    return entry
+
+
+def build_average_sales_purchase_gap_map(
+    sales: pd.DataFrame,
+    gap_key_matches: dict[tuple[str, ...], list[str]],
+    item_match_map: pd.DataFrame,
+    timeline: PurchaseTimelineIndex | None = None,
+) -> dict[tuple[str, ...], dict[str, float | int | None]]:
+    """Per gap key purchase statistics; pass the dataset's timeline index to skip building one from sales."""
+    if sales is None or sales.empty or not gap_key_matches:
+        return {key: empty_purchase_gap_stats() for key in gap_key_matches}
+    if timeline is None:
+        timeline = PurchaseTimelineIndex(sales)
+    return timeline.gap_map(gap_key_matches, item_match_map)
 
 
 @st.cache_data(show_spinner=False, max_entries=8)
@@ -15727,7 +18809,7 @@ def build_reminder_outcomes(
     if not sent_records:
         return empty_outcome_frame()
 
-    sales = prepare_sales_for_outcomes(sales_df)
+    timeline = purchase_timeline_index(sales_df)
     rows = []
     gap_key_matches: dict[tuple[str, ...], list[str]] = {}
     all_match_keys: set[str] = set()
@@ -15835,9 +18917,9 @@ def build_reminder_outcomes(
     if outcomes.empty:
         return empty_outcome_frame()
 
-    item_match_map = build_outcome_item_match_map(sales, all_match_keys)
+    item_match_map = build_outcome_item_match_map(timeline.item_key_frame(), all_match_keys)
     if gap_key_matches:
-        gap_map = build_average_sales_purchase_gap_map(sales, gap_key_matches, item_match_map)
+        gap_map = timeline.gap_map(gap_key_matches, item_match_map)
         outcomes["Avg Item Purchase Gap Days"] = outcomes["_OutcomeGapCacheKey"].map(
             lambda key: (gap_map.get(key) or {}).get("average")
         )
@@ -15922,148 +19004,158 @@ def build_reminder_outcomes(
         ],
     ]
 
-    if not measurable.empty and not sales.empty and not item_match_map.empty:
+    if not measurable.empty and len(timeline) and not item_match_map.empty:
         match_rows = measurable.explode("_OutcomeMatchKeys").rename(columns={"_OutcomeMatchKeys": "_OutcomeMatchKey"})
         match_rows = match_rows.loc[match_rows["_OutcomeMatchKey"].fillna("").astype(str).ne("")]
+        probes = pd.DataFrame()
+        first_next_purchases = pd.DataFrame()
         if not match_rows.empty:
             matched_item_rows = match_rows.merge(
                 item_match_map,
                 on="_OutcomeMatchKey",
                 how="inner",
             )
-            merged = matched_item_rows.merge(
-                sales[
-                    [
-                        "OutcomeClientKey",
-                        "OutcomePatientKey",
-                        "OutcomeChargeDate",
-                        "OutcomeItemKey",
-                        "OutcomeAmount",
-                        "Item Name",
-                        "OutcomeSaleID",
-                    ]
-                ],
-                left_on=["_OutcomeClientKey", "_OutcomePatientKey", "OutcomeItemKey"],
-                right_on=["OutcomeClientKey", "OutcomePatientKey", "OutcomeItemKey"],
-                how="inner",
+            charge_days, charge_missing = datetime_day_numbers(matched_item_rows["Charge Date"])
+            probes = pd.DataFrame({
+                "_OutcomeRecordID": matched_item_rows["_OutcomeRecordID"].to_numpy(),
+                "_ProbePatient": timeline.patient_codes(
+                    matched_item_rows["_OutcomeClientKey"],
+                    matched_item_rows["_OutcomePatientKey"],
+                ),
+                "_ProbeItem": timeline.item_codes(matched_item_rows["OutcomeItemKey"]),
+                # Only purchases after the original charge count; records without one take any purchase.
+                "_ProbeAfterDay": np.where(charge_missing, timeline.min_day, charge_days + 1),
+            })
+            probes = probes.loc[probes["_ProbePatient"].ge(0) & probes["_ProbeItem"].ge(0)].reset_index(drop=True)
+        if not probes.empty:
+            next_rows = timeline.next_purchase_on_or_after(
+                probes["_ProbePatient"].to_numpy(),
+                probes["_ProbeItem"].to_numpy(),
+                probes["_ProbeAfterDay"].to_numpy(),
             )
-            if not merged.empty:
-                merged = merged.drop_duplicates(["_OutcomeRecordID", "OutcomeSaleID"])
-                charge_dates = pd.to_datetime(merged["Charge Date"], errors="coerce")
-                after_original_mask = (
-                    charge_dates.isna()
-                    | (merged["OutcomeChargeDate"] > charge_dates)
-                )
-                merged = merged.loc[after_original_mask]
-            if not merged.empty:
+            found = next_rows >= 0
+            if found.any():
                 first_next_purchases = (
-                    merged.sort_values(["_OutcomeRecordID", "OutcomeChargeDate", "OutcomeSaleID"])
+                    pd.concat(
+                        [
+                            probes.loc[found, ["_OutcomeRecordID"]].reset_index(drop=True),
+                            timeline.purchase_rows(next_rows[found]),
+                        ],
+                        axis=1,
+                    )
+                    .sort_values(["_OutcomeRecordID", "OutcomeChargeDate", "OutcomeSaleID"])
                     .drop_duplicates("_OutcomeRecordID", keep="first")
                 )
-                if not first_next_purchases.empty:
-                    record_ids = first_next_purchases["_OutcomeRecordID"].astype(int).to_numpy()
-                    next_purchase_dates = pd.to_datetime(first_next_purchases["OutcomeChargeDate"], errors="coerce")
-                    charge_dates = pd.to_datetime(outcomes.loc[record_ids, "Charge Date"], errors="coerce").reset_index(drop=True)
-                    next_gap_days = (next_purchase_dates.reset_index(drop=True) - charge_dates).dt.days
-                    matched_items = first_next_purchases["Item Name"].map(
-                        lambda value: normalize_display_case(str(value or "").strip())
-                    ).to_numpy()
-
-                    outcomes.loc[record_ids, "Next Purchase Date"] = next_purchase_dates.to_numpy()
-                    outcomes.loc[record_ids, "Next Purchase Gap Days"] = next_gap_days.to_numpy()
-                    outcomes.loc[record_ids, "Next Matched Item"] = matched_items
+        if not first_next_purchases.empty:
+            record_ids = first_next_purchases["_OutcomeRecordID"].astype(int).to_numpy()
+            next_purchase_dates = pd.to_datetime(first_next_purchases["OutcomeChargeDate"], errors="coerce")
+            charge_dates = pd.to_datetime(outcomes.loc[record_ids, "Charge Date"], errors="coerce").reset_index(drop=True)
+            next_gap_days = (next_purchase_dates.reset_index(drop=True) - charge_dates).dt.days
+            matched_items = first_next_purchases["Item Name"].map(
+                lambda value: normalize_display_case(str(value or "").strip())
+            ).to_numpy()
+
+            outcomes.loc[record_ids, "Next Purchase Date"] = next_purchase_dates.to_numpy()
+            outcomes.loc[record_ids, "Next Purchase Gap Days"] = next_gap_days.to_numpy()
+            outcomes.loc[record_ids, "Next Matched Item"] = matched_items
+
+            desired_gap_days = pd.to_numeric(outcomes.loc[record_ids, "Desired Gap Days"], errors="coerce").reset_index(drop=True)
+            success_by_gap = (
+                next_gap_days.notna()
+                & desired_gap_days.notna()
+                & (next_gap_days.astype(float).sub(desired_gap_days.astype(float)).abs() <= due_date_window_days)
+            )
+            window_start = pd.to_datetime(outcomes.loc[record_ids, "Window Starts"], errors="coerce").reset_index(drop=True)
+            window_end = pd.to_datetime(outcomes.loc[record_ids, "Window Ends"], errors="coerce").reset_index(drop=True)
+            success_by_window = next_purchase_dates.reset_index(drop=True).between(window_start, window_end, inclusive="both")
+            success_by_due_window = (success_by_gap | success_by_window).fillna(False)
+            due_success_mask = success_by_due_window.to_numpy()
+            success_candidates = []
+            if due_success_mask.any():
+                success_candidates.append(pd.DataFrame({
+                    "_OutcomeRecordID": record_ids[due_success_mask],
+                    "Success Date": next_purchase_dates.iloc[due_success_mask].to_numpy(),
+                    "Matched Item": matched_items[due_success_mask],
+                    "Revenue": (
+                        pd.to_numeric(first_next_purchases.iloc[due_success_mask]["OutcomeAmount"], errors="coerce")
+                        .fillna(0)
+                        .to_numpy()
+                    ),
+                    "Success Gap Days": next_gap_days.iloc[due_success_mask].to_numpy(),
+                    "Success Basis": "Due date window",
+                    "_SuccessPriority": 0,
+                }))
 
-                    desired_gap_days = pd.to_numeric(outcomes.loc[record_ids, "Desired Gap Days"], errors="coerce").reset_index(drop=True)
-                    success_by_gap = (
-                        next_gap_days.notna()
-                        & desired_gap_days.notna()
-                        & (next_gap_days.astype(float).sub(desired_gap_days.astype(float)).abs() <= due_date_window_days)
+            charge_date_by_record = pd.to_datetime(outcomes["Charge Date"], errors="coerce")
+            sent_date_rows = []
+            for outcome_record_id, sent_dates in outcomes[["_OutcomeRecordID", "_OutcomeSentDates"]].itertuples(index=False):
+                for sent_date_value in sent_dates or []:
+                    sent_date_rows.append({
+                        "_OutcomeRecordID": int(outcome_record_id),
+                        "_SentDate": pd.Timestamp(sent_date_value),
+                    })
+            sent_date_frame = pd.DataFrame(sent_date_rows, columns=["_OutcomeRecordID", "_SentDate"])
+            post_candidates = pd.DataFrame()
+            if not sent_date_frame.empty:
+                post_probes = probes.merge(sent_date_frame, on="_OutcomeRecordID", how="inner")
+                post_probes = post_probes.loc[
+                    post_probes["_SentDate"].notna()
+                    & (post_probes["_SentDate"].dt.date <= today)
+                ].reset_index(drop=True)
+                sent_days, _ = datetime_day_numbers(post_probes["_SentDate"])
+                first_rows, stop_rows = timeline.purchases_between(
+                    post_probes["_ProbePatient"].to_numpy(),
+                    post_probes["_ProbeItem"].to_numpy(),
+                    np.maximum(sent_days, post_probes["_ProbeAfterDay"].to_numpy()),
+                    sent_days + post_reminder_window_days,
+                )
+                found = first_rows < stop_rows
+                if found.any():
+                    post_candidates = pd.concat(
+                        [
+                            post_probes.loc[found, ["_OutcomeRecordID", "_SentDate"]].reset_index(drop=True),
+                            timeline.purchase_rows(first_rows[found]),
+                        ],
+                        axis=1,
                     )
-                    window_start = pd.to_datetime(outcomes.loc[record_ids, "Window Starts"], errors="coerce").reset_index(drop=True)
-                    window_end = pd.to_datetime(outcomes.loc[record_ids, "Window Ends"], errors="coerce").reset_index(drop=True)
-                    success_by_window = next_purchase_dates.reset_index(drop=True).between(window_start, window_end, inclusive="both")
-                    success_by_due_window = (success_by_gap | success_by_window).fillna(False)
-                    due_success_mask = success_by_due_window.to_numpy()
-                    success_candidates = []
-                    if due_success_mask.any():
-                        success_candidates.append(pd.DataFrame({
-                            "_OutcomeRecordID": record_ids[due_success_mask],
-                            "Success Date": next_purchase_dates.iloc[due_success_mask].to_numpy(),
-                            "Matched Item": matched_items[due_success_mask],
-                            "Revenue": (
-                                pd.to_numeric(first_next_purchases.iloc[due_success_mask]["OutcomeAmount"], errors="coerce")
-                                .fillna(0)
-                                .to_numpy()
-                            ),
-                            "Success Gap Days": next_gap_days.iloc[due_success_mask].to_numpy(),
-                            "Success Basis": "Due date window",
-                            "_SuccessPriority": 0,
-                        }))
-
-                    charge_date_by_record = pd.to_datetime(outcomes["Charge Date"], errors="coerce")
-                    sent_date_rows = []
-                    for outcome_record_id, sent_dates in outcomes[["_OutcomeRecordID", "_OutcomeSentDates"]].itertuples(index=False):
-                        for sent_date_value in sent_dates or []:
-                            sent_date_rows.append({
-                                "_OutcomeRecordID": int(outcome_record_id),
-                                "_SentDate": pd.Timestamp(sent_date_value),
-                            })
-                    sent_date_frame = pd.DataFrame(sent_date_rows, columns=["_OutcomeRecordID", "_SentDate"])
-                    post_candidates = pd.DataFrame()
-                    if not sent_date_frame.empty:
-                        post_candidates = merged.merge(sent_date_frame, on="_OutcomeRecordID", how="inner")
-                        post_candidates["OutcomeChargeDate"] = pd.to_datetime(post_candidates["OutcomeChargeDate"], errors="coerce")
-                        post_candidates["_PostReminderWindowEnd"] = (
-                            post_candidates["_SentDate"] + pd.to_timedelta(post_reminder_window_days, unit="D")
-                        )
-                        post_candidates = post_candidates.loc[
-                            post_candidates["_SentDate"].notna()
-                            & (post_candidates["_SentDate"].dt.date <= today)
-                            & post_candidates["OutcomeChargeDate"].notna()
-                            & post_candidates["OutcomeChargeDate"].between(
-                                post_candidates["_SentDate"],
-                                post_candidates["_PostReminderWindowEnd"],
-                                inclusive="both",
-                            )
-                        ]
-                    if not post_candidates.empty:
-                        post_first_purchases = (
-                            post_candidates.sort_values(["_OutcomeRecordID", "OutcomeChargeDate", "OutcomeSaleID", "_SentDate"])
-                            .drop_duplicates("_OutcomeRecordID", keep="first")
-                        )
-                        post_record_ids = post_first_purchases["_OutcomeRecordID"].astype(int)
-                        post_purchase_dates = pd.to_datetime(post_first_purchases["OutcomeChargeDate"], errors="coerce")
-                        post_charge_dates = post_record_ids.map(charge_date_by_record)
-                        post_gap_days = (post_purchase_dates.reset_index(drop=True) - post_charge_dates.reset_index(drop=True)).dt.days
-                        success_candidates.append(pd.DataFrame({
-                            "_OutcomeRecordID": post_record_ids.to_numpy(),
-                            "Success Date": post_purchase_dates.to_numpy(),
-                            "Matched Item": post_first_purchases["Item Name"].map(
-                                lambda value: normalize_display_case(str(value or "").strip())
-                            ).to_numpy(),
-                            "Revenue": (
-                                pd.to_numeric(post_first_purchases["OutcomeAmount"], errors="coerce")
-                                .fillna(0)
-                                .to_numpy()
-                            ),
-                            "Success Gap Days": post_gap_days.to_numpy(),
-                            "Success Basis": "After sent date",
-                            "_SuccessPriority": 1,
-                        }))
-
-                    if success_candidates:
-                        selected_successes = (
-                            pd.concat(success_candidates, ignore_index=True)
-                            .sort_values(["_OutcomeRecordID", "Success Date", "_SuccessPriority"])
-                            .drop_duplicates("_OutcomeRecordID", keep="first")
-                        )
-                        success_record_ids = selected_successes["_OutcomeRecordID"].astype(int).to_numpy()
-                        outcomes.loc[success_record_ids, "Success Date"] = selected_successes["Success Date"].to_numpy()
-                        outcomes.loc[success_record_ids, "Matched Item"] = selected_successes["Matched Item"].to_numpy()
-                        outcomes.loc[success_record_ids, "Revenue"] = selected_successes["Revenue"].to_numpy()
-                        outcomes.loc[success_record_ids, "Success Gap Days"] = selected_successes["Success Gap Days"].to_numpy()
-                        outcomes.loc[success_record_ids, "Success Basis"] = selected_successes["Success Basis"].to_numpy()
-                        outcomes.loc[success_record_ids, "Outcome"] = "Reminder Success"
+            if not post_candidates.empty:
+                post_first_purchases = (
+                    post_candidates.sort_values(["_OutcomeRecordID", "OutcomeChargeDate", "OutcomeSaleID", "_SentDate"])
+                    .drop_duplicates("_OutcomeRecordID", keep="first")
+                )
+                post_record_ids = post_first_purchases["_OutcomeRecordID"].astype(int)
+                post_purchase_dates = pd.to_datetime(post_first_purchases["OutcomeChargeDate"], errors="coerce")
+                post_charge_dates = post_record_ids.map(charge_date_by_record)
+                post_gap_days = (post_purchase_dates.reset_index(drop=True) - post_charge_dates.reset_index(drop=True)).dt.days
+                success_candidates.append(pd.DataFrame({
+                    "_OutcomeRecordID": post_record_ids.to_numpy(),
+                    "Success Date": post_purchase_dates.to_numpy(),
+                    "Matched Item": post_first_purchases["Item Name"].map(
+                        lambda value: normalize_display_case(str(value or "").strip())
+                    ).to_numpy(),
+                    "Revenue": (
+                        pd.to_numeric(post_first_purchases["OutcomeAmount"], errors="coerce")
+                        .fillna(0)
+                        .to_numpy()
+                    ),
+                    "Success Gap Days": post_gap_days.to_numpy(),
+                    "Success Basis": "After sent date",
+                    "_SuccessPriority": 1,
+                }))
+
+            if success_candidates:
+                selected_successes = (
+                    pd.concat(success_candidates, ignore_index=True)
+                    .sort_values(["_OutcomeRecordID", "Success Date", "_SuccessPriority"])
+                    .drop_duplicates("_OutcomeRecordID", keep="first")
+                )
+                success_record_ids = selected_successes["_OutcomeRecordID"].astype(int).to_numpy()
+                outcomes.loc[success_record_ids, "Success Date"] = selected_successes["Success Date"].to_numpy()
+                outcomes.loc[success_record_ids, "Matched Item"] = selected_successes["Matched Item"].to_numpy()
+                outcomes.loc[success_record_ids, "Revenue"] = selected_successes["Revenue"].to_numpy()
+                outcomes.loc[success_record_ids, "Success Gap Days"] = selected_successes["Success Gap Days"].to_numpy()
+                outcomes.loc[success_record_ids, "Success Basis"] = selected_successes["Success Basis"].to_numpy()
+                outcomes.loc[success_record_ids, "Outcome"] = "Reminder Success"
 
     return outcomes[OUTCOME_TABLE_COLUMNS]
 
@@ -16129,6 +19221,20 @@ def filter_stats_sent_tab_rows(
     return filter_sent_outcomes_for_period(outcomes_df, period_label, today=user_today(), custom_range=custom_range)
 
 
+def stats_sent_period_bounds(
+    period_label: str,
+    custom_range: tuple[date, date] | None = None,
+    today: date | None = None,
+) -> tuple[date | None, date | None]:
+    """Sent-date bounds filter_stats_sent_tab_rows applies; (None, None) keeps every row."""
+    if str(period_label or "").strip() == "Custom" and custom_range is not None:
+        start_date, end_date = custom_range
+        return (end_date, start_date) if end_date < start_date else (start_date, end_date)
+    today = today or user_today()
+    start = statistics_period_start(sent_reminder_outcome_period(period_label), today)
+    return (None, None) if start is None else (start, today)
+
+
 def filter_stats_success_tab_rows(
     outcomes_df: pd.DataFrame,
     period_label: str,
@@ -16147,27 +19253,6 @@ def filter_stats_success_tab_rows(
     )
 
 
-def statistics_row_in_custom_range(row: dict, custom_range: tuple[date, date] | None) -> bool:
-    if custom_range is None:
-        return True
-    start_date, end_date = custom_range
-    if end_date < start_date:
-        start_date, end_date = end_date, start_date
-    return any(start_date <= value_date <= end_date for value_date in statistics_row_dates(row))
-
-
-def statistics_records_in_custom_range(
-    records: list[dict],
-    custom_range: tuple[date, date] | None,
-) -> list[dict]:
-    if custom_range is None:
-        return [dict(record) for record in records or [] if isinstance(record, dict)]
-    return [
-        dict(record) for record in records or []
-        if isinstance(record, dict) and statistics_row_in_custom_range(record, custom_range)
-    ]
-
-
 def statistics_generated_records_for_period_filter(
     generated_df: pd.DataFrame,
     period_label: str,
@@ -16176,9 +19261,8 @@ def statistics_generated_records_for_period_filter(
     if generated_df is None or getattr(generated_df, "empty", True):
         return []
     records = expand_grouped_action_records(generated_df.to_dict("records"))
-    if str(period_label or "").strip() == "Custom":
-        return statistics_records_in_custom_range(records, custom_range)
-    return statistics_records_in_reminder_period(records, sent_reminder_outcome_period(period_label), user_today())
+    mask = StatisticsDates(map(statistics_reminder_date_value, records)).period_filter_mask(period_label, custom_range)
+    return [dict(record) for record, keep in zip(records, mask) if keep]
 
 
 def statistics_action_records_for_scheduled_period_filter(
@@ -16187,9 +19271,8 @@ def statistics_action_records_for_scheduled_period_filter(
     custom_range: tuple[date, date] | None = None,
 ) -> list[dict]:
     expanded_records = expand_grouped_action_records(action_records)
-    if str(period_label or "").strip() == "Custom":
-        return statistics_records_in_custom_range(expanded_records, custom_range)
-    return statistics_records_in_reminder_period(expanded_records, sent_reminder_outcome_period(period_label), user_today())
+    mask = StatisticsDates(map(statistics_reminder_date_value, expanded_records)).period_filter_mask(period_label, custom_range)
+    return [dict(record) for record, keep in zip(expanded_records, mask) if keep]
 
 
 def statistics_action_records_for_actioned_period_filter(
@@ -16520,12 +19603,114 @@ def build_outcome_group_frame(
     return frame.sort_values(["Successes", "Sent"], ascending=False)
 
 
+class StatsOutcomeCube:
+    """
+    Sent, success and pending counts plus success revenue, summed per sent day x item x sender.
+    Built once per stats calculation signature; any stats period is a range sum over the day axis.
+    """
+
+    def __init__(self, outcome_rows: pd.DataFrame):
+        empty = outcome_rows is None or outcome_rows.empty
+        self.has_sender = not empty and "Sender" in outcome_rows.columns
+        if empty:
+            outcome_rows = empty_outcome_frame()
+
+        def labels(column: str) -> pd.Series:
+            if column not in outcome_rows.columns:
+                return pd.Series("Unknown", index=outcome_rows.index)
+            return outcome_rows[column].fillna("").astype(str).str.strip().replace("", "Unknown")
+
+        item_codes, self.items = pd.factorize(labels("Item"), sort=True)
+        sender_codes, self.senders = pd.factorize(labels("Sender"), sort=True)
+        if "Sent Date" in outcome_rows.columns:
+            sent_dates = pd.to_datetime(outcome_rows["Sent Date"], errors="coerce")
+            if getattr(sent_dates.dt, "tz", None) is not None:
+                sent_dates = sent_dates.dt.tz_localize(None)
+            days = sent_dates.dt.normalize().to_numpy(dtype="datetime64[D]").view("int64")
+        else:
+            days = np.full(len(outcome_rows.index), np.iinfo(np.int64).min)
+        outcomes = outcome_rows.get("Outcome", pd.Series("", index=outcome_rows.index))
+        success = outcomes.eq("Reminder Success").to_numpy(dtype=bool)
+        revenue = outcome_summary_numeric_series(outcome_rows, "Revenue")
+        revenue = (
+            pd.to_numeric(revenue, errors="coerce").fillna(0).to_numpy(dtype=float)
+            if len(revenue.index) == len(outcome_rows.index)
+            else np.zeros(len(outcome_rows.index))
+        )
+        # NaT days are int64 min, so they sort first and fall outside every bounded range.
+        cells = pd.DataFrame({
+            "day": days,
+            "item": item_codes,
+            "sender": sender_codes,
+            "sent": 1,
+            "successes": success.astype(np.int64),
+            "pending": outcomes.eq("Pending").to_numpy(dtype=np.int64),
+            "revenue": np.where(success, revenue, 0.0),
+        }).groupby(["day", "item", "sender"], sort=True).sum().reset_index()
+        self.days = cells["day"].to_numpy()
+        self.item_codes = cells["item"].to_numpy()
+        self.sender_codes = cells["sender"].to_numpy()
+        self.sent = cells["sent"].to_numpy(dtype=np.int64)
+        self.successes = cells["successes"].to_numpy(dtype=np.int64)
+        self.pending = cells["pending"].to_numpy(dtype=np.int64)
+        self.revenue = cells["revenue"].to_numpy(dtype=float)
+
+    def _cells(self, bounds: tuple[date | None, date | None]) -> slice:
+        start, end = bounds
+        if start is None and end is None:
+            return slice(0, len(self.days))
+        low = np.datetime64(start, "D").astype(np.int64) if start is not None else np.iinfo(np.int64).min + 1
+        high = np.datetime64(end, "D").astype(np.int64) if end is not None else np.iinfo(np.int64).max
+        return slice(
+            int(np.searchsorted(self.days, low, side="left")),
+            int(np.searchsorted(self.days, high, side="right")),
+        )
+
+    def summary(self, bounds: tuple[date | None, date | None]) -> dict:
+        """The sent, successes, pending, success rate and revenue figures of summarize_outcomes."""
+        cells = self._cells(bounds)
+        sent = int(self.sent[cells].sum())
+        successes = int(self.successes[cells].sum())
+        pending = int(self.pending[cells].sum())
+        return {
+            "sent": sent,
+            "successes": successes,
+            "pending": pending,
+            "no_match": max(0, sent - successes - pending),
+            "success_rate": (successes / sent) if sent else 0.0,
+            "revenue": float(self.revenue[cells].sum()) if successes else 0.0,
+        }
+
+    def sender_frame(self, bounds: tuple[date | None, date | None]) -> pd.DataFrame:
+        """build_outcome_group_frame(rows, "Sender", OUTCOME_SENDER_GROUP_COLUMNS) for the rows inside bounds."""
+        cells = self._cells(bounds)
+        if not self.has_sender or cells.start >= cells.stop:
+            return pd.DataFrame(columns=OUTCOME_SENDER_GROUP_COLUMNS)
+        senders = self.sender_codes[cells]
+        size = len(self.senders)
+        sent = np.bincount(senders, weights=self.sent[cells], minlength=size).astype(np.int64)
+        successes = np.bincount(senders, weights=self.successes[cells], minlength=size).astype(np.int64)
+        pending = np.bincount(senders, weights=self.pending[cells], minlength=size).astype(np.int64)
+        revenue = np.bincount(senders, weights=self.revenue[cells], minlength=size)
+        codes = np.flatnonzero(sent)
+        return pd.DataFrame({
+            "Sender": [self.senders[code] for code in codes],
+            "Sent": sent[codes],
+            "Successes": successes[codes],
+            "Pending": pending[codes],
+            "No Match": np.maximum(0, sent[codes] - successes[codes] - pending[codes]),
+            "Success Rate": successes[codes] / sent[codes],
+            "Revenue": np.where(successes[codes] > 0, revenue[codes], 0.0),
+        }).sort_values(["Successes", "Sent"], ascending=False)
+
+
 def build_stats_team_frame(
     outcome_sender_frame: pd.DataFrame,
     action_records: list[dict],
     period: str = "All time",
     today: date | None = None,
     action_rows: list[dict] | None = None,
+    team_action_frame: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
     outcome_columns = [
         "Team Member",
@@ -16548,7 +19733,9 @@ def build_stats_team_frame(
         )
         outcome_frame = outcome_frame[[column for column in outcome_columns if column in outcome_frame.columns]]
 
-    action_frame = build_statistics_team_frame(action_records, period, today, action_rows=action_rows).rename(
+    if team_action_frame is None:
+        team_action_frame = build_statistics_team_frame(action_records, period, today, action_rows=action_rows)
+    action_frame = team_action_frame.rename(
         columns={
             "User": "Team Member",
             "Sent": "Sent Actions",
@@ -16895,31 +20082,39 @@ def style_outcome_dataframe_for_display(display_frame: pd.DataFrame, highlight_c
     )
 
 
-def sort_stats_frame_for_pagination(frame: pd.DataFrame, column: str, ascending: bool) -> pd.DataFrame:
+def stats_sort_rank_codes(values: pd.Series) -> np.ndarray:
+    if values.name in OUTCOME_DISPLAY_DATE_COLUMNS or values.name == "Last Actioned":
+        return sort_rank_codes(pd.to_datetime(values, errors="coerce"))
+    if pd.api.types.is_numeric_dtype(values):
+        return sort_rank_codes(pd.to_numeric(values, errors="coerce"))
+    numeric_values = pd.to_numeric(values, errors="coerce")
+    non_empty_values = values.fillna("").astype(str).str.strip().ne("")
+    if non_empty_values.any() and numeric_values.notna().sum() == non_empty_values.sum():
+        return sort_rank_codes(numeric_values)
+    return sort_rank_codes(values.fillna("").astype(str).str.casefold())
+
+
+def stats_frame_sort_order(
+    frame: pd.DataFrame,
+    column: str,
+    ascending: bool,
+    version: tuple | None = None,
+) -> np.ndarray | None:
     if frame is None or frame.empty or not column or column not in frame.columns:
-        return frame
+        return None
+    return frame_sort_order(frame, column, ascending, stats_sort_rank_codes, version=version)
 
-    sorted_frame = frame.copy()
-    helper_col = "__stats_sort_value"
-    values = sorted_frame[column]
-    if column in OUTCOME_DISPLAY_DATE_COLUMNS or column == "Last Actioned":
-        sorted_frame[helper_col] = pd.to_datetime(values, errors="coerce")
-    elif pd.api.types.is_numeric_dtype(values):
-        sorted_frame[helper_col] = pd.to_numeric(values, errors="coerce")
-    else:
-        numeric_values = pd.to_numeric(values, errors="coerce")
-        non_empty_values = values.fillna("").astype(str).str.strip().ne("")
-        if non_empty_values.any() and numeric_values.notna().sum() == non_empty_values.sum():
-            sorted_frame[helper_col] = numeric_values
-        else:
-            sorted_frame[helper_col] = values.fillna("").astype(str).map(lambda value: value.casefold())
 
-    return (
-        sorted_frame
-        .sort_values(helper_col, ascending=ascending, kind="mergesort", na_position="last")
-        .drop(columns=[helper_col])
-        .reset_index(drop=True)
-    )
+def sort_stats_frame_for_pagination(
+    frame: pd.DataFrame,
+    column: str,
+    ascending: bool,
+    version: tuple | None = None,
+) -> pd.DataFrame:
+    order = stats_frame_sort_order(frame, column, ascending, version=version)
+    if order is None:
+        return frame
+    return frame.take(order).reset_index(drop=True)
 
 
 def reset_stats_table_page(table_key: str) -> None:
@@ -17036,12 +20231,7 @@ def stats_export_slug(value: str) -> str:
     return slug or "stats"
 
 
-def stats_export_csv_bytes(frame: pd.DataFrame) -> bytes:
-    if frame is None or getattr(frame, "empty", True):
-        return b""
-    return frame.to_csv(index=False).encode("utf-8")
-
-
+STATS_EXPORT_CSV_CHUNK_ROWS = 5000
 STATS_EXPORT_PERCENT_COLUMNS = {
     "Success Rate",
     "Gap Day % to Desired",
@@ -17116,12 +20306,88 @@ def prepare_stats_csv_export_frame(frame: pd.DataFrame) -> pd.DataFrame:
     return export_frame
 
 
+def iter_stats_export_csv_chunks(
+    frame: pd.DataFrame,
+    columns: list[str] | None = None,
+    display_preparer=None,
+    chunk_rows: int = STATS_EXPORT_CSV_CHUNK_ROWS,
+):
+    """Yield encoded CSV pieces, preparing and formatting one slice of rows at a time."""
+    if columns is not None:
+        frame = frame.loc[:, [column for column in columns if column in frame.columns]]
+    chunk_rows = max(1, int(chunk_rows))
+    for start in range(0, len(frame.index), chunk_rows):
+        export_chunk = frame.iloc[start:start + chunk_rows]
+        if display_preparer is not None:
+            export_chunk = display_preparer(export_chunk)
+        export_chunk = prepare_stats_csv_export_frame(export_chunk)
+        yield export_chunk.to_csv(index=False, header=start == 0).encode("utf-8")
+
+
+def stats_export_csv_bytes(
+    frame: pd.DataFrame,
+    columns: list[str] | None = None,
+    display_preparer=None,
+    chunk_rows: int = STATS_EXPORT_CSV_CHUNK_ROWS,
+) -> bytes:
+    if frame is None or getattr(frame, "empty", True):
+        return b""
+    if columns is not None and not any(column in frame.columns for column in columns):
+        return b""
+    return b"".join(iter_stats_export_csv_chunks(frame, columns, display_preparer, chunk_rows))
+
+
+def stats_export_scope(sales_df: pd.DataFrame, data_version: int) -> tuple:
+    """Sessions on the same shared clinic dataset share exports; anything else stays per session."""
+    shared_version = shared_dataset_store().version_of(sales_df)
+    if shared_version is not None:
+        return ("dataset", *shared_version)
+    return ("session", session_instance_token(), data_version)
+
+
+def stats_export_version(cache_signature: tuple, scope: tuple) -> tuple:
+    """Stats calculation signature with its per-session data version swapped for the export scope."""
+    return (scope, cache_signature[0], *cache_signature[2:])
+
+
 def stats_export_display_preparer_key(display_preparer) -> str:
     if display_preparer is None:
         return ""
     return getattr(display_preparer, "__name__", repr(display_preparer))
 
 
+_FRAME_FINGERPRINTS: dict[int, "FrameFingerprints"] = {}
+
+
+class FrameFingerprints:
+    """Content fingerprints of one frame object, per selected column tuple."""
+
+    __slots__ = ("frame_ref", "values")
+
+    def __init__(self, frame_ref):
+        self.frame_ref = frame_ref
+        self.values: dict[tuple, tuple] = {}
+
+
+def memoized_frame_fingerprint(frame: pd.DataFrame, columns: tuple = ()) -> tuple:
+    """stats_export_frame_fingerprint, hashed once per frame object and column selection."""
+    if frame is None:
+        return stats_export_frame_fingerprint(frame)
+    key = id(frame)
+    with _FRAME_INDEX_LOCK:
+        entry = _FRAME_FINGERPRINTS.get(key)
+    if entry is None or entry.frame_ref() is not frame:
+        entry = FrameFingerprints(weakref.ref(frame, lambda ref, key=key: _forget_frame_index(_FRAME_FINGERPRINTS, key, ref)))
+        with _FRAME_INDEX_LOCK:
+            _FRAME_FINGERPRINTS[key] = entry
+    fingerprint = entry.values.get(columns)
+    if fingerprint is None:
+        fingerprint = entry.values[columns] = stats_export_frame_fingerprint(
+            frame.loc[:, list(columns)] if columns else frame
+        )
+    return fingerprint
+
+
 def stats_export_frame_fingerprint(frame: pd.DataFrame) -> tuple:
     if frame is None:
         return (0, (), "")
@@ -17138,55 +20404,42 @@ def stats_export_csv_cache_key(
     view_name: str,
     columns: list[str] | None = None,
     display_preparer=None,
+    version: tuple | None = None,
 ) -> tuple:
+    """Keyed by the upstream stats version when given; content hashing is only the fallback."""
     selected_columns = tuple(column for column in (columns or []) if frame is not None and column in frame.columns)
-    fingerprint_frame = frame
-    if selected_columns and frame is not None:
-        fingerprint_frame = frame.loc[:, list(selected_columns)]
     return (
         stats_export_slug(view_name),
         selected_columns,
         stats_export_display_preparer_key(display_preparer),
-        stats_export_frame_fingerprint(fingerprint_frame),
+        ("version", version) if version is not None else memoized_frame_fingerprint(frame, selected_columns),
     )
 
 
+def lazy_stats_export_csv(cache_key: tuple, frame: pd.DataFrame, columns=None, display_preparer=None):
+    """No-argument callable for st.download_button; builds the CSV on click, off the script thread."""
+    cache = stats_export_csv_process_cache()
+
+    def build() -> bytes:
+        csv_bytes = cache.get(cache_key)
+        if csv_bytes is None:
+            csv_bytes = cache.put(cache_key, stats_export_csv_bytes(frame, columns, display_preparer))
+        return csv_bytes
+
+    return build
+
+
 def stats_export_csv_bytes_for_render(
     frame: pd.DataFrame,
     view_name: str,
     columns: list[str] | None = None,
     display_preparer=None,
+    version: tuple | None = None,
 ) -> bytes:
     if frame is None or getattr(frame, "empty", True):
         return b""
-    cache_key = stats_export_csv_cache_key(frame, view_name, columns, display_preparer)
-    cached = st.session_state.get("_stats_export_csv_cache")
-    if isinstance(cached, dict) and "entries" in cached:
-        entries = cached.get("entries")
-        if isinstance(entries, dict) and cache_key in entries:
-            return entries.get(cache_key, b"") or b""
-    if isinstance(cached, dict) and cached.get("key") == cache_key:
-        return cached.get("bytes", b"") or b""
-
-    export_frame = frame.copy()
-    if columns is not None:
-        export_frame = export_frame[[column for column in columns if column in export_frame.columns]]
-    if display_preparer is not None:
-        export_frame = display_preparer(export_frame)
-    export_frame = prepare_stats_csv_export_frame(export_frame)
-    csv_bytes = stats_export_csv_bytes(export_frame)
-    entries = {}
-    if isinstance(cached, dict):
-        cached_entries = cached.get("entries")
-        if isinstance(cached_entries, dict):
-            entries.update(cached_entries)
-        elif cached.get("key") is not None:
-            entries[cached.get("key")] = cached.get("bytes", b"") or b""
-    entries[cache_key] = csv_bytes
-    if len(entries) > 8:
-        entries = dict(list(entries.items())[-8:])
-    st.session_state["_stats_export_csv_cache"] = {"entries": entries}
-    return csv_bytes
+    cache_key = stats_export_csv_cache_key(frame, view_name, columns, display_preparer, version)
+    return lazy_stats_export_csv(cache_key, frame, columns, display_preparer)()
 
 
 def render_stats_csv_export(
@@ -17195,15 +20448,16 @@ def render_stats_csv_export(
     key: str,
     columns: list[str] | None = None,
     display_preparer=None,
+    version: tuple | None = None,
 ) -> None:
     if frame is None or getattr(frame, "empty", True):
         return
-    csv_bytes = stats_export_csv_bytes_for_render(frame, view_name, columns, display_preparer)
-    if not csv_bytes:
+    if columns is not None and not any(column in frame.columns for column in columns):
         return
+    cache_key = stats_export_csv_cache_key(frame, view_name, columns, display_preparer, version)
     st.download_button(
         "Export as CSV",
-        data=csv_bytes,
+        data=lazy_stats_export_csv(cache_key, frame, columns, display_preparer),
         file_name=f"{stats_export_slug(view_name)}-{user_today().isoformat()}.csv",
         mime="text/csv",
         key=f"{key}_export_csv",
@@ -17246,6 +20500,24 @@ def stats_team_column_config() -> dict:
     }
 
 
+def cached_stats_display_page(page_key: tuple):
+    cached = st.session_state.get(STATS_DISPLAY_PAGE_CACHE_KEY)
+    note_session_cache_use(STATS_DISPLAY_PAGE_CACHE_KEY)
+    if isinstance(cached, dict):
+        return cached.get("entries", {}).get(page_key)
+    return None
+
+
+def remember_stats_display_page(page_key: tuple, rendered_frame) -> None:
+    cached = st.session_state.get(STATS_DISPLAY_PAGE_CACHE_KEY)
+    entries = dict(cached.get("entries", {})) if isinstance(cached, dict) else {}
+    entries.pop(page_key, None)
+    entries[page_key] = rendered_frame
+    if len(entries) > STATS_DISPLAY_PAGE_CACHE_SIZE:
+        entries = dict(list(entries.items())[-STATS_DISPLAY_PAGE_CACHE_SIZE:])
+    st.session_state[STATS_DISPLAY_PAGE_CACHE_KEY] = {"entries": entries}
+
+
 def render_outcome_dataframe(
     frame: pd.DataFrame,
     columns: list[str] | None = None,
@@ -17256,16 +20528,41 @@ def render_outcome_dataframe(
     item_label: str = "outcome rows",
     display_column_labels: dict[str, str] | None = None,
     highlight_column: str | None = None,
+    version: tuple | None = None,
 ):
-    if columns is not None and frame is not None and not frame.empty:
-        frame = frame[[column for column in columns if column in frame.columns]]
-    if frame.empty:
+    """Rendered pages are keyed by the upstream stats version when given; content hashing is only the fallback."""
+    if frame is None or frame.empty:
         st.info("No outcome rows for this view yet.")
         return
-    frame = sort_stats_frame_for_pagination(frame, default_sort_column, default_sort_ascending)
-    frame = paginate_dataframe(frame, table_key, page_size, item_label)
-    display_frame = prepare_outcome_dataframe_for_display(frame, column_labels=display_column_labels)
-    rendered_frame = style_outcome_dataframe_for_display(display_frame, highlight_column=highlight_column)
+    # Sort on the caller's frame so its cached permutation survives the column projection below.
+    order = None
+    if columns is None or default_sort_column in columns:
+        order = stats_frame_sort_order(
+            frame,
+            default_sort_column,
+            default_sort_ascending,
+            version=None if version is None else (table_key, version),
+        )
+    fingerprint = ("version", version) if version is not None else memoized_frame_fingerprint(frame)
+    if columns is not None:
+        frame = frame[[column for column in columns if column in frame.columns]]
+    frame = paginate_dataframe(frame, table_key, page_size, item_label, order=order).reset_index(drop=True)
+    page_key = (
+        table_key,
+        fingerprint,
+        int(st.session_state.get(f"{table_key}_page", 0) or 0),
+        page_size,
+        tuple(columns or ()),
+        default_sort_column,
+        bool(default_sort_ascending),
+        tuple(sorted((display_column_labels or {}).items())),
+        highlight_column,
+    )
+    rendered_frame = cached_stats_display_page(page_key)
+    if rendered_frame is None:
+        display_frame = prepare_outcome_dataframe_for_display(frame, column_labels=display_column_labels)
+        rendered_frame = style_outcome_dataframe_for_display(display_frame, highlight_column=highlight_column)
+        remember_stats_display_page(page_key, rendered_frame)
     st.dataframe(
         rendered_frame,
         hide_index=True,
@@ -17526,9 +20823,14 @@ def refresh_outcome_results_state(sync_remote: bool = False) -> None:
         cached_statistics_generated_rows.clear()
     except Exception:
         pass
+    stats_cache = st.session_state.get("_stats_calculation_cache")
+    if isinstance(stats_cache, dict):
+        # Keep the last result on screen while the refreshed calculation runs in the background.
+        st.session_state["_stats_calculation_cache"] = {**stats_cache, "refresh_requested": True}
+    clinic_id = str(st.session_state.get("clinic_id", "") or "").strip()
+    stats_computation_jobs().forget_finished(normalize_clinic_id_key(clinic_id))
     if search_criteria_have_pending_changes():
         apply_search_criteria_changes(show_notice=False)
-    clinic_id = str(st.session_state.get("clinic_id", "") or "").strip()
     if sync_remote and clinic_id:
         invalidate_action_tracker_records_cache()
         tracked_actions = load_action_tracker_records_for_clinic(clinic_id)
@@ -17551,13 +20853,25 @@ def refresh_outcome_results_action() -> None:
         refresh_outcome_results_state()
 
 
-def stats_action_records_cache_signature(action_records: list[dict]) -> tuple[int, str]:
+def stats_action_records_cache_signature(action_records: list[dict], version: int | None = None) -> tuple[int, str, str]:
+    """
+    Count, latest action time and a content digest, so edits that keep the first two still invalidate.
+    Given the hidden-reminder index version the records came from, the digest is computed once per version.
+    """
+    if version is not None:
+        cached = st.session_state.get(STATS_ACTION_RECORDS_SIGNATURE_KEY)
+        if isinstance(cached, tuple) and len(cached) == 2 and cached[0] == version:
+            return cached[1]
     action_dates = [
         str(record.get("ActionedAt", "") or record.get("DeletedAt", ""))
         for record in action_records
         if isinstance(record, dict)
     ]
-    return len(action_records), max(action_dates, default="")
+    digest = hashlib.md5(json.dumps(action_records, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    signature = (len(action_records), max(action_dates, default=""), digest)
+    if version is not None:
+        st.session_state[STATS_ACTION_RECORDS_SIGNATURE_KEY] = (version, signature)
+    return signature
 
 
 def stats_calculation_cache_signature(
@@ -17567,6 +20881,7 @@ def stats_calculation_cache_signature(
     post_reminder_window_days: int,
     rules: dict,
     action_records: list[dict],
+    action_records_version: int | None = None,
 ) -> tuple:
     return (
         STATS_CALCULATION_CACHE_SCHEMA_VERSION,
@@ -17577,8 +20892,194 @@ def stats_calculation_cache_signature(
         user_today().isoformat(),
         _rules_fp(rules),
         statistics_exclusion_fp(),
-        stats_action_records_cache_signature(action_records),
+        stats_action_records_cache_signature(action_records, action_records_version),
+    )
+
+
+def compute_stats_calculation(
+    sales_df: pd.DataFrame,
+    prepared: pd.DataFrame,
+    rules: dict,
+    action_records: list[dict],
+    cache_signature: tuple,
+    due_date_window_days: int,
+    post_reminder_window_days: int,
+    outcomes_as_of_date: date,
+    statistics_group_days: int,
+    statistics_data_version: int,
+    today_iso: str,
+    rules_fp: str,
+    exclusion_fp: str,
+    exclusion_filter: ReminderExclusionFilter,
+    publish=None,
+) -> dict:
+    """
+    Build everything the Stats tab renders for one signature.
+    Outcome results are passed to publish(stage, result) before the generated-reminder facts are built.
+    Every session-derived input is passed in, so this runs on a worker thread without a script context.
+    """
+    if publish is not None:
+        publish("outcomes", {})
+    stats_expanded_sent_records = expand_grouped_action_records([
+        record for record in action_records
+        if str(record.get("Action", "")).strip().lower() == REMINDER_ACTION_SENT
+    ])
+    period_rows = build_reminder_outcomes(
+        action_records,
+        sales_df,
+        due_date_window_days=due_date_window_days,
+        post_reminder_window_days=post_reminder_window_days,
+        today=outcomes_as_of_date,
+        rules=rules,
+        action_records_reduced=True,
+        expanded_sent_records=stats_expanded_sent_records,
+    )
+    stats_outcome_rows = outcome_summary_precompute_numeric_columns(period_rows.copy())
+    result = {
+        "signature": cache_signature,
+        "stats_cube": StatsOutcomeCube(stats_outcome_rows),
+        "period_rows": period_rows,
+        "stats_outcome_rows": stats_outcome_rows,
+        "stats_item_outcome_frame": build_outcome_group_frame(
+            stats_outcome_rows,
+            "Item",
+            OUTCOME_ITEM_GROUP_COLUMNS,
+            numeric_precomputed=True,
+        ),
+    }
+    if publish is not None:
+        publish("summary", dict(result))
+    generated_df = cached_statistics_generated_rows(
+        prepared,
+        rules,
+        group_days=statistics_group_days,
+        period="All time",
+        today_iso=today_iso,
+        data_version=statistics_data_version,
+        rules_fp=rules_fp,
+        exclusion_fp=exclusion_fp,
+        schema_version=STATISTICS_GENERATED_SCHEMA_VERSION,
+        _exclusion_filter=exclusion_filter,
     )
+    result["generated_df"] = generated_df
+    result["stats_facts"] = StatisticsFacts(generated_df, action_records)
+    return result
+
+
+class StatsComputationJob:
+    """One background stats calculation; the outcome summary is published before the detail tables finish."""
+
+    ACTIVE_STATUSES = ("queued", "running")
+
+    def __init__(self, clinic_key: str, key: tuple):
+        self.clinic_key = clinic_key
+        self.key = key
+        self.status = "queued"
+        self.stage = "queued"
+        self.partial: dict = {}
+        self.result: dict | None = None
+        self.error: Exception | None = None
+        self.started_at = time.monotonic()
+        self.finished_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return self.status in self.ACTIVE_STATUSES
+
+    def publish(self, stage: str, partial: dict) -> None:
+        with self._lock:
+            self.status = "running"
+            self.stage = stage
+            self.partial = {**self.partial, **partial}
+
+    def finish(self, result: dict | None = None, error: Exception | None = None) -> None:
+        with self._lock:
+            self.result = result
+            self.error = error
+            self.status = "error" if error is not None else "success"
+            self.stage = self.status
+            self.finished_at = time.monotonic()
+
+    def elapsed_ms(self) -> float:
+        return ((self.finished_at or time.monotonic()) - self.started_at) * 1000
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "status": self.status,
+                "stage": self.stage,
+                "partial": self.partial,
+                "result": self.result,
+                "error": self.error,
+            }
+
+
+class StatsComputationRegistry:
+    """Process-wide stats calculations keyed by clinic and stats signature; one worker per key."""
+
+    def __init__(self, result_ttl_seconds: float = STATS_COMPUTATION_RESULT_TTL_SECONDS):
+        self._lock = threading.Lock()
+        self._jobs: dict[tuple, StatsComputationJob] = {}
+        self.result_ttl_seconds = result_ttl_seconds
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for job_key, job in list(self._jobs.items()):
+            if job.finished_at is not None and now - job.finished_at > self.result_ttl_seconds:
+                self._jobs.pop(job_key, None)
+
+    def submit(self, clinic_key: str, key: tuple, run) -> tuple[StatsComputationJob, bool]:
+        """Start a worker for the key unless one exists; a failed job is returned until it is forgotten."""
+        with self._lock:
+            self._prune()
+            existing = self._jobs.get((clinic_key, key))
+            if existing is not None:
+                return existing, False
+            job = StatsComputationJob(clinic_key, key)
+            self._jobs[(clinic_key, key)] = job
+        worker = threading.Thread(target=self._run, args=(job, run), name="stats-computation", daemon=True)
+        worker.start()
+        return job, True
+
+    @staticmethod
+    def _run(job: StatsComputationJob, run) -> None:
+        try:
+            job.finish(result=run(job))
+        except Exception as e:
+            job.finish(error=e)
+
+    def get(self, clinic_key: str, key: tuple) -> StatsComputationJob | None:
+        with self._lock:
+            return self._jobs.get((clinic_key, key))
+
+    def forget(self, job: StatsComputationJob) -> None:
+        """Drop one finished job, e.g. after its error was handled, so a later render may start another."""
+        with self._lock:
+            if self._jobs.get((job.clinic_key, job.key)) is job:
+                self._jobs.pop((job.clinic_key, job.key), None)
+
+    def forget_finished(self, clinic_key: str) -> None:
+        """Drop the clinic's finished calculations so the next render recomputes."""
+        with self._lock:
+            for job_key, job in list(self._jobs.items()):
+                if job_key[0] == clinic_key and not job.active:
+                    self._jobs.pop(job_key, None)
+
+
+@st.cache_resource(show_spinner=False)
+def stats_computation_jobs() -> StatsComputationRegistry:
+    return StatsComputationRegistry()
+
+
+@st.fragment(run_every=STATS_COMPUTATION_POLL_SECONDS)
+def render_stats_refresh_indicator(clinic_key: str, job_key: tuple, rendered_stage: str) -> None:
+    """Poll the background calculation and rerun the tab once it reaches a new stage."""
+    job = stats_computation_jobs().get(clinic_key, job_key)
+    stage = job.snapshot()["stage"] if job is not None else ""
+    if stage != rendered_stage:
+        st.rerun()
+    st.caption(STATS_COMPUTATION_STAGE_LABELS.get(stage, STATS_COMPUTATION_STAGE_LABELS["queued"]))
 
 
 def render_stats_tab(sales_df: pd.DataFrame, prepared: pd.DataFrame, rules: dict):
@@ -17658,103 +21159,75 @@ def render_stats_tab(sales_df: pd.DataFrame, prepared: pd.DataFrame, rules: dict
         post_reminder_window_days,
         rules,
         action_records,
+        hidden_reminder_index().version,
     )
     stats_cache = st.session_state.get("_stats_calculation_cache")
-    use_cached_stats = (
-        stats_date_range_selection_in_progress()
-        and isinstance(stats_cache, dict)
-        and stats_cache.get("signature") == cache_signature
-    )
-    if use_cached_stats:
-        generated_df = stats_cache["generated_df"]
-        stats_generated_item_rows = stats_cache["stats_generated_item_rows"]
-        stats_action_item_rows = stats_cache["stats_action_item_rows"]
-        stats_actioned_rows = stats_cache["stats_actioned_rows"]
-        period_rows = stats_cache["period_rows"]
-        stats_outcome_rows = stats_cache["stats_outcome_rows"]
-        stats_item_outcome_frame = stats_cache["stats_item_outcome_frame"]
-        stats_sender_outcome_frame = stats_cache["stats_sender_outcome_frame"]
-    else:
-        with busy_overlay("Calculating stats", "Matching sent reminders to later sales and summarising activity."):
-            stats_action_item_rows = expand_rows_for_statistics_item_period(action_records, stats_period)
-            stats_actioned_rows = filter_actions_by_actioned_period(
-                action_records,
-                stats_period,
-                include_parsed=True,
-            )
-            stats_expanded_sent_records = expand_grouped_action_records([
-                record for record in action_records
-                if str(record.get("Action", "")).strip().lower() == REMINDER_ACTION_SENT
-            ])
-            outcome_rows = build_reminder_outcomes(
-                action_records,
-                sales_df,
-                due_date_window_days=due_date_window_days,
-                post_reminder_window_days=post_reminder_window_days,
-                today=outcomes_as_of_date,
-                rules=rules,
-                action_records_reduced=True,
-                expanded_sent_records=stats_expanded_sent_records,
-            )
-            generated_df = cached_statistics_generated_rows(
-                prepared,
-                rules,
-                group_days=statistics_group_days,
-                period=stats_period,
-                today_iso=user_today().isoformat(),
-                data_version=statistics_data_version,
-                rules_fp=_rules_fp(rules),
-                exclusion_fp=statistics_exclusion_fp(),
-                schema_version=STATISTICS_GENERATED_SCHEMA_VERSION,
-            )
-            stats_generated_item_rows = expand_rows_for_statistics_item_period(
-                generated_df.to_dict("records") if not generated_df.empty else [],
-                stats_period,
-            )
-            period_rows = outcome_rows
-            stats_outcome_rows = outcome_summary_precompute_numeric_columns(period_rows.copy())
-            stats_item_outcome_frame = build_outcome_group_frame(
-                stats_outcome_rows,
-                "Item",
-                OUTCOME_ITEM_GROUP_COLUMNS,
-                numeric_precomputed=True,
-            )
-            stats_sender_outcome_frame = build_outcome_group_frame(
-                stats_outcome_rows,
-                "Sender",
-                OUTCOME_SENDER_GROUP_COLUMNS,
-                numeric_precomputed=True,
+    note_session_cache_use("_stats_calculation_cache")
+    if not isinstance(stats_cache, dict) or "stats_facts" not in stats_cache:
+        stats_cache = None
+    stats_result = stats_cache
+    refreshing_stage = ""
+    if stats_cache is None or stats_cache.get("signature") != cache_signature or stats_cache.get("refresh_requested"):
+        clinic_key = normalize_clinic_id_key(st.session_state.get("clinic_id", ""))
+        job_key = stats_export_version(cache_signature, stats_export_scope(sales_df, statistics_data_version))
+        calculation_inputs = {
+            "sales_df": sales_df,
+            "prepared": prepared,
+            "rules": rules,
+            "action_records": action_records,
+            "cache_signature": cache_signature,
+            "due_date_window_days": due_date_window_days,
+            "post_reminder_window_days": post_reminder_window_days,
+            "outcomes_as_of_date": outcomes_as_of_date,
+            "statistics_group_days": statistics_group_days,
+            "statistics_data_version": statistics_data_version,
+            "today_iso": user_today().isoformat(),
+            "rules_fp": _rules_fp(rules),
+            "exclusion_fp": statistics_exclusion_fp(),
+            "exclusion_filter": reminder_exclusion_filter(),
+        }
+        job, _ = stats_computation_jobs().submit(
+            clinic_key,
+            job_key,
+            lambda job: compute_stats_calculation(**calculation_inputs, publish=job.publish),
+        )
+        snapshot = job.snapshot()
+        if snapshot["status"] == "error":
+            record_error_tracker_event(
+                "stats_calculation_failed",
+                stage="compute_stats_calculation",
+                error=snapshot["error"],
+                source="stats",
             )
-            st.session_state["_stats_calculation_cache"] = {
-                "signature": cache_signature,
-                "generated_df": generated_df,
-                "stats_generated_item_rows": stats_generated_item_rows,
-                "stats_action_item_rows": stats_action_item_rows,
-                "stats_actioned_rows": stats_actioned_rows,
-                "period_rows": period_rows,
-                "stats_outcome_rows": stats_outcome_rows,
-                "stats_item_outcome_frame": stats_item_outcome_frame,
-                "stats_sender_outcome_frame": stats_sender_outcome_frame,
-            }
+            # Forget the failed job only after the inline retry, so concurrent renders do not resubmit it meanwhile.
+            try:
+                with busy_overlay("Calculating stats", "Matching sent reminders to later sales and summarising activity."):
+                    stats_result = compute_stats_calculation(**calculation_inputs)
+            finally:
+                stats_computation_jobs().forget(job)
+            st.session_state["_stats_calculation_cache"] = stats_result
+        elif snapshot["status"] == "success":
+            # Another session may have started the job; keep this session's own signature on its copy.
+            stats_result = {**snapshot["result"], "signature": cache_signature}
+            st.session_state["_stats_calculation_cache"] = stats_result
+        else:
+            refreshing_stage = snapshot["stage"]
+            summary_result = snapshot["partial"] if "stats_cube" in snapshot["partial"] else stats_cache
+            render_stats_refresh_indicator(clinic_key, job_key, refreshing_stage)
+    if not refreshing_stage:
+        summary_result = stats_result
+    if summary_result is None:
+        return
 
-    stats_summary_rows = filter_stats_sent_tab_rows(
-        stats_outcome_rows,
-        selected_stats_period,
-        custom_range=stats_custom_range,
-    )
-    stats_sender_period_frame = build_outcome_group_frame(
-        stats_summary_rows,
-        "Sender",
-        OUTCOME_SENDER_GROUP_COLUMNS,
-        numeric_precomputed=True,
-    )
-    summary = summarize_outcomes(stats_summary_rows)
+    stats_period_bounds = stats_sent_period_bounds(selected_stats_period, stats_custom_range)
+    summary_sender_frame = summary_result["stats_cube"].sender_frame(stats_period_bounds)
+    summary = summary_result["stats_cube"].summary(stats_period_bounds)
     metrics = [
         ("Total Reminded Items", f"{summary['sent']:,}"),
         ("Total Reminder Successes", f"{summary['successes']:,}"),
         ("Total Success Rate", f"{summary['success_rate']:.0%}"),
         ("Total Revenue from Successes", format_outcome_currency(summary["revenue"])),
-        ("Top Team Member", format_top_team_member_metric(stats_sender_period_frame)),
+        ("Top Team Member", format_top_team_member_metric(summary_sender_frame)),
     ]
     metric_cols = st.columns(len(metrics))
     for col, (label, value) in zip(metric_cols, metrics):
@@ -17762,7 +21235,42 @@ def render_stats_tab(sales_df: pd.DataFrame, prepared: pd.DataFrame, rules: dict
             render_statistics_metric_card(label, value, STATS_SUMMARY_CARD_HELP[label])
     st.markdown("<div class='stats-summary-tab-gap' aria-hidden='true'></div>", unsafe_allow_html=True)
 
+    if stats_result is None:
+        st.info("Detailed stats tables will appear when the calculation finishes.")
+        return
+    # While refreshing, the detail tables stay on the last completed result so they agree with each other.
+    period_rows = stats_result["period_rows"]
+    render_stats_subtab_panel(
+        stats_result["stats_facts"],
+        period_rows,
+        stats_result["stats_item_outcome_frame"],
+        summary_sender_frame if stats_result is summary_result else stats_result["stats_cube"].sender_frame(stats_period_bounds),
+        selected_stats_period,
+        stats_custom_range,
+        export_version=stats_export_version(
+            stats_result["signature"],
+            stats_export_scope(sales_df, statistics_data_version),
+        ),
+    )
+    record_slow_render_performance("stats_tab_render", render_started, rows=len(period_rows), source="stats")
+
+
+@st.fragment
+def render_stats_subtab_panel(
+    stats_facts: StatisticsFacts,
+    period_rows,
+    stats_item_outcome_frame: pd.DataFrame,
+    stats_sender_period_frame: pd.DataFrame,
+    selected_stats_period: str,
+    stats_custom_range,
+    export_version: tuple | None = None,
+):
+    """Subtab switches, table sorting, paging and exports rerun only this panel."""
+    begin_fragment_sheets_read_batch()
     active_stats_subtab = render_stats_subtab_selector()
+    period_export_version = (
+        None if export_version is None else (export_version, selected_stats_period, stats_custom_range)
+    )
 
     if active_stats_subtab == "Revenue":
         st.caption("Annual estimates use all uploaded sales data.")
@@ -17776,6 +21284,7 @@ def render_stats_tab(sales_df: pd.DataFrame, prepared: pd.DataFrame, rules: dict
             item_label="item rows",
             display_column_labels=STATS_ITEMS_DISPLAY_COLUMN_LABELS,
             highlight_column="Potential Annual Revenue Lift",
+            version=export_version,
         )
         render_stats_csv_export(
             item_frame,
@@ -17783,31 +21292,21 @@ def render_stats_tab(sales_df: pd.DataFrame, prepared: pd.DataFrame, rules: dict
             "stats_items",
             columns=STATS_REVENUE_DISPLAY_COLUMNS,
             display_preparer=prepare_stats_items_outcome_dataframe_for_display,
+            version=export_version,
         )
 
     elif active_stats_subtab == "Items":
-        selected_item_generated_rows = statistics_generated_records_for_period_filter(
-            generated_df,
-            selected_stats_period,
-            stats_custom_range,
-        )
-        selected_item_action_rows = statistics_action_records_for_scheduled_period_filter(
-            action_records,
-            selected_stats_period,
-            stats_custom_range,
-        )
-        item_actioning_frame = build_statistics_item_frame(
-            generated_df,
-            action_records,
-            "All time",
-            generated_rows=selected_item_generated_rows,
-            action_rows=selected_item_action_rows,
-        )
+        item_actioning_frame = stats_facts.item_frame_for_filter(selected_stats_period, stats_custom_range)
         item_frame = build_stats_items_display_frame(item_actioning_frame, stats_item_outcome_frame)
         if item_frame.empty:
             st.info("No item stats yet.")
         else:
-            item_frame = sort_stats_frame_for_pagination(item_frame, STATISTICS_SCHEDULED_REMINDERS_LABEL, False)
+            item_frame = sort_stats_frame_for_pagination(
+                item_frame,
+                STATISTICS_SCHEDULED_REMINDERS_LABEL,
+                False,
+                version=None if period_export_version is None else ("stats_items_detail", period_export_version),
+            )
             paged_item_frame = paginate_dataframe(
                 item_frame,
                 "stats_items_detail",
@@ -17826,6 +21325,7 @@ def render_stats_tab(sales_df: pd.DataFrame, prepared: pd.DataFrame, rules: dict
                 "stats-items",
                 "stats_items_detail",
                 columns=STATS_ITEMS_DISPLAY_COLUMNS,
+                version=period_export_version,
             )
 
     elif active_stats_subtab == "Successes":
@@ -17839,6 +21339,7 @@ def render_stats_tab(sales_df: pd.DataFrame, prepared: pd.DataFrame, rules: dict
             OUTCOME_SUCCESS_DISPLAY_COLUMNS,
             table_key="outcomes_successes",
             item_label="success rows",
+            version=period_export_version,
         )
         render_stats_csv_export(
             success_rows,
@@ -17846,6 +21347,7 @@ def render_stats_tab(sales_df: pd.DataFrame, prepared: pd.DataFrame, rules: dict
             "outcomes_successes",
             columns=OUTCOME_SUCCESS_DISPLAY_COLUMNS,
             display_preparer=prepare_outcome_dataframe_for_display,
+            version=period_export_version,
         )
 
     elif active_stats_subtab == "Reminders":
@@ -17856,6 +21358,7 @@ def render_stats_tab(sales_df: pd.DataFrame, prepared: pd.DataFrame, rules: dict
             table_key="outcomes_sent",
             page_size=OUTCOME_SENT_PAGE_SIZE,
             item_label="sent outcome rows",
+            version=period_export_version,
         )
         render_stats_csv_export(
             sent_rows,
@@ -17863,19 +21366,14 @@ def render_stats_tab(sales_df: pd.DataFrame, prepared: pd.DataFrame, rules: dict
             "outcomes_sent",
             columns=OUTCOME_SENT_DISPLAY_COLUMNS,
             display_preparer=prepare_outcome_dataframe_for_display,
+            version=period_export_version,
         )
 
     elif active_stats_subtab == "Team":
-        selected_team_action_rows = statistics_action_records_for_actioned_period_filter(
-            action_records,
-            selected_stats_period,
-            stats_custom_range,
-        )
         team_frame = build_stats_team_frame(
             stats_sender_period_frame,
-            action_records,
-            "All time",
-            action_rows=selected_team_action_rows,
+            [],
+            team_action_frame=stats_facts.team_frame_for_filter(selected_stats_period, stats_custom_range),
         )
         if team_frame.empty:
             st.info("No team stats yet.")
@@ -17898,8 +21396,8 @@ def render_stats_tab(sales_df: pd.DataFrame, prepared: pd.DataFrame, rules: dict
                 "stats-team",
                 "stats_team",
                 display_preparer=prepare_stats_team_display_frame,
+                version=period_export_version,
             )
-    record_slow_render_performance("stats_tab_render", render_started, rows=len(period_rows), source="stats")
 
 
 def render_search_terms_editor():
@@ -17925,7 +21423,7 @@ def render_search_terms_editor():
             return
         old_value = st.session_state["rules"][rule].get("days", "")
         st.session_state["rules"][rule]["days"] = int(days_raw)
-        save_settings_quietly()
+        queue_settings_save()
         if str(old_value) != str(int(days_raw)):
             record_settings_audit_event("search_term_changed", "search_terms", rule, "days", old_value, int(days_raw), "search_terms_tab")
         invalidate_reminder_rule_cache()
@@ -17947,7 +21445,7 @@ def render_search_terms_editor():
             }.get(field, "Reminder")
             st.session_state["_search_terms_autosave_error"] = f"{label} must be blank or a positive number for: {rule}"
             return
-        save_settings_quietly()
+        queue_settings_save()
         if str(old_value) != str(new_value):
             record_settings_audit_event("search_term_changed", "search_terms", rule, field, old_value, new_value, "search_terms_tab")
         invalidate_reminder_rule_cache()
@@ -17959,7 +21457,7 @@ def render_search_terms_editor():
             st.session_state["rules"][rule]["visible_text"] = visible_text
         else:
             st.session_state["rules"][rule].pop("visible_text", None)
-        save_settings_quietly()
+        queue_settings_save()
         if str(old_value) != str(visible_text):
             record_settings_audit_event("search_term_changed", "search_terms", rule, "visible_text", old_value, visible_text, "search_terms_tab")
         invalidate_reminder_rule_cache()
@@ -17967,7 +21465,7 @@ def render_search_terms_editor():
     def toggle_use_qty(rule, key):
         old_value = st.session_state["rules"][rule].get("use_qty", "")
         st.session_state["rules"][rule]["use_qty"] = st.session_state[key]
-        save_settings_quietly()
+        queue_settings_save()
         if bool(old_value) != bool(st.session_state[key]):
             record_settings_audit_event("search_term_changed", "search_terms", rule, "use_qty", old_value, st.session_state[key], "search_terms_tab")
         invalidate_reminder_rule_cache()
@@ -17981,7 +21479,7 @@ def render_search_terms_editor():
         st.session_state["rules"][rule]["category"] = category
         if "applied_rules" in st.session_state and rule in st.session_state["applied_rules"]:
             st.session_state["applied_rules"][rule]["category"] = category
-        save_settings_quietly()
+        queue_settings_save()
         if str(old_value) != str(category):
             record_settings_audit_event("search_term_changed", "search_terms", rule, "category", old_value, category, "search_terms_tab")
 
@@ -18297,7 +21795,7 @@ has_working_df = st.session_state.get("working_df") is not None
 if st.session_state.get("logged_in", False):
     needs_working_df = active_main_section in {"Reminders", "Stats"}
     needs_prepared_df = active_main_section == "Stats"
-    df = st.session_state["working_df"].copy() if has_working_df and needs_working_df else pd.DataFrame()
+    df = st.session_state["working_df"] if has_working_df and needs_working_df else pd.DataFrame()
     applied_rules = get_applied_reminder_rules() if needs_working_df else {}
     prepared = (
         get_prepared_df(df, applied_rules)
@@ -18400,14 +21898,23 @@ if st.session_state.get("logged_in", False):
             )
 
         with busy_overlay("Loading reminders", "Preparing the reminder list for this clinic."):
-            reminder_source_df = filter_sales_as_of_date(df, start_date)
-            prepared = build_prepared_reminder_rows(reminder_source_df, applied_rules)
+            prepared = incremental_prepared_reminder_rows(
+                "_reminder_source_prepared_rows",
+                df,
+                (st.session_state.get("data_version", 0), start_date, PREPARED_SCHEMA_VERSION),
+                applied_rules,
+                lambda frame: filter_sales_as_of_date(frame, start_date),
+            )
+            st.session_state["_reminder_source_prepared_df"] = prepared
+            note_session_cache_use("_reminder_source_prepared_df")
 
             # ✅ safety: if schema changed but cache is stale, rebuild
             if "BaseIntervalDays" not in prepared.columns:
                 st.error("Reminders need to refresh. Rebuilding now...")
                 st.session_state.pop("prepared_df", None)
                 st.session_state.pop("prepared_key", None)
+                st.session_state.pop("_prepared_reminder_rows", None)
+                st.session_state.pop("_reminder_source_prepared_rows", None)
                 # optional big hammer:
                 # st.cache_data.clear()
                 st.rerun()
@@ -20237,6 +23744,7 @@ if False and st.session_state.get("clinic_id") == "Admin":
                     SHEET_COL_SETTINGS_JSON: "{}",
                     SHEET_COL_UPDATED_AT: utc_now_iso(),
                 }))
+                invalidate_settings_directory_index(sheet)
                 upsert_user_tracker(new_clinic, event="admin_created")
                 st.success(f"✅ Added new clinic '{new_clinic}'.")
 
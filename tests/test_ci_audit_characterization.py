@@ -434,11 +434,11 @@ class AuditCharacterizationTests(unittest.TestCase):
 
         class FakeSettingsSheet:
             def __init__(self):
-                self.get_all_records_calls = 0
+                self.get_all_values_calls = 0
 
-            def get_all_records(self):
-                self.get_all_records_calls += 1
-                return [row]
+            def get_all_values(self):
+                self.get_all_values_calls += 1
+                return [list(row), list(row.values())]
 
         sheet = FakeSettingsSheet()
         self.app.st.session_state["logged_in"] = True
@@ -454,7 +454,7 @@ class AuditCharacterizationTests(unittest.TestCase):
 
         self.assertEqual(profile["clinic_id"], "Clinic A")
         self.assertEqual(updated, {"clinic_id": "Clinic A", "email": "owner@example.com"})
-        self.assertEqual(sheet.get_all_records_calls, 1)
+        self.assertEqual(sheet.get_all_values_calls, 1)
         update_fields.assert_called_once()
         self.assertEqual(update_fields.call_args.args[0], "Clinic A")
         self.assertEqual(
@@ -69,6 +69,25 @@ class AuthSessionTests(unittest.TestCase):
         self.assertEqual(record["ActionedAtUTC"], "2026-05-17T00:30:00")
         self.assertEqual(self.app.statistics_actioned_date(record), date(2026, 5, 16))
 
+    def test_cached_action_tracker_records_are_shared_read_only(self):
+        self.app.st.session_state["_action_tracker_records_cache"] = {
+            "clinic_key": "clinic a",
+            "timezone_key": "UTC",
+            "records": [self.app.ReadOnlyRecord({"Client Name": "Client A", "Action": "sent"})],
+        }
+
+        with patch.object(self.app, "user_timezone_name", return_value="UTC"):
+            first = self.app.load_action_tracker_records_for_clinic("Clinic A")
+            second = self.app.load_action_tracker_records_for_clinic("Clinic A")
+
+        self.assertIs(first[0], second[0])
+        with self.assertRaises(TypeError):
+            first[0]["Action"] = "declined"
+        editable = dict(first[0])
+        editable["Action"] = "declined"
+        self.assertEqual(second[0]["Action"], "sent")
+        self.app.st.session_state.pop("_action_tracker_records_cache", None)
+
     def test_statistics_default_today_uses_user_timezone_helper(self):
         with patch.object(self.app, "user_today", return_value=date(2026, 5, 17)):
             self.assertEqual(self.app.statistics_period_start("Today"), date(2026, 5, 17))
@@ -943,6 +962,128 @@ class AuthSessionTests(unittest.TestCase):
         self.assertEqual(sheet.get_all_values_calls, 1)
         self.assertEqual(sheet.get_all_records_calls, 0)
 
+    def test_settings_directory_index_serves_repeat_logins_from_one_row_read(self):
+        self.app.st.session_state.pop("_settings_row_cache", None)
+        headers = [
+            self.app.SHEET_COL_CLINIC_ID,
+            self.app.SHEET_COL_PASSWORD_HASH,
+            self.app.SHEET_COL_GOOGLE_EMAIL,
+            self.app.SHEET_COL_GOOGLE_SUBJECT,
+        ]
+        password_hash = self.app.password_hash_for_storage("secret-password")
+
+        class FakeSheet:
+            def __init__(self):
+                self.values = [
+                    headers,
+                    ["Other Clinic", "", "other@example.com", "other-subject"],
+                    ["Clinic A", password_hash, "owner@example.com", "google-subject"],
+                ]
+                self.get_all_values_calls = 0
+                self.row_values_calls = []
+
+            def get_all_values(self):
+                self.get_all_values_calls += 1
+                return [list(row) for row in self.values]
+
+            def row_values(self, row_idx):
+                self.row_values_calls.append(row_idx)
+                return list(self.values[row_idx - 1])
+
+        sheet = FakeSheet()
+        google_user = {"is_logged_in": True, "email": "owner@example.com", "subject": "google-subject"}
+        with patch.object(self.app, "get_settings_sheet", return_value=sheet):
+            first = self.app.authenticate_user("Clinic A", "secret-password")
+            self.app.st.session_state.pop("_settings_row_cache", None)
+            second = self.app.authenticate_user("clinic a", "secret-password")
+            self.app.st.session_state.pop("_settings_row_cache", None)
+            google_row = self.app.get_clinic_row_by_google_identity(google_user)
+            lookup = self.app.get_clinic_row("CLINIC A")
+
+        self.assertEqual(first["ClinicID"], "Clinic A")
+        self.assertEqual(second, first)
+        self.assertEqual(google_row["ClinicID"], "Clinic A")
+        self.assertEqual(lookup["ClinicID"], "Clinic A")
+        self.assertEqual(sheet.get_all_values_calls, 1)
+        self.assertEqual(sheet.row_values_calls, [3, 3, 3])
+
+    def test_authentication_still_checks_duplicate_clinic_rows(self):
+        self.app.st.session_state.pop("_settings_row_cache", None)
+        headers = [self.app.SHEET_COL_CLINIC_ID, self.app.SHEET_COL_PASSWORD_HASH]
+        values = [
+            headers,
+            ["Clinic A", self.app.password_hash_for_storage("older-password")],
+            ["Clinic A", self.app.password_hash_for_storage("secret-password")],
+        ]
+
+        class FakeSheet:
+            def get_all_values(self):
+                return [list(row) for row in values]
+
+            def row_values(self, row_idx):
+                return list(values[row_idx - 1])
+
+        with patch.object(self.app, "get_settings_sheet", return_value=FakeSheet()):
+            self.app.invalidate_settings_directory_index()
+            self.app.get_clinic_row("Clinic A")
+            authenticated = self.app.authenticate_user("Clinic A", "secret-password")
+            rejected = self.app.authenticate_user("Clinic A", "wrong-password")
+
+        self.assertEqual(authenticated[self.app.SHEET_COL_PASSWORD_HASH], values[2][1])
+        self.assertIsNone(rejected)
+        self.assertEqual(self.app.st.session_state["_settings_row_cache"]["row_idx"], 3)
+
+    def test_settings_directory_index_rescans_when_indexed_row_shifted(self):
+        self.app.st.session_state.pop("_settings_row_cache", None)
+        headers = [self.app.SHEET_COL_CLINIC_ID, self.app.SHEET_COL_SETTINGS_JSON]
+
+        class FakeSheet:
+            def __init__(self):
+                self.values = [headers, ["Deleted Clinic", "{}"], ["Clinic A", "{}"]]
+                self.get_all_values_calls = 0
+
+            def get_all_values(self):
+                self.get_all_values_calls += 1
+                return [list(row) for row in self.values]
+
+            def row_values(self, row_idx):
+                return list(self.values[row_idx - 1]) if row_idx <= len(self.values) else []
+
+        sheet = FakeSheet()
+        with patch.object(self.app, "get_settings_sheet", return_value=sheet):
+            _sheet, _headers, first_row_idx = self.app._get_settings_row_for_clinic("Clinic A")
+            sheet.values = [headers, ["Clinic A", "{}"]]
+            self.app.st.session_state.pop("_settings_row_cache", None)
+            _sheet, _headers, shifted_row_idx = self.app._get_settings_row_for_clinic("Clinic A")
+
+        self.assertEqual(first_row_idx, 3)
+        self.assertEqual(shifted_row_idx, 2)
+        self.assertEqual(sheet.get_all_values_calls, 2)
+
+    def test_settings_directory_index_is_invalidated_on_account_creation(self):
+        headers = list(self.app.SETTINGS_REQUIRED_COLUMNS)
+
+        class FakeSheet:
+            def get_all_values(self):
+                return [headers]
+
+            def append_row(self, values, value_input_option=None):
+                self.appended = values
+
+        sheet = FakeSheet()
+        index = self.app.settings_directory_index()
+        with (
+            patch.object(self.app, "get_settings_sheet", return_value=sheet),
+            patch.object(self.app, "ensure_settings_sheet_columns", return_value=headers),
+            patch.object(self.app, "_gspread_retry", side_effect=lambda fn, *a, **kw: fn(*a, **kw)),
+            patch.object(self.app, "upsert_user_tracker"),
+            patch.object(self.app, "record_account_lifecycle_event"),
+            patch.object(index, "invalidate", wraps=index.invalidate) as invalidate,
+        ):
+            self.app.create_clinic_account("Clinic New", "United States", "better-random-passphrase-2026")
+
+        invalidate.assert_called_once_with(self.app.settings_sheet_index_key(sheet))
+
     def test_settings_row_values_writes_google_columns_when_present(self):
         headers = [
             "ClinicID",
@@ -1220,6 +1361,97 @@ class AuthSessionTests(unittest.TestCase):
             },
         )
 
+    def _batch_read_fixture(self):
+        class FakeSpreadsheet:
+            id = "settings-spreadsheet"
+
+            def __init__(self):
+                self.batch_requests = []
+                self.tables = {
+                    "Settings": [["ClinicID", "SettingsJSON"], ["clinic a", "{}"]],
+                    "Action Tracker": [["ClinicID", "Action"], ["clinic a", "called", ""]],
+                }
+
+            def values_batch_get(self, ranges, params=None):
+                self.batch_requests.append(list(ranges))
+                value_ranges = []
+                for range_name in ranges:
+                    title, _, a1 = range_name.partition("!")
+                    rows = self.tables[title.strip("'")]
+                    if a1:
+                        row_idx = int(a1.split(":")[0])
+                        rows = rows[row_idx - 1:row_idx]
+                    value_ranges.append({"range": range_name, "values": [list(row) for row in rows]})
+                return {"valueRanges": value_ranges}
+
+        class RecordingWorksheet(self.app.gspread.Worksheet):
+            def update(self, values=None, range_name=None, **kwargs):
+                self.spreadsheet.tables[self.title][0] = list(values[0])
+
+        spreadsheet = FakeSpreadsheet()
+        http_client = object.__new__(self.app.gspread.http_client.HTTPClient)
+        settings = RecordingWorksheet(spreadsheet, {"title": "Settings", "sheetId": 0, "index": 0}, "ss", http_client)
+        tracker = RecordingWorksheet(spreadsheet, {"title": "Action Tracker", "sheetId": 1, "index": 1}, "ss", http_client)
+        return spreadsheet, settings, tracker
+
+    def test_batch_reader_serves_queued_ranges_from_one_batch_get(self):
+        spreadsheet, settings, tracker = self._batch_read_fixture()
+        self.app.begin_sheets_read_batch()
+        reader = self.app.sheets_batch_reader(spreadsheet)
+        reader.want(
+            self.app.sheets_a1_range("Settings", "2:2"),
+            self.app.sheets_a1_range("Action Tracker"),
+        )
+        reader.fetch()
+
+        row_values = self.app.worksheet_batch_row(settings, 2)
+        tracker_values = self.app.worksheet_batch_values(tracker)
+
+        self.assertEqual(spreadsheet.batch_requests, [["'Settings'!2:2", "'Action Tracker'"]])
+        self.assertEqual(row_values, ["clinic a", "{}"])
+        self.assertEqual(tracker_values, [["ClinicID", "Action", ""], ["clinic a", "called", ""]])
+        self.assertEqual(self.app.sheets_a1_range("Bob's Sheet", "1:1"), "'Bob''s Sheet'!1:1")
+
+    def test_batch_reader_drops_ranges_after_worksheet_write(self):
+        spreadsheet, settings, tracker = self._batch_read_fixture()
+        self.app.begin_sheets_read_batch()
+
+        self.assertEqual(self.app.worksheet_batch_row(settings, 1), ["ClinicID", "SettingsJSON"])
+        self.assertEqual(self.app.worksheet_batch_row(tracker, 1), ["ClinicID", "Action"])
+        self.app._gspread_retry(settings.update, values=[["ClinicID", "Rules"]], range_name="A1:B1")
+        self.assertEqual(self.app.worksheet_batch_row(settings, 1), ["ClinicID", "Rules"])
+        self.assertEqual(self.app.worksheet_batch_row(tracker, 1), ["ClinicID", "Action"])
+
+        self.assertEqual(len(spreadsheet.batch_requests), 3)
+
+    def test_batch_read_helpers_fall_back_to_direct_reads_for_plain_sheets(self):
+        class PlainSheet:
+            def row_values(self, row_idx):
+                return ["clinic a", str(row_idx)]
+
+            def get_all_values(self):
+                return [["ClinicID"], ["clinic a"]]
+
+        self.app.begin_sheets_read_batch()
+
+        self.assertEqual(self.app.worksheet_batch_row(PlainSheet(), 4), ["clinic a", "4"])
+        self.assertEqual(self.app.worksheet_batch_values(PlainSheet()), [["ClinicID"], ["clinic a"]])
+        self.assertNotIn(self.app.SHEETS_BATCH_READS_STATE_KEY, self.app.st.session_state)
+
+    def test_fragment_reruns_start_a_fresh_batch_read_memo(self):
+        spreadsheet, settings, _tracker = self._batch_read_fixture()
+        self.app.begin_sheets_read_batch()
+        self.app.worksheet_batch_row(settings, 1)
+        spreadsheet.tables["Settings"][0] = ["ClinicID", "Rules"]
+
+        with patch.object(self.app, "is_fragment_rerun", return_value=False):
+            self.app.begin_fragment_sheets_read_batch()
+        self.assertEqual(self.app.worksheet_batch_row(settings, 1), ["ClinicID", "SettingsJSON"])
+        with patch.object(self.app, "is_fragment_rerun", return_value=True):
+            self.app.begin_fragment_sheets_read_batch()
+        self.assertEqual(self.app.worksheet_batch_row(settings, 1), ["ClinicID", "Rules"])
+        self.assertEqual(len(spreadsheet.batch_requests), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
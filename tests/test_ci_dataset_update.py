@@ -2,6 +2,8 @@ import contextlib
 import hashlib
 import importlib
 import io
+import threading
+import time
 import unittest
 from unittest.mock import patch
 
@@ -251,6 +253,39 @@ class DatasetUpdateTests(unittest.TestCase):
             20,
         )
 
+    def test_billed_item_dedupe_keeps_first_or_last_complete_row(self):
+        rows = pd.DataFrame(
+            {
+                "ChargeDate": ["2025-01-01", "2025-01-01 09:30", "2025-01-02", "", "2025-01-01"],
+                "Client Name": ["Owner A", "OWNER A", "Owner A", "Owner A", "Owner A"],
+                "Animal Name": ["Pet A", "Pet\u00a0A", "Pet A", "Pet A", ""],
+                "Item Name": ["Rabies", "rabies", "Rabies", "Rabies", "Rabies"],
+                "Amount": [1, 2, 3, 4, 5],
+            }
+        )
+
+        last = self.app.drop_duplicate_billed_item_rows(rows, keep="last")
+        first = self.app.drop_duplicate_billed_item_rows(rows, keep="first")
+
+        self.assertEqual(last["Amount"].tolist(), [2, 3, 4, 5])
+        self.assertEqual(first["Amount"].tolist(), [1, 3, 4, 5])
+
+    def test_drop_early_duplicates_keeps_latest_charge_per_matched_item_group(self):
+        df = pd.DataFrame(
+            {
+                "Client Name": ["Owner B", "Owner A", "Owner A", "Owner A", "Owner A"],
+                "Animal Name": ["Pet B", "Pet A", "Pet A", "Pet A", "Pet A"],
+                "MatchedItems": [["rabies"], ["dhpp", "rabies"], ["rabies", "dhpp"], ["rabies"], ["rabies"]],
+                "ChargeDate": pd.to_datetime(["2025-01-01", "2025-03-01", "2025-01-01", "2025-02-01", None]),
+                "Row": range(5),
+            }
+        )
+
+        kept = self.app.drop_early_duplicates_fast(df)
+
+        self.assertEqual(kept["Row"].tolist(), [1, 3, 4, 0])
+        self.assertEqual(kept.index.tolist(), [0, 1, 2, 3])
+
     def test_publish_dataset_records_repairable_operation_success(self):
         state = self.app.st.session_state
         state["clinic_id"] = "Clinic A"
@@ -1239,6 +1274,393 @@ class DatasetUpdateTests(unittest.TestCase):
         self.assertEqual(len(state["working_df"]), 1)
         self.assertEqual(state["_settings_row_cache"]["row_values"][4], "fresh-drive-file-id")
 
+    def _publish_job_state(self, clinic_id):
+        state = self.app.st.session_state
+        for key in list(state.keys()):
+            del state[key]
+        state["clinic_id"] = clinic_id
+        state["logged_in"] = True
+        return state, pd.DataFrame(
+            {
+                "ChargeDate": pd.to_datetime(["2025-01-01"]),
+                "Client Name": ["Client A"],
+                "Animal Name": ["Pet A"],
+                "Item Name": ["Rabies"],
+                "Qty": [1],
+                "Amount": [10],
+            }
+        )
+
+    def _wait_for_publish_job(self, job):
+        deadline = time.monotonic() + 5
+        while job.active and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(job.active)
+
+    def test_publish_job_runs_off_thread_once_per_clinic_and_tracks_stage_bytes(self):
+        state, new_df = self._publish_job_state("Clinic Job")
+        release_upload = threading.Event()
+        tracker_events = []
+        upload_threads = []
+
+        def drive_upload(file_bytes, on_progress=None, **kwargs):
+            upload_threads.append(threading.current_thread().name)
+            on_progress(len(file_bytes) // 2, len(file_bytes))
+            release_upload.wait(5)
+            on_progress(len(file_bytes), len(file_bytes))
+            return "job-drive-file"
+
+        def capture_tracker(event, status, **kwargs):
+            tracker_events.append({"event": event, "status": status, **kwargs})
+            return True
+
+        with (
+            patch.object(self.app, "record_dataset_tracker_event", side_effect=capture_tracker),
+            patch.object(self.app, "drive_upsert_csv_bytes", side_effect=drive_upload),
+            patch.object(self.app, "update_clinic_dataset_pointer", return_value="2026-05-16T00:00:00"),
+        ):
+            job, started = self.app.start_dataset_publish_job(
+                "Clinic Job",
+                new_df,
+                upload_key="upload-1",
+                datasets_folder_id="datasets-folder",
+                existing_file_id="",
+                existing_name="",
+                existing_df=pd.DataFrame(),
+            )
+            deadline = time.monotonic() + 5
+            while job.snapshot()["stage"] != "drive_upload" and time.monotonic() < deadline:
+                time.sleep(0.01)
+            in_flight = job.snapshot()
+            duplicate, duplicate_started = self.app.start_dataset_publish_job(
+                "clinic job",
+                new_df,
+                upload_key="upload-2",
+                datasets_folder_id="datasets-folder",
+                existing_file_id="",
+                existing_name="",
+            )
+            release_upload.set()
+            self._wait_for_publish_job(job)
+
+        self.assertTrue(started)
+        self.assertFalse(duplicate_started)
+        self.assertIs(duplicate, job)
+        self.assertEqual(in_flight["status"], "running")
+        self.assertGreater(in_flight["bytes_total"], 0)
+        self.assertNotEqual(upload_threads, [threading.current_thread().name])
+        self.assertEqual(job.status, "success")
+        self.assertEqual(
+            (job.result["file_id"], job.result["file_name"], job.result["updated_at"]),
+            ("job-drive-file", "Clinic Job_shared_dataset.csv", "2026-05-16T00:00:00"),
+        )
+        progress_events = [event for event in tracker_events if event["event"] == "dataset_publish_progress"]
+        self.assertEqual(
+            [event["status"] for event in progress_events],
+            ["load_existing", "merge", "serialize", "drive_upload", "settings_pointer_update", "complete"],
+        )
+        self.assertIn(f"bytes_total={job.bytes_total}", progress_events[-1]["message"])
+        self.assertEqual({event["operation_id"] for event in tracker_events}, {job.job_id})
+        self.assertNotIn("shared_dataset_updated_at", state)
+        self.app.dataset_publish_jobs().collect(job.clinic_key, job.job_id)
+
+    def test_publish_worker_acts_for_captured_tenant_and_keeps_no_frames(self):
+        state, new_df = self._publish_job_state("Clinic Detached")
+        state["user_name"] = "Alex"
+        headers = list(self.app.SETTINGS_REQUIRED_COLUMNS)
+        state["_settings_row_cache"] = {
+            "clinic_key": "clinic detached",
+            "headers": headers,
+            "row_idx": 2,
+            "row_values": ["Clinic Detached"] + [""] * (len(headers) - 1),
+        }
+        session_changed = threading.Event()
+        tracker_rows = []
+
+        def drive_upload(file_bytes, on_progress=None, **kwargs):
+            session_changed.wait(5)
+            return "detached-drive-file"
+
+        def capture_tracker(title, headers, row_values):
+            tracker_rows.append(row_values)
+            return True
+
+        with (
+            patch.object(self.app, "append_tracker_row", side_effect=capture_tracker),
+            patch.object(self.app, "get_settings_sheet", return_value=object()),
+            patch.object(self.app, "_update_dataset_pointer_cells"),
+            patch.object(self.app, "drive_upsert_csv_bytes", side_effect=drive_upload),
+        ):
+            job, _ = self.app.start_dataset_publish_job(
+                "Clinic Detached",
+                new_df,
+                upload_key="upload-detached",
+                datasets_folder_id="datasets-folder",
+                existing_file_id="",
+                existing_name="",
+                existing_df=pd.DataFrame(),
+            )
+            for key in list(state.keys()):
+                del state[key]
+            state["clinic_id"] = "Other Clinic"
+            session_changed.set()
+            self._wait_for_publish_job(job)
+
+        self.assertEqual(job.status, "success", job.error)
+        self.assertEqual(dict(state), {"clinic_id": "Other Clinic"})
+        self.assertEqual({(row[3], row[4]) for row in tracker_rows}, {("Clinic Detached", "Alex")})
+        self.assertFalse(any(isinstance(value, pd.DataFrame) for value in job.result.values()))
+        saved_row = job.result["settings_row_cache"]["row_values"]
+        self.assertEqual(saved_row[headers.index(self.app.SHEET_COL_DATASET_FILE_ID)], "detached-drive-file")
+        shared = self.app.shared_dataset_store().get(
+            "clinic detached",
+            self.app.shared_dataset_version_key("detached-drive-file", job.result["updated_at"]),
+        )
+        self.assertEqual(len(shared), job.result["rows"])
+        self.app.dataset_publish_jobs().collect(job.clinic_key, job.job_id)
+        self.app.shared_dataset_store().drop("clinic detached")
+
+    def test_uncollected_publish_jobs_expire_after_result_ttl(self):
+        registry = self.app.DatasetPublishJobRegistry(result_ttl_seconds=0)
+        job, started = registry.submit("clinic ttl", lambda job: {"file_id": "ttl-file"}, owner="gone")
+        self._wait_for_publish_job(job)
+        time.sleep(0.01)
+
+        self.assertTrue(started)
+        self.assertIsNone(registry.get("clinic ttl"))
+        self.assertIsNone(registry.collect("clinic ttl", job.job_id))
+
+    def test_finished_publish_job_is_applied_once_by_owning_session(self):
+        state, new_df = self._publish_job_state("Clinic Apply")
+        with (
+            patch.object(self.app, "record_dataset_tracker_event"),
+            patch.object(self.app, "drive_upsert_csv_bytes", return_value="applied-drive-file"),
+            patch.object(self.app, "update_clinic_dataset_pointer", return_value="2026-05-16T00:00:00"),
+        ):
+            job, _ = self.app.start_dataset_publish_job(
+                "Clinic Apply",
+                new_df,
+                upload_key="upload-apply",
+                context={
+                    "file_names": ["sales.csv"],
+                    "summary_rows": [{"File name": "sales.csv", "PMS": "CSV", "Rows": 1, "From": "2025-01-01", "To": "2025-01-01"}],
+                    "new_df": new_df,
+                },
+                datasets_folder_id="datasets-folder",
+                existing_file_id="",
+                existing_name="",
+                existing_df=pd.DataFrame(),
+            )
+            self._wait_for_publish_job(job)
+
+        with (
+            patch.object(self.app, "record_dataset_tracker_events"),
+            patch.object(self.app, "record_performance_tracker_event"),
+            patch.object(self.app, "save_settings_quietly", return_value=True),
+            patch.object(self.app, "remember_shared_dataset_loaded_for_current_pointer"),
+            patch.object(self.app.st, "rerun") as rerun,
+        ):
+            applied = self.app.apply_finished_dataset_publish_job("Clinic Apply")
+            applied_again = self.app.apply_finished_dataset_publish_job("Clinic Apply")
+
+        self.assertTrue(applied)
+        self.assertFalse(applied_again)
+        rerun.assert_called_once()
+        self.assertEqual(state["last_saved_upload_key"], "upload-apply")
+        self.assertEqual(state["shared_dataset_name"], "Clinic Apply_shared_dataset.csv")
+        self.assertEqual(state["shared_dataset_updated_at"], "2026-05-16T00:00:00")
+        self.assertEqual([row["file_name"] for row in state["dataset_upload_history"]], ["sales.csv"])
+        self.assertIsNone(self.app.current_dataset_publish_job("Clinic Apply"))
+
+    def test_failed_publish_job_blocks_automatic_resave_of_same_upload(self):
+        state, new_df = self._publish_job_state("Clinic Fail")
+        with (
+            patch.object(self.app, "record_dataset_tracker_event"),
+            patch.object(self.app, "drive_upsert_csv_bytes", side_effect=RuntimeError("drive unavailable")),
+        ):
+            job, _ = self.app.start_dataset_publish_job(
+                "Clinic Fail",
+                new_df,
+                upload_key="upload-fail",
+                datasets_folder_id="datasets-folder",
+                existing_file_id="",
+                existing_name="",
+                existing_df=pd.DataFrame(),
+            )
+            self._wait_for_publish_job(job)
+
+        with (
+            patch.object(self.app, "record_dataset_tracker_event"),
+            patch.object(self.app, "record_error_tracker_event"),
+            patch.object(self.app, "record_performance_tracker_event"),
+            patch.object(self.app.st, "rerun") as rerun,
+        ):
+            applied = self.app.apply_finished_dataset_publish_job("Clinic Fail")
+
+        self.assertTrue(applied)
+        rerun.assert_not_called()
+        self.assertEqual(state["_dataset_publish_failed_upload_key"], "upload-fail")
+        self.assertNotIn("drive unavailable", state["_pending_dataset_warning"])
+        self.assertNotIn("last_saved_upload_key", state)
+
+    def test_shared_dataset_is_frozen_under_mutation_guard_and_pipeline_derives_new_frames(self):
+        raw = pd.DataFrame(
+            {
+                "ChargeDate": ["2025-01-01", "2025-01-05"],
+                "Client Name": ["Client A", "Client B"],
+                "Animal Name": ["Pet A", "Pet B"],
+                "Item Name": ["Rabies", "Dental"],
+                "Qty": [1, 2],
+                "Amount": [10, 20],
+                "Note": pd.array(["a", None], dtype="string"),
+            }
+        )
+        with patch.object(self.app, "WORKING_DATASET_MUTATION_GUARD", True):
+            shared = self.app.share_working_df("Clinic Frozen", self.app.sanitize_working_df(raw), "file-1", "t1")
+        before = shared.copy()
+
+        with self.assertRaises(ValueError):
+            shared.loc[0, "Qty"] = 5
+        prepared = self.app.ensure_reminder_columns(shared, {"rabies": {"days": 365}})
+        resanitized = self.app.sanitize_working_df(shared)
+        derived = shared.copy(deep=False)
+        derived.loc[0, "Qty"] = 9
+
+        pd.testing.assert_frame_equal(shared, before)
+        self.assertIn("NextDueDate", prepared.columns)
+        self.assertNotIn("NextDueDate", shared.columns)
+        self.assertEqual(len(resanitized), 2)
+        self.assertEqual(derived.loc[0, "Qty"], 9)
+        self.app.shared_dataset_store().drop("clinic frozen")
+
+    def test_shared_dataset_store_drops_least_recently_used_clinics_past_its_budget(self):
+        frame = pd.DataFrame({"Qty": list(range(100))})
+        size = self.app.dataframe_memory_bytes(frame)
+        store = self.app.SharedDatasetStore(max_bytes=size * 2)
+
+        store.put("clinic a", ("a", "t1"), frame.copy())
+        store.put("clinic b", ("b", "t1"), frame.copy())
+        self.assertIsNotNone(store.get("clinic a", ("a", "t1")))
+        store.put("clinic c", ("c", "t1"), frame.copy())
+
+        self.assertEqual(len(store), 2)
+        self.assertIsNone(store.get("clinic b", ("b", "t1")))
+        self.assertIsNotNone(store.get("clinic a", ("a", "t1")))
+        self.assertIsNotNone(store.get("clinic c", ("c", "t1")))
+        self.assertLessEqual(store.total_bytes(), size * 2)
+
+    def test_shared_dataset_store_hands_out_copies_without_copy_on_write(self):
+        store = self.app.SharedDatasetStore()
+        with patch.object(self.app, "PANDAS_COPIES_ON_WRITE", False):
+            shared = store.put("clinic copy", ("f", "t1"), pd.DataFrame({"Qty": [1, 2]}))
+            shared.loc[0, "Qty"] = 5
+            again = store.get("clinic copy", ("f", "t1"))
+
+        self.assertEqual(again.loc[0, "Qty"], 1)
+        self.assertFalse(store.holds(shared))
+
+    def test_saved_dataset_is_downloaded_once_per_process_for_each_pointer_version(self):
+        headers = [
+            "ClinicID",
+            self.app.SHEET_COL_DATASET_FILE_ID,
+            self.app.SHEET_COL_DATASET_FILE_NAME,
+            self.app.SHEET_COL_DATASET_UPDATED_AT,
+        ]
+        pointer = ["Clinic Shared", "shared-file", "shared.csv", "2026-05-16T00:00:00"]
+        csv_bytes = (
+            b"ChargeDate,Client Name,Animal Name,Item Name,Qty,Amount\n"
+            b"2025-01-01,Client A,Pet A,Rabies,1,10\n"
+        )
+        loaded_frames = []
+
+        def load_in_new_session():
+            self._publish_job_state("Clinic Shared")
+            self.app.load_shared_dataset_for_clinic()
+            loaded_frames.append(self.app.st.session_state["working_df"])
+
+        self.app.shared_dataset_store().drop("clinic shared")
+        with (
+            patch.object(self.app, "get_fresh_settings_row_values", return_value=(None, headers, 2, pointer)),
+            patch.object(self.app, "drive_download_bytes", return_value=csv_bytes) as download,
+            patch.object(self.app, "require_clinic_dataset_file_access"),
+            patch.object(self.app, "busy_overlay", return_value=contextlib.nullcontext()),
+        ):
+            load_in_new_session()
+            load_in_new_session()
+            pointer[3] = "2026-05-17T00:00:00"
+            load_in_new_session()
+
+        self.assertEqual(download.call_count, 2)
+        self.assertIs(loaded_frames[0], loaded_frames[1])
+        self.assertIsNot(loaded_frames[1], loaded_frames[2])
+        self.assertTrue(self.app.st.session_state["shared_dataset_loaded"])
+        self.app.shared_dataset_store().drop("clinic shared")
+
+    def _memory_budget_state(self):
+        state, _ = self._publish_job_state("Clinic Memory")
+        frame = pd.DataFrame({"value": range(20_000)})
+        state["working_df"] = frame
+        state["prepared_df"] = frame.copy()
+        state["prepared_key"] = ("prepared",)
+        state["_stats_calculation_cache"] = {"generated_df": frame.copy()}
+        state["_active_reminder_window_cache"] = {"grouped": frame.copy()}
+        self.app.note_session_cache_use("_stats_calculation_cache")
+        self.app.note_session_cache_use("_active_reminder_window_cache")
+        self.app.note_session_cache_use("prepared_df")
+        return state, self.app.dataframe_memory_bytes(frame)
+
+    def test_memory_budget_evicts_least_recently_used_recomputable_caches(self):
+        state, frame_bytes = self._memory_budget_state()
+
+        with (
+            patch.object(self.app, "session_memory_ledger", return_value=self.app.SessionMemoryLedger()),
+            patch.object(self.app, "shared_dataset_store", return_value=self.app.SharedDatasetStore()),
+            patch.object(self.app, "record_performance_tracker_event") as record_event,
+        ):
+            report = self.app.enforce_session_memory_budget(
+                session_budget_bytes=int(frame_bytes * 3.5),
+                process_budget_bytes=frame_bytes * 100,
+            )
+
+        self.assertEqual(report["evicted"], ["_stats_calculation_cache"])
+        self.assertNotIn("_stats_calculation_cache", state)
+        self.assertIn("prepared_df", state)
+        self.assertIn("working_df", state)
+        self.assertLessEqual(report["session_bytes"], frame_bytes * 3.5)
+        record_event.assert_called_once()
+        self.assertEqual(record_event.call_args.kwargs["status"], "evicted")
+        self.assertIn("top=", record_event.call_args.kwargs["message"])
+
+    def test_memory_budget_shrinks_to_fair_share_when_process_is_over_budget(self):
+        state, frame_bytes = self._memory_budget_state()
+        ledger = self.app.SessionMemoryLedger()
+        ledger.update("other-session", frame_bytes * 10)
+
+        with (
+            patch.object(self.app, "session_memory_ledger", return_value=ledger),
+            patch.object(self.app, "shared_dataset_store", return_value=self.app.SharedDatasetStore()),
+            patch.object(self.app, "record_performance_tracker_event"),
+        ):
+            report = self.app.enforce_session_memory_budget(
+                session_budget_bytes=frame_bytes * 100,
+                process_budget_bytes=frame_bytes * 3,
+            )
+
+        self.assertEqual(report["target_bytes"], frame_bytes * 3 // 2)
+        self.assertEqual(set(report["evicted"]), {"_stats_calculation_cache", "_active_reminder_window_cache", "prepared_df"})
+        self.assertNotIn("prepared_key", state)
+        self.assertIn("working_df", state)
+
+    def test_shared_working_dataset_is_not_charged_to_the_session(self):
+        state, _ = self._publish_job_state("Clinic Memory Shared")
+        state["working_df"] = self.app.share_working_df("Clinic Memory Shared", pd.DataFrame({"value": [1, 2]}), "f", "t")
+        state["prepared_df"] = pd.DataFrame({"value": [1, 2]})
+
+        usage = self.app.session_memory_usage()
+
+        self.assertEqual(set(usage), {"prepared_df"})
+        self.app.shared_dataset_store().drop("clinic memory shared")
+
 
 if __name__ == "__main__":
     unittest.main()
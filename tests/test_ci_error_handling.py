@@ -1,6 +1,7 @@
 import contextlib
 import importlib
 import io
+import threading
 import unittest
 from datetime import datetime
 from unittest.mock import patch
@@ -403,6 +404,165 @@ class ErrorHandlingObservabilityTests(unittest.TestCase):
         self.assertEqual(kwargs["stage"], "drive_upsert_csv_bytes")
         self.assertEqual(kwargs["source"], "drive_upsert_csv_bytes")
 
+    def test_adaptive_drive_chunk_size_tracks_throughput_within_bounds(self):
+        alignment = self.app.DRIVE_UPLOAD_CHUNK_ALIGNMENT_BYTES
+        initial = self.app.DRIVE_UPLOAD_INITIAL_CHUNK_BYTES
+
+        self.assertEqual(self.app.adaptive_drive_chunk_bytes(initial, initial, 0.1), initial * 2)
+        self.assertEqual(self.app.adaptive_drive_chunk_bytes(initial, initial, 60.0), initial // 2)
+        self.assertEqual(self.app.adaptive_drive_chunk_bytes(alignment, alignment, 600.0), alignment)
+        self.assertEqual(
+            self.app.adaptive_drive_chunk_bytes(self.app.DRIVE_UPLOAD_MAX_CHUNK_BYTES, 10**9, 1.0),
+            self.app.DRIVE_UPLOAD_MAX_CHUNK_BYTES,
+        )
+        self.assertEqual(self.app.adaptive_drive_chunk_bytes(initial, 0, 1.0), initial)
+        self.assertEqual(self.app.adaptive_drive_chunk_bytes(initial, initial, 3.0) % alignment, 0)
+
+    def _resumable_drive_service(self):
+        class FakeDriveUploads:
+            def __init__(self):
+                self.sessions = 0
+                self.committed = 0
+                self.chunk_offsets = []
+                self.status_queries = 0
+                self.fail_after_chunks = None
+                self.drop_once_after_chunks = None
+
+        uploads = FakeDriveUploads()
+
+        class FakeResponse(dict):
+            def __init__(self, status, headers=None):
+                super().__init__(headers or {})
+                self.status = status
+
+        class FakeHttp:
+            def request(self, uri, method="GET", headers=None):
+                uploads.status_queries += 1
+                total = int(headers["Content-Range"].rsplit("/", 1)[1])
+                if uploads.committed >= total:
+                    return FakeResponse(200), b'{"id": "uploaded-file"}'
+                return FakeResponse(308, {"range": f"bytes=0-{uploads.committed - 1}"}), b""
+
+        class FakeUploadRequest:
+            def __init__(self, media):
+                self.media = media
+                self.http = FakeHttp()
+                self.resumable_uri = None
+                self.resumable_progress = 0
+
+            def next_chunk(self):
+                if self.resumable_uri is None:
+                    uploads.sessions += 1
+                    uploads.committed = 0
+                    self.resumable_uri = f"https://upload.example/session-{uploads.sessions}"
+                if uploads.drop_once_after_chunks == len(uploads.chunk_offsets):
+                    uploads.drop_once_after_chunks = None
+                    raise ConnectionResetError("reset by peer")
+                if uploads.fail_after_chunks is not None and len(uploads.chunk_offsets) >= uploads.fail_after_chunks:
+                    raise ConnectionResetError("network dropped")
+                uploads.chunk_offsets.append(self.resumable_progress)
+                size = self.media.size()
+                self.resumable_progress = min(size, self.resumable_progress + self.media.chunksize())
+                uploads.committed = self.resumable_progress
+                if self.resumable_progress >= size:
+                    return None, {"id": "uploaded-file"}
+                return None, None
+
+        class FakeFiles:
+            def create(self, **kwargs):
+                return FakeUploadRequest(kwargs["media_body"])
+
+        class FakeService:
+            def files(self):
+                return FakeFiles()
+
+        return FakeService(), uploads
+
+    def test_drive_upload_retry_resumes_saved_session_for_same_operation(self):
+        file_bytes = b"x" * (self.app.DRIVE_UPLOAD_INITIAL_CHUNK_BYTES * 3)
+        service, uploads = self._resumable_drive_service()
+        uploads.fail_after_chunks = 1
+        self.app.drive_upload_sessions().drop("op-resume")
+
+        with (
+            patch.object(self.app, "get_drive_service", return_value=service),
+            patch.object(self.app.time, "sleep"),
+        ):
+            with self.assertRaises(ConnectionResetError):
+                self.app.drive_upsert_csv_bytes(file_bytes, "clinic.csv", "folder-id", None, operation_id="op-resume")
+            committed = uploads.committed
+            uploads.fail_after_chunks = None
+            uploads.chunk_offsets.clear()
+            uploads.status_queries = 0
+            file_id = self.app.drive_upsert_csv_bytes(file_bytes, "clinic.csv", "folder-id", None, operation_id="op-resume")
+
+        self.assertEqual(file_id, "uploaded-file")
+        self.assertEqual(committed, self.app.DRIVE_UPLOAD_INITIAL_CHUNK_BYTES)
+        self.assertEqual(uploads.sessions, 1)
+        self.assertEqual(uploads.status_queries, 1)
+        self.assertEqual(uploads.chunk_offsets[0], committed)
+        self.assertLess(len(uploads.chunk_offsets), 3)
+        self.assertIsNone(self.app.drive_upload_sessions().get("op-resume", ""))
+
+    def test_drive_upload_does_not_resume_session_for_different_bytes(self):
+        file_bytes = b"x" * (self.app.DRIVE_UPLOAD_INITIAL_CHUNK_BYTES * 3)
+        service, uploads = self._resumable_drive_service()
+        uploads.fail_after_chunks = 1
+
+        with (
+            patch.object(self.app, "get_drive_service", return_value=service),
+            patch.object(self.app.time, "sleep"),
+        ):
+            with self.assertRaises(ConnectionResetError):
+                self.app.drive_upsert_csv_bytes(file_bytes, "clinic.csv", "folder-id", None, operation_id="op-changed")
+            uploads.fail_after_chunks = None
+            uploads.chunk_offsets.clear()
+            uploads.status_queries = 0
+            self.app.drive_upsert_csv_bytes(file_bytes + b"y", "clinic.csv", "folder-id", None, operation_id="op-changed")
+
+        self.assertEqual(uploads.sessions, 2)
+        self.assertEqual(uploads.status_queries, 0)
+        self.assertEqual(uploads.chunk_offsets[0], 0)
+
+    def test_drive_upload_resumes_in_call_after_transient_network_error(self):
+        file_bytes = b"x" * (self.app.DRIVE_UPLOAD_INITIAL_CHUNK_BYTES * 2)
+        service, uploads = self._resumable_drive_service()
+        uploads.drop_once_after_chunks = 1
+
+        with (
+            patch.object(self.app, "get_drive_service", return_value=service),
+            patch.object(self.app.time, "sleep") as sleep,
+        ):
+            file_id = self.app.drive_upsert_csv_bytes(file_bytes, "clinic.csv", "folder-id", None, operation_id="op-flaky")
+
+        self.assertEqual(file_id, "uploaded-file")
+        sleep.assert_called_once()
+        self.assertEqual(uploads.status_queries, 1)
+        self.assertEqual(uploads.chunk_offsets, [0, self.app.DRIVE_UPLOAD_INITIAL_CHUNK_BYTES])
+
+    def test_drive_upload_forgets_saved_session_after_non_resumable_error(self):
+        file_bytes = b"x" * (self.app.DRIVE_UPLOAD_INITIAL_CHUNK_BYTES * 3)
+        service, uploads = self._resumable_drive_service()
+        fingerprint = self.app.drive_upload_fingerprint(file_bytes, "clinic.csv", "folder-id", None)
+        self.app.drive_upload_sessions().save(
+            "op-rejected",
+            fingerprint,
+            "https://upload.example/expired",
+            self.app.DRIVE_UPLOAD_INITIAL_CHUNK_BYTES,
+            self.app.DRIVE_UPLOAD_INITIAL_CHUNK_BYTES,
+        )
+        rejected = self.app.HttpError(type("Resp", (dict,), {"status": 404, "reason": "Not Found"})(), b"gone")
+
+        with (
+            patch.object(self.app, "get_drive_service", return_value=service),
+            patch.object(self.app, "drive_upload_session_status", side_effect=rejected),
+        ):
+            with self.assertRaises(self.app.HttpError):
+                self.app.drive_upsert_csv_bytes(file_bytes, "clinic.csv", "folder-id", None, operation_id="op-rejected")
+
+        self.assertIsNone(self.app.drive_upload_sessions().get("op-rejected", fingerprint))
+        self.assertEqual(uploads.chunk_offsets, [])
+
     def test_gspread_retry_returns_fast_success_with_elapsed_budget(self):
         with patch.object(self.app.time, "perf_counter", side_effect=[0.0, 0.1, 0.2]):
             result = self.app._gspread_retry(lambda: "ok", timeout_seconds=1)
@@ -451,6 +611,129 @@ class ErrorHandlingObservabilityTests(unittest.TestCase):
         self.assertEqual(calls, ["called"])
         sleep.assert_not_called()
 
+    def test_sheets_scheduler_serves_interactive_requests_ahead_of_telemetry(self):
+        scheduler = self.app.SheetsRequestScheduler(requests_per_minute=60, burst=2, interactive_reserve=1)
+
+        self.assertTrue(scheduler.acquire(self.app.SHEETS_PRIORITY_TELEMETRY, timeout_seconds=0))
+        self.assertFalse(scheduler.acquire(self.app.SHEETS_PRIORITY_TELEMETRY, timeout_seconds=0))
+        self.assertTrue(scheduler.acquire(self.app.SHEETS_PRIORITY_INTERACTIVE, timeout_seconds=0))
+
+        metrics = scheduler.metrics()
+        self.assertEqual(metrics["granted"], 2)
+        self.assertEqual(metrics["acquire_timeouts"], 1)
+        self.assertEqual(metrics["queue_depth"], 0)
+
+    def test_sheets_scheduler_coalesces_identical_concurrent_reads(self):
+        scheduler = self.app.SheetsRequestScheduler()
+        release = threading.Event()
+
+        class FakeWorksheet:
+            def __init__(self):
+                self.calls = 0
+
+            def get_all_values(self):
+                self.calls += 1
+                release.wait(2)
+                return [["ClinicID"], ["Clinic A"]]
+
+        worksheet = FakeWorksheet()
+        results = []
+
+        def read():
+            results.append(self.app._gspread_retry(worksheet.get_all_values, timeout_seconds=5))
+
+        with patch.object(self.app, "sheets_request_scheduler", return_value=scheduler):
+            threads = [threading.Thread(target=read) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            while scheduler.metrics()["coalesced_reads"] < 3:
+                threading.Event().wait(0.01)
+            release.set()
+            for thread in threads:
+                thread.join(2)
+
+        self.assertEqual(worksheet.calls, 1)
+        self.assertEqual(results, [[["ClinicID"], ["Clinic A"]]] * 4)
+        results[0][1][0] = "mutated"
+        self.assertEqual(results[1][1][0], "Clinic A")
+
+    def test_read_after_write_does_not_join_a_read_started_before_the_write(self):
+        scheduler = self.app.SheetsRequestScheduler()
+        first_read_started = threading.Event()
+        release_first_read = threading.Event()
+
+        class FakeWorksheet:
+            spreadsheet_id = "spreadsheet-1"
+            id = 7
+
+            def __init__(self):
+                self.rows = [["ClinicID"], ["Clinic A"]]
+                self.calls = 0
+
+            def get_all_values(self):
+                self.calls += 1
+                snapshot = [list(row) for row in self.rows]
+                if self.calls == 1:
+                    first_read_started.set()
+                    release_first_read.wait(2)
+                return snapshot
+
+            def append_row(self, row):
+                self.rows.append(list(row))
+
+        worksheet = FakeWorksheet()
+        results = {}
+
+        def read(name):
+            results[name] = self.app._gspread_retry(worksheet.get_all_values, timeout_seconds=5)
+
+        with patch.object(self.app, "sheets_request_scheduler", return_value=scheduler):
+            older = threading.Thread(target=read, args=("older",))
+            older.start()
+            self.assertTrue(first_read_started.wait(2))
+            self.app._gspread_retry(worksheet.append_row, ["Clinic B"], timeout_seconds=5)
+            newer = threading.Thread(target=read, args=("newer",))
+            newer.start()
+            newer.join(2)
+            newer_finished_first = not newer.is_alive()
+            release_first_read.set()
+            older.join(2)
+
+        self.assertTrue(newer_finished_first)
+        self.assertEqual(worksheet.calls, 2)
+        self.assertEqual(results["older"], [["ClinicID"], ["Clinic A"]])
+        self.assertEqual(results["newer"], [["ClinicID"], ["Clinic A"], ["Clinic B"]])
+        self.assertEqual(scheduler.metrics()["coalesced_reads"], 0)
+
+    def test_gspread_retry_pauses_shared_bucket_on_quota_errors_without_local_sleep(self):
+        class FakeResponse:
+            text = "quota"
+
+            def json(self):
+                return {"error": {"code": 429, "message": "quota", "status": "RESOURCE_EXHAUSTED"}}
+
+        calls = []
+
+        def throttled_once():
+            calls.append("called")
+            if len(calls) == 1:
+                raise self.app.APIError(FakeResponse())
+            return "ok"
+
+        scheduler = self.app.SheetsRequestScheduler(requests_per_minute=6000, burst=5)
+        with (
+            patch.object(self.app, "sheets_request_scheduler", return_value=scheduler),
+            patch.object(self.app, "SHEETS_THROTTLE_BACKOFF_SECONDS", 0.01),
+            patch.object(self.app.random, "random", return_value=0.0),
+            patch.object(self.app.time, "sleep") as sleep,
+        ):
+            result = self.app._gspread_retry(throttled_once, timeout_seconds=5)
+
+        self.assertEqual(result, "ok")
+        self.assertEqual(calls, ["called", "called"])
+        self.assertEqual(scheduler.metrics()["throttled"], 1)
+        sleep.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -108,6 +108,31 @@ class ReminderGroupingTests(unittest.TestCase):
         self.assertIn(("Client A", "Rabies Vaccine"), remaining)
         self.assertIn(("Client B", "Dental Descale"), remaining)
 
+    def test_exclusion_filter_is_compiled_once_until_lists_change(self):
+        due_df = pd.DataFrame(
+            {
+                "Client Name": ["Client  A", "client a", "Client B", "Client C"],
+                "Animal Name": ["Alpha", "ALPHA", "Bravo", "Charlie"],
+                "Item Name": ["Dental Descale", "Rabies Vaccine", "Flea Tablet", "Rabies Vaccine"],
+            }
+        )
+        state = self.app.st.session_state
+        state["client_exclusions"] = ["client c"]
+        state["patient_exclusions"] = []
+        state["client_item_exclusions"] = [{"client": "Client A", "item": "dental"}]
+        state["automatic_patient_exclusions"] = []
+        state["exclusions"] = ["flea"]
+
+        with patch.object(self.app, "ReminderExclusionFilter", wraps=self.app.ReminderExclusionFilter) as compile_filter:
+            first = self.app.apply_reminder_exclusion_filters(due_df, self.app.DEFAULT_RULES)
+            self.app.apply_reminder_exclusion_filters(due_df, self.app.DEFAULT_RULES)
+            state["patient_exclusions"].append({"client": "client a", "patient": "alpha"})
+            second = self.app.apply_reminder_exclusion_filters(due_df, self.app.DEFAULT_RULES)
+
+        self.assertEqual(compile_filter.call_count, 2)
+        self.assertEqual(first["Item Name"].tolist(), ["Rabies Vaccine"])
+        self.assertTrue(second.empty)
+
     def test_passaway_keywords_create_automatic_patient_exclusions_from_upload(self):
         state = self.app.st.session_state
         state["patient_passaway_keywords"] = ["euthanasia", "pentobarb"]
@@ -188,18 +213,71 @@ class ReminderGroupingTests(unittest.TestCase):
         self.assertEqual(int(mapped.at[5, "IntervalDays"]), 365)
         self.assertTrue(pd.isna(mapped.at[9, "IntervalDays"]))
 
+    def test_rule_edit_only_remaps_rows_matching_changed_terms(self):
+        df = pd.DataFrame(
+            {
+                "ChargeDate": pd.to_datetime(["2025-01-01", "2025-02-01", "2025-01-05", "2025-01-09", None]),
+                "Client Name": ["A Client", "A Client", "B Client", "B Client", "C Client"],
+                "Animal Name": ["Rex", "Rex", "Tom", "Tom", "Kit"],
+                "Item Name": ["Rabies Vaccine", "Rabies Vaccine", "Nexgard Large", "Dental Exam", "Rabies Vaccine"],
+                "Qty": [1, 1, 2, 1, 1],
+                "Amount": [100, 100, 50, 200, 100],
+            }
+        )
+        rules = {
+            "rabies": {"days": 365, "use_qty": False, "visible_text": "Rabies Vaccine"},
+            "nexgard": {"days": 30, "use_qty": True, "visible_text": "Nexgard", "reminder_1": 5},
+        }
+        state = self.app.PreparedReminderRows(df, rules, df, ("source",))
+        edited = {
+            **rules,
+            "nexgard": {**rules["nexgard"], "days": 45, "reminder_2": 3},
+            "dental": {"days": 180, "use_qty": False, "visible_text": "Dental"},
+        }
+
+        with patch.object(self.app, "map_intervals_vec", wraps=self.app.map_intervals_vec) as remap:
+            prepared = state.update(edited)
+
+        self.assertEqual(len(remap.call_args.args[0]), 2)
+        pd.testing.assert_frame_equal(prepared, self.app.build_prepared_reminder_rows(df, edited))
+        self.assertIs(state.update(edited), prepared)
+
+    def test_failed_rule_edit_keeps_serving_rows_of_the_previous_rules(self):
+        df = pd.DataFrame(
+            {
+                "ChargeDate": pd.to_datetime(["2025-01-01", "2025-01-05", "2025-01-09"]),
+                "Client Name": ["A Client", "B Client", "B Client"],
+                "Animal Name": ["Rex", "Tom", "Tom"],
+                "Item Name": ["Rabies Vaccine", "Nexgard Large", "Dental Exam"],
+                "Qty": [1, 2, 1],
+                "Amount": [100, 50, 200],
+            }
+        )
+        rules = {
+            "rabies": {"days": 365, "use_qty": False, "visible_text": "Rabies Vaccine"},
+            "nexgard": {"days": 30, "use_qty": True, "visible_text": "Nexgard"},
+        }
+        state = self.app.PreparedReminderRows(df, rules, df, ("source",))
+        before = state.prepared
+        edited = {**rules, "nexgard": {**rules["nexgard"], "days": 45}}
+
+        with patch.object(self.app, "ensure_reminder_columns", side_effect=RuntimeError("remap failed")):
+            with self.assertRaises(RuntimeError):
+                state.update(edited)
+
+        self.assertIs(state.prepared, before)
+        self.assertEqual(state.rules, rules)
+        pd.testing.assert_frame_equal(state.update(edited), self.app.build_prepared_reminder_rows(df, edited))
+
     def test_loading_clinic_without_dataset_clears_stale_session_data(self):
         dataset_file_id_col = self.app.SHEET_COL_DATASET_FILE_ID
         dataset_file_name_col = self.app.SHEET_COL_DATASET_FILE_NAME
 
         class FakeSheet:
-            def get_all_records(self):
+            def get_all_values(self):
                 return [
-                    {
-                        "ClinicID": "Fresh Clinic",
-                        dataset_file_id_col: "",
-                        dataset_file_name_col: "",
-                    }
+                    ["ClinicID", dataset_file_id_col, dataset_file_name_col],
+                    ["Fresh Clinic", "", ""],
                 ]
 
         stale_keys = [
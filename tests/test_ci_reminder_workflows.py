@@ -69,12 +69,9 @@ class ReminderWorkflowTests(unittest.TestCase):
         self.assertEqual(state["main_section_tab"], "Reminders")
         self.assertEqual(state["deleted_reminders"], [])
         self.assertEqual(state["wa_reminder_log"], [])
-        self.assertEqual(
-            state["_deleted_reminder_remove_keys_once"],
-            [list(self.app.hidden_reminder_key(row))],
-        )
+        self.assertNotIn("_deleted_reminder_remove_keys_once", state)
         self.assertFalse(state["daily_reveal_hidden_reminders"])
-        save_settings.assert_called_once()
+        save_settings.assert_not_called()
 
     def test_sent_action_does_not_update_local_state_when_tracker_write_fails(self):
         row = sample_reminder_row()
@@ -290,6 +287,60 @@ class ReminderWorkflowTests(unittest.TestCase):
         self.assertEqual(len(state["wa_reminder_log"]), 1)
         self.assertIn("was not saved", state["_pending_action_sync_warning"])
 
+    def test_reminder_grid_click_events_map_back_to_listed_row_actions(self):
+        vals = {
+            "Reminder Date": "01 May 2026",
+            "Due Date": "08 May 2026",
+            "Charge Date": "01 May 2025",
+            "Client Name": "ANN LEE",
+            "Animal Name": "rex",
+            "Plan Item": "rabies",
+            "Qty": "1",
+            "Days": "365",
+        }
+        rendered_rows = [
+            (4, {"Client Name": "ANN LEE"}, vals, "", "daily_wa_4", "daily_sent_4", "daily_decline_4"),
+            (9, {"Client Name": "Bob"}, vals, self.app.REMINDER_ACTION_SENT, "daily_wa_9", "daily_sent_9", "daily_decline_9"),
+        ]
+
+        frame = self.app.reminder_grid_frame(rendered_rows)
+
+        self.assertEqual(list(frame.columns), [*self.app.REMINDER_GRID_COLUMNS, "Status", "RowKey"])
+        self.assertEqual(frame["Status"].tolist(), ["", "Sent"])
+        self.assertEqual(frame["RowKey"].tolist(), ["4", "9"])
+        self.assertEqual(frame.loc[0, "Client Name"], self.app.normalize_display_case("ANN LEE"))
+
+        with (
+            patch.object(self.app, "prepare_whatsapp_action") as whatsapp,
+            patch.object(self.app, "mark_reminder_sent_action") as sent,
+            patch.object(self.app, "decline_reminder_action") as decline,
+        ):
+            self.app.st.session_state["daily_grid"] = {"action": {"row": "9", "action": "sent"}}
+            self.app.run_reminder_grid_action("daily_grid", rendered_rows, "daily", "daily_msg")
+            self.assertTrue(self.app.dispatch_reminder_grid_action({"row": "4", "action": "whatsapp"}, rendered_rows, "daily", "daily_msg"))
+            self.assertTrue(self.app.dispatch_reminder_grid_action({"row": "4", "action": "decline"}, rendered_rows, "daily", "daily_msg"))
+            self.assertFalse(self.app.dispatch_reminder_grid_action({"row": "5", "action": "sent"}, rendered_rows, "daily", "daily_msg"))
+            self.assertFalse(self.app.dispatch_reminder_grid_action({"row": "4", "action": "delete"}, rendered_rows, "daily", "daily_msg"))
+            self.assertFalse(self.app.dispatch_reminder_grid_action(None, rendered_rows, "daily", "daily_msg"))
+
+        sent.assert_called_once_with({"Client Name": "Bob"}, "daily", "daily_msg", 9)
+        whatsapp.assert_called_once_with({"Client Name": "ANN LEE"}, "daily", "daily_msg", 4)
+        decline.assert_called_once_with({"Client Name": "ANN LEE"}, "daily")
+
+    def test_reminder_grid_sort_event_toggles_table_sort(self):
+        self.app.st.session_state["daily_grid"] = {"sort": "Client Name"}
+        self.app.run_reminder_grid_sort("daily_grid", "daily")
+        self.assertEqual(self.app.get_reminder_table_sort("daily"), {"column": "Client Name", "ascending": True})
+
+        self.app.run_reminder_grid_sort("daily_grid", "daily")
+        self.assertEqual(self.app.get_reminder_table_sort("daily"), {"column": "Client Name", "ascending": False})
+        headers = {header["column"]: header for header in self.app.reminder_grid_headers("daily")}
+        self.assertTrue(headers["Client Name"]["label"].endswith("↓"))
+        self.assertFalse(headers["Sent"]["sortable"])
+
+        self.app.st.session_state["daily_grid"] = {"sort": "Qty"}
+        self.app.run_reminder_grid_sort("daily_grid", "daily")
+        self.assertEqual(self.app.get_reminder_table_sort("daily")["column"], "Client Name")
 
 if __name__ == "__main__":
     unittest.main()
@@ -163,6 +163,44 @@ class RemindersBadgeTests(unittest.TestCase):
         self.assertEqual(third_count, 0)
         self.assertEqual(mock_bundle.call_count, 1)
 
+    def test_badge_count_applies_action_events_without_recounting(self):
+        rows = [
+            {
+                "Reminder Date": "16 May 2026",
+                "Due Date": "16 May 2026",
+                "Client Name": f"Client {name}",
+                "Animal Name": "Pet",
+                "Plan Item": "Rabies",
+            }
+            for name in ("A", "B")
+        ]
+        prepared = pd.DataFrame({
+            "ReminderDateTs": pd.to_datetime(["2026-05-16"]),
+            "NextDueDate": pd.to_datetime(["2026-05-16"]),
+        })
+        state = self.app.st.session_state
+        state["working_df"] = pd.DataFrame({"row": [1]})
+        state["reminder_lookback_days"] = 0
+        state["deleted_reminders"] = []
+        mock_bundle = mock.Mock(return_value=pd.DataFrame(rows))
+
+        with (
+            mock.patch.object(self.app, "get_applied_reminder_rules", return_value={"rabies": {"days": 365}}),
+            mock.patch.object(self.app, "get_prepared_df", return_value=prepared),
+            mock.patch.object(self.app, "bundle_client_reminders_by_window", mock_bundle),
+        ):
+            counts = [self.app.get_active_reminder_badge_count(today=date(2026, 5, 16))]
+            self.app.upsert_hidden_reminder(rows[0], self.app.REMINDER_ACTION_SENT)
+            with mock.patch.object(self.app, "count_active_badge_rows", side_effect=AssertionError("should apply events")):
+                counts.append(self.app.get_active_reminder_badge_count(today=date(2026, 5, 16)))
+                self.app.upsert_hidden_reminder(rows[0], self.app.REMINDER_ACTION_DECLINED)
+                counts.append(self.app.get_active_reminder_badge_count(today=date(2026, 5, 16)))
+                self.app.remove_actioned_reminder(rows[0])
+                counts.append(self.app.get_active_reminder_badge_count(today=date(2026, 5, 16)))
+
+        self.assertEqual(counts, [2, 1, 1, 2])
+        self.assertEqual(mock_bundle.call_count, 1)
+
     def test_badge_count_without_rules_skips_prepared_dataframe_work(self):
         state = self.app.st.session_state
         state["working_df"] = pd.DataFrame({"row": [1]})
@@ -175,7 +213,7 @@ class RemindersBadgeTests(unittest.TestCase):
 
         self.assertEqual(count, 0)
 
-    def test_hidden_reminders_index_invalidates_after_in_place_key_change(self):
+    def test_hidden_reminders_index_rebuilds_when_history_list_is_replaced(self):
         record = {
             "Reminder Date": "16 May 2026",
             "Due Date": "16 May 2026",
@@ -190,12 +228,63 @@ class RemindersBadgeTests(unittest.TestCase):
         self.assertIn(self.app.hidden_reminder_key(record), original_index)
 
         original_key = self.app.hidden_reminder_key(record)
+        replacement = {**record, "Client Name": "Client B"}
+        state["deleted_reminders"] = [replacement]
+        updated_index = self.app.get_hidden_reminders_index()
+
+        self.assertNotIn(original_key, updated_index)
+        self.assertIn(self.app.hidden_reminder_key(replacement), updated_index)
+
+    def test_hidden_reminders_index_invalidates_after_in_place_key_change(self):
+        record = {
+            "Reminder Date": "16 May 2026",
+            "Due Date": "16 May 2026",
+            "Client Name": "Client A",
+            "Animal Name": "Pet A",
+            "Plan Item": "Rabies",
+        }
+        state = self.app.st.session_state
+        state["deleted_reminders"] = [record]
+        original_key = self.app.hidden_reminder_key(record)
+        self.assertIn(original_key, self.app.get_hidden_reminders_index())
+        original_version = self.app.hidden_reminder_index().version
+
         record["Client Name"] = "Client B"
-        updated_key = self.app.hidden_reminder_key(record)
+        self.app.invalidate_hidden_reminder_index()
         updated_index = self.app.get_hidden_reminders_index()
 
         self.assertNotIn(original_key, updated_index)
-        self.assertIn(updated_key, updated_index)
+        self.assertIn(self.app.hidden_reminder_key(record), updated_index)
+        self.assertNotEqual(self.app.hidden_reminder_index().version, original_version)
+
+    def test_hidden_reminder_index_version_moves_on_upsert_and_remove(self):
+        row = {
+            "Reminder Date": "16 May 2026",
+            "Due Date": "16 May 2026",
+            "Client Name": "Client  A",
+            "Animal Name": "Pet A",
+            "Plan Item": "Rabies",
+        }
+        state = self.app.st.session_state
+        state["deleted_reminders"] = []
+        frame = pd.DataFrame([row, {**row, "Animal Name": "Pet B"}])
+
+        start = self.app.active_reminder_action_fingerprint()
+        self.assertEqual(self.app.active_reminder_action_fingerprint(), start)
+        self.app.upsert_hidden_reminder(row, self.app.REMINDER_ACTION_SENT)
+        after_upsert = self.app.active_reminder_action_fingerprint()
+        filtered = self.app.filter_hidden_reminders(frame)
+        self.app.remove_actioned_reminder(row)
+        after_remove = self.app.active_reminder_action_fingerprint()
+
+        self.assertNotEqual(after_upsert, start)
+        self.assertNotEqual(after_remove, after_upsert)
+        self.assertEqual(filtered["Animal Name"].tolist(), ["Pet B"])
+        self.assertEqual(state["deleted_reminders"], [])
+        self.assertEqual(
+            self.app.hidden_reminder_key_digests(frame)[0],
+            self.app.hidden_reminder_key_digest(self.app.hidden_reminder_key(row)),
+        )
 
     def test_hidden_reminder_record_uses_provided_index(self):
         row = {
@@ -265,6 +354,80 @@ class RemindersBadgeTests(unittest.TestCase):
         due_df = mock_bundle.call_args.args[0]
         self.assertEqual(list(due_df["Client Name"]), ["Client A", "Client B"])
 
+        self.app.st.session_state["weekly_reminder_sort"] = {"column": "Client Name", "ascending": False}
+        with mock.patch.object(self.app, "reminder_sort_rank_codes", wraps=self.app.reminder_sort_rank_codes) as rank_codes:
+            first_order = self.app.reminder_table_order(first_grouped, "weekly")
+            second_order = self.app.reminder_table_order(second_grouped, "weekly")
+        self.assertEqual(rank_codes.call_count, 1)
+        self.assertEqual(first_order.tolist(), second_order.tolist())
+
+    def test_date_range_rows_slices_sorted_frame_and_matches_mask(self):
+        prepared = self.app.sort_frame_by_date(
+            pd.DataFrame(
+                {
+                    "ReminderDateTs": pd.to_datetime(
+                        ["2024-03-05", None, "2024-03-01", "2024-03-03", "2024-03-03", "2024-03-09"]
+                    ),
+                    "Row": range(6),
+                }
+            ),
+            "ReminderDateTs",
+        )
+        start, end = pd.Timestamp("2024-03-02"), pd.Timestamp("2024-03-05")
+
+        window = self.app.date_range_rows(prepared, "ReminderDateTs", start, end)
+        index = self.app.sorted_date_index(prepared, "ReminderDateTs")
+
+        self.assertIsNone(index.order)
+        self.assertEqual(window["Row"].tolist(), [3, 4, 0])
+        mask = (prepared["ReminderDateTs"] >= start) & (prepared["ReminderDateTs"] <= end)
+        self.assertEqual(window["Row"].tolist(), prepared.loc[mask, "Row"].tolist())
+        self.assertIs(self.app.sorted_date_index(prepared, "ReminderDateTs"), index)
+
+    def test_filter_sales_as_of_date_keeps_row_order_and_missing_dates(self):
+        sales = pd.DataFrame(
+            {
+                "ChargeDate": ["2024-03-05", "", "2024-03-01", "2024-03-03", "2024-03-09"],
+                "Row": range(5),
+            }
+        )
+
+        kept = self.app.filter_sales_as_of_date(sales, date(2024, 3, 4))
+        everything = self.app.filter_sales_as_of_date(sales, date(2024, 3, 9))
+
+        self.assertEqual(kept["Row"].tolist(), [1, 2, 3])
+        self.assertIsNotNone(self.app.sorted_date_index(sales, "ChargeDate", self.app.parse_dates).order)
+        self.assertEqual(everything["Row"].tolist(), [0, 1, 2, 3, 4])
+
+    def test_reminders_fragment_requests_full_rerun_only_when_badge_crosses_zero(self):
+        state = self.app.st.session_state
+        self.assertFalse(self.app.reminders_nav_badge_is_stale())
+
+        state[self.app.REMINDERS_NAV_BADGE_COUNT_KEY] = 3
+        with mock.patch.object(self.app, "get_active_reminder_badge_count", side_effect=[2, 0]):
+            self.assertFalse(self.app.reminders_nav_badge_is_stale())
+            self.assertTrue(self.app.reminders_nav_badge_is_stale())
+
+    def test_reminders_fragment_redraws_nav_badge_count_without_full_rerun(self):
+        state = self.app.st.session_state
+        state[self.app.REMINDERS_NAV_BADGE_COUNT_KEY] = 3
+        badge_uri, _ = self.app.tab_badge_svg_data_uri("2")
+
+        with (
+            mock.patch.object(self.app, "get_active_reminder_badge_count", return_value=2),
+            mock.patch.object(self.app, "is_fragment_rerun", return_value=True),
+            mock.patch.object(self.app.st, "rerun") as rerun,
+            mock.patch.object(self.app.st, "markdown") as markdown,
+        ):
+            self.app.refresh_reminders_nav_badge()
+
+        rerun.assert_not_called()
+        css = markdown.call_args.args[0]
+        self.assertIn(".st-key-main_section_nav_reminders button img { display: none !important; }", css)
+        self.assertIn(badge_uri, css)
+        self.assertIn(badge_uri, self.app.reminders_badge_label(2))
+        self.assertNotIn("::after", self.app.reminders_nav_badge_css(0))
+
     def test_caught_up_banner_copy_only_when_notification_count_is_zero(self):
         self.assertIsNone(self.app.reminders_caught_up_banner_copy(active_count=2, lookback_days=5))
 
@@ -836,6 +836,160 @@ class SettingsSaveStateTests(unittest.TestCase):
         self.assertFalse(saved)
         self.assertIn("Google Sheets was busy", self.app.st.session_state["_pending_settings_sync_warning"])
 
+    def test_save_settings_skips_full_remote_read_when_version_stamp_matches(self):
+        headers = ["ClinicID", "PlainPassword", "PasswordHash", "SettingsJSON", "UpdatedAt"]
+        sheet = FakeSettingsSheet({"rules": {"stale-json": {"days": 1, "use_qty": False}}})
+        captured = {}
+
+        def capture_settings_update(sheet, headers, row_idx, settings_json, updated_at):
+            captured["settings"] = json.loads(settings_json)
+            captured["updated_at"] = updated_at
+
+        self.app.cache_remote_settings(
+            "Clinic Save State",
+            {"rules": {"rabies": {"days": 365, "use_qty": False}}},
+            "2026-05-15T00:00:00",
+        )
+        self.app.st.session_state["rules"] = {"rabies": {"days": 400, "use_qty": False}}
+
+        with (
+            patch.object(self.app, "_get_settings_row_for_clinic", return_value=(sheet, headers, 2)),
+            patch.object(self.app, "_update_settings_cells", side_effect=capture_settings_update),
+            patch.object(self.app, "read_remote_settings_for_save") as full_read,
+        ):
+            self.assertTrue(self.app.save_settings(track_user=False))
+
+        full_read.assert_not_called()
+        self.assertEqual(captured["settings"]["rules"]["rabies"]["days"], 400)
+        self.assertNotIn("stale-json", captured["settings"]["rules"])
+        self.assertEqual(
+            self.app.get_cached_remote_settings_version("Clinic Save State"),
+            captured["updated_at"],
+        )
+
+    def test_save_settings_rereads_and_merges_when_version_stamp_moved(self):
+        headers = ["ClinicID", "PlainPassword", "PasswordHash", "SettingsJSON", "UpdatedAt"]
+        sheet = FakeSettingsSheet({
+            "rules": {
+                "rabies": {"days": 365, "use_qty": False},
+                "librela": {"days": 30, "use_qty": False},
+            },
+        })
+        captured = {}
+
+        def capture_settings_update(sheet, headers, row_idx, settings_json, updated_at):
+            captured["settings"] = json.loads(settings_json)
+
+        self.app.cache_remote_settings(
+            "Clinic Save State",
+            {"rules": {"rabies": {"days": 365, "use_qty": False}}},
+            "2026-05-14T00:00:00",
+        )
+        self.app.st.session_state["rules"] = {"rabies": {"days": 400, "use_qty": False}}
+
+        with (
+            patch.object(self.app, "_get_settings_row_for_clinic", return_value=(sheet, headers, 2)),
+            patch.object(self.app, "_update_settings_cells", side_effect=capture_settings_update),
+        ):
+            self.assertTrue(self.app.save_settings(track_user=False))
+
+        self.assertEqual(captured["settings"]["rules"]["rabies"]["days"], 400)
+        self.assertEqual(captured["settings"]["rules"]["librela"]["days"], 30)
+
+    def test_save_settings_skips_write_when_no_setting_changed(self):
+        headers = ["ClinicID", "PlainPassword", "PasswordHash", "SettingsJSON", "UpdatedAt"]
+        sheet = FakeSettingsSheet({})
+
+        def capture_settings_update(sheet, headers, row_idx, settings_json, updated_at):
+            sheet.remote_settings = json.loads(settings_json)
+
+        with (
+            patch.object(self.app, "_get_settings_row_for_clinic", return_value=(sheet, headers, 2)),
+            patch.object(self.app, "_update_settings_cells", side_effect=capture_settings_update) as update_cells,
+        ):
+            self.assertTrue(self.app.save_settings(track_user=False))
+            self.app.cache_remote_settings("Clinic Save State", sheet.remote_settings, "2026-05-15T00:00:00")
+            self.assertTrue(self.app.save_settings(track_user=False))
+
+        self.assertEqual(update_cells.call_count, 1)
+        self.assertEqual(self.app.settings_delta_keys({"a": 1, "b": [1]}, {"a": 1, "b": [2], "c": 0}), ["b", "c"])
+
+    def test_cached_settings_base_excludes_legacy_action_logs(self):
+        self.app.cache_remote_settings(
+            "Clinic Save State",
+            {
+                "rules": {},
+                "deleted_reminders": [{"Client Name": "Client A"}],
+                "wa_reminder_log": [{"Client Name": "Client A", "RemindedAt": "2026-05-15T10:00:00"}],
+            },
+        )
+
+        self.assertEqual(self.app.get_cached_remote_settings("Clinic Save State"), {"rules": {}})
+
+    def test_action_log_index_serves_client_lookups_until_history_is_replaced(self):
+        state = self.app.st.session_state
+        state["deleted_reminders"] = [
+            {"Client Name": "Client A", "Plan Item": "Rabies", "Action": "sent", "ActionedAt": "2026-05-15T10:00:00"},
+        ]
+        state["wa_reminder_log"] = [
+            {"Client Name": "Client  A", "RemindedAt": "2026-05-14T10:00:00"},
+            {"Client Name": "client a", "RemindedAt": "2026-05-15T10:00:00"},
+        ]
+
+        index = self.app.action_log_index()
+        self.assertIs(self.app.action_log_index(), index)
+        self.assertEqual(index.last_reminded_at("CLIENT A").isoformat(), "2026-05-15T10:00:00")
+        self.assertEqual(self.app.get_started_latest_action_token("sent"), "2026-05-15T10:00:00")
+
+        self.app.record_wa_reminder_click("Client B", now=self.app.datetime(2026, 5, 16, 9, 0), save=False)
+
+        self.assertIsNot(self.app.action_log_index(), index)
+        self.assertIsNotNone(self.app.action_log_index().last_reminded_at("Client B"))
+
+    def test_queued_settings_edits_coalesce_into_one_save_after_debounce(self):
+        clock = [100.0]
+
+        with (
+            patch.object(self.app.time, "monotonic", side_effect=lambda: clock[0]),
+            patch.object(self.app, "save_settings_quietly", return_value=True) as save_quietly,
+        ):
+            for _ in range(5):
+                self.assertTrue(self.app.queue_settings_save())
+                clock[0] += 0.5
+            self.assertFalse(self.app.flush_pending_settings_save())
+            clock[0] += self.app.SETTINGS_SAVE_DEBOUNCE_SECONDS
+            self.assertTrue(self.app.flush_pending_settings_save())
+            self.assertFalse(self.app.flush_pending_settings_save())
+
+        save_quietly.assert_called_once_with()
+        self.assertNotIn(self.app.PENDING_SETTINGS_SAVE_KEY, self.app.st.session_state)
+
+    def test_pending_settings_edit_is_saved_before_switching_clinic(self):
+        state = self.app.st.session_state
+        state["clinic_id"] = "Clinic Save State"
+        state["logged_in"] = True
+        self.assertTrue(self.app.queue_settings_save())
+
+        with patch.object(self.app, "save_settings_quietly", return_value=True) as save_quietly:
+            self.assertFalse(self.app.flush_pending_settings_save_before_clinic_change("clinic save state"))
+            self.assertTrue(self.app.flush_pending_settings_save_before_clinic_change("Other Clinic"))
+
+        save_quietly.assert_called_once_with()
+        self.assertNotIn(self.app.PENDING_SETTINGS_SAVE_KEY, state)
+
+    def test_pending_settings_edit_of_another_clinic_warns_instead_of_vanishing(self):
+        state = self.app.st.session_state
+        state["clinic_id"] = "Clinic Save State"
+        self.assertTrue(self.app.queue_settings_save())
+        state["clinic_id"] = "Other Clinic"
+
+        with patch.object(self.app, "save_settings_quietly") as save_quietly:
+            self.assertFalse(self.app.flush_pending_settings_save(force=True))
+
+        save_quietly.assert_not_called()
+        self.assertNotIn(self.app.PENDING_SETTINGS_SAVE_KEY, state)
+        self.assertIn("could not be saved", state["_pending_settings_sync_warning"])
+
     def test_action_tracker_reduce_keeps_other_actions_when_one_is_undone(self):
         hidden_a = {
             "Client Name": "Client A",
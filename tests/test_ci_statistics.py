@@ -1,6 +1,8 @@
 import contextlib
 import importlib
 import io
+import threading
+import time
 import unittest
 from datetime import date
 from pathlib import Path
@@ -19,6 +21,7 @@ class StatisticsTests(unittest.TestCase):
         state = self.app.st.session_state
         for key in list(state.keys()):
             del state[key]
+        self.app.stats_export_csv_process_cache().clear()
 
     def make_generated_rows(self):
         return pd.DataFrame(
@@ -285,6 +288,54 @@ class StatisticsTests(unittest.TestCase):
                     self.legacy_statistics_item_frame(generated, actions, period, today=today).reset_index(drop=True),
                 )
 
+    def test_statistics_facts_switch_periods_without_reparsing_dates(self):
+        generated = self.make_generated_rows()
+        actions = self.make_action_records()
+        facts = self.app.StatisticsFacts(generated, actions)
+        today = date(2026, 5, 16)
+        filters = (("Last 7 days", None), ("Custom", (today, date(2026, 5, 10))), ("Custom", None))
+
+        with mock.patch.object(self.app, "user_today", return_value=today):
+            expected = {
+                (label, custom_range): (
+                    self.app.build_statistics_item_frame(
+                        generated,
+                        actions,
+                        "All time",
+                        generated_rows=self.legacy_generated_rows_for_period_filter(generated, label, custom_range),
+                        action_rows=self.legacy_generated_rows_for_period_filter(pd.DataFrame(actions), label, custom_range),
+                    ),
+                    self.app.build_statistics_team_frame(
+                        actions,
+                        "All time",
+                        action_rows=self.app.statistics_action_records_for_actioned_period_filter(actions, label, custom_range),
+                    ),
+                )
+                for label, custom_range in filters
+            }
+            facts.item_frame_for_filter("All time")
+            facts.team_frame_for_filter("All time")
+            with mock.patch.object(
+                self.app,
+                "parse_statistics_date_part",
+                side_effect=AssertionError("period switches should reuse parsed fact dates"),
+            ):
+                for label, custom_range in filters:
+                    with self.subTest(label=label, custom_range=custom_range):
+                        item_frame, team_frame = expected[(label, custom_range)]
+                        pd.testing.assert_frame_equal(facts.item_frame_for_filter(label, custom_range), item_frame)
+                        pd.testing.assert_frame_equal(facts.team_frame_for_filter(label, custom_range), team_frame)
+
+    def legacy_generated_rows_for_period_filter(self, frame, label, custom_range):
+        rows = self.app.expand_grouped_action_records(frame.to_dict("records"))
+        if label != "Custom":
+            period = self.app.sent_reminder_outcome_period(label)
+            return [row for row in rows if self.legacy_statistics_row_in_reminder_period(row, period, date(2026, 5, 16))]
+        if custom_range is None:
+            return rows
+        start, end = sorted(custom_range)
+        return [row for row in rows if any(start <= day <= end for day in self.app.statistics_row_dates(row))]
+
     def test_all_time_reminder_period_filter_avoids_per_date_period_checks(self):
         row = {"Reminder Date": "16 May 2026"}
 
@@ -692,6 +743,194 @@ class StatisticsTests(unittest.TestCase):
         self.assertIsNone(self.app.top_team_member_summary(sender_frame))
         self.assertEqual(self.app.format_top_team_member_metric(sender_frame), "❤️ No successes yet")
 
+    def test_stats_outcome_cube_answers_periods_without_regrouping_rows(self):
+        today = date(2026, 5, 16)
+        rows = self.app.outcome_summary_precompute_numeric_columns(pd.DataFrame(
+            [
+                {"Sent Date": "2026-05-16", "Sender": "Nurse A", "Item": "Rabies", "Outcome": "Reminder Success", "Revenue": 120.0},
+                {"Sent Date": "2026-05-12", "Sender": " Nurse B ", "Item": "Librela", "Outcome": "Pending", "Revenue": 0},
+                {"Sent Date": "2026-05-01", "Sender": "Nurse B", "Item": "Rabies", "Outcome": "Reminder Success", "Revenue": 80.0},
+                {"Sent Date": "2026-04-01", "Sender": "", "Item": "Rabies", "Outcome": "No Match", "Revenue": None},
+                {"Sent Date": None, "Sender": "Nurse A", "Item": "Librela", "Outcome": "Reminder Success", "Revenue": 15.0},
+            ]
+        ))
+        cube = self.app.StatsOutcomeCube(rows)
+
+        with mock.patch.object(self.app, "user_today", return_value=today):
+            filters = (
+                ("Previous 7 days", None),
+                ("Previous 30 days", None),
+                ("All-time", None),
+                ("Custom", (date(2026, 5, 12), date(2026, 4, 1))),
+            )
+            expected = {}
+            for label, custom_range in filters:
+                period_rows = self.app.filter_stats_sent_tab_rows(rows, label, custom_range=custom_range)
+                expected[label, custom_range] = (
+                    self.app.summarize_outcomes(period_rows),
+                    self.app.build_outcome_group_frame(
+                        period_rows,
+                        "Sender",
+                        self.app.OUTCOME_SENDER_GROUP_COLUMNS,
+                        numeric_precomputed=True,
+                    ),
+                )
+            with mock.patch.object(
+                self.app,
+                "summarize_outcomes",
+                side_effect=AssertionError("period switches should read the cube"),
+            ):
+                for label, custom_range in filters:
+                    with self.subTest(label=label, custom_range=custom_range):
+                        legacy_summary, legacy_sender_frame = expected[label, custom_range]
+                        bounds = self.app.stats_sent_period_bounds(label, custom_range)
+                        summary = cube.summary(bounds)
+                        for key in ("sent", "successes", "success_rate", "revenue"):
+                            self.assertAlmostEqual(summary[key], legacy_summary[key])
+                        pd.testing.assert_frame_equal(cube.sender_frame(bounds), legacy_sender_frame)
+
+    def test_stats_computation_job_publishes_summary_before_detail_tables(self):
+        outcomes = pd.DataFrame(
+            [{"Sent Date": "2026-05-16", "Sender": "Nurse A", "Item": "Rabies", "Outcome": "Reminder Success", "Revenue": 120.0}]
+        )
+        release_details = threading.Event()
+
+        def generated_rows(*args, **kwargs):
+            self.assertTrue(release_details.wait(5))
+            return self.make_generated_rows()
+
+        registry = self.app.StatsComputationRegistry()
+        calculation_inputs = {
+            "sales_df": pd.DataFrame(),
+            "prepared": pd.DataFrame(),
+            "rules": {},
+            "action_records": [],
+            "cache_signature": ("signature",),
+            "due_date_window_days": 30,
+            "post_reminder_window_days": 30,
+            "outcomes_as_of_date": date(2026, 5, 16),
+            "statistics_group_days": 1,
+            "statistics_data_version": 0,
+            "today_iso": "2026-05-16",
+            "rules_fp": "",
+            "exclusion_fp": "",
+            "exclusion_filter": self.app.ReminderExclusionFilter([], [], [], []),
+        }
+        with mock.patch.object(self.app, "build_reminder_outcomes", return_value=outcomes), mock.patch.object(
+            self.app, "cached_statistics_generated_rows", side_effect=generated_rows
+        ):
+            job, started = registry.submit(
+                "clinic",
+                ("key",),
+                lambda job: self.app.compute_stats_calculation(**calculation_inputs, publish=job.publish),
+            )
+            for _ in range(500):
+                if job.snapshot()["stage"] == "summary":
+                    break
+                time.sleep(0.01)
+            snapshot = job.snapshot()
+            self.assertTrue(started)
+            self.assertTrue(job.active)
+            self.assertEqual(snapshot["stage"], "summary")
+            self.assertEqual(snapshot["partial"]["stats_cube"].summary((None, None))["revenue"], 120.0)
+            self.assertNotIn("stats_facts", snapshot["partial"])
+            self.assertEqual(registry.submit("clinic", ("key",), lambda job: {}), (job, False))
+
+            release_details.set()
+            for _ in range(500):
+                if not job.active:
+                    break
+                time.sleep(0.01)
+
+        snapshot = job.snapshot()
+        self.assertEqual(snapshot["status"], "success")
+        self.assertIn("stats_facts", snapshot["result"])
+        self.assertIs(registry.get("clinic", ("key",)), job)
+        registry.forget_finished("clinic")
+        self.assertIsNone(registry.get("clinic", ("key",)))
+
+    def test_failed_stats_computation_is_kept_until_forgotten(self):
+        registry = self.app.StatsComputationRegistry()
+        runs = []
+
+        def failing_run(job):
+            runs.append(job)
+            raise RuntimeError("stats failed")
+
+        job, started = registry.submit("clinic", ("key",), failing_run)
+        for _ in range(500):
+            if not job.active:
+                break
+            time.sleep(0.01)
+        retry, retry_started = registry.submit("clinic", ("key",), failing_run)
+
+        self.assertTrue(started)
+        self.assertIs(retry, job)
+        self.assertFalse(retry_started)
+        self.assertEqual(job.snapshot()["status"], "error")
+        self.assertEqual(len(runs), 1)
+
+        registry.forget(job)
+        self.assertIsNone(registry.get("clinic", ("key",)))
+        replacement, replacement_started = registry.submit("clinic", ("key",), lambda job: {})
+        self.assertTrue(replacement_started)
+        self.assertIsNot(replacement, job)
+
+    def test_purchase_timeline_index_is_built_once_per_dataset_and_combines_item_keys(self):
+        sales_df = pd.DataFrame(
+            [
+                {"ChargeDate": "2025-01-01", "Client Name": "Client A", "Animal Name": "Pet A", "Item Name": "Rabies 1ml", "Amount": 100},
+                {"ChargeDate": "2025-12-27", "Client Name": "Client A", "Animal Name": "Pet A", "Item Name": "Rabies Booster", "Amount": 120},
+                {"ChargeDate": "2025-12-27", "Client Name": "Client A", "Animal Name": "Pet A", "Item Name": "Rabies 1ml", "Amount": 999},
+                {"ChargeDate": "2025-03-01", "Client Name": "Client B", "Animal Name": "Pet B", "Item Name": "Rabies 1ml", "Amount": 80},
+                {"ChargeDate": "2025-03-01", "Client Name": "", "Animal Name": "Pet C", "Item Name": "Rabies 1ml", "Amount": 50},
+            ]
+        )
+        shared = self.app.share_working_df("Clinic Repurchase", sales_df, "file-1", "t1")
+        timeline = self.app.purchase_timeline_index(shared)
+        sales = self.app.prepare_sales_for_outcomes(shared)
+        gap_key_matches = {("terms", "rabies"): ["rabies"], ("exact", "rabies booster"): ["rabies booster"]}
+        item_match_map = self.app.build_outcome_item_match_map(sales, ["rabies", "rabies booster"])
+
+        with mock.patch.object(
+            self.app,
+            "prepare_sales_for_outcomes",
+            side_effect=AssertionError("the published index should be reused"),
+        ):
+            self.assertIs(self.app.purchase_timeline_index(shared), timeline)
+            gap_map = self.app.build_average_sales_purchase_gap_map(
+                sales,
+                gap_key_matches,
+                item_match_map,
+                timeline=timeline,
+            )
+
+        rabies = gap_map[("terms", "rabies")]
+        self.assertEqual(rabies["average"], 360.0)
+        self.assertEqual(rabies["total"], 3)
+        self.assertEqual(rabies["unique_patients"], 2)
+        self.assertEqual(rabies["unique_repeat_patients"], 1)
+        self.assertAlmostEqual(rabies["repeat_rate"], 1 / 3)
+        self.assertAlmostEqual(rabies["average_revenue"], (100 + 999 + 80) / 3)
+        booster = gap_map[("exact", "rabies booster")]
+        self.assertIsNone(booster["average"])
+        self.assertEqual((booster["total"], booster["unique_patients"]), (1, 1))
+        self.assertEqual(
+            self.app.build_average_sales_purchase_gap_map(sales, gap_key_matches, item_match_map),
+            gap_map,
+        )
+
+        patient = timeline.patient_codes([sales.iloc[0]["OutcomeClientKey"]], [sales.iloc[0]["OutcomePatientKey"]])
+        item = timeline.item_codes(["rabies 1ml"])
+        first_day = (pd.Timestamp("2025-01-01") - pd.Timestamp(0)).days
+        next_rows = timeline.next_purchase_on_or_after(patient, item, [first_day + 1])
+        next_purchase = timeline.purchase_rows(next_rows)
+        self.assertEqual(next_purchase.loc[0, "OutcomeChargeDate"], pd.Timestamp("2025-12-27"))
+        self.assertEqual(next_purchase.loc[0, "OutcomeAmount"], 999)
+        first, stop = timeline.purchases_between(patient, item, [first_day], [first_day + 300])
+        self.assertEqual((stop - first).tolist(), [1])
+        self.assertEqual(timeline.next_purchase_on_or_after(patient, item, [first_day + 400]).tolist(), [-1])
+
     def test_all_paged_tables_use_50_rows(self):
         self.assertEqual(self.app.TABLE_PAGE_SIZE, 50)
         self.assertEqual(self.app.REMINDER_TABLE_PAGE_SIZE, 50)
@@ -784,6 +1023,75 @@ class StatisticsTests(unittest.TestCase):
         self.assertIn("background: #fee2e2", css)
         self.assertNotIn(self.app.WHATSAPP_ICON_MASK_DATA_URI, css)
 
+    def test_sort_permutations_are_cached_per_frame_and_reused_for_subsets(self):
+        base = pd.DataFrame(
+            {
+                "Reminder Date": ["03 May 2026", "01 May 2026 | 04 May 2026", "", "02 May 2026"],
+                "Client Name": ["b", "A", "c", "a"],
+            },
+            index=[10, 11, 12, 13],
+        )
+        self.app.st.session_state["grid_reminder_sort"] = {"column": "Reminder Date", "ascending": True}
+
+        with mock.patch.object(self.app, "reminder_sort_rank_codes", wraps=self.app.reminder_sort_rank_codes) as rank_codes:
+            full_order = self.app.reminder_table_order(base, "grid")
+            subset = base.loc[[10, 12, 13]]
+            subset_order = self.app.reminder_table_order(subset, "grid", base=base)
+            self.app.reminder_table_order(base, "grid")
+
+        self.assertEqual(rank_codes.call_count, 1)
+        self.assertEqual(base.index[full_order].tolist(), [11, 13, 10, 12])
+        self.assertEqual(subset.index[subset_order].tolist(), [13, 10, 12])
+        paged = self.app.paginate_dataframe(base, "grid_page", 2, "rows", order=full_order)
+        self.assertEqual(paged.index.tolist(), [11, 13])
+
+    def test_stats_action_records_digest_is_computed_once_per_index_version(self):
+        state = self.app.st.session_state
+        state.pop(self.app.STATS_ACTION_RECORDS_SIGNATURE_KEY, None)
+        records = [{"Action": "Sent", "ActionedAt": "2026-05-16 09:00:00", "Client Name": "Client A"}]
+
+        with mock.patch.object(self.app.json, "dumps", wraps=self.app.json.dumps) as dumps:
+            first = self.app.stats_action_records_cache_signature(records, 7)
+            repeated = self.app.stats_action_records_cache_signature([dict(record) for record in records], 7)
+            edited = self.app.stats_action_records_cache_signature([{**records[0], "Client Name": "Client B"}], 8)
+
+        self.assertEqual(dumps.call_count, 2)
+        self.assertEqual(first, repeated)
+        self.assertNotEqual(first[2], edited[2])
+        self.assertEqual(first[:2], edited[:2])
+
+    def test_statistics_vocabulary_assigns_one_code_per_value_across_threads(self):
+        vocabulary = self.app.StatisticsVocabulary()
+        batches = [[f"item {idx}" for idx in range(start, 2000, 4)] for start in range(4)]
+        results = {}
+
+        def assign(position, values):
+            results[position] = vocabulary.codes("items", values)
+
+        threads = [threading.Thread(target=assign, args=(position, values)) for position, values in enumerate(batches)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        labels = vocabulary.labels("items")
+        self.assertEqual(len(labels), 2000)
+        for position, values in enumerate(batches):
+            self.assertEqual([labels[code] for code in results[position]], values)
+
+    def test_stats_sort_permutations_survive_frame_rebuilds_with_the_same_version(self):
+        def build_frame():
+            return pd.DataFrame({"Item": ["b", "a", "c"], "Successes": [2, 3, 1]})
+
+        with mock.patch.object(self.app, "stats_sort_rank_codes", wraps=self.app.stats_sort_rank_codes) as rank_codes:
+            first = self.app.stats_frame_sort_order(build_frame(), "Successes", False, version=("stats_items", "v1"))
+            second = self.app.stats_frame_sort_order(build_frame(), "Successes", False, version=("stats_items", "v1"))
+            self.app.stats_frame_sort_order(build_frame(), "Successes", False, version=("stats_items", "v2"))
+
+        self.assertEqual(rank_codes.call_count, 2)
+        self.assertEqual(first.tolist(), [1, 0, 2])
+        self.assertEqual(second.tolist(), [1, 0, 2])
+
     def test_render_outcome_dataframe_sorts_all_rows_before_pagination_without_global_controls(self):
         frame = pd.DataFrame(
             [
@@ -818,6 +1126,65 @@ class StatisticsTests(unittest.TestCase):
         selectbox.assert_not_called()
         radio.assert_not_called()
 
+    def test_render_outcome_dataframe_formats_each_visible_page_once(self):
+        frame = pd.DataFrame(
+            [{"Item": f"Item {idx:02d}", "Successes": idx, "Sent Date": "2026-05-01"} for idx in range(66)]
+        )
+        state = self.app.st.session_state
+        state["stats_cached_page"] = 0
+
+        with (
+            mock.patch.object(self.app.st, "caption"),
+            mock.patch.object(self.app.st, "button", return_value=False),
+            mock.patch.object(self.app.st, "dataframe") as dataframe,
+            mock.patch.object(
+                self.app,
+                "prepare_outcome_dataframe_for_display",
+                wraps=self.app.prepare_outcome_dataframe_for_display,
+            ) as prepare,
+        ):
+            self.app.render_outcome_dataframe(frame, table_key="stats_cached")
+            self.app.render_outcome_dataframe(frame, table_key="stats_cached")
+            state["stats_cached_page"] = 1
+            self.app.render_outcome_dataframe(frame, table_key="stats_cached")
+
+        self.assertEqual(prepare.call_count, 2)
+        self.assertEqual([len(call.args[0]) for call in prepare.call_args_list], [50, 16])
+        self.assertIs(dataframe.call_args_list[0].args[0], dataframe.call_args_list[1].args[0])
+        self.assertEqual(dataframe.call_args_list[2].args[0].iloc[0]["Successes"], 15)
+
+    def test_render_outcome_dataframe_reuses_pages_of_rebuilt_frames_by_stats_version(self):
+        def build_frame():
+            return pd.DataFrame(
+                [{"Item": f"Item {idx:02d}", "Successes": idx, "Sent Date": "2026-05-01"} for idx in range(12)]
+            )
+
+        state = self.app.st.session_state
+        state["stats_versioned_page"] = 0
+        state.pop(self.app.STATS_DISPLAY_PAGE_CACHE_KEY, None)
+
+        with (
+            mock.patch.object(self.app.st, "caption"),
+            mock.patch.object(self.app.st, "button", return_value=False),
+            mock.patch.object(self.app.st, "dataframe") as dataframe,
+            mock.patch.object(
+                self.app,
+                "stats_export_frame_fingerprint",
+                side_effect=AssertionError("a versioned page should not hash the frame"),
+            ),
+            mock.patch.object(
+                self.app,
+                "prepare_outcome_dataframe_for_display",
+                wraps=self.app.prepare_outcome_dataframe_for_display,
+            ) as prepare,
+        ):
+            self.app.render_outcome_dataframe(build_frame(), table_key="stats_versioned", version=("v1",))
+            self.app.render_outcome_dataframe(build_frame(), table_key="stats_versioned", version=("v1",))
+            self.app.render_outcome_dataframe(build_frame(), table_key="stats_versioned", version=("v2",))
+
+        self.assertEqual(prepare.call_count, 2)
+        self.assertIs(dataframe.call_args_list[0].args[0], dataframe.call_args_list[1].args[0])
+
     def test_stats_revenue_display_columns_keep_revenue_metrics_only(self):
         frame = pd.DataFrame([
             {
@@ -1145,7 +1512,8 @@ class StatisticsTests(unittest.TestCase):
 
         download_button.assert_called_once()
         kwargs = download_button.call_args.kwargs
-        exported = pd.read_csv(io.BytesIO(kwargs["data"]), dtype=str)
+        self.assertTrue(callable(kwargs["data"]))
+        exported = pd.read_csv(io.BytesIO(kwargs["data"]()), dtype=str)
 
         self.assertEqual(download_button.call_args.args[0], "Export as CSV")
         self.assertEqual(kwargs["mime"], "text/csv")
@@ -1230,7 +1598,61 @@ class StatisticsTests(unittest.TestCase):
         self.assertEqual(first_again, first)
         self.assertNotEqual(second, first)
         self.assertEqual(csv_bytes.call_count, 2)
-        self.assertEqual(len(self.app.st.session_state["_stats_export_csv_cache"]["entries"]), 2)
+        self.assertEqual(len(self.app.stats_export_csv_process_cache()), 2)
+        self.assertNotIn("_stats_export_csv_cache", self.app.st.session_state)
+
+    def test_stats_export_csv_versioned_key_skips_hashing_and_streams_chunks(self):
+        frame = pd.DataFrame(
+            {
+                "Item": [f"Item {index}" for index in range(7)],
+                "Sent": [index + 0.4 for index in range(7)],
+                "Success Rate": [index / 10 for index in range(7)],
+                "Revenue": [1000.6 * index for index in range(7)],
+            }
+        )
+        columns = ["Item", "Sent", "Success Rate", "Revenue"]
+        whole = self.app.stats_export_csv_bytes(
+            frame,
+            columns,
+            self.app.prepare_outcome_dataframe_for_display,
+            chunk_rows=len(frame),
+        )
+        chunked = self.app.stats_export_csv_bytes(
+            frame,
+            columns,
+            self.app.prepare_outcome_dataframe_for_display,
+            chunk_rows=3,
+        )
+        self.assertEqual(chunked, whole)
+
+        version = ("dataset", "clinic", "file-1", "2026-05-16", "signature")
+        with (
+            mock.patch.object(self.app, "memoized_frame_fingerprint") as fingerprint,
+            mock.patch.object(self.app, "stats_export_csv_bytes", wraps=self.app.stats_export_csv_bytes) as csv_bytes,
+            mock.patch.object(self.app.st, "download_button") as download_button,
+        ):
+            self.app.render_stats_csv_export(
+                frame,
+                "Stats Items",
+                "stats_items",
+                columns=columns,
+                display_preparer=self.app.prepare_outcome_dataframe_for_display,
+                version=version,
+            )
+            csv_bytes.assert_not_called()
+            first = download_button.call_args.kwargs["data"]()
+            second = self.app.stats_export_csv_bytes_for_render(
+                frame.copy(),
+                "Stats Items",
+                columns,
+                self.app.prepare_outcome_dataframe_for_display,
+                version=version,
+            )
+
+        fingerprint.assert_not_called()
+        self.assertEqual(csv_bytes.call_count, 1)
+        self.assertEqual(first, whole)
+        self.assertIs(second, first)
 
     def test_statistics_exclusion_fingerprint_tracks_filter_changes(self):
         state = self.app.st.session_state